@@ -0,0 +1,112 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Benchmark the throughput of meta_schedule PerStoreFeature, in candidates scored per second.
+
+The candidates are random tilings of a matmul, sampled with replacement like the mutated
+population of the evolutionary search, so that the same module shows up several times.
+The extraction is timed without the feature cache, single-threaded and over the thread pool,
+then with the cache, for a first pass and for a second pass over the same candidates.
+
+    python meta_schedule_feature_bench.py --candidates 2000 --unique 500
+"""
+import argparse
+import random
+import time
+
+import tvm
+from tvm import meta_schedule as ms
+from tvm import te, tir
+from tvm.meta_schedule.utils import cpu_count
+
+
+def matmul(n):
+    A = te.placeholder((n, n), name="A")
+    B = te.placeholder((n, n), name="B")
+    k = te.reduce_axis((0, n), name="k")
+    C = te.compute((n, n), lambda i, j: te.sum(A[i, k] * B[k, j], axis=k), name="C")
+    return te.create_prim_func([A, B, C])
+
+
+def sample_candidates(func, num_candidates, num_unique, seed):
+    """Sample random tilings, then draw the candidates among them with replacement."""
+    schedules = []
+    for i in range(num_unique):
+        sch = tir.Schedule(func, seed=seed + i)
+        i_loop, j_loop, k_loop = sch.get_loops(sch.get_block("C"))
+        i_tiles = sch.split(i_loop, sch.sample_perfect_tile(i_loop, n=3))
+        j_tiles = sch.split(j_loop, sch.sample_perfect_tile(j_loop, n=3))
+        k_tiles = sch.split(k_loop, sch.sample_perfect_tile(k_loop, n=2))
+        sch.reorder(
+            i_tiles[0],
+            j_tiles[0],
+            i_tiles[1],
+            j_tiles[1],
+            k_tiles[0],
+            i_tiles[2],
+            k_tiles[1],
+            j_tiles[2],
+        )
+        sch.parallel(sch.fuse(i_tiles[0], j_tiles[0]))
+        sch.vectorize(j_tiles[2])
+        schedules.append(sch)
+    rng = random.Random(seed)
+    return [
+        ms.MeasureCandidate(sch=rng.choice(schedules), args_info=[]) for _ in range(num_candidates)
+    ]
+
+
+def bench(extractor, context, candidates, passes):
+    """Return the candidates scored per second of each pass."""
+    throughputs = []
+    for _ in range(passes):
+        start = time.perf_counter()
+        extractor.extract_from(context, candidates)
+        throughputs.append(len(candidates) / (time.perf_counter() - start))
+    return throughputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=512)
+    parser.add_argument("--candidates", type=int, default=2000)
+    parser.add_argument("--unique", type=int, default=500)
+    parser.add_argument("--num-threads", type=int, default=cpu_count())
+    parser.add_argument("--target", type=str, default="llvm")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    candidates = sample_candidates(matmul(args.size), args.candidates, args.unique, args.seed)
+    target = tvm.target.Target(args.target)
+    serial = ms.TuneContext(target=target, num_threads=1)
+    parallel = ms.TuneContext(target=target, num_threads=args.num_threads)
+
+    print(f"{len(candidates)} candidates, {args.unique} unique, {args.num_threads} threads")
+    (result,) = bench(ms.feature_extractor.PerStoreFeature(max_cache_size=0), serial, candidates, 1)
+    print(f"no cache, 1 thread      : {result:10.1f} candidates/s")
+    (result,) = bench(
+        ms.feature_extractor.PerStoreFeature(max_cache_size=0), parallel, candidates, 1
+    )
+    print(f"no cache, thread pool   : {result:10.1f} candidates/s")
+    extractor = ms.feature_extractor.PerStoreFeature()
+    first, second = bench(extractor, parallel, candidates, 2)
+    print(f"cache, first pass       : {first:10.1f} candidates/s")
+    print(f"cache, second pass      : {second:10.1f} candidates/s")
+    print(f"cache hits / misses     : {extractor.num_cache_hits} / {extractor.num_cache_misses}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Benchmark nnz-balanced CSR sparse_dense against the row-parallel schedule on x86.
+
+The sparse matrices are synthetic with power-law (Zipf) distributed row lengths, the
+shape of sparsity seen in GNN adjacency matrices and pruned embedding tables.
+
+    python sparse_dense_balanced_bench.py --rows 65536 --cols 65536 --feat 64 --alpha 1.6
+"""
+import argparse
+
+import numpy as np
+import scipy.sparse as sp
+
+import tvm
+import tvm.testing
+from tvm import te, topi
+from tvm.topi.sparse.utils import csr_balanced_row_partition
+
+
+def power_law_csr(rows, cols, alpha, max_row_nnz, dtype="float32"):
+    """Generate a CSR matrix whose row lengths follow a Zipf distribution."""
+    row_nnz = np.minimum(np.random.zipf(alpha, rows), min(cols, max_row_nnz))
+    indptr = np.concatenate([[0], np.cumsum(row_nnz)]).astype("int32")
+    indices = np.concatenate(
+        [np.sort(np.random.choice(cols, n, replace=False)) for n in row_nnz]
+    ).astype("int32")
+    data = np.random.randn(indptr[-1]).astype(dtype)
+    return sp.csr_matrix((data, indices, indptr), shape=(rows, cols))
+
+
+def build_row_parallel(X, W_data, W_indices, W_indptr, target):
+    Y = topi.nn.sparse_dense(X, W_data, W_indices, W_indptr)
+    s = te.create_schedule(Y.op)
+    s[Y].reorder(Y.op.axis[1], Y.op.axis[0])
+    s[Y].parallel(Y.op.axis[1])
+    return tvm.build(s, [X, W_data, W_indices, W_indptr, Y], target=target)
+
+
+def build_balanced(X, W_data, W_indices, W_indptr, target, num_parts, precomputed):
+    args = [X, W_data, W_indices, W_indptr]
+    row_partition = None
+    if precomputed:
+        row_partition = te.placeholder((num_parts + 1,), dtype="int32", name="row_partition")
+        args.append(row_partition)
+    Y = topi.nn.sparse_dense_csr_balanced(
+        X, W_data, W_indices, W_indptr, num_parts=num_parts, row_partition=row_partition
+    )
+    s = topi.x86.schedule_sparse_dense_csr_balanced([Y])
+    return tvm.build(s, args + [Y], target=target)
+
+
+def evaluate(func, dev, args, repeat):
+    ftimer = func.time_evaluator(func.entry_name, dev, number=1, repeat=repeat)
+    return np.array(ftimer(*args).results) * 1000  # multiply 1000 for converting to millisecond
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=65536, help="rows of the sparse matrix")
+    parser.add_argument("--cols", type=int, default=65536, help="cols of the sparse matrix")
+    parser.add_argument("--feat", type=int, default=64, help="rows of the dense matrix")
+    parser.add_argument("--alpha", type=float, default=1.6, help="Zipf exponent of row lengths")
+    parser.add_argument("--max-row-nnz", type=int, default=16384)
+    parser.add_argument("--num-parts", type=int, default=256)
+    parser.add_argument("--target", type=str, default="llvm -mcpu=core-avx2")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    target = tvm.target.Target(args.target)
+    dev = tvm.cpu(0)
+    W_sp = power_law_csr(args.rows, args.cols, args.alpha, args.max_row_nnz)
+    X_np = np.random.randn(args.feat, args.cols).astype("float32")
+    row_nnz = np.diff(W_sp.indptr)
+    print(
+        "rows=%d nnz=%d max_row_nnz=%d mean_row_nnz=%.2f"
+        % (args.rows, W_sp.nnz, row_nnz.max(), row_nnz.mean())
+    )
+
+    X = te.placeholder(X_np.shape, dtype="float32", name="X")
+    W_data = te.placeholder(W_sp.data.shape, dtype="float32", name="W_data")
+    W_indices = te.placeholder(W_sp.indices.shape, dtype="int32", name="W_indices")
+    W_indptr = te.placeholder(W_sp.indptr.shape, dtype="int32", name="W_indptr")
+
+    inputs = [
+        tvm.nd.array(X_np, dev),
+        tvm.nd.array(W_sp.data, dev),
+        tvm.nd.array(W_sp.indices, dev),
+        tvm.nd.array(W_sp.indptr, dev),
+    ]
+    partition = tvm.nd.array(csr_balanced_row_partition(W_sp.indptr, args.num_parts), dev)
+    Y_ref = (W_sp @ X_np.T).T
+
+    candidates = [
+        ("row-parallel", build_row_parallel(X, W_data, W_indices, W_indptr, target), inputs),
+        (
+            "balanced (in-kernel split)",
+            build_balanced(X, W_data, W_indices, W_indptr, target, args.num_parts, False),
+            inputs,
+        ),
+        (
+            "balanced (precomputed split)",
+            build_balanced(X, W_data, W_indices, W_indptr, target, args.num_parts, True),
+            inputs + [partition],
+        ),
+    ]
+
+    print("--------------------------------------------------")
+    print("%-30s %-20s %s" % ("Schedule", "Mean Time (std dev)", "Speedup"))
+    print("--------------------------------------------------")
+    baseline = None
+    for name, func, func_args in candidates:
+        Y = tvm.nd.empty(Y_ref.shape, "float32", dev)
+        func(*func_args, Y)
+        tvm.testing.assert_allclose(Y.numpy(), Y_ref, rtol=1e-4, atol=1e-4)
+        prof_res = evaluate(func, dev, func_args + [Y], args.repeat)
+        baseline = baseline or np.mean(prof_res)
+        print(
+            "%-30s %-20s %.2fx"
+            % (
+                name,
+                "%.2f ms (%.2f ms)" % (np.mean(prof_res), np.std(prof_res)),
+                baseline / np.mean(prof_res),
+            )
+        )
@@ -0,0 +1,71 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# Compare the latency of the relax VM and the AOT compiled module on the MLP and ResNet examples
+
+import timeit
+
+import tvm
+import tvm.testing
+from tvm import relax, topi
+from tvm.relay import testing
+from tvm.relax.testing import relay_translator, nn
+import numpy as np
+
+
+def build_mlp(data, weight):
+    bb = relax.BlockBuilder()
+
+    with bb.function("main", [data, weight]):
+        gv0 = bb.emit_te(tvm.contrib.cblas.matmul, data, weight, transa=False, transb=False)
+        gv1 = bb.emit_te(topi.nn.relu, gv0)
+        bb.emit_func_output(gv1)
+
+    return bb.get()
+
+
+def benchmark(name, mod, inputs, target, number=100):
+    ex, lib = relax.vm.build(mod, target)
+    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    aot_mod = relax.aot.build(mod, target)
+    tvm.testing.assert_allclose(
+        aot_mod["main"](*inputs).numpy(), vm["main"](*inputs).numpy(), rtol=1e-5, atol=1e-5
+    )
+
+    vm_ms = timeit.timeit(lambda: vm["main"](*inputs), number=number) / number * 1e3
+    aot_ms = timeit.timeit(lambda: aot_mod["main"](*inputs), number=number) / number * 1e3
+    print("%s: vm %.3f ms, aot %.3f ms, speedup %.2fx" % (name, vm_ms, aot_ms, vm_ms / aot_ms))
+
+
+if __name__ == "__main__":
+    target = tvm.target.Target("llvm", host="llvm")
+
+    # MLP with static shapes, where the interpreter overhead dominates
+    data = relax.Var("data", [16, 32], relax.DynTensorType(2, "float32"))
+    weight = relax.Var("weight", [32, 16], relax.DynTensorType(2, "float32"))
+    mlp_inputs = [
+        tvm.nd.array(np.random.rand(16, 32).astype(np.float32)),
+        tvm.nd.array(np.random.rand(32, 16).astype(np.float32)),
+    ]
+    benchmark("mlp", build_mlp(data, weight), mlp_inputs, target, number=1000)
+
+    # ResNet-50 translated from Relay
+    relay_mod, _ = testing.resnet.get_workload(num_layers=50, batch_size=1, dtype="float32")
+    relax_mod = relay_translator.from_relay(relay_mod["main"])
+    resnet_inputs = [tvm.nd.array(np.random.rand(1, 3, 224, 224).astype(np.float32))]
+    resnet_inputs += nn.init_params(relax_mod)
+    benchmark("resnet50", relax_mod, resnet_inputs, target, number=10)
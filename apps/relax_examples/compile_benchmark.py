@@ -0,0 +1,282 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# Measure where the compile time of the Relax pipeline goes, stage by stage and pass by pass.
+#
+# Each model is compiled in a fresh process, so that the peak memory of one model does not leak
+# into the next one. The stages are those of relax.vm.build, preceded by the construction of the
+# Relax program:
+#   translate     building the program with BlockBuilder or translating it from Relay
+#   relax_passes  the Relax passes lowering to the VM builtins
+#   tir_lowering  the TIR passes run by tvm.build
+#   llvm_codegen  the rest of tvm.build, i.e. the code generation
+#   vm_codegen    the generation of the VM executable
+# The time of each pass is its own time, excluding its sub-passes, as measured by
+# PassTimingInstrument. The peak memory is the peak resident set size of the process at the end
+# of each stage. A model whose process fails, is killed, e.g. when running out of memory, or
+# exceeds --timeout is recorded with an "error" entry instead.
+#
+# Usage:
+#   python compile_benchmark.py --models mlp,resnet18,bert --output compile_time.json
+#   python compile_benchmark.py --models resnet152 --stages translate
+
+import argparse
+import json
+import multiprocessing
+import queue
+import re
+import resource
+import sys
+import time
+from typing import Callable, Dict
+
+import tvm
+from tvm import relax, relay, topi
+from tvm.ir.instrument import PassTimingInstrument
+from tvm.relax.testing import relay_translator
+from tvm.relay import testing
+
+# The version of the JSON output, to be bumped on any change of its layout
+SCHEMA_VERSION = 2
+
+
+def _mlp() -> tvm.IRModule:
+    bb = relax.BlockBuilder()
+    data = relax.Var("data", [64, 1024], relax.DynTensorType(2, "float32"))
+    weights = [
+        relax.Var("w%d" % i, [1024, 1024], relax.DynTensorType(2, "float32")) for i in range(4)
+    ]
+    with bb.function("main", [data, *weights]):
+        with bb.dataflow():
+            out = data
+            for weight in weights:
+                out = bb.emit_te(topi.nn.dense, out, weight)
+                out = bb.emit_te(topi.nn.relu, out)
+            gv = bb.emit_output(out)
+        bb.emit_func_output(gv)
+    return bb.get()
+
+
+def _resnet(num_layers: int) -> Callable[[], tvm.IRModule]:
+    def _build():
+        relay_mod, _ = testing.resnet.get_workload(num_layers=num_layers, batch_size=1)
+        return relay_translator.from_relay(relay_mod["main"])
+
+    return _build
+
+
+def _bert(
+    num_layers: int = 4, seq_len: int = 128, hidden: int = 768, heads: int = 12
+) -> Callable[[], tvm.IRModule]:
+    # A BERT-style encoder, without the layer norms which Relay does not compute directly
+    def _build():
+        head_dim = hidden // heads
+        data = relay.var("data", shape=(seq_len, hidden), dtype="float32")
+        params = [data]
+
+        def _linear(x, name, in_units, units):
+            weight = relay.var(name + "_weight", shape=(units, in_units), dtype="float32")
+            bias = relay.var(name + "_bias", shape=(units,), dtype="float32")
+            params.extend([weight, bias])
+            return relay.add(relay.nn.dense(x, weight), bias)
+
+        def _split_heads(x):
+            x = relay.reshape(x, (seq_len, heads, head_dim))
+            return relay.transpose(x, (1, 0, 2))
+
+        out = data
+        for i in range(num_layers):
+            name = "layer%d" % i
+            query = _split_heads(_linear(out, name + "_query", hidden, hidden))
+            key = _split_heads(_linear(out, name + "_key", hidden, hidden))
+            value = _split_heads(_linear(out, name + "_value", hidden, hidden))
+            scores = relay.nn.batch_matmul(query, key)
+            scores = relay.divide(scores, relay.const(head_dim**0.5, "float32"))
+            probs = relay.nn.softmax(scores)
+            context = relay.nn.batch_matmul(probs, value, transpose_b=False)
+            context = relay.reshape(relay.transpose(context, (1, 0, 2)), (seq_len, hidden))
+            out = relay.add(out, _linear(context, name + "_output", hidden, hidden))
+            ffn = relay.tanh(_linear(out, name + "_ffn0", hidden, hidden * 4))
+            out = relay.add(out, _linear(ffn, name + "_ffn1", hidden * 4, hidden))
+        func = relay.Function(params, out)
+        func = relay.transform.InferType()(tvm.IRModule.from_expr(func))["main"]
+        return relay_translator.from_relay(func)
+
+    return _build
+
+
+MODELS: Dict[str, Callable[[], tvm.IRModule]] = {
+    "mlp": _mlp,
+    "resnet18": _resnet(18),
+    "resnet50": _resnet(50),
+    "resnet152": _resnet(152),
+    "bert": _bert(),
+}
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / (1 << 10)
+
+
+def _pass_times(profile: str) -> Dict[str, float]:
+    """Sum the own time of each pass, in seconds, from the profile of PassTimingInstrument."""
+    times: Dict[str, float] = {}
+    for line in profile.splitlines():
+        match = re.match(r"^\t*(.+): (\d+)us \[(\d+)us\]", line)
+        if match:
+            name, self_us = match.group(1), int(match.group(3))
+            times[name] = times.get(name, 0.0) + self_us * 1e-6
+    return times
+
+
+def _run_stage(stages, name, func, *args, profile_passes=False):
+    timing = PassTimingInstrument()
+    with tvm.transform.PassContext(opt_level=3, instruments=[timing]):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        profile = timing.render() if profile_passes else ""
+    stages[name] = {"sec": elapsed, "peak_rss_mb": _peak_rss_mb()}
+    if profile_passes:
+        stages[name]["passes"] = _pass_times(profile)
+    return result
+
+
+def compile_model(name: str, target: str, translate_only: bool = False) -> Dict:
+    """Compile a model stage by stage, and report the time and the peak memory of each stage."""
+    target = tvm.target.Target(target)
+    stages: Dict[str, Dict] = {}
+    mod = _run_stage(stages, "translate", MODELS[name])
+    if translate_only:
+        return {
+            "num_prim_funcs": len(
+                [func for func in mod.functions.values() if isinstance(func, tvm.tir.PrimFunc)]
+            ),
+            "total_sec": stages["translate"]["sec"],
+            "peak_rss_mb": _peak_rss_mb(),
+            "stages": stages,
+        }
+    mod = _run_stage(stages, "relax_passes", relax.vm._lower_relax, mod, profile_passes=True)
+    rx_mod, tir_mod = relax.vm._split_tir_relax(mod)
+    _run_stage(stages, "tir_build", tvm.build, tir_mod, target, profile_passes=True)
+    # The passes of tvm.build lower the TIR, and the remaining time is spent in codegen
+    tir_build = stages.pop("tir_build")
+    tir_sec = sum(tir_build["passes"].values())
+    stages["tir_lowering"] = {
+        "sec": tir_sec,
+        "peak_rss_mb": tir_build["peak_rss_mb"],
+        "passes": tir_build["passes"],
+    }
+    stages["llvm_codegen"] = {
+        "sec": max(tir_build["sec"] - tir_sec, 0.0),
+        "peak_rss_mb": tir_build["peak_rss_mb"],
+    }
+    _run_stage(stages, "vm_codegen", relax._ffi_api.VMCodeGen, rx_mod)
+    return {
+        "num_prim_funcs": len(tir_mod.functions),
+        "total_sec": sum(stage["sec"] for stage in stages.values()),
+        "peak_rss_mb": _peak_rss_mb(),
+        "stages": stages,
+    }
+
+
+def _compile_in_subprocess(result_queue, name, target, translate_only):
+    try:
+        result = compile_model(name, target, translate_only)
+    except Exception as err:  # pylint: disable=broad-except
+        result = {"error": "%s: %s" % (type(err).__name__, err)}
+    result_queue.put(result)
+
+
+def _wait_for_result(result_queue, proc, timeout_sec):
+    """Wait for the result of the compiling process, or for an error if it dies or times out"""
+    deadline = time.time() + timeout_sec
+    while True:
+        try:
+            return result_queue.get(timeout=1)
+        except queue.Empty:
+            pass
+        if not proc.is_alive():
+            # The result may have been put right before the process exited
+            try:
+                return result_queue.get(timeout=1)
+            except queue.Empty:
+                return {"error": "compiling process exited with code %s" % proc.exitcode}
+        if time.time() > deadline:
+            proc.kill()
+            return {"error": "timed out after %.0f s" % timeout_sec}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile-time benchmark of the Relax pipeline")
+    parser.add_argument("--models", default=",".join(MODELS), help="comma separated model names")
+    parser.add_argument("--target", default="llvm")
+    parser.add_argument(
+        "--stages",
+        default="all",
+        choices=["all", "translate"],
+        help="the stages to run, 'translate' only measures the construction of the program",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=3600, help="the time limit of each model in seconds"
+    )
+    parser.add_argument("--output", default=None, help="the JSON file to write the results to")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    results = {}
+    for name in args.models.split(","):
+        if name not in MODELS:
+            raise ValueError("Unknown model %s, expected one of %s" % (name, list(MODELS)))
+        result_queue = ctx.Queue()
+        proc = ctx.Process(
+            target=_compile_in_subprocess,
+            args=(result_queue, name, args.target, args.stages == "translate"),
+        )
+        proc.start()
+        results[name] = _wait_for_result(result_queue, proc, args.timeout)
+        proc.join()
+        if "error" in results[name]:
+            print("%s: failed, %s" % (name, results[name]["error"]))
+            continue
+        stages = results[name]["stages"]
+        print(
+            "%s: %.2f s, peak %.0f MB (%s)"
+            % (
+                name,
+                results[name]["total_sec"],
+                results[name]["peak_rss_mb"],
+                ", ".join("%s %.2f s" % (stage, info["sec"]) for stage, info in stages.items()),
+            )
+        )
+
+    report = {
+        "schema_version": SCHEMA_VERSION,
+        "tvm_version": tvm.__version__,
+        "git_commit": tvm.support.libinfo().get("GIT_COMMIT_HASH", ""),
+        "target": str(tvm.target.Target(args.target)),
+        "models": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# Measure how the time of the Relax expression traversals scales with the size of the graph.
+#
+# Two graphs of increasing size are built:
+#   anf     a chain of bindings emitted one by one with BlockBuilder, as for an unrolled model
+#   nested  a single expression made of nested calls, as written by hand or by a frontend
+# For each graph, the time of BlockBuilder normalization, of a mutator pass (ToANF) and of a
+# visitor (post_order_visit) is reported, together with the time per node. The time per node
+# should stay flat as the size grows, i.e. the compile time should be linear in the graph size.
+#
+# Usage:
+#   python expr_functor_scaling.py --sizes 1000,10000,100000
+
+import argparse
+import threading
+import time
+from typing import Callable, Dict, List
+
+import tvm
+from tvm import relax
+
+# The graphs are destroyed recursively by the runtime, so the nested ones need a large stack even
+# though they are traversed with an explicit stack
+STACK_SIZE = 1 << 30
+
+
+def _input() -> relax.Var:
+    return relax.Var("x", [4], relax.DynTensorType(1, "float32"))
+
+
+def _anf(size: int) -> Dict[str, Callable[[], None]]:
+    x = _input()
+
+    def _build():
+        bb = relax.BlockBuilder()
+        with bb.function("main", [x]):
+            with bb.dataflow():
+                out = x
+                for _ in range(size):
+                    out = bb.emit(relax.op.add(out, x))
+                gv = bb.emit_output(out)
+            bb.emit_func_output(gv)
+        return bb.get()
+
+    mod = _build()
+    return {
+        "normalize": _build,
+        "mutator": lambda: relax.transform.ToANF()(mod),
+        "visitor": lambda: relax.analysis.post_order_visit(mod["main"], lambda e: None),
+    }
+
+
+def _nested(size: int) -> Dict[str, Callable[[], None]]:
+    x = _input()
+    body = x
+    for _ in range(size):
+        body = relax.op.add(body, x)
+    gvar = relax.GlobalVar("main")
+    mod = tvm.IRModule({gvar: relax.Function([x], body, None, gvar)})
+
+    def _normalize():
+        bb = relax.BlockBuilder()
+        with bb.function("main", [x]):
+            bb.emit_func_output(bb.emit(body))
+
+    return {
+        "normalize": _normalize,
+        "mutator": lambda: relax.transform.ToANF()(mod),
+        "visitor": lambda: relax.analysis.post_order_visit(body, lambda e: None),
+    }
+
+
+GRAPHS = {"anf": _anf, "nested": _nested}
+
+
+def _measure(sizes: List[int], repeat: int) -> None:
+    for graph, make in GRAPHS.items():
+        for size in sizes:
+            funcs = make(size)
+            times = {}
+            for name, func in funcs.items():
+                elapsed = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    func()
+                    elapsed.append(time.perf_counter() - start)
+                times[name] = min(elapsed)
+            print(
+                "%-6s %8d nodes: %s"
+                % (
+                    graph,
+                    size,
+                    ", ".join(
+                        "%s %.3f s (%.2f us/node)" % (name, sec, sec / size * 1e6)
+                        for name, sec in times.items()
+                    ),
+                )
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling of the Relax expression traversals")
+    parser.add_argument("--sizes", default="1000,4000,16000,64000", help="comma separated sizes")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    threading.stack_size(STACK_SIZE)
+    thread = threading.Thread(target=_measure, args=(sizes, args.repeat))
+    thread.start()
+    thread.join()
+
+
+if __name__ == "__main__":
+    main()
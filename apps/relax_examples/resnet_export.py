@@ -0,0 +1,54 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# Export ResNet-50 as a single shared library and measure the cold start of the artifact
+
+import os
+import time
+
+import tvm
+from tvm.contrib import utils
+from tvm.relay import testing
+from tvm import relax
+from tvm.relax.testing import relay_translator, nn
+import numpy as np
+
+if __name__ == "__main__":
+    relay_mod, _ = testing.resnet.get_workload(num_layers=50, batch_size=1, dtype="float32")
+    relax_mod = relay_translator.from_relay(relay_mod["main"])
+    target = tvm.target.Target("llvm", host="llvm")
+    ex, lib = relax.vm.build(relax_mod, target)
+
+    temp = utils.tempdir()
+    path = temp.relpath("resnet50.so")
+    ex.export_library(lib, path)
+    print("artifact size: %.2f MB" % (os.path.getsize(path) / 1024 / 1024))
+
+    data = tvm.nd.array(np.random.rand(1, 3, 224, 224).astype(np.float32))
+    params = nn.init_params(relax_mod)
+
+    start = time.perf_counter()
+    loaded = tvm.runtime.load_module(path)
+    load_time = time.perf_counter() - start
+    vm = relax.VirtualMachine(loaded, tvm.cpu())
+    init_time = time.perf_counter() - start - load_time
+    vm["main"](data, *params)
+    first_run_time = time.perf_counter() - start - load_time - init_time
+
+    print("load_module: %.2f ms" % (load_time * 1e3))
+    print("VirtualMachine creation, including deserialization: %.2f ms" % (init_time * 1e3))
+    print("first inference: %.2f ms" % (first_run_time * 1e3))
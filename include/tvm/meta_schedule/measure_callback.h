@@ -129,6 +129,21 @@ class MeasureCallback : public runtime::ObjectRef {
    * \return The measure callback created.
    */
   TVM_DLL static MeasureCallback UpdateCostModel();
+  /*!
+   * \brief Create a measure callback that stops tuning once the wall-clock budget is used up.
+   * \param max_time_sec The wall-clock budget in seconds, counted from the first invocation.
+   * \return The measure callback created.
+   * \note The tasks whose measurement is in flight are stopped once their results are collected.
+   */
+  TVM_DLL static MeasureCallback TimeBudget(double max_time_sec);
+  /*!
+   * \brief Create a measure callback that stops a task once its best latency converges.
+   * \param num_rounds The number of consecutive rounds without improvement before stopping.
+   * \param min_improvement The minimal relative reduction of the best latency that counts as an
+   * improvement.
+   * \return The measure callback created.
+   */
+  TVM_DLL static MeasureCallback StopOnConvergence(int num_rounds, double min_improvement);
   /*!
    * \brief Create a measure callback with customized methods on the python-side.
    * \param f_apply The packed function of `Apply`.
@@ -274,6 +274,8 @@ class SearchStrategy : public runtime::ObjectRef {
    * \param genetic_mutate_prob The probability of mutation.
    * \param genetic_max_fail_count The maximum number to try evolving the given trace.
    * \param eps_greedy The ratio to select samples in a greedy fashion via their predicted score.
+   * \param cross_task_seed_ratio The ratio of the initial population seeded from the best measured
+   * traces of other tasks with the same block structure. Zero disables cross-task seeding.
    */
   TVM_DLL static SearchStrategy EvolutionarySearch(int num_trials_per_iter,     //
                                                    int num_trials_total,        //
@@ -283,7 +285,8 @@ class SearchStrategy : public runtime::ObjectRef {
                                                    int genetic_num_iters,       //
                                                    double genetic_mutate_prob,  //
                                                    int genetic_max_fail_count,  //
-                                                   double eps_greedy);
+                                                   double eps_greedy,           //
+                                                   double cross_task_seed_ratio);
 
   TVM_DEFINE_MUTABLE_OBJECT_REF_METHODS(SearchStrategy, ObjectRef, SearchStrategyNode);
 };
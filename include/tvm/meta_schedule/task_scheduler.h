@@ -259,6 +259,32 @@ class TaskScheduler : public runtime::ObjectRef {
                                           Database database,               //
                                           Optional<CostModel> cost_model,  //
                                           Optional<Array<MeasureCallback>> measure_callbacks);
+  /*!
+   * \brief Create a task scheduler that allocates trials to the tasks by the estimated latency
+   * improvement of the whole workload per trial.
+   * \param tasks The tasks to be tuned.
+   * \param task_weights The weights of the tasks, i.e. how many times each of them occurs.
+   * \param builder The builder of the scheduler.
+   * \param runner The runner of the scheduler.
+   * \param database The database of the scheduler.
+   * \param cost_model The cost model of the scheduler.
+   * \param measure_callbacks The measure callbacks of the scheduler.
+   * \param alpha The weight of the backward gradient against the forward one.
+   * \param window_size The number of rounds the backward gradient looks back.
+   * \param early_stopping_rounds The number of rounds without improvement after which a task is
+   * stopped, or -1 to never stop a task early.
+   * \return The task scheduler created.
+   */
+  TVM_DLL static TaskScheduler GradientBased(Array<TuneContext> tasks,                            //
+                                             Array<FloatImm> task_weights,                        //
+                                             Builder builder,                                     //
+                                             Runner runner,                                       //
+                                             Database database,                                   //
+                                             Optional<CostModel> cost_model,                      //
+                                             Optional<Array<MeasureCallback>> measure_callbacks,  //
+                                             double alpha,                                        //
+                                             int window_size,                                     //
+                                             int early_stopping_rounds);
   /*!
    * \brief Create a task scheduler with customized methods on the python-side.
    * \param tasks The tasks to be tuned.
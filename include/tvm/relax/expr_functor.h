@@ -37,6 +37,7 @@
 #include <deque>
 #include <string>
 #include <unordered_map>
+#include <unordered_set>
 #include <utility>
 #include <vector>
 namespace tvm {
@@ -139,6 +140,10 @@ class ExprFunctor<R(const Expr& n, Args...)> {
 /*!
  * \brief A simple visitor wrapper around ExprFunctor.
  *  Recursively visit the content.
+ *
+ * Nested dataflow expressions, i.e. chains of Call, Tuple and TupleGetItem, are expanded with an
+ * explicit stack instead of recursion, so that deeply nested expressions do not overflow the
+ * stack. Within such an expansion every node is visited once, in post-order.
  */
 class ExprVisitor : public ExprFunctor<void(const Expr&)> {
  public:
@@ -192,6 +197,20 @@ class ExprVisitor : public ExprFunctor<void(const Expr&)> {
 
   virtual void VisitType(const Type& t);
   virtual void VisitSpan(const Span& span);
+
+ protected:
+  /*!
+   * \brief Visit the nested dataflow nodes of an expression in post-order with an explicit stack,
+   *  then the expression itself.
+   * \param expr The expr to be visited.
+   */
+  void ExpandDataflow(const Expr& expr);
+
+  /*!
+   * \brief The nodes already visited by the current dataflow expansion. Subclasses overriding
+   *  VisitExpr can check it to skip the nodes visited again by their parents.
+   */
+  std::unordered_set<const Object*> visited_;
 };
 
 void PostOrderVisit(const Expr& node, std::function<void(const Expr&)> fvisit);
@@ -202,6 +221,10 @@ void PostOrderVisit(const Expr& node, std::function<void(const Expr&)> fvisit);
  * ExprMutator treats Expr as dataflow graph, and only Mutate each Expr once.
  * The mutated results are memoized in a map and reused so that
  * local transformation on the dataflow preserves the graph structure.
+ *
+ * Nested dataflow expressions, i.e. chains of Call, Tuple and TupleGetItem, are expanded with an
+ * explicit stack instead of recursion: their nodes are rewritten in post-order and memoized, so
+ * that the rewrite of each node finds the rewritten children in the memo.
  */
 class ExprMutator : public ExprFunctor<Expr(const Expr&)> {
  public:
@@ -296,9 +319,20 @@ class ExprMutator : public ExprFunctor<Expr(const Expr&)> {
    */
   Var WithShapeAndType(Var var, Optional<ObjectRef> shape, Type type);
 
+  /*!
+   * \brief Rewrite the nested dataflow nodes of an expression in post-order with an explicit
+   *  stack, then the expression itself.
+   * \param expr The expr to be rewritten.
+   * \return The expr after rewriting.
+   */
+  Expr ExpandDataflow(const Expr& expr);
+
   /*! \brief Internal block builder to emit bindings during rewriting. */
   BlockBuilder builder_;
 
+  /*! \brief The rewritten nodes of the current dataflow expansion. */
+  std::unordered_map<const Object*, Expr> memo_;
+
   /*! \brief Remap a var to a new var in use-site. */
   std::unordered_map<Id, Var, ObjectPtrHash, ObjectPtrEqual> var_remap_;
 };
@@ -25,6 +25,7 @@
 #define TVM_RELAX_TRANSFORM_H_
 
 #include <tvm/ir/transform.h>
+#include <tvm/meta_schedule/cost_model.h>
 #include <tvm/meta_schedule/integration.h>
 #include <tvm/relax/expr.h>
 
@@ -79,13 +80,34 @@ TVM_DLL Pass CallTIRRewrite();
  */
 TVM_DLL Pass ToANF();
 
+/*!
+ * \brief Convert the float32 tensors computed by PrimFuncs to float16 or bfloat16. The converted
+ * PrimFuncs keep computing and accumulating in float32, and casts are inserted where the tensors
+ * are passed to the calls which stay in float32. The parameters and the results of the Relax
+ * functions stay in float32.
+ *
+ * \param dtype The lower precision dtype, float16 or bfloat16.
+ * \param exclude The names of the PrimFuncs which stay in float32, ignoring numeric suffixes. If
+ * it is not defined, numerically sensitive PrimFuncs like softmax and exp are excluded.
+ * \return The Pass.
+ */
+TVM_DLL Pass ToMixedPrecision(DataType dtype, Optional<Array<String>> exclude = NullOpt);
+
 /*!
  * \brief Apply the best schedule from tuning database.
  *
+ * \param database The tuning database.
+ * \param target The target of the schedules.
+ * \param fallback Whether to schedule the PrimFuncs missing from the database with a default
+ * schedule sampled from the design space, without any measurement.
+ * \param cost_model The cost model to pick the fallback schedule among the samples. If it is not
+ * defined, the first valid sample is picked.
  * \return The Pass.
  */
 TVM_DLL Pass MetaScheduleApplyHistoryBest(const tvm::meta_schedule::Database& database,
-                                          Target target);
+                                          Target target, bool fallback = false,
+                                          Optional<tvm::meta_schedule::CostModel> cost_model =
+                                              NullOpt);
 
 }  // namespace transform
 }  // namespace relax
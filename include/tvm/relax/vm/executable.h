@@ -97,6 +97,11 @@ class ExecutableNode : public Object {
    * \param stream The binary stream that load the executable from.
    */
   static Executable LoadFromBinary(void* stream);
+  /*!
+   * \brief Load Executable from its serialized content.
+   * \param code The serialized content, as written by SaveToBinary.
+   */
+  static Executable LoadFromBytes(std::string code);
   /*!
    * \brief Write the Executable to the provided path as a file contianing its serialized content.
    * \param path The path to write the serialized data to.
@@ -25,6 +25,8 @@
 #define TVM_RELAX_VM_VM_H_
 
 #include <string>
+#include <unordered_map>
+#include <utility>
 #include <vector>
 
 #include "./bytecode.h"
@@ -70,6 +72,55 @@ struct VMState {
   runtime::Module mod_;
 };
 
+/*!
+ * \brief A call recorded by the virtual machine in the record-and-replay mode.
+ */
+struct RecordedCall {
+  /*! \brief Where an argument of the call comes from. */
+  enum ArgSource : int {
+    /*! \brief A constant, an immediate or the VM state, recorded as is. */
+    kConstant = 0,
+    /*! \brief An input of the function. */
+    kInput = 1,
+    /*! \brief The result of an earlier recorded call. */
+    kCallResult = 2,
+  };
+  /*! \brief The resolved function. */
+  PackedFunc func;
+  /*! \brief Whether the call only allocates memory or computes shapes, and is skipped on replay. */
+  bool elided;
+  /*! \brief The source of each argument. */
+  std::vector<ArgSource> arg_sources;
+  /*! \brief The input index or the call index of each argument, unused for constants. */
+  std::vector<Index> arg_indices;
+  /*! \brief The argument values, of which only the constants are kept between replays. */
+  std::vector<TVMValue> values;
+  /*! \brief The argument type codes. */
+  std::vector<int> tcodes;
+};
+
+/*!
+ * \brief The calls made by a function when it is invoked with inputs of a given signature.
+ */
+struct Recording {
+  /*! \brief The devices, dtypes and shapes of the input tensors. */
+  std::vector<int64_t> signature;
+  /*! \brief Whether the function can be replayed, which is not the case with control flow. */
+  bool replayable{true};
+  /*! \brief The recorded calls, in the order they are made. */
+  std::vector<RecordedCall> calls;
+  /*! \brief The results of the calls. The results of the elided calls are reused on replay. */
+  std::vector<RegType> results;
+  /*! \brief The source and the index of the value in each register, only used when recording. */
+  std::vector<std::pair<RecordedCall::ArgSource, Index>> reg_sources;
+  /*! \brief The source of the return value. */
+  RecordedCall::ArgSource ret_source{RecordedCall::kConstant};
+  /*! \brief The input index or the call index of the return value. */
+  Index ret_index{-1};
+  /*! \brief The return value when it is a constant. */
+  RegType ret_value;
+};
+
 /*!
  * \brief The virtual machine.
  *
@@ -95,6 +146,17 @@ class VirtualMachine : public runtime::ModuleNode {
    * \param mod The library module.
    */
   void Load(Executable exec, runtime::Module mod);
+  /*!
+   * \brief Enable or disable the record-and-replay mode.
+   *
+   * In this mode, the first invocation of a function with a given signature of input shapes
+   * records the resolved PackedFuncs and their arguments. Later invocations with the same
+   * signature replay the recorded calls directly, skipping the allocations and the shape
+   * computations and reusing the same buffers. A different signature records again.
+   *
+   * \param enabled Whether to enable the mode.
+   */
+  void SetRecordReplay(bool enabled);
   /*!
    * \brief Get a PackedFunc from module.
    *
@@ -149,6 +211,32 @@ class VirtualMachine : public runtime::ModuleNode {
    * \return The object representing the result.
    */
   RegType Invoke(Index fidx, const std::vector<RegType>& args);
+  /*!
+   * \brief Invoke a VM function in the record-and-replay mode.
+   * \param fidx The function index.
+   * \param args The arguments to the function.
+   * \return The object representing the result.
+   */
+  RegType InvokeRecordReplay(Index fidx, TVMArgs args);
+  /*!
+   * \brief Replay the calls recorded for a function.
+   * \param recording The recording to replay.
+   * \param args The arguments to the function.
+   * \return The object representing the result.
+   */
+  RegType Replay(Recording* recording, TVMArgs args);
+  /*!
+   * \brief Record a call made by the dispatch loop.
+   * \param instr The call instruction.
+   * \param func_name The name of the function.
+   * \param func The resolved function.
+   * \param values The argument values.
+   * \param tcodes The argument type codes.
+   * \param ret The result of the call.
+   */
+  void RecordCall(const Instruction& instr, const std::string& func_name, const PackedFunc& func,
+                  const std::vector<TVMValue>& values, const std::vector<int>& tcodes,
+                  const RegType& ret);
   /*! \brief Run VM dispatch loop. */
   void RunLoop();
 
@@ -163,6 +251,12 @@ class VirtualMachine : public runtime::ModuleNode {
   RegType return_value_;
   /*! \brief The devices. */
   std::vector<Device> devices_;
+  /*! \brief Whether the record-and-replay mode is enabled. */
+  bool record_replay_{false};
+  /*! \brief The latest recording of each function. */
+  std::unordered_map<Index, Recording> recordings_;
+  /*! \brief The recording in progress, or nullptr. */
+  Recording* recording_{nullptr};
 };
 
 }  // namespace relax_vm
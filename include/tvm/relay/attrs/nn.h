@@ -1136,6 +1136,17 @@ struct SparseDenseAttrs : public tvm::AttrsNode<SparseDenseAttrs> {
   }
 };
 
+/*! \brief Attributes for sparse_dense_nm operator */
+struct SparseDenseNMAttrs : public tvm::AttrsNode<SparseDenseNMAttrs> {
+  int n;
+  int m;
+
+  TVM_DECLARE_ATTRS(SparseDenseNMAttrs, "relay.attrs.SparseDenseNMAttrs") {
+    TVM_ATTR_FIELD(n).describe("The maximum number of nonzeros in each group of the weight.");
+    TVM_ATTR_FIELD(m).describe("The number of consecutive values in each group of the weight.");
+  }
+};
+
 /*! \brief Attributes for sparse_transpose operator */
 struct SparseTransposeAttrs : public tvm::AttrsNode<SparseTransposeAttrs> {
   TVM_DECLARE_ATTRS(SparseTransposeAttrs, "relay.attrs.SparseTransposeAttrs") {}
@@ -1157,6 +1168,17 @@ struct SparseConv2DAttrs : public tvm::AttrsNode<SparseConv2DAttrs> {
   }
 };
 
+/*! \brief Attributes for sddmm operator */
+struct SDDMMAttrs : public tvm::AttrsNode<SDDMMAttrs> {
+  Array<IndexExpr> block_size;
+
+  TVM_DECLARE_ATTRS(SDDMMAttrs, "relay.attrs.SDDMMAttrs") {
+    TVM_ATTR_FIELD(block_size)
+        .set_default(Array<IndexExpr>{1, 1})
+        .describe("Block size (bs_r, bs_c) of the BSR output mask, (1, 1) for CSR.");
+  }
+};
+
 /*! \brief Attributes for FIFO buffer operator */
 struct FIFOBufferAttrs : public tvm::AttrsNode<FIFOBufferAttrs> {
   int axis;
@@ -314,6 +314,15 @@ class PopenPoolExecutor:
             raise TypeError("initializer must be callable for PopenPoolExecutor")
 
     def __del__(self):
+        self.shutdown()
+
+    def shutdown(self):
+        """Kill the worker processes and shut down the internal thread pool.
+
+        Note
+        ----
+        The executor cannot submit new jobs after it is shut down.
+        """
         self._lock.acquire()
         for worker in self._worker_map.values():
             try:
@@ -17,7 +17,9 @@
 """
 XGBoost-based cost model
 """
+import hashlib
 from itertools import chain as itertools_chain
+import json
 import logging
 import os
 import tempfile
@@ -26,7 +28,10 @@ from typing import Any, Callable, Dict, List, NamedTuple, Optional, TYPE_CHECKIN
 import numpy as np  # type: ignore
 
 from ...contrib.tar import tar, untar
+from ...target import Target
+from ...tir import Schedule
 from ..cost_model import PyCostModel
+from ..database import Database, TuningRecord
 from ..feature_extractor import FeatureExtractor
 from ..runner import RunnerResult
 from ..search_strategy import MeasureCandidate
@@ -42,7 +47,7 @@ logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
 
 def make_metric_sorter(focused_metric):
-    """ Make sure the focused metric is the first one. """
+    """Make sure the focused metric is the first one."""
 
     def metric_name_for_sort(name):
         if focused_metric == name:
@@ -370,6 +375,98 @@ class XGBModel(PyCostModel):
             )
             logger.info("Saved XGBModel to %s", path)
 
+    def warm_start(
+        self,
+        database: Database,
+        *,
+        feature_cache_path: Optional[str] = None,
+        batch_size: int = 512,
+        num_threads: Optional[int] = None,
+    ) -> int:
+        """Bootstrap the training data with all the tuning records of a database, and train.
+
+        Parameters
+        ----------
+        database : Database
+            The database to load the tuning records from, e.g. the logs of earlier runs on
+            similar workloads.
+        feature_cache_path : Optional[str]
+            The `.npz` file caching the features extracted from each record, keyed by the hash
+            of the workload, the target and the trace. Only the records missing from the cache
+            are replayed and featurized, and the new features are written back to it.
+        batch_size : int
+            The number of records featurized in one batch.
+        num_threads : Optional[int]
+            The number of threads to extract the features of a batch with.
+            Default is None, which means to use all the cores.
+
+        Returns
+        -------
+        num_records : int
+            The number of records added to the training data.
+        """
+        from ..tune_context import TuneContext  # pylint: disable=import-outside-toplevel
+
+        cache: Dict[str, np.ndarray] = {}
+        if feature_cache_path is not None and os.path.exists(feature_cache_path):
+            with np.load(feature_cache_path) as cached:
+                cache = {key: cached[key] for key in cached.files}
+        num_cached = len(cache)
+        # group the records missing from the cache by target, as features depend on it
+        keys: List[str] = []
+        costs: List[float] = []
+        missing: Dict[str, List[Tuple[str, TuningRecord]]] = {}
+        missing_keys = set()
+        for record in database.get_all_tuning_records():
+            target = str(record.target)
+            key = _record_key(record, target)
+            if key not in cache and key not in missing_keys:
+                missing_keys.add(key)
+                missing.setdefault(target, []).append((key, record))
+            keys.append(key)
+            costs.append(_mean_cost(record.run_secs))
+        for target, records in missing.items():
+            context = TuneContext(target=Target(target), num_threads=num_threads)
+            for i in range(0, len(records), batch_size):
+                batch_keys, candidates = [], []
+                for key, record in records[i : i + batch_size]:
+                    sch = Schedule(record.workload.mod)
+                    try:
+                        record.trace.apply_to_schedule(sch, remove_postproc=False)
+                    except Exception:  # pylint: disable=broad-except
+                        logger.warning("Skipping a tuning record whose trace fails to replay")
+                        continue
+                    batch_keys.append(key)
+                    candidates.append(MeasureCandidate(sch, record.args_info))
+                features = self.extractor.extract_from(context, candidates)
+                for key, feature in zip(batch_keys, features):
+                    cache[key] = feature.numpy().astype("float32")
+        if feature_cache_path is not None and len(cache) > num_cached:
+            np.savez(feature_cache_path, **cache)
+        new_features, new_mean_costs = [], []
+        for key, cost in zip(keys, costs):
+            if key in cache:
+                new_features.append(cache[key])
+                new_mean_costs.append(cost)
+        logger.info(
+            "XGBModel warm start: %d records, %d featurized, %d from cache",
+            len(new_features),
+            len(cache) - num_cached,
+            len(new_features) - (len(cache) - num_cached),
+        )
+        if not new_features:
+            return 0
+        self.cached_features.extend(new_features)
+        self.cached_mean_costs = np.append(
+            self.cached_mean_costs, np.asarray(new_mean_costs, dtype="float32")
+        )
+        self._set_cached_normalizer()
+        self._train(
+            xs=self.cached_features,
+            ys=self.cached_mean_costs,
+        )
+        return len(new_features)
+
     def update(
         self,
         context: "TuneContext",
@@ -391,17 +488,11 @@ class XGBModel(PyCostModel):
         if len(candidates) == 0:
             return
         # extract feature and do validation
-
-        def _mean_cost(x: RunnerResult) -> float:
-            if not x.run_secs:
-                return 1e10
-            return float(np.median([float(s) for s in x.run_secs]))
-
         new_features = [
             x.numpy().astype("float32") for x in self.extractor.extract_from(context, candidates)
         ]
         new_mean_costs = np.asarray(
-            [_mean_cost(x) for x in results],
+            [_mean_cost(x.run_secs) for x in results],
             dtype="float32",
         )
         if self.booster is not None and self.cached_normalizer is not None:
@@ -558,6 +649,20 @@ class XGBModel(PyCostModel):
             assert self.cached_normalizer > 0
 
 
+def _mean_cost(run_secs: Optional[List[Any]]) -> float:
+    """The cost of a measurement as trained on, 1e10 for a failed one"""
+    if not run_secs:
+        return 1e10
+    return float(np.median([float(s) for s in run_secs]))
+
+
+def _record_key(record: TuningRecord, target: str) -> str:
+    """The key of the features of a tuning record in the feature cache"""
+    workload_shash = record.workload.as_json()[0]
+    trace = json.dumps(record.trace.as_json(remove_postproc=False))
+    return hashlib.sha256(f"{workload_shash}|{target}|{trace}".encode("utf-8")).hexdigest()
+
+
 def custom_callback(
     early_stopping_rounds: int,
     verbose_eval: int,
@@ -19,4 +19,5 @@ The tvm.meta_schedule.database package.
 The database that stores serialized tuning records and workloads
 """
 from .database import Database, PyDatabase, TuningRecord, Workload
-from .json_database import JSONDatabase
+from .json_database import JSONDatabase, compact_json_database
+from .sqlite_database import SQLiteDatabase
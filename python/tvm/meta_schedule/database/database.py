@@ -202,6 +202,16 @@ class Database(Object):
         """
         return _ffi_api.DatabaseGetTopK(self, workload, top_k)  # type: ignore # pylint: disable=no-member
 
+    def get_all_tuning_records(self) -> List[TuningRecord]:
+        """Get all the tuning records from the database.
+
+        Returns
+        -------
+        tuning_records : List[TuningRecord]
+            All the tuning records in the database.
+        """
+        return _ffi_api.DatabaseGetAllTuningRecords(self)  # type: ignore # pylint: disable=no-member
+
     def __len__(self) -> int:
         """Get the number of records in the database.
 
@@ -236,6 +246,10 @@ class PyDatabase(Database):
         def f_get_top_k(workload: Workload, top_k: int) -> List[TuningRecord]:
             return self.get_top_k(workload, top_k)
 
+        @check_override(self.__class__, Database, required=False)
+        def f_get_all_tuning_records() -> List[TuningRecord]:
+            return self.get_all_tuning_records()
+
         @check_override(self.__class__, Database, func_name="__len__")
         def f_size() -> int:
             return len(self)
@@ -246,5 +260,6 @@ class PyDatabase(Database):
             f_commit_workload,
             f_commit_tuning_record,
             f_get_top_k,
+            f_get_all_tuning_records,
             f_size,
         )
@@ -15,6 +15,11 @@
 # specific language governing permissions and limitations
 # under the License.
 """The default database that uses a JSON File to store tuning records"""
+import heapq
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
 from tvm._ffi import register_object
 
 from .. import _ffi_api
@@ -31,16 +36,20 @@ class JSONDatabase(Database):
         The path to the workload table.
     path_tuning_record : str
         The path to the tuning record table.
+    max_records_per_workload : int
+        The max number of best records kept in memory for each workload, -1 for unlimited.
     """
 
     path_workload: str
     path_tuning_record: str
+    max_records_per_workload: int
 
     def __init__(
         self,
         path_workload: str,
         path_tuning_record: str,
         allow_missing: bool = True,
+        max_records_per_workload: int = -1,
     ) -> None:
         """Constructor.
 
@@ -52,10 +61,104 @@ class JSONDatabase(Database):
             The path to the tuning record table.
         allow_missing : bool
             Whether to create new file when the given path is not found.
+        max_records_per_workload : int
+            The max number of best records kept in memory for each workload, -1 for unlimited.
+            The record table is loaded in chunks of lines, so that the records beyond the limit
+            are dropped as they are read. The size of the database only counts the records kept.
         """
         self.__init_handle_by_constructor__(
             _ffi_api.DatabaseJSONDatabase,  # type: ignore # pylint: disable=no-member
             path_workload,
             path_tuning_record,
             allow_missing,
+            max_records_per_workload,
         )
+
+
+def _is_json_line(line: str) -> bool:
+    line = line.strip()
+    return bool(line) and not line.startswith("#") and not line.startswith("//")
+
+
+def _mean_run_secs(run_secs: List[float]) -> float:
+    if not run_secs:
+        return 1e10  # keep in sync with `SortTuningRecordByMeanRunSecs::kMaxMeanTime`
+    return sum(run_secs) / len(run_secs)
+
+
+def compact_json_database(
+    path_workload: str,
+    path_tuning_record: str,
+    top_k: int,
+    output_path_workload: Optional[str] = None,
+    output_path_tuning_record: Optional[str] = None,
+) -> Tuple[int, int]:
+    """Rewrite the tables of a JSONDatabase, keeping only the best `top_k` records per workload.
+
+    The record table is streamed, so memory is bounded by the kept records. Workloads without
+    any record left are dropped and the remaining ones are re-indexed. This is a pure file
+    operation which does not need the tuned modules to be deserialized.
+
+    Parameters
+    ----------
+    path_workload : str
+        The path to the workload table.
+    path_tuning_record : str
+        The path to the tuning record table.
+    top_k : int
+        The number of best records to keep for each workload.
+    output_path_workload : Optional[str]
+        The path to write the compacted workload table, defaults to `path_workload`.
+    output_path_tuning_record : Optional[str]
+        The path to write the compacted record table, defaults to `path_tuning_record`.
+
+    Returns
+    -------
+    num_records : Tuple[int, int]
+        The number of records before and after the compaction.
+    """
+    if top_k <= 0:
+        raise ValueError(f"Expected `top_k` to be positive, but gets: {top_k}")
+    if output_path_workload is None:
+        output_path_workload = path_workload
+    if output_path_tuning_record is None:
+        output_path_tuning_record = path_tuning_record
+
+    with open(path_workload, "r", encoding="utf-8") as i_f:
+        workloads = [line.strip() for line in i_f if _is_json_line(line)]
+
+    num_records = 0
+    # workload index => max-heap (by negated mean run seconds) of the best records so far
+    best: Dict[int, List[Tuple[float, int, str]]] = {}
+    with open(path_tuning_record, "r", encoding="utf-8") as i_f:
+        for line in i_f:
+            if not _is_json_line(line):
+                continue
+            workload_index, record = json.loads(line)
+            item = (-_mean_run_secs(record[1]), num_records, json.dumps(record))
+            num_records += 1
+            heap = best.setdefault(workload_index, [])
+            if len(heap) < top_k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+
+    new_workloads: List[str] = []
+    new_records: List[str] = []
+    for workload_index, workload in enumerate(workloads):
+        if workload_index not in best:
+            continue
+        for _, _, record in sorted(best[workload_index], key=lambda x: (-x[0], x[1])):
+            new_records.append(f"[{len(new_workloads)}, {record}]")
+        new_workloads.append(workload)
+
+    for path, lines in [
+        (output_path_workload, new_workloads),
+        (output_path_tuning_record, new_records),
+    ]:
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as o_f:
+            for line in lines:
+                o_f.write(line + "\n")
+        os.replace(tmp_path, path)
+    return num_records, len(new_records)
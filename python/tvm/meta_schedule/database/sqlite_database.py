@@ -0,0 +1,292 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""A database that stores tuning records in a SQLite file, safe for concurrent writers"""
+import json
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from tvm.ir import IRModule, structural_equal
+
+from ..utils import structural_hash
+from .database import PyDatabase, TuningRecord, Workload
+from .json_database import _is_json_line, _mean_run_secs
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workload (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    shash TEXT NOT NULL,
+    json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS workload_by_shash ON workload (shash);
+CREATE TABLE IF NOT EXISTS tuning_record (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    workload_id INTEGER NOT NULL REFERENCES workload (id),
+    mean_run_secs REAL NOT NULL,
+    json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tuning_record_by_workload_mean
+    ON tuning_record (workload_id, mean_run_secs);
+"""
+
+
+class SQLiteDatabase(PyDatabase):
+    """A database backed by a single SQLite file.
+
+    Workloads are keyed by their structural hash and tuning records are indexed by
+    (workload, mean run seconds), so `get_top_k` does not scan the other records. The file
+    runs in write-ahead-log mode and every write is a short immediate transaction, so several
+    tuning processes, possibly on different machines sharing a file system with working POSIX
+    locks, can commit to the same database concurrently.
+
+    Parameters
+    ----------
+    path : str
+        The path to the SQLite file, created if missing.
+    timeout : float
+        The seconds to wait for the lock held by another writer before failing.
+    """
+
+    path: str
+
+    def __init__(self, path: str, timeout: float = 60.0) -> None:
+        super().__init__()
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        # workload id => workload, and structural hash => [workload id], for the workloads seen
+        self._workloads: Dict[int, Workload] = {}
+        self._ids_by_shash: Dict[str, List[int]] = {}
+        # workload object => workload id
+        self._workload_ids: Dict[Workload, int] = {}
+
+    def _cache_workload(self, workload_id: int, workload: Workload, shash: str) -> None:
+        if workload_id not in self._workloads:
+            self._workloads[workload_id] = workload
+            self._ids_by_shash.setdefault(shash, []).append(workload_id)
+        self._workload_ids[workload] = workload_id
+
+    def _find_workload(self, mod: IRModule, shash: str) -> Optional[Tuple[int, Workload]]:
+        for workload_id in self._ids_by_shash.get(shash, []):
+            workload = self._workloads[workload_id]
+            if structural_equal(workload.mod, mod):
+                return workload_id, workload
+        # look up the workloads committed by other writers
+        rows = self._conn.execute("SELECT id, json FROM workload WHERE shash = ?", (shash,))
+        for workload_id, workload_json in rows.fetchall():
+            if workload_id in self._workloads:
+                continue
+            workload = Workload.from_json(json.loads(workload_json))
+            self._cache_workload(workload_id, workload, shash)
+            if structural_equal(workload.mod, mod):
+                return workload_id, workload
+        return None
+
+    def _workload_id(self, workload: Workload) -> int:
+        workload_id = self._workload_ids.get(workload, None)
+        if workload_id is None:
+            workload_id = self._commit_workload(workload.mod)[0]
+            self._workload_ids[workload] = workload_id
+        return workload_id
+
+    def _commit_workload(self, mod: IRModule) -> Tuple[int, Workload]:
+        shash = structural_hash(mod)
+        found = self._find_workload(mod, shash)
+        if found is not None:
+            return found
+        # take the write lock before checking again, so that concurrent writers
+        # committing the same workload end up with a single row
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            found = self._find_workload(mod, shash)
+            if found is None:
+                workload = Workload(mod)
+                cursor = self._conn.execute(
+                    "INSERT INTO workload (shash, json) VALUES (?, ?)",
+                    (shash, json.dumps(workload.as_json())),
+                )
+                found = (cursor.lastrowid, workload)
+                self._cache_workload(cursor.lastrowid, workload, shash)
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        return found
+
+    def has_workload(self, mod: IRModule) -> bool:
+        with self._lock:
+            return self._find_workload(mod, structural_hash(mod)) is not None
+
+    def commit_workload(self, mod: IRModule) -> Workload:
+        with self._lock:
+            return self._commit_workload(mod)[1]
+
+    def commit_tuning_record(self, record: TuningRecord) -> None:
+        with self._lock:
+            workload_id = self._workload_id(record.workload)
+            self._conn.execute(
+                "INSERT INTO tuning_record (workload_id, mean_run_secs, json) VALUES (?, ?, ?)",
+                (
+                    workload_id,
+                    _mean_run_secs([float(x) for x in record.run_secs]),
+                    json.dumps(record.as_json()),
+                ),
+            )
+
+    def get_top_k(self, workload: Workload, top_k: int) -> List[TuningRecord]:
+        if top_k < 0:
+            raise ValueError(f"Expected `top_k` to be non-negative, but gets: {top_k}")
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT json FROM tuning_record WHERE workload_id = ? "
+                "ORDER BY mean_run_secs, id LIMIT ?",
+                (self._workload_id(workload), int(top_k)),
+            ).fetchall()
+        return [
+            TuningRecord.from_json(json.loads(record_json), workload) for (record_json,) in rows
+        ]
+
+    def get_all_tuning_records(self) -> List[TuningRecord]:
+        with self._lock:
+            # a read transaction gives a consistent snapshot while other writers commit
+            self._conn.execute("BEGIN")
+            try:
+                for workload_id, shash, workload_json in self._conn.execute(
+                    "SELECT id, shash, json FROM workload"
+                ).fetchall():
+                    if workload_id not in self._workloads:
+                        workload = Workload.from_json(json.loads(workload_json))
+                        self._cache_workload(workload_id, workload, shash)
+                rows = self._conn.execute(
+                    "SELECT workload_id, json FROM tuning_record ORDER BY id"
+                ).fetchall()
+            finally:
+                self._conn.execute("COMMIT")
+        return [
+            TuningRecord.from_json(json.loads(record_json), self._workloads[workload_id])
+            for workload_id, record_json in rows
+        ]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM tuning_record").fetchone()[0]
+
+    def import_json(self, path_workload: str, path_tuning_record: str) -> int:
+        """Import the tables of a JSONDatabase in a single transaction.
+
+        Workloads already in the database, with the same structural hash and serialization,
+        are reused.
+
+        Parameters
+        ----------
+        path_workload : str
+            The path to the workload table.
+        path_tuning_record : str
+            The path to the tuning record table.
+
+        Returns
+        -------
+        num_records : int
+            The number of imported tuning records.
+        """
+        with open(path_workload, "r", encoding="utf-8") as i_f:
+            workloads = [json.loads(line) for line in i_f if _is_json_line(line)]
+        num_records = 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                workload_ids = []
+                for workload_json in workloads:
+                    workload_str = json.dumps(workload_json)
+                    row = self._conn.execute(
+                        "SELECT id FROM workload WHERE shash = ? AND json = ?",
+                        (workload_json[0], workload_str),
+                    ).fetchone()
+                    if row is None:
+                        row = (
+                            self._conn.execute(
+                                "INSERT INTO workload (shash, json) VALUES (?, ?)",
+                                (workload_json[0], workload_str),
+                            ).lastrowid,
+                        )
+                    workload_ids.append(row[0])
+                with open(path_tuning_record, "r", encoding="utf-8") as i_f:
+                    for line in i_f:
+                        if not _is_json_line(line):
+                            continue
+                        workload_index, record_json = json.loads(line)
+                        self._conn.execute(
+                            "INSERT INTO tuning_record (workload_id, mean_run_secs, json) "
+                            "VALUES (?, ?, ?)",
+                            (
+                                workload_ids[workload_index],
+                                _mean_run_secs(record_json[1]),
+                                json.dumps(record_json),
+                            ),
+                        )
+                        num_records += 1
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return num_records
+
+    def export_json(self, path_workload: str, path_tuning_record: str) -> int:
+        """Export the database to the two tables of a JSONDatabase.
+
+        Parameters
+        ----------
+        path_workload : str
+            The path to write the workload table.
+        path_tuning_record : str
+            The path to write the tuning record table.
+
+        Returns
+        -------
+        num_records : int
+            The number of exported tuning records.
+        """
+        num_records = 0
+        with self._lock:
+            # a read transaction gives a consistent snapshot while other writers commit
+            self._conn.execute("BEGIN")
+            try:
+                workload_index = {}
+                with open(path_workload, "w", encoding="utf-8") as o_f:
+                    for workload_id, workload_json in self._conn.execute(
+                        "SELECT id, json FROM workload ORDER BY id"
+                    ):
+                        workload_index[workload_id] = len(workload_index)
+                        o_f.write(workload_json + "\n")
+                with open(path_tuning_record, "w", encoding="utf-8") as o_f:
+                    for workload_id, record_json in self._conn.execute(
+                        "SELECT workload_id, json FROM tuning_record ORDER BY id"
+                    ):
+                        o_f.write(f"[{workload_index[workload_id]}, {record_json}]\n")
+                        num_records += 1
+            finally:
+                self._conn.execute("COMMIT")
+        return num_records
+
+    def close(self) -> None:
+        """Close the connection to the SQLite file."""
+        with self._lock:
+            self._conn.close()
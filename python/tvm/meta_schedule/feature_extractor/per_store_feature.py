@@ -35,6 +35,9 @@ class PerStoreFeature(FeatureExtractor):
         The number of samples used in the arithmetic intensity curve.
     cache_line_bytes : int
         The number of bytes in a cache line.
+    max_cache_size : int
+        The max number of modules whose features are cached, keyed by their structural hash,
+        so that the candidates revisited by the search are not lowered again. 0 to disable.
     """
 
     buffers_per_store: int
@@ -45,16 +48,24 @@ class PerStoreFeature(FeatureExtractor):
     """The number of bytes in a cache line."""
     feature_vector_length: int
     """Length of the feature vector."""
+    max_cache_size: int
+    """The max number of modules whose features are cached."""
+    num_cache_hits: int
+    """The number of candidates whose features are found in the cache."""
+    num_cache_misses: int
+    """The number of candidates whose features are extracted."""
 
     def __init__(
         self,
         buffers_per_store: int = 5,
         arith_intensity_curve_num_samples: int = 10,
         cache_line_bytes: int = 64,
+        max_cache_size: int = 10000,
     ):
         self.__init_handle_by_constructor__(
             _ffi_api.FeatureExtractorPerStoreFeature,  # type: ignore # pylint: disable=no-member
             buffers_per_store,
             arith_intensity_curve_num_samples,
             cache_line_bytes,
+            max_cache_size,
         )
@@ -21,4 +21,6 @@ from .measure_callback import MeasureCallback, PyMeasureCallback
 from .add_to_database import AddToDatabase
 from .echo_statistics import EchoStatistics
 from .remove_build_artifact import RemoveBuildArtifact
+from .stop_on_convergence import StopOnConvergence
+from .time_budget import TimeBudget
 from .update_cost_model import UpdateCostModel
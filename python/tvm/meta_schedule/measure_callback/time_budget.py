@@ -0,0 +1,43 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""A measure callback that stops tuning once the wall-clock budget is used up"""
+from tvm._ffi import register_object
+
+from .. import _ffi_api
+from .measure_callback import MeasureCallback
+
+
+@register_object("meta_schedule.TimeBudget")
+class TimeBudget(MeasureCallback):
+    """A measure callback that stops tuning once the wall-clock budget is used up. The tasks
+    whose measurement is in flight are stopped once their results are collected.
+
+    Parameters
+    ----------
+    max_time_sec : float
+        The wall-clock budget in seconds, counted from the first time the callback is invoked,
+        i.e. when the results of the first round of measurements are in.
+    """
+
+    max_time_sec: float
+
+    def __init__(self, max_time_sec: float) -> None:
+        """Constructor"""
+        self.__init_handle_by_constructor__(
+            _ffi_api.MeasureCallbackTimeBudget,  # type: ignore # pylint: disable=no-member
+            max_time_sec,
+        )
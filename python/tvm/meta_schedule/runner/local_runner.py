@@ -15,8 +15,11 @@
 # specific language governing permissions and limitations
 # under the License.
 """Local Runner"""
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 import logging
+import os
+import queue
 from typing import Callable, List, Optional, Union
 
 import tvm
@@ -45,18 +48,28 @@ class LocalRunnerFuture(RunnerFuture):
         The optional result as a list of float.
     error_message: Optional[str]
         The optional error message.
+    future: Optional[concurrent.futures.Future]
+        The optional pending measurement, resolved into a result or an error message.
+    timeout_sec: Optional[float]
+        The timeout in seconds of the pending measurement.
 
     Note
     ----
-    Only one of the parameters should be None upon the creation
+    Exactly one of `res`, `error_message` and `future` should be given upon the creation
     of LocalRunnerFuture object
     """
 
     res: Optional[List[float]]
     error_message: Optional[str]
+    future: Optional[Future]
+    timeout_sec: Optional[float]
 
     def __init__(
-        self, res: Optional[List[float]] = None, error_message: Optional[str] = None
+        self,
+        res: Optional[List[float]] = None,
+        error_message: Optional[str] = None,
+        future: Optional[Future] = None,
+        timeout_sec: Optional[float] = None,
     ) -> None:
         """Constructor
 
@@ -66,25 +79,38 @@ class LocalRunnerFuture(RunnerFuture):
             The result of this LocalRunnerFuture
         error_message: Optional[str]
             The stringfied error message of any exception during execution
-
+        future: Optional[concurrent.futures.Future]
+            The pending measurement of this LocalRunnerFuture
+        timeout_sec: Optional[float]
+            The timeout in seconds of the pending measurement
         """
         super().__init__()
         self.res = res
         self.error_message = error_message
+        self.future = future
+        self.timeout_sec = timeout_sec
 
         # sanity check upon the creation of LocalRunnerFuture object
-        if (res is None and error_message is None) or (
-            res is not None and error_message is not None
-        ):
+        if sum(x is not None for x in (res, error_message, future)) != 1:
             raise AttributeError(
-                "Only one of the two parameters should be None upon the creation"
+                "Exactly one of the three parameters should be given upon the creation "
                 "of LocalRunnerFuture object."
             )
 
     def done(self) -> bool:
-        return True
+        return self.future is None or self.future.done()
 
     def result(self) -> RunnerResult:
+        if self.future is not None:
+            try:
+                self.res = self.future.result()
+            except TimeoutError as exception:
+                self.error_message = (
+                    f"LocalRunner: Timeout, killed after {self.timeout_sec} seconds\n"
+                )
+            except Exception as exception:  # pylint: disable=broad-except
+                self.error_message = "LocalRunner: An exception occurred\n" + str(exception)
+            self.future = None
         return RunnerResult(self.res, self.error_message)
 
 
@@ -105,8 +131,17 @@ class LocalRunner(PyRunner):
         The function name to run the evaluator or the function itself.
     f_cleanup: Optional[str, Callable]
         The function name to cleanup the session or the function itself.
+    max_workers: int
+        The number of candidates measured concurrently.
+    worker_cores: Optional[List[List[int]]]
+        The disjoint CPU cores each measurement worker is pinned to, or None if not pinned.
+    overlap_build: bool
+        Whether `run` returns before the measurements finish, so that the next candidates are
+        built while they run.
+    pools: List[PopenPoolExecutor]
+        The popen pool executors, one single-process pool per measurement worker.
     pool: PopenPoolExecutor
-        The popen pool executor.
+        The popen pool executor of the first measurement worker.
 
     Attributes
     ----------
@@ -175,6 +210,10 @@ class LocalRunner(PyRunner):
     f_run_evaluator: Union[T_RUN_EVALUATOR, str, None]
     f_cleanup: Union[T_CLEANUP, str, None]
 
+    max_workers: int
+    worker_cores: Optional[List[List[int]]]
+    overlap_build: bool
+    pools: List[PopenPoolExecutor]
     pool: PopenPoolExecutor
 
     def __init__(
@@ -187,6 +226,9 @@ class LocalRunner(PyRunner):
         f_run_evaluator: Union[T_RUN_EVALUATOR, str, None] = None,
         f_cleanup: Union[T_CLEANUP, str, None] = None,
         initializer: Optional[Callable[[], None]] = None,
+        max_workers: int = 1,
+        cores_per_worker: Optional[int] = None,
+        overlap_build: bool = False,
     ) -> None:
         """Constructor
 
@@ -208,6 +250,19 @@ class LocalRunner(PyRunner):
             The function name to cleanup the session or the function itself.
         initializer: Optional[Callable[[], None]]
             The initializer function.
+        max_workers: int
+            The number of candidates measured concurrently. When larger than 1, the cores of
+            the machine are split into `max_workers` disjoint slots and the TVM thread pool of
+            each worker process is pinned to its own slot, so that concurrent measurements do
+            not compete for cores.
+        cores_per_worker: Optional[int]
+            The number of cores in each slot. Defaults to an even split of the available cores.
+            Setting it with `max_workers=1` pins the single worker as well.
+        overlap_build: bool
+            Whether to return the measurements as pending futures, so that the task scheduler
+            builds the next candidates while they run. The builder uses all the cores of the
+            machine, so only enable it when the measurements do not compete with it, e.g. when
+            the builder is given its own cores.
         """
         super().__init__()
         self.timeout_sec = timeout_sec
@@ -218,40 +273,135 @@ class LocalRunner(PyRunner):
         self.f_run_evaluator = f_run_evaluator
         self.f_cleanup = f_cleanup
 
-        logger.info("LocalRunner: max_workers = 1")
-        self.pool = PopenPoolExecutor(
-            max_workers=1,  # one local worker
-            timeout=timeout_sec,
-            initializer=initializer,
-        )
+        self.max_workers = max_workers
+        self.overlap_build = overlap_build
+        if max_workers > 1 or cores_per_worker is not None:
+            self.worker_cores = _partition_cores(max_workers, cores_per_worker)
+            logger.info(
+                "LocalRunner: max_workers = %d, cores per worker = %d",
+                max_workers,
+                len(self.worker_cores[0]),
+            )
+            self.pools = [
+                PopenPoolExecutor(
+                    max_workers=1,  # one process per slot of cores
+                    timeout=timeout_sec,
+                    initializer=_pin_worker_to_cores,
+                    initargs=(cores, initializer),
+                )
+                for cores in self.worker_cores
+            ]
+        else:
+            self.worker_cores = None
+            logger.info("LocalRunner: max_workers = 1")
+            self.pools = [
+                PopenPoolExecutor(
+                    max_workers=1,  # one local worker
+                    timeout=timeout_sec,
+                    initializer=initializer,
+                )
+            ]
+        self.pool = self.pools[0]
+        self._free_workers: "queue.Queue[int]" = queue.Queue()
+        for worker_id in range(len(self.pools)):
+            self._free_workers.put(worker_id)
+        self._executor = ThreadPoolExecutor(max_workers=len(self.pools))
         self._sanity_check()
 
     def run(self, runner_inputs: List[RunnerInput]) -> List[RunnerFuture]:
-        results: List[RunnerFuture] = []
-        for runner_input in runner_inputs:
-            future = self.pool.submit(
-                LocalRunner._worker_func,
-                self.f_alloc_argument,
-                self.f_run_evaluator,
-                self.f_cleanup,
-                self.evaluator_config,
-                self.alloc_repeat,
-                str(runner_input.artifact_path),
-                str(runner_input.device_type),
-                tuple(arg_info.as_json() for arg_info in runner_input.args_info),
+        futures = [
+            LocalRunnerFuture(
+                future=self._executor.submit(self._run_on_free_worker, runner_input),
+                timeout_sec=self.timeout_sec,
             )
-            try:
-                result: List[float] = future.result()
-                error_message: str = None
-            except TimeoutError as exception:
-                result = None
-                error_message = f"LocalRunner: Timeout, killed after {self.timeout_sec} seconds\n"
-            except Exception as exception:  # pylint: disable=broad-except
-                result = None
-                error_message = "LocalRunner: An exception occurred\n" + str(exception)
-            local_future = LocalRunnerFuture(res=result, error_message=error_message)
-            results.append(local_future)
-        return results
+            for runner_input in runner_inputs
+        ]
+        if not self.overlap_build:
+            # The builder uses all the cores and would skew the timings of the measurements
+            # running alongside it, so wait for them before the next candidates are built
+            for future in futures:
+                future.result()
+        return futures
+
+    def _run_on_free_worker(self, runner_input: RunnerInput) -> List[float]:
+        # every worker measures one candidate at a time, and picks the next one once done
+        worker_id = self._free_workers.get()
+        try:
+            return (
+                self.pools[worker_id]
+                .submit(
+                    LocalRunner._worker_func,
+                    self.f_alloc_argument,
+                    self.f_run_evaluator,
+                    self.f_cleanup,
+                    self.evaluator_config,
+                    self.alloc_repeat,
+                    str(runner_input.artifact_path),
+                    str(runner_input.device_type),
+                    tuple(arg_info.as_json() for arg_info in runner_input.args_info),
+                )
+                .result()
+            )
+        finally:
+            self._free_workers.put(worker_id)
+
+    def shutdown(self) -> None:
+        """Shut down the measurement workers and the threads dispatching to them. The runner
+        cannot run after it is shut down."""
+        self._executor.shutdown(wait=True)
+        for pool in self.pools:
+            pool.shutdown()
+
+    def noise_check(self, runner_inputs: List[RunnerInput], rtol: float = 0.1) -> float:
+        """Check that concurrent measurements stay comparable to serial ones.
+
+        The inputs are measured by this runner and by a serial, unpinned LocalRunner with the
+        same configuration, and the mean run times of every candidate are compared.
+
+        Parameters
+        ----------
+        runner_inputs: List[RunnerInput]
+            The candidates to measure, ideally several copies of representative workloads.
+        rtol: float
+            The relative deviation above which a warning is logged.
+
+        Returns
+        -------
+        deviation: float
+            The median relative deviation between the concurrent and the serial mean run times.
+        """
+        serial = LocalRunner(
+            timeout_sec=self.timeout_sec,
+            evaluator_config=self.evaluator_config,
+            alloc_repeat=self.alloc_repeat,
+            f_alloc_argument=self.f_alloc_argument,
+            f_run_evaluator=self.f_run_evaluator,
+            f_cleanup=self.f_cleanup,
+        )
+        deviations = []
+        try:
+            for future, serial_future in zip(self.run(runner_inputs), serial.run(runner_inputs)):
+                result, serial_result = future.result(), serial_future.result()
+                if result.error_msg is not None or serial_result.error_msg is not None:
+                    continue
+                mean = sum(float(x) for x in result.run_secs) / len(result.run_secs)
+                serial_mean = sum(float(x) for x in serial_result.run_secs) / len(
+                    serial_result.run_secs
+                )
+                deviations.append(abs(mean - serial_mean) / serial_mean)
+        finally:
+            serial.shutdown()
+        if not deviations:
+            raise ValueError("LocalRunner: No candidate was measured successfully")
+        deviations.sort()
+        deviation = deviations[len(deviations) // 2]
+        if deviation > rtol:
+            logger.warning(
+                "LocalRunner: Concurrent measurements deviate by %.1f%% from serial ones, "
+                "consider fewer workers or more cores per worker",
+                deviation * 100,
+            )
+        return deviation
 
     def _sanity_check(self) -> None:
         def _check(
@@ -266,13 +416,14 @@ class LocalRunner(PyRunner):
                 name="tvm.contrib.random.random_fill", default=None
             )
 
-        value = self.pool.submit(
-            _check,
-            self.f_alloc_argument,
-            self.f_run_evaluator,
-            self.f_cleanup,
-        )
-        value.result()
+        for pool in self.pools:
+            value = pool.submit(
+                _check,
+                self.f_alloc_argument,
+                self.f_run_evaluator,
+                self.f_cleanup,
+            )
+            value.result()
 
     @staticmethod
     def _worker_func(
@@ -324,6 +475,34 @@ class LocalRunner(PyRunner):
         return costs
 
 
+def _partition_cores(max_workers: int, cores_per_worker: Optional[int]) -> List[List[int]]:
+    """Split the cores available to this process into disjoint slots, one per worker"""
+    if hasattr(os, "sched_getaffinity"):
+        cores = sorted(os.sched_getaffinity(0))
+    else:
+        cores = list(range(os.cpu_count() or 1))
+    if cores_per_worker is None:
+        cores_per_worker = max(1, len(cores) // max_workers)
+    if max_workers * cores_per_worker > len(cores):
+        raise ValueError(
+            f"LocalRunner: Cannot pin {max_workers} workers to {cores_per_worker} cores each, "
+            f"only {len(cores)} cores are available"
+        )
+    return [cores[i * cores_per_worker : (i + 1) * cores_per_worker] for i in range(max_workers)]
+
+
+def _pin_worker_to_cores(cores: List[int], initializer: Optional[Callable[[], None]]) -> None:
+    """Initializer of a measurement worker, pinning the process and its TVM thread pool"""
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+    os.environ["TVM_NUM_THREADS"] = str(len(cores))
+    # one TVM thread per core of the slot, i.e. `kSpecifyOneCorePerThread`
+    config_threadpool = tvm.get_global_func("runtime.config_threadpool")
+    config_threadpool(-2, len(cores), [str(core) for core in cores])
+    if initializer is not None:
+        initializer()
+
+
 def default_alloc_argument(
     device: Device,
     args_info: T_ARG_INFO_JSON_OBJ_LIST,
@@ -16,9 +16,10 @@
 # under the License.
 """Evolutionary Search Strategy"""
 
-from typing import NamedTuple
+from typing import Dict, List, NamedTuple
 
 from tvm._ffi import register_object
+from tvm.tir import FloatImm
 
 from .. import _ffi_api
 from .search_strategy import SearchStrategy
@@ -50,6 +51,21 @@ class EvolutionarySearch(SearchStrategy):
         The maximum number to retry mutation.
     eps_greedy : float
         The ratio of greedy selected samples in the final picks.
+    cross_task_seed_ratio : float
+        The ratio of the initial population seeded from the best measured traces of the other
+        tasks in the same task scheduler that share the block structure of this task, i.e. that
+        are identical up to shape. The tile sizes of the seeds are re-sampled for the new shapes.
+        Zero disables cross-task seeding.
+
+    Attributes
+    ----------
+    num_cross_task_seeds : int
+        The number of candidates seeded from other tasks so far.
+    search_stats : List[Dict[str, FloatImm]]
+        The statistics of each iteration of the genetic algorithm, with keys "iter",
+        "population_size", "diversity" (the ratio of structurally unique candidates),
+        "score_min", "score_median", "score_max" and "score_mean" of the predicted scores,
+        and "mutation_success_rate" for the iterations that evolve the population.
     """
 
     num_trials_per_iter: int
@@ -61,6 +77,9 @@ class EvolutionarySearch(SearchStrategy):
     genetic_mutate_prob: float
     genetic_max_fail_count: int
     eps_greedy: float
+    cross_task_seed_ratio: float
+    num_cross_task_seeds: int
+    search_stats: List[Dict[str, FloatImm]]
 
     def __init__(
         self,
@@ -74,6 +93,7 @@ class EvolutionarySearch(SearchStrategy):
         genetic_mutate_prob: float,
         genetic_max_fail_count: int,
         eps_greedy: float,
+        cross_task_seed_ratio: float = 0.0,
     ) -> None:
         """Constructor"""
         self.__init_handle_by_constructor__(
@@ -87,6 +107,7 @@ class EvolutionarySearch(SearchStrategy):
             genetic_mutate_prob,
             genetic_max_fail_count,
             eps_greedy,
+            cross_task_seed_ratio,
         )
 
 
@@ -102,6 +123,7 @@ class EvolutionarySearchConfig(NamedTuple):
     genetic_mutate_prob: float = 0.85
     genetic_max_fail_count: int = 10
     eps_greedy: float = 0.05
+    cross_task_seed_ratio: float = 0.0
 
     def create_strategy(self) -> EvolutionarySearch:
         return EvolutionarySearch(
@@ -114,4 +136,5 @@ class EvolutionarySearchConfig(NamedTuple):
             genetic_mutate_prob=self.genetic_mutate_prob,
             genetic_max_fail_count=self.genetic_max_fail_count,
             eps_greedy=self.eps_greedy,
+            cross_task_seed_ratio=self.cross_task_seed_ratio,
         )
@@ -0,0 +1,129 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Gradient Based Task Scheduler"""
+
+from typing import List, Optional, TYPE_CHECKING
+
+from tvm._ffi import register_object
+from tvm.meta_schedule.measure_callback.measure_callback import MeasureCallback
+
+from ..builder import Builder
+from ..runner import Runner
+from ..database import Database
+from ..cost_model import CostModel
+from .task_scheduler import TaskScheduler
+
+from .. import _ffi_api
+
+if TYPE_CHECKING:
+    from ..tune_context import TuneContext
+
+
+@register_object("meta_schedule.GradientBased")
+class GradientBased(TaskScheduler):
+    """Gradient Based Task Scheduler
+
+    After measuring every task once, the scheduler keeps picking the task whose next round of
+    trials is expected to reduce the weighted latency of the whole workload the most, i.e.
+    `weight * (alpha * backward + (1 - alpha) * forward)`, where `backward` is the latency
+    reduction of the task over the last `window_size` rounds, and `forward` is its best latency
+    divided by its number of rounds. A task that does not improve for `early_stopping_rounds`
+    rounds is stopped. The tasks still being measured are not waited for: the next task is picked
+    among the tasks whose results are all in, unless every remaining task is being measured.
+
+    Parameters
+    ----------
+    tasks: List[TuneContext]
+        The list of tune context to process.
+    task_weights: List[float]
+        The weights of the tasks, i.e. how many times each of them occurs in the workload.
+    builder: Builder
+        The builder of the scheduler.
+    runner: Runner
+        The runner of the scheduler.
+    database: Database
+        The database of the scheduler.
+    measure_callbacks: Optional[List[MeasureCallback]] = None
+        The list of measure callbacks of the scheduler.
+    alpha: float
+        The weight of the backward gradient against the forward one.
+    window_size: int
+        The number of rounds the backward gradient looks back.
+    early_stopping_rounds: int
+        The number of rounds without improvement after which a task is stopped.
+    """
+
+    task_weights: List[float]
+    alpha: float
+    window_size: int
+    early_stopping_rounds: int
+
+    def __init__(
+        self,
+        tasks: List["TuneContext"],
+        builder: Builder,
+        runner: Runner,
+        database: Database,
+        cost_model: Optional[CostModel] = None,
+        measure_callbacks: Optional[List[MeasureCallback]] = None,
+        *,
+        task_weights: Optional[List[float]] = None,
+        alpha: float = 0.2,
+        window_size: int = 3,
+        early_stopping_rounds: int = 5,
+    ) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        tasks : List[TuneContext]
+            List of tasks to schedule.
+        builder : Builder
+            The builder.
+        runner : Runner
+            The runner.
+        database : Database
+            The database.
+        cost_model : Optional[CostModel]
+            The cost model.
+        measure_callbacks: Optional[List[MeasureCallback]]
+            The list of measure callbacks of the scheduler.
+        task_weights : Optional[List[float]]
+            The weights of the tasks. Defaults to 1.0 for every task.
+        alpha : float
+            The weight of the backward gradient against the forward one.
+        window_size : int
+            The number of rounds the backward gradient looks back.
+        early_stopping_rounds : int
+            The number of rounds without improvement after which a task is stopped,
+            or -1 to never stop a task early.
+        """
+        if task_weights is None:
+            task_weights = [1.0 for _ in tasks]
+        self.__init_handle_by_constructor__(
+            _ffi_api.TaskSchedulerGradientBased,  # type: ignore # pylint: disable=no-member
+            tasks,
+            [float(weight) for weight in task_weights],
+            builder,
+            runner,
+            database,
+            cost_model,
+            measure_callbacks,
+            alpha,
+            window_size,
+            early_stopping_rounds,
+        )
@@ -16,9 +16,10 @@
 # under the License.
 """Workloads in TE"""
 # pylint: disable=missing-docstring
-from typing import Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 from tvm import te, tir, topi
+from tvm.runtime import Device, NDArray, ndarray
 
 
 def batch_matmul_nkkm(  # pylint: disable=invalid-name,missing-docstring
@@ -701,6 +702,50 @@ def softmax_mn(m, n) -> Tuple[te.Tensor, te.Tensor]:  # pylint: disable=invalid-
     return (a, b)
 
 
+def sparse_dense_csr_ell(  # pylint: disable=invalid-name
+    m: int,
+    n: int,
+    k: int,
+    width: int,
+) -> Tuple[te.Tensor, te.Tensor, te.Tensor, te.Tensor]:
+    x = te.placeholder((m, k), name="X")
+    w_data = te.placeholder((n, width), name="W_data")
+    w_indices = te.placeholder((n, width), name="W_indices", dtype="int32")
+    y = topi.sparse.sparse_dense_ell(x, w_data, w_indices)
+    return (x, w_data, w_indices, y)
+
+
+def sparse_dense_bsr_ell(  # pylint: disable=invalid-name
+    m: int,
+    n: int,
+    k: int,
+    bs_r: int,
+    bs_c: int,
+    width: int,
+) -> Tuple[te.Tensor, te.Tensor, te.Tensor, te.Tensor]:
+    x = te.placeholder((m, k), name="X")
+    w_data = te.placeholder((n // bs_r, width, bs_r, bs_c), name="W_data")
+    w_indices = te.placeholder((n // bs_r, width), name="W_indices", dtype="int32")
+    y = topi.sparse.sparse_dense_ell(x, w_data, w_indices)
+    return (x, w_data, w_indices, y)
+
+
+def sddmm_bsr(  # pylint: disable=invalid-name
+    m: int,
+    n: int,
+    k: int,
+    bs_r: int,
+    bs_c: int,
+    num_blocks: int,
+) -> Tuple[te.Tensor, te.Tensor, te.Tensor, te.Tensor, te.Tensor]:
+    a = te.placeholder((m, k), name="A")
+    b = te.placeholder((n, k), name="B")
+    mask_indices = te.placeholder((num_blocks,), name="mask_indices", dtype="int32")
+    mask_indptr = te.placeholder((m // bs_r + 1,), name="mask_indptr", dtype="int32")
+    c = topi.sparse.sddmm(a, b, mask_indices, mask_indptr, (bs_r, bs_c))
+    return (a, b, mask_indices, mask_indptr, c)
+
+
 def create_te_workload(name: str, idx: int) -> tir.PrimFunc:
     workload_func, params = CONFIGS[name]
     return te.create_prim_func(workload_func(*params[idx]))  # type: ignore
@@ -874,4 +919,114 @@ CONFIGS = {
             (1, 128, 12, 128),
         ],
     ),
+    "SPMM-CSR": (
+        sparse_dense_csr_ell,
+        [
+            # (m, n, k, width), roughly 90% sparse weights of transformer dense layers
+            (128, 768, 768, 80),
+            (128, 3072, 768, 80),
+            (128, 768, 3072, 320),
+        ],
+    ),
+    "SPMM-BSR": (
+        sparse_dense_bsr_ell,
+        [
+            # (m, n, k, bs_r, bs_c, width)
+            (128, 768, 768, 16, 1, 80),
+            (128, 3072, 768, 16, 1, 80),
+            (128, 768, 3072, 32, 1, 320),
+        ],
+    ),
+    "SDDMM": (
+        sddmm_bsr,
+        [
+            # (m, n, k, bs_r, bs_c, num_blocks), block-sparse attention scores
+            (1024, 1024, 64, 32, 32, 224),
+            (4096, 4096, 64, 64, 64, 448),
+        ],
+    ),
 }
+
+
+def sparse_fixed_inputs(name: str, idx: int, seed: int = 0) -> Dict[int, Any]:
+    """Generate valid sparse structure arrays for a sparse workload in `CONFIGS`.
+
+    Randomly filled index arrays read out of bounds, so the sparse workloads cannot be
+    measured with the default argument allocation.
+
+    Parameters
+    ----------
+    name : str
+        One of "SPMM-CSR", "SPMM-BSR" and "SDDMM"
+    idx : int
+        The index of the configuration
+    seed : int
+        The random seed
+
+    Returns
+    -------
+    fixed_inputs : Dict[int, np.ndarray]
+        The index arrays keyed by their position in the workload arguments
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    rng = np.random.default_rng(seed)
+    _, params = CONFIGS[name]
+    if name == "SPMM-CSR":
+        _, n, k, width = params[idx]
+        return {2: rng.integers(0, k, size=(n, width), dtype="int32")}
+    if name == "SPMM-BSR":
+        _, n, k, bs_r, bs_c, width = params[idx]
+        return {2: rng.integers(0, k // bs_c, size=(n // bs_r, width), dtype="int32")}
+    if name == "SDDMM":
+        m, n, _, bs_r, bs_c, num_blocks = params[idx]
+        num_block_rows, num_block_cols = m // bs_r, n // bs_c
+        chosen = np.sort(
+            rng.choice(num_block_rows * num_block_cols, size=num_blocks, replace=False)
+        )
+        row_nnz = np.bincount(chosen // num_block_cols, minlength=num_block_rows)
+        indptr = np.concatenate([[0], np.cumsum(row_nnz)]).astype("int32")
+        return {2: (chosen % num_block_cols).astype("int32"), 3: indptr}
+    raise ValueError("Workload %s has no sparse inputs" % name)
+
+
+def fixed_input_alloc_argument(fixed_inputs: Dict[int, Any]) -> Callable:
+    """Create an `f_alloc_argument` for the runners which copies `fixed_inputs` into the
+    arguments at their positions and randomly fills the others, like the default one.
+
+    Parameters
+    ----------
+    fixed_inputs : Dict[int, np.ndarray]
+        The arrays keyed by their position in the arguments
+
+    Returns
+    -------
+    f_alloc_argument : Callable
+        The function to pass as `f_alloc_argument` to `LocalRunner` or `RPCRunner`
+    """
+
+    def alloc_argument(
+        device: Device,
+        args_info: List,
+        alloc_repeat: int,
+    ) -> List[List[NDArray]]:
+        # pylint: disable=import-outside-toplevel
+        from tvm.meta_schedule.utils import get_global_func_with_default_on_worker
+
+        f_random_fill = get_global_func_with_default_on_worker(
+            name="tvm.contrib.random.random_fill", default=None
+        )
+        repeated_args = []
+        for _ in range(alloc_repeat):
+            args = []
+            for i, (_, dtype, shape) in enumerate(args_info):
+                arg = ndarray.empty(shape=shape, dtype=dtype, device=device)
+                if i in fixed_inputs:
+                    arg.copyfrom(fixed_inputs[i])
+                else:
+                    f_random_fill(arg)
+                args.append(arg)
+            repeated_args.append(args)
+        return repeated_args
+
+    return alloc_argument
@@ -17,8 +17,10 @@
 """User-facing Tuning API"""
 # pylint: disable=import-outside-toplevel
 import logging
+import math
 import os.path
-from typing import Callable, Dict, List, Optional, Tuple, Union
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
 
 import tvm
 from tvm._ffi.registry import register_func
@@ -29,26 +31,37 @@ from tvm.runtime import Module, NDArray
 from tvm.target import Target
 from tvm.te import Tensor, create_prim_func
 from tvm.tir import PrimFunc, Schedule
+from tvm.tir.schedule import Trace
 
-from .builder import Builder, LocalBuilder
+from .arg_info import ArgInfo, TensorInfo
+from .builder import Builder, BuilderInput, BuilderResult, LocalBuilder
 from .cost_model import CostModel, XGBModel
 from .database import Database, JSONDatabase, TuningRecord
 from .feature_extractor import PerStoreFeature
-from .integration import ApplyHistoryBest, ExtractedTask, extract_task_from_relay
-from .measure_callback import MeasureCallback
+from .integration import (
+    ApplyHistoryBest,
+    ExtractedTask,
+    extract_task_from_relax,
+    extract_task_from_relay,
+)
+from .measure_callback import MeasureCallback, PyMeasureCallback
 from .mutator import Mutator
 from .postproc import Postproc
-from .runner import LocalRunner, Runner
+from .runner import LocalRunner, Runner, RunnerInput, RunnerResult
 from .schedule_rule import ScheduleRule
 from .search_strategy import (
     EvolutionarySearchConfig,
+    MeasureCandidate,
     ReplayFuncConfig,
     ReplayTraceConfig,
 )
 from .space_generator import PostOrderApply, SpaceGenerator
-from .task_scheduler import RoundRobin, TaskScheduler
+from .task_scheduler import GradientBased, RoundRobin, TaskScheduler
 from .tune_context import TuneContext
 
+if TYPE_CHECKING:
+    from tvm.relax.expr import Function as RelaxFunc
+
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
 SearchStrategyConfig = Union[
@@ -264,11 +277,13 @@ class Parse:
     @staticmethod
     def _callbacks(
         measure_callbacks: Optional[List[MeasureCallback]],
+        max_tuning_time_sec: Optional[float] = None,
+        convergence_rounds: Optional[int] = None,
     ) -> List[MeasureCallback]:
-        if measure_callbacks is None:
-            from tvm.meta_schedule import measure_callback as M
+        from tvm.meta_schedule import measure_callback as M
 
-            return [
+        if measure_callbacks is None:
+            measure_callbacks = [
                 M.AddToDatabase(),
                 M.RemoveBuildArtifact(),
                 M.EchoStatistics(),
@@ -286,6 +301,10 @@ class Parse:
                     f"Expected `measure_callbacks` to be List[MeasureCallback], "
                     f"but measure_callbacks[{i}] is: {callback}"
                 )
+        if max_tuning_time_sec is not None:
+            measure_callbacks.append(M.TimeBudget(max_tuning_time_sec))
+        if convergence_rounds is not None:
+            measure_callbacks.append(M.StopOnConvergence(convergence_rounds))
         return measure_callbacks
 
     @staticmethod
@@ -390,15 +409,16 @@ class Parse:
 
     @staticmethod
     def _task_scheduler(
-        task_scheduler: Union[None, TaskScheduler, FnTaskScheduler],
+        task_scheduler: Union[None, str, TaskScheduler, FnTaskScheduler],
         tasks: List[TuneContext],
         builder: Builder,
         runner: Runner,
         database: Database,
         cost_model: CostModel,
         measure_callbacks: List[MeasureCallback],
+        task_weights: Optional[List[float]] = None,
     ):
-        if task_scheduler is None:
+        if task_scheduler is None or task_scheduler == "round_robin":
             return RoundRobin(
                 tasks=tasks,
                 builder=builder,
@@ -407,6 +427,18 @@ class Parse:
                 cost_model=cost_model,
                 measure_callbacks=measure_callbacks,
             )
+        if task_scheduler == "gradient":
+            return GradientBased(
+                tasks=tasks,
+                builder=builder,
+                runner=runner,
+                database=database,
+                cost_model=cost_model,
+                measure_callbacks=measure_callbacks,
+                task_weights=task_weights,
+            )
+        if isinstance(task_scheduler, str):
+            raise ValueError(f"Unknown task scheduler: {task_scheduler}")
         if callable(task_scheduler):
             return task_scheduler(
                 tasks,
@@ -423,6 +455,80 @@ class Parse:
         return task_scheduler
 
 
+@register_func("tvm.meta_schedule.tune.fallback_schedule")  # for MetaScheduleApplyHistoryBest
+def fallback_schedule(
+    mod: Union[PrimFunc, IRModule],
+    target: Union[str, Target],
+    cost_model: Optional[CostModel] = None,
+    num_samples: int = 16,
+) -> Optional[IRModule]:
+    """Schedule a module with a default schedule, without any measurement. A few schedules are
+    sampled from the default design space of the target, e.g. with multi-level tiling and
+    parallelization, vectorization and unrolling, and the best one predicted by the cost model
+    is picked.
+
+    Parameters
+    ----------
+    mod : Union[PrimFunc, IRModule]
+        The module to schedule.
+    target : Union[str, Target]
+        The target to schedule for.
+    cost_model : Optional[CostModel]
+        The cost model to pick the schedule among the samples with. If None, the first valid
+        sample is picked.
+    num_samples : int
+        The number of schedules sampled from the design space.
+
+    Returns
+    -------
+    mod : Optional[IRModule]
+        The scheduled module, or None if the target has no default design space or no valid
+        schedule is sampled.
+    """
+    # pylint: disable=protected-access
+    mod = Parse._mod(mod)
+    target = Parse._target(target)
+    if target.kind.name not in ("llvm", "cuda"):
+        logger.warning("No fallback schedule for target: %s", target)
+        return None
+    context = TuneContext(
+        mod=mod,
+        target=target,
+        space_generator=PostOrderApply(),
+        sch_rules=Parse._sch_rules(None, target),
+        postprocs=Parse._postproc(None, target),
+        task_name="fallback",
+        num_threads=1,
+    )
+    # pylint: enable=protected-access
+    context.initialize()
+    spaces = context.space_generator.generate_design_space(mod)
+    if not spaces:
+        return None
+    candidates: List[Schedule] = []
+    for i in range(num_samples):
+        sch = Schedule(mod, seed=i + 1)
+        trace = Trace(spaces[i % len(spaces)].trace.insts, {})
+        try:
+            trace.apply_to_schedule(sch, remove_postproc=True)
+        except tvm.TVMError:
+            # The sampled decisions may be invalid, e.g. with a tile size not dividing a loop
+            continue
+        sch.enter_postproc()
+        if all(postproc.apply(sch) for postproc in context.postprocs):
+            candidates.append(sch)
+    if not candidates:
+        return None
+    if cost_model is None or len(candidates) == 1:
+        return candidates[0].mod
+    args_info = ArgInfo.from_prim_func(mod["main"])
+    scores = cost_model.predict(
+        context,
+        [MeasureCandidate(sch, args_info) for sch in candidates],
+    )
+    return candidates[max(range(len(candidates)), key=lambda i: scores[i])].mod
+
+
 def tune_tir(
     mod: Union[IRModule, PrimFunc],
     target: Union[str, Target],
@@ -515,6 +621,247 @@ def tune_tir(
     return sch
 
 
+def _symbolic_vars(func: PrimFunc) -> Dict[str, tvm.tir.Var]:
+    """Collect the symbolic vars of the shapes of a PrimFunc by name, including the scalar
+    parameters passed along the shapes, e.g. by call_tir."""
+    sym_vars: Dict[str, tvm.tir.Var] = {}
+
+    def _visit(expr):
+        if isinstance(expr, tvm.tir.Var):
+            sym_vars.setdefault(expr.name, expr)
+
+    for param in func.params:
+        if param in func.buffer_map:
+            for dim in func.buffer_map[param].shape:
+                tvm.tir.stmt_functor.post_order_visit(dim, _visit)
+        else:
+            sym_vars.setdefault(param.name, param)
+    return sym_vars
+
+
+def _symbolic_args_info(func: PrimFunc) -> List[ArgInfo]:
+    """The arguments of a PrimFunc with symbolic shapes, with -1 for the symbolic dimensions.
+    The scalar parameters of the symbolic vars are not arguments of the tuning records."""
+    return [
+        TensorInfo(
+            func.buffer_map[param].dtype,
+            [
+                int(dim) if isinstance(dim, tvm.tir.IntImm) else -1
+                for dim in func.buffer_map[param].shape
+            ],
+        )
+        for param in func.params
+        if param in func.buffer_map
+    ]
+
+
+def _specialize_shape(mod: IRModule, binding: Dict[str, int]) -> IRModule:
+    """Specialize the symbolic shape of the main PrimFunc of a module to a static one."""
+    func = mod["main"]
+    sym_vars = _symbolic_vars(func)
+    missing = [name for name in sym_vars if name not in binding]
+    if missing:
+        raise ValueError(f"The shape sample {binding} misses the symbolic vars: {missing}")
+    var_map = {var: tvm.tir.IntImm(var.dtype, binding[name]) for name, var in sym_vars.items()}
+    param_map = {}
+    for param in func.params:
+        if param in func.buffer_map:
+            buffer = func.buffer_map[param]
+            shape = [tvm.tir.stmt_functor.substitute(dim, var_map) for dim in buffer.shape]
+            param_map[param] = tvm.tir.decl_buffer(shape, buffer.dtype, buffer.name)
+        else:
+            param_map[param] = var_map[param]
+    return IRModule({"main": func.specialize(param_map)})
+
+
+def tune_symbolic_tir(
+    mod: Union[IRModule, PrimFunc],
+    target: Union[str, Target],
+    config: SearchStrategyConfig,
+    work_dir: str,
+    shape_samples: List[Dict[str, int]],
+    *,
+    task_name: str = "main",
+    builder: Optional[Builder] = None,
+    runner: Optional[Runner] = None,
+    database: Optional[Database] = None,
+    cost_model: Optional[CostModel] = None,
+    measure_callbacks: Optional[List[MeasureCallback]] = None,
+    task_scheduler: Union[None, str, TaskScheduler] = None,
+    space: Optional[FnSpaceGenerator] = None,
+    sch_rules: Optional[FnScheduleRule] = None,
+    postprocs: Optional[FnPostproc] = None,
+    mutator_probs: Optional[FnMutatorProb] = None,
+    num_threads: Optional[int] = None,
+    max_tuning_time_sec: Optional[float] = None,
+    convergence_rounds: Optional[int] = None,
+    num_candidates: int = 8,
+) -> Optional[Schedule]:
+    """Tune a TIR IRModule with symbolic shapes, e.g. a dynamic batch size, with a given target.
+
+    The module is specialized to each shape sample and tuned as a static module. The best traces
+    of the samples are then replayed on the symbolic module, where the tiles of the symbolic
+    loops keep their inner factors and the tails are guarded, and measured on every sample. The
+    trace with the smallest geometric mean slowdown over the best of each sample is recorded
+    under the symbolic module, so that a single record serves all the shapes.
+
+    In the recorded trace, the decision of SamplePerfectTile on a symbolic loop has -1 as its
+    outermost factor, since the extent of the loop is unknown. Replaying the trace keeps the
+    inner factors and infers the outermost one, on the symbolic module as on a static one. The
+    arguments of the record have -1 for the symbolic dimensions.
+
+    Parameters
+    ----------
+    mod : Union[IRModule, PrimFunc]
+        The module to tune.
+    target : Union[str, Target]
+        The target to tune for.
+    config : SearchStrategyConfig
+        The search strategy config of each shape sample.
+    work_dir : Optional[str]
+        The working directory to save intermediate results.
+    shape_samples : List[Dict[str, int]]
+        The representative values of the symbolic vars, by name, e.g. ``[{"n": 1}, {"n": 64}]``.
+    task_name : str
+        The name of the task.
+    builder : Optional[Builder]
+        The builder to use.
+    runner : Optional[Runner]
+        The runner to use.
+    database : Optional[Database]
+        The database to use.
+    cost_model : Optional[CostModel]
+        The cost model to use.
+    measure_callbacks : Optional[List[MeasureCallback]]
+        The callbacks used during tuning.
+    task_scheduler : Union[None, str, TaskScheduler]
+        The task scheduler to tune the samples with, or one of "round_robin" (default) and
+        "gradient".
+    space : Optional[FnSpaceGenerator]
+        The space generator to use.
+    sch_rules : Optional[FnScheduleRule]
+        The search rules to use.
+    postprocs : Optional[FnPostproc]
+        The postprocessors to use.
+    mutator_probs : Optional[FnMutatorProb]
+        The probability distribution to use different mutators.
+    num_threads : Optional[int]
+        The number of threads to use.
+    max_tuning_time_sec : Optional[float]
+        The wall-clock budget of tuning the samples in seconds.
+    convergence_rounds : Optional[int]
+        If given, a sample is stopped once its best latency has not improved for this many rounds.
+    num_candidates : int
+        The number of best traces of each sample measured on all the samples.
+
+    Returns
+    -------
+    sch : Optional[Schedule]
+        The tuned schedule of the symbolic module, or None if no trace applies to it.
+    """
+    logger.info("Working directory: %s", work_dir)
+    # pylint: disable=protected-access
+    mod = Parse._mod(mod)
+    target = Parse._target(target)
+    builder = Parse._builder(builder)
+    runner = Parse._runner(runner)
+    database = Parse._database(database, task_name, work_dir)
+    samples = [_specialize_shape(mod, binding) for binding in shape_samples]
+    # Step 1. Tune each shape sample as a static module
+    tune_contexts = [
+        Parse._tune_context(
+            tune_context=None,
+            mod=sample,
+            target=target,
+            config=config,
+            task_name=f"{task_name}_{i}",
+            space_generator=space,
+            sch_rules=sch_rules,
+            postprocs=postprocs,
+            mutator_probs=mutator_probs,
+            num_threads=num_threads,
+        )
+        for i, sample in enumerate(samples)
+    ]
+    task_scheduler = Parse._task_scheduler(
+        task_scheduler,
+        tune_contexts,
+        builder=builder,
+        runner=runner,
+        database=database,
+        cost_model=Parse._cost_model(cost_model),
+        measure_callbacks=Parse._callbacks(
+            measure_callbacks,
+            max_tuning_time_sec=max_tuning_time_sec,
+            convergence_rounds=convergence_rounds,
+        ),
+    )
+    # pylint: enable=protected-access
+    task_scheduler.tune()
+    # Step 2. Replay the best traces of the samples on the symbolic module
+    candidates: List[Schedule] = []
+    seen = set()
+    for sample in samples:
+        for record in database.get_top_k(database.commit_workload(sample), num_candidates):
+            sch = Schedule(mod)
+            try:
+                record.trace.apply_to_schedule(sch, remove_postproc=False)
+            except tvm.TVMError:
+                continue
+            if str(sch.trace) not in seen:
+                seen.add(str(sch.trace))
+                candidates.append(sch)
+    # The symbolic module itself must build, e.g. without vectorizing a loop of symbolic length
+    build_results = builder.build([BuilderInput(sch.mod, target) for sch in candidates])
+    candidates = [sch for sch, res in zip(candidates, build_results) if res.error_msg is None]
+    if not candidates:
+        logger.warning("No tuned trace applies to the symbolic module of task %s", task_name)
+        return None
+    # Step 3. Measure each candidate on every sample
+    builder_inputs = [
+        BuilderInput(_specialize_shape(sch.mod, binding), target)
+        for sch in candidates
+        for binding in shape_samples
+    ]
+    runner_inputs = []
+    indices = []
+    for i, (inp, res) in enumerate(zip(builder_inputs, builder.build(builder_inputs))):
+        if res.error_msg is None:
+            args_info = ArgInfo.from_prim_func(inp.mod["main"])
+            runner_inputs.append(RunnerInput(res.artifact_path, target.kind.name, args_info))
+            indices.append(i)
+    num_samples = len(samples)
+    latencies = [[math.inf] * num_samples for _ in candidates]
+    for i, future in zip(indices, runner.run(runner_inputs)):
+        result = future.result()
+        if result.error_msg is None:
+            run_secs = [float(sec) for sec in result.run_secs]
+            latencies[i // num_samples][i % num_samples] = sum(run_secs) / len(run_secs)
+    # Step 4. Pick the candidate closest to the best of each sample
+    best = [min(lat[j] for lat in latencies) for j in range(num_samples)]
+
+    def _slowdown(lat: List[float]) -> float:
+        if any(math.isinf(sec) for sec in lat):
+            return math.inf
+        return sum(math.log(sec / best_sec) for sec, best_sec in zip(lat, best)) / num_samples
+
+    index = min(range(len(candidates)), key=lambda i: _slowdown(latencies[i]))
+    if math.isinf(_slowdown(latencies[index])):
+        logger.warning("No tuned trace runs on all the shape samples of task %s", task_name)
+        return None
+    # The latencies of the record are those of the shape samples
+    database.commit_tuning_record(
+        TuningRecord(
+            candidates[index].trace,
+            latencies[index],
+            database.commit_workload(mod),
+            target,
+            _symbolic_args_info(mod["main"]),
+        )
+    )
+    return candidates[index]
+
+
 def tune_te(
     tensors: List[Tensor],
     target: Union[str, Target],
@@ -586,6 +933,76 @@ def tune_te(
     )
 
 
+class _TrialCounter(PyMeasureCallback):
+    """Append the number of trials measured in each round to a file, keyed by the structural hash
+    of the tuned module. Unlike the database, it also counts the failed trials."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+
+    def apply(
+        self,
+        task_scheduler: TaskScheduler,
+        task_id: int,
+        measure_candidates: List[MeasureCandidate],
+        builder_results: List[BuilderResult],
+        runner_results: List[RunnerResult],
+    ) -> None:
+        mod = task_scheduler.tasks[task_id].mod
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(f"{structural_hash(mod)} {len(runner_results)}\n")
+
+
+def _load_trial_counts(path: str) -> Dict[int, int]:
+    """Sum up the trial counts written by `_TrialCounter` per structural hash of the module"""
+    trial_counts: Dict[int, int] = {}
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    shash, count = line.split()
+                    trial_counts[int(shash)] = trial_counts.get(int(shash), 0) + int(count)
+    return trial_counts
+
+
+def _resume_config(
+    config: SearchStrategyConfig,
+    database: Database,
+    mod: IRModule,
+    trial_counts: Dict[int, int],
+) -> Optional[SearchStrategyConfig]:
+    """Deduct the trials already measured by the previous run from the search strategy config, so
+    that tuning a module resumes where the previous run left off.
+
+    Parameters
+    ----------
+    config : SearchStrategyConfig
+        The search strategy config.
+    database : Database
+        The database of the previous run.
+    mod : IRModule
+        The module to tune.
+    trial_counts : Dict[int, int]
+        The number of trials measured by the previous run, failed ones included, per structural
+        hash of the module.
+
+    Returns
+    -------
+    config : Optional[SearchStrategyConfig]
+        The config with the remaining trials, or None if the module is already fully tuned.
+    """
+    num_measured = trial_counts.get(structural_hash(mod), 0)
+    if database.has_workload(mod):
+        # The previous run may predate the trial counts, fall back to the successful trials
+        workload = database.commit_workload(mod)
+        num_measured = max(num_measured, len(database.get_top_k(workload, config.num_trials_total)))
+    num_remaining = config.num_trials_total - num_measured
+    if num_remaining <= 0:
+        return None
+    return config._replace(num_trials_total=num_remaining)
+
+
 def deduplicate_extracted_tasks(
     extracted_tasks: List[ExtractedTask],
 ) -> Tuple[List[ExtractedTask], List[int]]:
@@ -629,12 +1046,15 @@ def tune_extracted_tasks(
     database: Optional[Database] = None,
     cost_model: Optional[CostModel] = None,
     measure_callbacks: Optional[List[MeasureCallback]] = None,
-    task_scheduler: Optional[TaskScheduler] = None,
+    task_scheduler: Union[None, str, TaskScheduler] = None,
     space: Optional[FnSpaceGenerator] = None,
     sch_rules: Optional[FnScheduleRule] = None,
     postprocs: Optional[FnPostproc] = None,
     mutator_probs: Optional[FnMutatorProb] = None,
     num_threads: Optional[int] = None,
+    max_tuning_time_sec: Optional[float] = None,
+    convergence_rounds: Optional[int] = None,
+    resume: bool = False,
 ) -> Database:
     """Tune extracted tasks with a given target.
 
@@ -658,8 +1078,9 @@ def tune_extracted_tasks(
         The cost model to use.
     measure_callbacks : Optional[List[MeasureCallback]]
         The callbacks used during tuning.
-    task_scheduler : Optional[TaskScheduler]
-        The task scheduler to use.
+    task_scheduler : Union[None, str, TaskScheduler]
+        The task scheduler to use, or one of "round_robin" (default) and "gradient". The
+        gradient based scheduler weights each task by how many times it occurs.
     space : Optional[FnSpaceGenerator]
         The space generator to use.
     sch_rules : Optional[FnScheduleRule]
@@ -670,6 +1091,17 @@ def tune_extracted_tasks(
         The probability distribution to use different mutators.
     num_threads : Optional[int]
         The number of threads to use.
+    max_tuning_time_sec : Optional[float]
+        The wall-clock budget of tuning in seconds. Tuning stops once it is used up, even if
+        the trials are not.
+    convergence_rounds : Optional[int]
+        If given, a task is stopped once its best latency has not improved for this many rounds.
+    resume : bool
+        Whether to resume from the tuning records in the database, e.g. after a restart. The
+        trials already measured for a task, as counted in `work_dir`, are deducted from its
+        budget, fully tuned tasks are skipped, and the XGBModel cost model is warm started from
+        the records. Without a `work_dir`, only the successful trials in the database are
+        deducted.
 
     Returns
     -------
@@ -679,20 +1111,33 @@ def tune_extracted_tasks(
     """
     # deduplication
     logger.info("Before task deduplication: %d tasks", len(extracted_tasks))
-    extracted_tasks, _ = deduplicate_extracted_tasks(extracted_tasks)
+    extracted_tasks, task_counts = deduplicate_extracted_tasks(extracted_tasks)
     logger.info("After task deduplication: %d tasks", len(extracted_tasks))
     # pylint: disable=protected-access
     target = Parse._target(target)
+    database = Parse._database(database, "default", work_dir)
+    trial_count_path = None if work_dir is None else os.path.join(work_dir, "trial_counts.txt")
+    trial_counts = _load_trial_counts(trial_count_path) if resume and trial_count_path else {}
+    if resume and work_dir is None:
+        logger.warning(
+            "No work_dir to count the trials in, resuming from the successful tuning records only"
+        )
     # parse the tuning contexts
     tune_contexts = []
-    for task in extracted_tasks:
+    task_weights = []
+    for task, count in zip(extracted_tasks, task_counts):
         assert len(task.dispatched) == 1, "Only size 1 dispatched task list is supported for now"
+        mod = Parse._mod(task.dispatched[0])
+        task_config = _resume_config(config, database, mod, trial_counts) if resume else config
+        if task_config is None:
+            logger.info("Task %s is already tuned in the database, skipping", task.task_name)
+            continue
         tune_contexts.append(
             Parse._tune_context(
                 tune_context=None,
-                mod=Parse._mod(task.dispatched[0]),
+                mod=mod,
                 target=target,
-                config=config,
+                config=task_config,
                 task_name=task.task_name,
                 space_generator=space,
                 sch_rules=sch_rules,
@@ -701,16 +1146,35 @@ def tune_extracted_tasks(
                 num_threads=num_threads,
             )
         )
+        task_weights.append(float(count))
+    if not tune_contexts:
+        return database
+    cost_model = Parse._cost_model(cost_model)
+    if resume and isinstance(cost_model, XGBModel):
+        num_records = cost_model.warm_start(
+            database,
+            feature_cache_path=(
+                None if work_dir is None else os.path.join(work_dir, "feature_cache.npz")
+            ),
+        )
+        logger.info("Warm started the cost model with %d tuning records", num_records)
+    measure_callbacks = Parse._callbacks(
+        measure_callbacks,
+        max_tuning_time_sec=max_tuning_time_sec,
+        convergence_rounds=convergence_rounds,
+    )
+    if trial_count_path is not None:
+        measure_callbacks.append(_TrialCounter(trial_count_path))
     # parse the task scheduler
-    database = Parse._database(database, "default", work_dir)
     task_scheduler = Parse._task_scheduler(
         task_scheduler,
         tune_contexts,
         builder=Parse._builder(builder),
         runner=Parse._runner(runner),
         database=database,
-        cost_model=Parse._cost_model(cost_model),
-        measure_callbacks=Parse._callbacks(measure_callbacks),
+        cost_model=cost_model,
+        measure_callbacks=measure_callbacks,
+        task_weights=task_weights,
     )
     # pylint: enable=protected-access
     task_scheduler.tune()
@@ -729,12 +1193,15 @@ def tune_relay(
     database: Optional[Database] = None,
     cost_model: Optional[CostModel] = None,
     measure_callbacks: Optional[List[MeasureCallback]] = None,
-    task_scheduler: Optional[TaskScheduler] = None,
+    task_scheduler: Union[None, str, TaskScheduler] = None,
     space: Optional[FnSpaceGenerator] = None,
     sch_rules: Optional[FnScheduleRule] = None,
     postprocs: Optional[FnPostproc] = None,
     mutator_probs: Optional[FnMutatorProb] = None,
     num_threads: Optional[int] = None,
+    max_tuning_time_sec: Optional[float] = None,
+    convergence_rounds: Optional[int] = None,
+    resume: bool = False,
 ) -> Module:
     """Tune a TIR IRModule with a given target.
 
@@ -764,6 +1231,12 @@ def tune_relay(
         The function to create TuneContext.
     f_task_scheduler : Optional[TYPE_F_TASK_SCHEDULER]
         The function to create TaskScheduler.
+    max_tuning_time_sec : Optional[float]
+        The wall-clock budget of tuning in seconds.
+    convergence_rounds : Optional[int]
+        If given, a task is stopped once its best latency has not improved for this many rounds.
+    resume : bool
+        Whether to resume from the tuning records in the database, e.g. after a restart.
 
     Returns
     -------
@@ -789,6 +1262,9 @@ def tune_relay(
         postprocs=postprocs,
         mutator_probs=mutator_probs,
         num_threads=num_threads,
+        max_tuning_time_sec=max_tuning_time_sec,
+        convergence_rounds=convergence_rounds,
+        resume=resume,
     )
     with ApplyHistoryBest(database):
         with tvm.transform.PassContext(
@@ -796,3 +1272,161 @@ def tune_relay(
             config={"relay.backend.use_meta_schedule": True},
         ):
             return relay_build(mod, target=target, params=params)
+
+
+def tune_relax(
+    mod: Union["RelaxFunc", IRModule],
+    target: Union[str, Target],
+    config: SearchStrategyConfig,
+    work_dir: str,
+    *,
+    builder: Optional[Builder] = None,
+    runner: Optional[Runner] = None,
+    database: Optional[Database] = None,
+    cost_model: Optional[CostModel] = None,
+    measure_callbacks: Optional[List[MeasureCallback]] = None,
+    task_scheduler: Union[None, str, TaskScheduler] = None,
+    space: Optional[FnSpaceGenerator] = None,
+    sch_rules: Optional[FnScheduleRule] = None,
+    postprocs: Optional[FnPostproc] = None,
+    mutator_probs: Optional[FnMutatorProb] = None,
+    num_threads: Optional[int] = None,
+    max_tuning_time_sec: Optional[float] = None,
+    convergence_rounds: Optional[int] = None,
+    resume: bool = False,
+    shape_samples: Optional[List[Dict[str, int]]] = None,
+) -> IRModule:
+    """Tune a Relax IRModule with a given target.
+
+    Parameters
+    ----------
+    mod : Union[RelaxFunc, IRModule]
+        The module to tune.
+    target : Union[str, Target]
+        The target to tune for.
+    config : SearchStrategyConfig
+        The search strategy config.
+    work_dir : Optional[str]
+        The working directory to save intermediate results.
+    builder : Optional[Builder]
+        The builder to use.
+    runner : Optional[Runner]
+        The runner to use.
+    database : Optional[Database]
+        The database to use.
+    cost_model : Optional[CostModel]
+        The cost model to use.
+    measure_callbacks : Optional[List[MeasureCallback]]
+        The callbacks used during tuning.
+    task_scheduler : Union[None, str, TaskScheduler]
+        The task scheduler to use, or one of "round_robin" (default) and "gradient".
+    space : Optional[FnSpaceGenerator]
+        The space generator to use.
+    sch_rules : Optional[FnScheduleRule]
+        The search rules to use.
+    postprocs : Optional[FnPostproc]
+        The postprocessors to use.
+    mutator_probs : Optional[FnMutatorProb]
+        The probability distribution to use different mutators.
+    num_threads : Optional[int]
+        The number of threads to use.
+    max_tuning_time_sec : Optional[float]
+        The wall-clock budget of tuning in seconds, shared by the static and the symbolic tasks.
+        The symbolic tasks left once it is used up are not tuned.
+    convergence_rounds : Optional[int]
+        If given, a task is stopped once its best latency has not improved for this many rounds.
+    resume : bool
+        Whether to resume from the tuning records in the database, e.g. after a restart.
+    shape_samples : Optional[List[Dict[str, int]]]
+        The representative values of the symbolic vars by name, e.g. of the batch size. If
+        given, the TIR functions with symbolic shapes are tuned with `tune_symbolic_tir`, and a
+        single record serves all their shapes. Otherwise, they are tuned as the static ones.
+
+    Returns
+    -------
+    mod : IRModule
+        The module with the TIR functions replaced by the best schedules in the database, ready
+        to be built with `relax.vm.build`.
+    """
+    from tvm.relax.expr import Function as RelaxFunc
+    from tvm.relax.transform import MetaScheduleApplyHistoryBest
+
+    logger.info("Working directory: %s", work_dir)
+    tuning_start = time.time()
+    if isinstance(mod, RelaxFunc):
+        mod = IRModule.from_expr(mod)
+    target = Parse._target(target)  # pylint: disable=protected-access
+    extracted_tasks = extract_task_from_relax(mod, target)
+    symbolic_tasks = []
+    if shape_samples:
+        static_tasks = []
+        for task in extracted_tasks:
+            task_mod = Parse._mod(task.dispatched[0])  # pylint: disable=protected-access
+            if _symbolic_vars(task_mod["main"]):
+                symbolic_tasks.append(task)
+            else:
+                static_tasks.append(task)
+        extracted_tasks = static_tasks
+    database = tune_extracted_tasks(
+        extracted_tasks,
+        target,
+        config,
+        work_dir,
+        builder=builder,
+        runner=runner,
+        database=database,
+        cost_model=cost_model,
+        measure_callbacks=measure_callbacks,
+        task_scheduler=task_scheduler,
+        space=space,
+        sch_rules=sch_rules,
+        postprocs=postprocs,
+        mutator_probs=mutator_probs,
+        num_threads=num_threads,
+        max_tuning_time_sec=max_tuning_time_sec,
+        convergence_rounds=convergence_rounds,
+        resume=resume,
+    )
+    symbolic_tasks, _ = deduplicate_extracted_tasks(symbolic_tasks)
+    for task in symbolic_tasks:
+        task_mod = Parse._mod(task.dispatched[0])  # pylint: disable=protected-access
+        if resume and database.has_workload(task_mod):
+            if database.get_top_k(database.commit_workload(task_mod), 1):
+                logger.info("Task %s is already tuned in the database, skipping", task.task_name)
+                continue
+        remaining_time_sec = None
+        if max_tuning_time_sec is not None:
+            remaining_time_sec = max_tuning_time_sec - (time.time() - tuning_start)
+            if remaining_time_sec <= 0:
+                logger.warning("Tuning time budget is used up, skipping the remaining tasks")
+                break
+        # Restrict the samples to the symbolic vars of the task
+        sym_vars = _symbolic_vars(task_mod["main"])
+        samples = []
+        for binding in shape_samples:
+            sample = {name: binding[name] for name in sym_vars if name in binding}
+            if sample not in samples:
+                samples.append(sample)
+        tune_symbolic_tir(
+            task_mod,
+            target,
+            config,
+            work_dir,
+            samples,
+            task_name=task.task_name,
+            builder=builder,
+            runner=runner,
+            database=database,
+            cost_model=cost_model,
+            measure_callbacks=measure_callbacks,
+            task_scheduler=task_scheduler,
+            space=space,
+            sch_rules=sch_rules,
+            postprocs=postprocs,
+            mutator_probs=mutator_probs,
+            num_threads=num_threads,
+            max_tuning_time_sec=remaining_time_sec,
+            convergence_rounds=convergence_rounds,
+        )
+    with tvm.transform.PassContext(opt_level=3):
+        return MetaScheduleApplyHistoryBest(database, target)(mod)
@@ -119,3 +119,8 @@ class TuneContext(Object):
             rand_state,
             num_threads,
         )
+
+    def initialize(self) -> None:
+        """Initialize the space generator, search strategy, schedule rules, postprocessors and
+        mutators of the tuning context with the context itself."""
+        _ffi_api.TuneContextInitialize(self)  # type: ignore # pylint: disable=no-member
@@ -20,6 +20,7 @@ from . import exec_builder
 from . import expr
 from . import ty
 from . import vm
+from . import aot
 from . import block_builder
 from . import op
 from . import analysis
@@ -37,3 +37,24 @@ def post_order_visit(expr, fvisit):
         The visitor function to be applied.
     """
     return _ffi_api.post_order_visit(expr, fvisit)
+
+
+def meta_schedule_report(mod, database):
+    """Report which PrimFuncs of a module have a schedule in the tuning database,
+    along with their estimated share of the cost.
+
+    Parameters
+    ----------
+    mod : tvm.IRModule
+        The input module.
+
+    database : tvm.meta_schedule.database.Database
+        The tuning database.
+
+    Returns
+    -------
+    ret : List[Dict[str, Object]]
+        One entry per PrimFunc, with its "name", its "status" ("hit" or "miss"),
+        its estimated "flop", and its "cost_share" of the FLOPs of all the PrimFuncs.
+    """
+    return _ffi_api.meta_schedule_report(mod, database)
@@ -0,0 +1,118 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=invalid-name
+"""Ahead-of-time compilation of static-shape Relax functions"""
+from typing import Callable, Dict, List, Tuple, Union
+
+import tvm
+from tvm import relax
+from tvm.ir.module import IRModule
+from tvm.runtime import Module, NDArray
+from tvm.target import Target
+
+from . import _ffi_api
+from .vm import _split_tir_relax
+
+
+class AOTModule(object):
+    """A runtime module in which each Relax function is a native host function.
+
+    The host function generated for a Relax function takes its inputs followed by its outputs,
+    and calls the PrimFuncs directly without going through the VM interpreter. The module
+    allocates the outputs before calling it. The underlying ``lib`` can be exported with
+    ``export_library``, after which the host functions are called with the outputs passed
+    explicitly.
+    """
+
+    def __init__(self, lib: Module, outputs: Dict[str, List[Tuple[Tuple[int, ...], str]]]) -> None:
+        """
+        Parameters
+        ----------
+        lib : tvm.runtime.Module
+            The runtime module containing the host functions and the PrimFuncs.
+
+        outputs : Dict[str, List[Tuple[Tuple[int, ...], str]]]
+            The shape and dtype of the outputs of each host function.
+        """
+        self.lib = lib
+        self.outputs = outputs
+
+    def __getitem__(self, key: str) -> Callable[..., Union[NDArray, Tuple[NDArray, ...]]]:
+        func = self.lib[key]
+        outputs = self.outputs[key]
+
+        def _call(*args: NDArray) -> Union[NDArray, Tuple[NDArray, ...]]:
+            dev = args[0].device if args else tvm.cpu()
+            outs = [tvm.nd.empty(shape, dtype, dev) for shape, dtype in outputs]
+            func(*args, *outs)
+            return outs[0] if len(outs) == 1 else tuple(outs)
+
+        return _call
+
+    def export_library(self, file_name: str, **kwargs) -> None:
+        """Export the underlying runtime module to a shared library."""
+        self.lib.export_library(file_name, **kwargs)
+
+
+def build(mod: IRModule, target: Union[str, Target]) -> AOTModule:
+    """
+    Compile the Relax functions of an IRModule ahead of time.
+
+    Each Relax function is lowered to a host function which calls the PrimFuncs with buffers
+    planned at compile time, instead of an executable interpreted by the VM. Only functions with
+    static shapes and no control flow are supported, on CPU targets.
+
+    Parameters
+    ----------
+    mod: IRModule
+        The input IRModule to be built.
+
+    target : Union[str, tvm.target.Target]
+        The CPU target to build for.
+
+    Returns
+    -------
+    aot_mod: AOTModule
+        The module whose functions can be called directly on NDArrays.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        aot_mod = relax.aot.build(mod, tvm.target.Target("llvm"))
+        res = aot_mod["main"](data, weight)
+    """
+    target = Target(target) if isinstance(target, str) else target
+    if "cpu" not in target.keys:
+        raise ValueError("AOT compilation of Relax only supports CPU targets, got %s" % target)
+    seq = tvm.transform.Sequential(
+        [relax.transform.ToNonDataflow(), relax.transform.CallTIRRewrite()]
+    )
+    new_mod = seq(mod)
+    _, tir_mod = _split_tir_relax(new_mod)
+    host_mod = _ffi_api.AOTCodeGen(new_mod)
+    outputs = {}
+    for gv, func in host_mod.functions.items():
+        num_outputs = func.attrs["relax.aot_num_outputs"].value
+        outputs[gv.name_hint] = [
+            (tuple(int(dim) for dim in func.buffer_map[param].shape), func.buffer_map[param].dtype)
+            for param in func.params[len(func.params) - num_outputs :]
+        ]
+        tir_mod[gv.name_hint] = func
+    lib = tvm.build(tir_mod, target)
+    return AOTModule(lib, outputs)
@@ -292,6 +292,21 @@ class BlockBuilder(Object):
         """
         return _ffi_api.BlockBuilderEmit(self, expr)
 
+    def lookup_binding(self, var: Var) -> Expr:
+        """Look up the value bound to a var emitted by this builder.
+
+        Parameters
+        ----------
+        var : tvm.relax.Var
+            The var to be looked up.
+
+        Returns
+        -------
+        ret : tvm.relax.Expr
+            The value bound to the var.
+        """
+        return _ffi_api.BlockBuilderLookupBinding(self, var)
+
     def emit_te(self, func: Callable, *args: Any, **kwargs: Any) -> Var:
         """Emit a call node according to the te function.
         This function converts arguments from relax expression to te tensor,
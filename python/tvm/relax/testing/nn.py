@@ -18,6 +18,7 @@
 """PyTorch-like nn.Module API for constructing workloads."""
 
 
+import math
 from typing import List, Any, Callable
 import tvm
 from tvm import relax, topi, tir
@@ -114,6 +115,7 @@ def _unpack_params(value: object) -> List[relax.Var]:
 def init_params(mod: tvm.IRModule) -> List[tvm.nd.array]:
     """Utility function to initialize model's parameters."""
     shape_dict = {v.name_hint: v.shape_ for v in mod["main"].params}
+    dtype_dict = {v.name_hint: v.type_annotation.dtype for v in mod["main"].params}
     params = []
     for k, v in shape_dict.items():
         if k.startswith("data"):
@@ -125,7 +127,7 @@ def init_params(mod: tvm.IRModule) -> List[tvm.nd.array]:
                     shape.append(int(i))
                 else:
                     raise TypeError("cannot initialize for unknown-shape parameters.")
-            params.append(tvm.nd.array(np.zeros(shape).astype(np.float32)))
+            params.append(tvm.nd.array(np.zeros(shape).astype(dtype_dict[k])))
         else:
             raise TypeError("cannot initialize for unknown-shape parameters.")
     return params
@@ -186,3 +188,37 @@ class Linear(Module):
         if self.bias is not None:
             y = emit_te(topi.add, y, self.bias)
         return y
+
+
+class BlockSparseAttention(Module):
+    r"""Computes scaled dot-product attention restricted to the blocks of a fixed BSR mask:
+    :math:`y = \mathrm{softmax}(QK^T / \sqrt{d} \odot M) V`.
+
+    Only the nonzero blocks of the mask are materialized, so the memory of the attention
+    scores scales with the number of mask blocks instead of `seq_len ** 2`. The mask structure
+    (`indices` and `indptr` of the BSR layout, e.g. a Longformer/BigBird pattern) is given by
+    the two int32 parameters of the layer.
+    """
+
+    def __init__(self, seq_len, head_dim, block_size, num_blocks):
+        if seq_len % block_size != 0:
+            raise ValueError("seq_len should be a multiple of block_size")
+        self.seq_len = seq_len
+        self.head_dim = head_dim
+        self.block_size = block_size
+        self.num_blocks = num_blocks
+        self.mask_indices = Parameter((num_blocks,), dtype="int32", name="attn_mask_indices")
+        self.mask_indptr = Parameter(
+            (seq_len // block_size + 1,), dtype="int32", name="attn_mask_indptr"
+        )
+
+    def forward(  # pylint: disable=arguments-differ
+        self, query: relax.Expr, key: relax.Expr, value: relax.Expr
+    ) -> relax.Var:
+        block_size = (self.block_size, self.block_size)
+        scores = emit_te(
+            topi.sparse.sddmm, query, key, self.mask_indices, self.mask_indptr, block_size
+        )
+        scores = emit_te(topi.multiply, scores, 1.0 / math.sqrt(self.head_dim))
+        probs = emit_te(topi.nn.sparse_softmax, scores, self.mask_indices, self.mask_indptr)
+        return emit_te(topi.sparse.bsrmm, probs, self.mask_indices, self.mask_indptr, value)
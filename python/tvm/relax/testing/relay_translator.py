@@ -18,11 +18,126 @@
 """Relay to Relax translator."""
 
 from __future__ import annotations
-from typing import Dict, List
+import contextlib
+from typing import Callable, Dict, List, Optional, Tuple, Union
 import tvm
+from tvm import tir
 from tvm.ir.module import IRModule
 from tvm import relax, relay, topi
+from tvm.contrib import cblas, mkl, mkldnn
 from tvm.relax.testing import nn
+from tvm.runtime import NDArray
+from tvm.target import Target
+
+
+class LibraryDispatch(object):
+    """A policy dispatching the matmuls of the translated program to a vendor library.
+
+    The matmuls for which the policy picks the library are emitted as call_tir to PrimFuncs
+    which call the library with ``tvm_call_packed``, so that the outputs are allocated the same
+    way as for the generated kernels. The other matmuls keep the generated kernels.
+
+    Parameters
+    ----------
+    library : str
+        The library to call, "cblas", "mkl" or "mkldnn". The runtime must be built with it,
+        otherwise no matmul is dispatched.
+
+    min_flops : int
+        The default policy picks the library for the matmuls of at least ``min_flops`` floating
+        point operations. The kernels generated for smaller matmuls are usually faster once
+        tuned, as they are fused and avoid the call overhead of the library.
+
+    policy : Optional[Callable[[str, List[int], List[int]], bool]]
+        If defined, overrides the default policy. It takes the name of the Relay op and the
+        static shapes of the two operands, and returns whether to call the library.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        relax_mod = relay_translator.from_relay(
+            relay_mod["main"], library_dispatch=LibraryDispatch("mkl", min_flops=2**24)
+        )
+    """
+
+    _current = None
+
+    def __init__(
+        self,
+        library: str = "cblas",
+        min_flops: int = 2**20,
+        policy: Optional[Callable[[str, List[int], List[int]], bool]] = None,
+    ):
+        if library not in ("cblas", "mkl", "mkldnn"):
+            raise ValueError("Unsupported library {}".format(library))
+        self.library = library
+        self.min_flops = min_flops
+        self.policy = policy
+        self._old = None
+
+    def __enter__(self) -> "LibraryDispatch":
+        self._old = LibraryDispatch._current
+        LibraryDispatch._current = self
+        return self
+
+    def __exit__(self, ptype, value, trace):
+        LibraryDispatch._current = self._old
+
+    @staticmethod
+    def current() -> Optional["LibraryDispatch"]:
+        """Get the library dispatch policy in scope."""
+        return LibraryDispatch._current
+
+    def dispatch(
+        self, op_name: str, inputs: List[relax.Expr], transpose_b: bool = True
+    ) -> Optional[Callable]:
+        """Get the function emitting the op with the library, or None to keep the generated
+        kernel.
+
+        Parameters
+        ----------
+        op_name : str
+            The name of the Relay op, "nn.dense" or "nn.batch_matmul"
+
+        inputs : List[relax.Expr]
+            The operands of the op
+
+        transpose_b : bool
+            Whether the second operand is transposed
+
+        Returns
+        -------
+        func : Optional[Callable]
+            The te function of the library computing the op
+        """
+        lib = {"cblas": cblas, "mkl": mkl, "mkldnn": mkldnn}[self.library]
+        func_name = "matmul" if op_name == "nn.dense" else "batch_matmul"
+        if not hasattr(lib, func_name) or not tvm.get_global_func(
+            "tvm.contrib.{}.{}".format(self.library, func_name), allow_missing=True
+        ):
+            return None
+        # The libraries only take float32 operands of static shapes
+        shapes = []
+        for inp in inputs:
+            if inp.checked_type.dtype != "float32" or not isinstance(inp.shape, relax.ShapeExpr):
+                return None
+            if not all(isinstance(dim, tir.IntImm) for dim in inp.shape.values):
+                return None
+            shapes.append([int(dim) for dim in inp.shape.values])
+        if op_name == "nn.batch_matmul" and shapes[0][0] != shapes[1][0]:
+            return None
+        if self.policy is not None:
+            use_library = self.policy(op_name, *shapes)
+        else:
+            # 2 * M * K * N, with the batch dimension in the first operand for batch_matmul
+            flops = 2
+            for dim in shapes[0]:
+                flops *= dim
+            flops *= shapes[1][-2] if transpose_b else shapes[1][-1]
+            use_library = flops >= self.min_flops
+        return getattr(lib, func_name) if use_library else None
 
 
 class RelayOpConverter(object):
@@ -45,9 +160,24 @@ class Dense(RelayOpConverter):
 
     @classmethod
     def _impl(cls, inputs, attrs):
+        dispatch = LibraryDispatch.current()
+        lib_func = dispatch.dispatch("nn.dense", inputs) if dispatch else None
+        if lib_func is not None and attrs["out_dtype"] in ("", "float32"):
+            return nn.emit_te(
+                lib_func, *inputs, False, True, primfunc_name_hint=dispatch.library + "_matmul"
+            )
         return nn.emit_te(topi.nn.dense, *inputs)
 
 
+class DensePack(RelayOpConverter):
+    """Operator converter for nn.contrib_dense_pack."""
+
+    @classmethod
+    def _impl(cls, inputs, attrs):
+        out_dtype = attrs["out_dtype"] if attrs["out_dtype"] else None
+        return nn.emit_te(topi.nn.dense_pack, *inputs, None, out_dtype)
+
+
 class BatchNorm(RelayOpConverter):
     """Operator converter for nn.batch_norm."""
 
@@ -72,6 +202,24 @@ class Conv2D(RelayOpConverter):
         return nn.emit_te(topi.nn.conv2d_nchw, *new_inputs)
 
 
+class Conv2DNCHWc(RelayOpConverter):
+    """Operator converter for nn.contrib_conv2d_NCHWc."""
+
+    @classmethod
+    def _impl(cls, inputs, attrs):
+        out_dtype = attrs["out_dtype"] if attrs["out_dtype"] else inputs[0].checked_type.dtype
+        return nn.emit_te(
+            topi.nn.conv2d_NCHWc,
+            *inputs,
+            attrs["strides"],
+            attrs["padding"],
+            attrs["dilation"],
+            attrs["data_layout"],
+            attrs["out_layout"],
+            out_dtype,
+        )
+
+
 class BatchMatmul(RelayOpConverter):
     """Operator converter for nn.batch_matmul."""
 
@@ -84,6 +232,18 @@ class BatchMatmul(RelayOpConverter):
             new_attrs["transpose_a"] = bool(new_attrs["transpose_a"])
         if "transpose_b" in new_attrs:
             new_attrs["transpose_b"] = bool(new_attrs["transpose_b"])
+        transpose_a = new_attrs.get("transpose_a", False)
+        transpose_b = new_attrs.get("transpose_b", True)
+        dispatch = LibraryDispatch.current()
+        lib_func = dispatch.dispatch("nn.batch_matmul", inputs, transpose_b) if dispatch else None
+        if lib_func is not None:
+            return nn.emit_te(
+                lib_func,
+                *inputs,
+                transpose_a,
+                transpose_b,
+                primfunc_name_hint=dispatch.library + "_batch_matmul",
+            )
         return nn.emit_te(topi.nn.batch_matmul, *inputs, **new_attrs)
 
 
@@ -96,6 +256,23 @@ class Softmax(RelayOpConverter):
         return nn.emit_te(topi.nn.softmax, *inputs, **new_attrs)
 
 
+class SDDMM(RelayOpConverter):
+    """Operator converter for nn.sddmm."""
+
+    @classmethod
+    def _impl(cls, inputs, attrs):
+        block_size = [int(b) for b in attrs["block_size"]]
+        return nn.emit_te(topi.sparse.sddmm, *inputs, block_size)
+
+
+class SparseSoftmax(RelayOpConverter):
+    """Operator converter for nn.sparse_softmax."""
+
+    @classmethod
+    def _impl(cls, inputs, attrs):
+        return nn.emit_te(topi.nn.sparse_softmax, *inputs)
+
+
 # convert_map defines maps of name to converter functor(callable)
 # use attr_convert if attributes need to be converted
 # for 1 to N mapping(composed), use custom callable functions
@@ -105,10 +282,14 @@ class Softmax(RelayOpConverter):
 def get_convert_map():
     return {
         "nn.dense": Dense.get_converter(),
+        "nn.contrib_dense_pack": DensePack.get_converter(),
         "nn.batch_norm": BatchNorm.get_converter(),
         "nn.conv2d": Conv2D.get_converter(),
+        "nn.contrib_conv2d_NCHWc": Conv2DNCHWc.get_converter(),
         "nn.batch_matmul": BatchMatmul.get_converter(),
         "nn.softmax": Softmax.get_converter(),
+        "nn.sddmm": SDDMM.get_converter(),
+        "nn.sparse_softmax": SparseSoftmax.get_converter(),
     }
 
 
@@ -149,20 +330,176 @@ def attr_convert(attrs: tvm.ir.Attrs) -> Dict:
     return attrs_dict
 
 
-def from_relay(func: relay.Function) -> IRModule:
+def _handle(node: tvm.runtime.Object) -> int:
+    return node.handle.value
+
+
+def _is_static(ty: relay.Type) -> bool:
+    if isinstance(ty, relay.TensorType):
+        return all(isinstance(dim, tir.IntImm) for dim in ty.shape)
+    if isinstance(ty, relay.TupleType):
+        return all(_is_static(field) for field in ty.fields)
+    return False
+
+
+class _StructuralKey(object):
+    """A dict key comparing IR objects structurally."""
+
+    def __init__(self, obj: tvm.runtime.Object):
+        self.obj = obj
+        self._hash = tvm.ir.structural_hash(obj)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _StructuralKey) and tvm.ir.structural_equal(self.obj, other.obj)
+
+
+class _CallTIRCache(object):
+    """Reuse the PrimFuncs lowered for the Relay calls of the same op, attributes and types.
+
+    Lowering the ops with TE takes most of the translation time, while the calls of a model
+    repeat a few signatures. The first call of a signature is emitted as usual, and the later
+    ones emit a call_tir to the same PrimFunc with their own arguments. Only the calls of static
+    shapes are cached, as the PrimFuncs of symbolic shapes take the shape variables in scope.
+    """
+
+    def __init__(self, bb: relax.BlockBuilder):
+        self.bb = bb
+        self.call_tir_op = tvm.ir.Op.get("relax.call_tir")
+        # the call_tir emitted for each signature, and the indices of its arguments in the inputs
+        self.entries: Dict[_StructuralKey, Tuple[relax.Call, List[int]]] = {}
+
+    @staticmethod
+    def signature(node: relay.Call) -> Optional[_StructuralKey]:
+        types = [arg.checked_type for arg in node.args] + [node.checked_type]
+        if not all(_is_static(ty) for ty in types):
+            return None
+        fields = [node.op] + ([node.attrs] if node.attrs is not None else []) + types
+        return _StructuralKey(tvm.runtime.convert(fields))
+
+    def lookup(
+        self, signature: Optional[_StructuralKey], inputs: List[relax.Expr]
+    ) -> Optional[relax.Var]:
+        entry = self.entries.get(signature) if signature is not None else None
+        if entry is None:
+            return None
+        call, arg_indices = entry
+        if any(i >= len(inputs) for i in arg_indices):
+            return None
+        args = [inputs[i] for i in arg_indices]
+        return self.bb.emit(relax.op.call_tir(call.args[0], call.args[1], args))
+
+    def record(
+        self, signature: Optional[_StructuralKey], inputs: List[relax.Expr], var: relax.Var
+    ) -> None:
+        if signature is None:
+            return
+        call = self.bb.lookup_binding(var)
+        if (
+            not isinstance(call, relax.Call)
+            or not call.op.same_as(self.call_tir_op)
+            or len(call.args) != 3
+        ):
+            return
+        # the arguments cannot be told apart when an input is passed several times
+        if len({_handle(inp) for inp in inputs}) != len(inputs):
+            return
+        arg_indices = []
+        for arg in call.args[2].fields:
+            index = next((i for i, inp in enumerate(inputs) if inp.same_as(arg)), None)
+            if index is None:
+                return
+            arg_indices.append(index)
+        self.entries[signature] = (call, arg_indices)
+
+
+def alter_layout(
+    func: relay.Function,
+    target: Union[str, Target],
+    params: Optional[Dict[str, NDArray]] = None,
+) -> relay.Function:
+    """Rewrite the conv2d and dense of a Relay function to the layouts preferred by the target.
+
+    This runs Relay's AlterOpLayout, which picks the blocked layouts of the target, e.g. NCHWc
+    for conv2d on x86, and only keeps the layout transforms at the boundaries of the subgraphs
+    working in a blocked layout. The layout transforms of the weights bound in ``params`` are
+    folded, so that the weights are packed once at compile time instead of in every call.
+
+    Parameters
+    ----------
+    func : relay.Function
+        Relay function to be rewritten
+
+    target : Union[str, tvm.target.Target]
+        The target whose layouts are used
+
+    params : Optional[Dict[str, tvm.runtime.NDArray]]
+        The weights to bind as constants
+
+    Returns
+    -------
+    func : relay.Function
+        The rewritten Relay function
+    """
+    target = Target(target) if isinstance(target, str) else target
+    if params:
+        func = relay.build_module.bind_params_by_name(func, params)
+    seq = tvm.transform.Sequential(
+        [
+            relay.transform.InferType(),
+            relay.transform.SimplifyInference(),
+            relay.transform.FoldConstant(),
+            relay.transform.AlterOpLayout(),
+            relay.transform.FoldConstant(),
+            relay.transform.InferType(),
+        ]
+    )
+    with target, tvm.transform.PassContext(opt_level=3):
+        mod = seq(IRModule.from_expr(func))
+    return mod["main"]
+
+
+def from_relay(
+    func: relay.Function,
+    target: Optional[Union[str, Target]] = None,
+    params: Optional[Dict[str, NDArray]] = None,
+    library_dispatch: Optional[LibraryDispatch] = None,
+) -> IRModule:
     """Convert a Relay function into a Relax program.
 
     Parameters
     ----------
     func : relay.Function
-        Relay function to be converted
+        Relay function to be converted. Its types are inferred if they are not already.
+
+    target : Optional[Union[str, tvm.target.Target]]
+        If defined, the conv2d and dense are converted to the layouts of the target with
+        :py:func:`alter_layout` before the translation
+
+    params : Optional[Dict[str, tvm.runtime.NDArray]]
+        The weights to bind as constants. The weights bound are packed to the layouts of the
+        target at compile time.
+
+    library_dispatch : Optional[LibraryDispatch]
+        If defined, the dense and batch_matmul chosen by the policy call a vendor library instead
+        of generated kernels. The dense rewritten to dense_pack for the target are not dispatched.
 
     Returns
     -------
     mod : tvm.IRModule
         The Relax IRModule for compilation
     """
-    # A map to store the mapping of Relay Expr to its corresponding Relax var
+    if target is not None:
+        func = alter_layout(func, target, params)
+    elif params:
+        func = relay.build_module.bind_params_by_name(func, params)
+        func = relay.transform.InferType()(IRModule.from_expr(func))["main"]
+    elif func._checked_type_ is None:
+        func = relay.transform.InferType()(IRModule.from_expr(func))["main"]
+    # A map to store the mapping of Relay Expr to its corresponding Relax var, keyed by the
+    # handles of the Relay nodes so that the lookups do not go through the FFI
     var_map = {}
     # The output of the function
     output_var = None
@@ -173,57 +510,64 @@ def from_relay(func: relay.Function) -> IRModule:
         nonlocal output_var
         if isinstance(node, relay.Var):
             if isinstance(node.type_annotation, relay.TensorType):
-                var_map[node] = nn.Placeholder(
+                var_map[_handle(node)] = nn.Placeholder(
                     tuple(node.type_annotation.shape), node.type_annotation.dtype, node.name_hint
                 )
-                params.append(var_map[node])
+                params.append(var_map[_handle(node)])
             else:
                 raise TypeError("The type of relay.Var to be translated must be of TensorType.")
         elif isinstance(node, relay.Call):
-            args = node.args
             new_args = []
-            for arg in args:
-                if arg in var_map:
-                    new_args.append(var_map[arg])
+            for arg in node.args:
+                if _handle(arg) in var_map:
+                    new_args.append(var_map[_handle(arg)])
 
             op_name = node.op.name
             attrs = node.attrs
-            compute_func = node.op.get_attr("FTVMCompute")
-            if compute_func is None:
-                if node.op.name not in convert_map:
-                    raise tvm.error.OpNotImplemented(
-                        "Operator {} is not supported.".format(op_name)
+            signature = cache.signature(node)
+            var = cache.lookup(signature, new_args)
+            if var is None:
+                compute_func = node.op.get_attr("FTVMCompute")
+                if compute_func is None:
+                    if node.op.name not in convert_map:
+                        raise tvm.error.OpNotImplemented(
+                            "Operator {} is not supported.".format(op_name)
+                        )
+                    var = convert_map[op_name](new_args, attrs)
+                else:
+                    name_hint = op_name.split(".")[-1]
+                    var = bb.emit_te(
+                        compute_func,
+                        attrs,
+                        new_args,
+                        node.checked_type,
+                        primfunc_name_hint=name_hint,
                     )
-                var = convert_operator(op_name, new_args, attrs)
-            else:
-                name_hint = op_name.split(".")[-1]
-                var = bb.emit_te(
-                    compute_func, attrs, new_args, node.checked_type, primfunc_name_hint=name_hint
-                )
+                cache.record(signature, new_args, var)
 
             output_var = var
-            var_map[node] = var
+            var_map[_handle(node)] = var
         elif isinstance(node, relay.Constant):
             # fill the shape and checked_type fields of the Constant
             new_constant = relay.Constant(node.data)
-            var_map[node] = new_constant
+            var_map[_handle(node)] = new_constant
         elif isinstance(node, relay.Tuple):
             new_fields = []
             for field in node.fields:
-                if field in var_map:
-                    new_fields.append(var_map[field])
+                if _handle(field) in var_map:
+                    new_fields.append(var_map[_handle(field)])
                 else:
                     raise RuntimeError("field is not in var_map.")
             new_tuple = relax.Tuple(new_fields)
             new_tuple_var = relax.BlockBuilder.current().emit(new_tuple)
-            var_map[node] = new_tuple_var
+            var_map[_handle(node)] = new_tuple_var
             output_var = new_tuple_var
         elif isinstance(node, relay.TupleGetItem):
-            if node.tuple_value in var_map:
-                new_tuple = var_map[node.tuple_value]
+            if _handle(node.tuple_value) in var_map:
+                new_tuple = var_map[_handle(node.tuple_value)]
                 new_tuple_get_item_node = relax.TupleGetItem(new_tuple, node.index)
                 new_tuple_get_item_var = relax.BlockBuilder.current().emit(new_tuple_get_item_node)
-                var_map[node] = new_tuple_get_item_var
+                var_map[_handle(node)] = new_tuple_get_item_var
                 output_var = new_tuple_get_item_var
             else:
                 raise RuntimeError("tuple is not in var_map")
@@ -235,7 +579,9 @@ def from_relay(func: relay.Function) -> IRModule:
             raise TypeError("{} is not supported yet.".format(str(type(node))))
 
     bb = relax.BlockBuilder()
-    with bb.function("main"):
-        relay.analysis.post_order_visit(func, visit_func)
+    cache = _CallTIRCache(bb)
+    with library_dispatch if library_dispatch is not None else contextlib.nullcontext():
+        with bb.function("main"):
+            relay.analysis.post_order_visit(func, visit_func)
 
     return bb.get()
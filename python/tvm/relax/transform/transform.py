@@ -16,8 +16,11 @@
 # under the License.
 # pylint: disable=invalid-name
 """Relax transformation passes."""
+from typing import List, Optional
+
 import tvm.ir
 from tvm.target import Target
+from tvm.meta_schedule.cost_model import CostModel
 from tvm.meta_schedule.database import PyDatabase
 from . import _ffi_api
 
@@ -90,6 +93,31 @@ def ToANF() -> tvm.ir.transform.Pass:
     return _ffi_api.ToANF()
 
 
+def ToMixedPrecision(
+    out_dtype: str = "float16", exclude: Optional[List[str]] = None
+) -> tvm.ir.transform.Pass:
+    """Convert the float32 tensors computed by PrimFuncs to float16 or bfloat16.
+
+    The converted PrimFuncs keep computing and accumulating in float32, and casts are inserted
+    where the tensors are passed to the calls which stay in float32. The parameters and the
+    results of the Relax functions stay in float32.
+
+    Parameters
+    ----------
+    out_dtype : str
+        The lower precision dtype, "float16" or "bfloat16".
+
+    exclude : Optional[List[str]]
+        The names of the PrimFuncs which stay in float32, ignoring numeric suffixes. If None,
+        numerically sensitive PrimFuncs like softmax and exp are excluded.
+
+    Returns
+    -------
+    ret: tvm.ir.transform.Pass
+    """
+    return _ffi_api.ToMixedPrecision(out_dtype, exclude)
+
+
 def ResolveGlobals() -> tvm.ir.transform.Pass:
     """Resolve global variables using string equality. This ensures all GlobalVars in the IR refer
     to the correct GlobalVar of the input IRModule. An error is reported if any GlobalVar cannot be
@@ -105,16 +133,22 @@ def ResolveGlobals() -> tvm.ir.transform.Pass:
 def MetaScheduleApplyHistoryBest(
     database: PyDatabase,
     target: Target,
+    fallback: bool = False,
+    cost_model: Optional[CostModel] = None,
 ) -> tvm.ir.transform.Pass:
     """Apply the best schedule from tuning database.
     Parameters
     ----------
     database : metaschedule tuning database
     target: target info
+    fallback: whether to schedule the PrimFuncs missing from the database with a default
+        schedule sampled from the design space, without any measurement
+    cost_model: the cost model to pick the fallback schedule among the samples with. If None,
+        the first valid sample is picked
 
     Returns
     -------
     ret: tvm.ir.transform.Pass
 
     """
-    return _ffi_api.MetaScheduleApplyHistoryBest(database, target)
+    return _ffi_api.MetaScheduleApplyHistoryBest(database, target, fallback, cost_model)
@@ -49,6 +49,33 @@ class Executable(Object):
         """print the instructions as python program."""
         return _ffi_api.ExecutableAsPython(self)
 
+    def export_library(self, lib: Module, file_name: str, **kwargs) -> None:
+        """
+        Export the executable, including its constants, together with the library it runs
+        into a single shared library.
+
+        Parameters
+        ----------
+        lib : tvm.runtime.Module
+            The runtime module containing the generated code, as returned by build.
+
+        file_name : str
+            The name of the shared library.
+
+        kwargs : dict
+            Additional arguments passed to tvm.runtime.Module.export_library.
+
+        Example
+        -------
+
+        .. code-block:: python
+
+            ex, lib = relax.vm.build(mod, target)
+            ex.export_library(lib, "model.so")
+            vm = relax.VirtualMachine(tvm.runtime.load_module("model.so"), tvm.cpu())
+        """
+        _ffi_api.ExecutableModule(self, lib).export_library(file_name, **kwargs)
+
 
 def load_exec_from_file(file_name: str) -> Executable:
     return _ffi_api.ExecutableLoadFromFile(file_name)
@@ -62,18 +89,21 @@ class VirtualMachine(object):
 
     def __init__(
         self,
-        exec: Executable,
+        exec: Union[Executable, Module],
         device: Union[Device, List[Device]],
         memory_cfg: Optional[Union[str, Dict[Device, str]]] = None,
         mod: Optional[Module] = None,
+        record_replay: bool = False,
     ) -> None:
         """
         Construct a VirtualMachine wrapper object.
 
         Parameters
         ----------
-        exec: Executable
-            The VM executable.
+        exec: Union[Executable, tvm.runtime.Module]
+            The VM executable, or a module loaded from a shared library exported by
+            Executable.export_library. In the latter case, the executable is deserialized
+            on first use and the library is taken from the module.
 
         device : tvm.runtime.Device or List[tvm.runtime.Device]
             The device to deploy the module.
@@ -89,13 +119,27 @@ class VirtualMachine(object):
         mod : tvm.runtime.Module, optional
             Optional runtime module to load to the VM.
 
+        record_replay : bool
+            Whether to record the calls made by a function the first time it is invoked with
+            tensors of a given shape signature, and replay them directly afterwards, skipping
+            the allocations and the shape computations. A new shape signature records again.
+            The replayed calls reuse the same buffers, so the output of a function is
+            overwritten by its next invocation.
+
         Returns
         -------
         vm: VirtualMachine
             A VM wrapper object.
         """
-        self.module = _ffi_api.VirtualMachine(exec, mod)
+        if isinstance(exec, Module):
+            if mod is not None:
+                raise ValueError("mod must not be given along with an exported executable")
+            self.module = _ffi_api.VirtualMachineFromModule(exec)
+        else:
+            self.module = _ffi_api.VirtualMachine(exec, mod)
         self._setup_device(device, memory_cfg)
+        if record_replay:
+            _ffi_api.VirtualMachineSetRecordReplay(self.module, True)
 
     def _setup_device(self, dev: Device, memory_cfg: Union[str, Dict[Device, str]]) -> None:
         """init devices and allocators."""
@@ -177,12 +221,7 @@ def build(mod: tvm.IRModule, target: tvm.target.Target) -> Tuple[Executable, Mod
         target = tvm.target.Target("llvm", host="llvm")
         ex, lib = relax.vm.build(mod, target)
     """
-    passes = [relax.transform.ToNonDataflow()]
-    passes.append(relax.transform.CallTIRRewrite())
-    passes.append(relax.transform.VMMemoryLower())
-    passes.append(relax.transform.VMShapeLower())
-    seq = tvm.transform.Sequential(passes)
-    new_mod = seq(mod)
+    new_mod = _lower_relax(mod)
 
     # split primfunc and relax function
     rx_mod, tir_mod = _split_tir_relax(new_mod)
@@ -191,6 +230,16 @@ def build(mod: tvm.IRModule, target: tvm.target.Target) -> Tuple[Executable, Mod
     return ex, lib
 
 
+def _lower_relax(mod: tvm.IRModule) -> tvm.IRModule:
+    """Run the Relax passes of the VM build, which lower the Relax functions to VM builtins."""
+    passes = [relax.transform.ToNonDataflow()]
+    passes.append(relax.transform.CallTIRRewrite())
+    passes.append(relax.transform.VMMemoryLower())
+    passes.append(relax.transform.VMShapeLower())
+    seq = tvm.transform.Sequential(passes)
+    return seq(mod)
+
+
 def _split_tir_relax(mod: tvm.IRModule) -> Tuple[tvm.IRModule, tvm.IRModule]:
     rx_mod = IRModule({})
     tir_mod = IRModule({})
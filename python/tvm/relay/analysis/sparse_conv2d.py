@@ -25,6 +25,7 @@ import numpy as np
 import scipy.sparse as sp
 import tvm
 from . import _ffi_api
+from .sparse_dense import _as_numpy_view, _map_weights, _register_bsr_task_inputs
 
 
 SparseAnalysisResult = namedtuple(
@@ -55,7 +56,14 @@ def _search_conv2d_op_weight(expr):
 
 
 def process_params(
-    expr, params, block_size, sparsity_threshold, layout, kernel_size, reg_task_input=True
+    expr,
+    params,
+    block_size,
+    sparsity_threshold,
+    layout,
+    kernel_size,
+    reg_task_input=True,
+    num_workers=None,
 ):
     """Process parameters of conv2d from dense to sparse.
 
@@ -71,6 +79,12 @@ def process_params(
         Minimal sparsity requirement for converting to sparse operation
     layout : str
         layout of network
+    kernel_size : int
+        kernel size of the conv2d to convert, 1 or 3
+    reg_task_input : bool
+        Whether to register the BSR buffers as auto_scheduler task inputs
+    num_workers : Optional[int]
+        Number of threads used to convert weights. Defaults to the number of CPUs.
 
     Returns
     -------
@@ -78,28 +92,20 @@ def process_params(
         return names of qualified conv2d weight and the shape in BSR format
     """
 
-    # pylint: disable=import-outside-toplevel
-    from tvm.auto_scheduler.search_task import (
-        register_task_input_buffer,
-    )  # lazily import to avoid recursive dependency
-
-    memo = SparseAnalysisResult(weight_name=[], weight_shape=[])
-    weight_names = _search_conv2d_op_weight(expr)
-    for name in weight_names:
-        name = str(name)
-        w_np = params[name].numpy()
+    def _convert(name):
+        w_np = _as_numpy_view(params[name])
 
         if layout == "NHWC":  # HWIO
             weight_kernel = (w_np.shape[0], w_np.shape[1])
         elif layout == "NCHW":  # OIHW
             weight_kernel = (w_np.shape[2], w_np.shape[3])
         if weight_kernel[0] != weight_kernel[1]:
-            continue
+            return name, None, None, None
 
         if weight_kernel[0] == kernel_size == 1:
             sparsity = 1.0 - (np.count_nonzero(w_np) / w_np.size)
             if sparsity < sparsity_threshold:
-                continue
+                return name, None, None, None
             if layout == "NHWC":
                 w_np = w_np.squeeze().T
             elif layout == "NCHW":
@@ -121,9 +127,18 @@ def process_params(
                 w_np = w_np.reshape((w_np.shape[0], -1))
             sparse_weight = sp.bsr_matrix(w_np, blocksize=block_size)
             if 1 - (sparse_weight.nnz / w_np.size) < sparsity_threshold:
-                continue
+                return name, None, None, None
             sparse_weight_data = sparse_weight.data
         else:
+            return name, None, None, None
+        return name, w_np.shape, sparse_weight, sparse_weight_data
+
+    memo = SparseAnalysisResult(weight_name=[], weight_shape=[])
+    weight_names = [str(name) for name in _search_conv2d_op_weight(expr)]
+    for name, w_shape, sparse_weight, sparse_weight_data in _map_weights(
+        _convert, weight_names, num_workers
+    ):
+        if sparse_weight is None:
             continue
 
         # remove dense weight
@@ -134,37 +149,21 @@ def process_params(
             + list(sparse_weight.indices.shape)
             + list(sparse_weight.indptr.shape)
         )
-        params[name + ".data"] = tvm.nd.array(sparse_weight_data)
-        params[name + ".indices"] = tvm.nd.array(sparse_weight.indices)
-        params[name + ".indptr"] = tvm.nd.array(sparse_weight.indptr)
+        # the same device copies back both the params and the task input registry
+        data = params[name + ".data"] = tvm.nd.array(sparse_weight_data)
+        indices = params[name + ".indices"] = tvm.nd.array(sparse_weight.indices)
+        indptr = params[name + ".indptr"] = tvm.nd.array(sparse_weight.indptr)
 
         if reg_task_input:
             prefix = "sparse_conv2d_bsr_%d_%d_%d_%d_%d_%d_" % (
-                w_np.shape[0],
-                w_np.shape[1],
+                w_shape[0],
+                w_shape[1],
                 block_size[0],
                 block_size[1],
                 sparse_weight.indices.shape[0],
                 sparse_weight.indptr.shape[0],
             )
-            register_task_input_buffer(
-                "default",
-                prefix + "W_data",
-                tvm.runtime.ndarray.array(sparse_weight_data),
-                overwrite=True,
-            )
-            register_task_input_buffer(
-                "default",
-                prefix + "W_indices",
-                tvm.runtime.ndarray.array(sparse_weight.indices),
-                overwrite=True,
-            )
-            register_task_input_buffer(
-                "default",
-                prefix + "W_indptr",
-                tvm.runtime.ndarray.array(sparse_weight.indptr),
-                overwrite=True,
-            )
+            _register_bsr_task_inputs(prefix, data, indices, indptr)
     ret = SparseAnalysisResult(
         weight_name=tvm.runtime.convert(memo.weight_name),
         weight_shape=tvm.runtime.convert(memo.weight_shape),
@@ -21,6 +21,8 @@ This file contains helper functions for convert dense model
 to block sparse model
 """
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import os
 import numpy as np
 import scipy.sparse as sp
 import tvm
@@ -54,8 +56,64 @@ def _search_dense_op_weight(expr):
     return _ffi_api.search_dense_op_weight(expr)
 
 
-def process_params(expr, params, block_size, sparsity_threshold):
-    """[summary]
+def _as_numpy_view(arr):
+    """Return a numpy array sharing memory with ``arr`` when possible.
+
+    CPU NDArrays are exported through DLPack so that no copy of the (potentially
+    very large) dense weight is made. Other devices, or numpy versions without
+    ``np.from_dlpack``, fall back to ``NDArray.numpy()``.
+
+    Parameters
+    ----------
+    arr : Union[tvm.nd.NDArray, numpy.ndarray]
+        The array to view
+
+    Returns
+    -------
+    ret : numpy.ndarray
+        A read-only-by-convention view of the same data
+    """
+    if isinstance(arr, np.ndarray):
+        return arr
+    if arr.device.device_type == tvm.cpu().device_type and hasattr(np, "from_dlpack"):
+        try:
+            return np.from_dlpack(arr)
+        except (BufferError, RuntimeError, TypeError):
+            pass
+    return arr.numpy()
+
+
+def _map_weights(func, items, num_workers):
+    """Apply ``func`` over ``items`` in a thread pool, yielding results in order.
+
+    numpy and scipy release the GIL in the heavy parts of ``count_nonzero`` and the
+    dense to BSR conversion, so threads give real parallelism here without having
+    to pickle the weights into worker processes.
+    """
+    if num_workers is None:
+        num_workers = min(len(items), os.cpu_count() or 1)
+    if num_workers <= 1 or len(items) <= 1:
+        for item in items:
+            yield func(item)
+        return
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        yield from executor.map(func, items)
+
+
+def _register_bsr_task_inputs(prefix, data, indices, indptr):
+    """Register BSR buffers for auto_scheduler measurement, sharing the given NDArrays."""
+    # pylint: disable=import-outside-toplevel
+    from tvm.auto_scheduler.search_task import (
+        register_task_input_buffer,
+    )  # lazily import to avoid recursive dependency
+
+    register_task_input_buffer("default", prefix + "W_data", data, overwrite=True)
+    register_task_input_buffer("default", prefix + "W_indices", indices, overwrite=True)
+    register_task_input_buffer("default", prefix + "W_indptr", indptr, overwrite=True)
+
+
+def process_params(expr, params, block_size, sparsity_threshold, num_workers=None):
+    """Process parameters of dense from dense to sparse.
 
     Parameters
     ----------
@@ -67,6 +125,8 @@ def process_params(expr, params, block_size, sparsity_threshold):
         Blocksize in BSR matrix
     sparsity_threshold : float
         Minimal sparsity requirement for converting to sparse operation
+    num_workers : Optional[int]
+        Number of threads used to convert weights. Defaults to the number of CPUs.
 
     Returns
     -------
@@ -74,57 +134,92 @@ def process_params(expr, params, block_size, sparsity_threshold):
         return names of qualified dense weight and the shape in BSR format
     """
 
+    def _convert(name):
+        w_np = _as_numpy_view(params[name])
+        sparsity = 1.0 - (np.count_nonzero(w_np) / w_np.size)
+        if sparsity < sparsity_threshold:
+            return name, w_np.shape, None
+        return name, w_np.shape, sp.bsr_matrix(w_np, blocksize=block_size)
+
+    memo = SparseAnalysisResult(weight_name=[], weight_shape=[])
+    weight_names = [str(name) for name in _search_dense_op_weight(expr)]
+    for name, w_shape, sparse_weight in _map_weights(_convert, weight_names, num_workers):
+        if sparse_weight is None:
+            continue
+        # remove dense weight
+        del params[name]
+        memo.weight_name.append(name)
+        memo.weight_shape.append(
+            list(sparse_weight.data.shape)
+            + list(sparse_weight.indices.shape)
+            + list(sparse_weight.indptr.shape)
+        )
+        # the same device copies back both the params and the task input registry
+        data = params[name + ".data"] = tvm.nd.array(sparse_weight.data)
+        indices = params[name + ".indices"] = tvm.nd.array(sparse_weight.indices)
+        indptr = params[name + ".indptr"] = tvm.nd.array(sparse_weight.indptr)
+
+        prefix = "sparse_dense_bsr_%d_%d_%d_%d_%d_%d_" % (
+            w_shape[0],
+            w_shape[1],
+            block_size[0],
+            block_size[1],
+            sparse_weight.indices.shape[0],
+            sparse_weight.indptr.shape[0],
+        )
+        _register_bsr_task_inputs(prefix, data, indices, indptr)
+    ret = SparseAnalysisResult(
+        weight_name=tvm.runtime.convert(memo.weight_name),
+        weight_shape=tvm.runtime.convert(memo.weight_shape),
+    )
+    return ret
+
+
+def process_params_nm(expr, params, n, m, num_workers=None):
+    """Process parameters of dense from dense to N:M structured sparse.
+
+    Only the weights in which every group of `m` consecutive values along the reduction
+    axis holds at most `n` nonzeros are converted; the other weights are left dense.
+
+    Parameters
+    ----------
+    expr : Relay.Expr
+        Expr of the network
+    params : Dict[String, tvm.nd.array]
+        parameters of the network
+    n : int
+        The maximum number of nonzeros in each group
+    m : int
+        The group size
+    num_workers : Optional[int]
+        Number of threads used to convert weights. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    ret : Namedtuple[weight_name: Array[String], weight_shape: Array[Array[IntImm]]]
+        return names of qualified dense weight and the shape in N:M format
+    """
     # pylint: disable=import-outside-toplevel
-    from tvm.auto_scheduler.search_task import (
-        register_task_input_buffer,
-    )  # lazily import to avoid recursive dependency
+    from tvm.topi.sparse.utils import is_nm_sparse, nm_compress
+
+    def _convert(name):
+        w_np = _as_numpy_view(params[name])
+        if not is_nm_sparse(w_np, n, m):
+            return name, None
+        return name, nm_compress(w_np, n, m)
 
     memo = SparseAnalysisResult(weight_name=[], weight_shape=[])
-    weight_names = _search_dense_op_weight(expr)
-    for name in weight_names:
-        name = str(name)
-        w_np = params[name].numpy()
-        sparsity = 1.0 - (np.count_nonzero(w_np) / w_np.size)
-        if sparsity >= sparsity_threshold:
-            sparse_weight = sp.bsr_matrix(w_np, blocksize=block_size)
-            # remove dense weight
-            del params[name]
-            memo.weight_name.append(name)
-            memo.weight_shape.append(
-                list(sparse_weight.data.shape)
-                + list(sparse_weight.indices.shape)
-                + list(sparse_weight.indptr.shape)
-            )
-            params[name + ".data"] = tvm.nd.array(sparse_weight.data)
-            params[name + ".indices"] = tvm.nd.array(sparse_weight.indices)
-            params[name + ".indptr"] = tvm.nd.array(sparse_weight.indptr)
-
-            prefix = "sparse_dense_bsr_%d_%d_%d_%d_%d_%d_" % (
-                w_np.shape[0],
-                w_np.shape[1],
-                block_size[0],
-                block_size[1],
-                sparse_weight.indices.shape[0],
-                sparse_weight.indptr.shape[0],
-            )
-            register_task_input_buffer(
-                "default",
-                prefix + "W_data",
-                tvm.runtime.ndarray.array(sparse_weight.data),
-                overwrite=True,
-            )
-            register_task_input_buffer(
-                "default",
-                prefix + "W_indices",
-                tvm.runtime.ndarray.array(sparse_weight.indices),
-                overwrite=True,
-            )
-            register_task_input_buffer(
-                "default",
-                prefix + "W_indptr",
-                tvm.runtime.ndarray.array(sparse_weight.indptr),
-                overwrite=True,
-            )
+    weight_names = [str(name) for name in _search_dense_op_weight(expr)]
+    for name, nm_weight in _map_weights(_convert, weight_names, num_workers):
+        if nm_weight is None:
+            continue
+        values, meta = nm_weight
+        # remove dense weight
+        del params[name]
+        memo.weight_name.append(name)
+        memo.weight_shape.append(list(values.shape) + [meta.shape[0]])
+        params[name + ".nm_values"] = tvm.nd.array(values)
+        params[name + ".nm_meta"] = tvm.nd.array(meta)
     ret = SparseAnalysisResult(
         weight_name=tvm.runtime.convert(memo.weight_name),
         weight_shape=tvm.runtime.convert(memo.weight_shape),
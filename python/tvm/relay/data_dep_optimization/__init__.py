@@ -20,3 +20,4 @@
 from . import bsr_dense
 from . import simplify_fc_transpose
 from . import bsr_conv2d
+from . import nm_dense
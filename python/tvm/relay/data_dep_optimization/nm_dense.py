@@ -0,0 +1,57 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=unused-argument, not-context-manager
+"""Automatic convert model from dense to N:M structured sparse"""
+
+from tvm import relay
+from tvm.relay.analysis.sparse_dense import process_params_nm
+
+from .utils import _run_opt_pass
+
+
+def convert(func, params, nm=(2, 4)):
+    """Convert a dense func and according parameters to N:M structured sparse
+
+    Only the weights that already follow the N:M pattern (e.g. produced by 2:4 pruning)
+    are converted. Every kept value is stored with a 2-bit (m <= 4) or 4-bit (m <= 16)
+    in-group position instead of a 32-bit column index.
+
+    Parameters
+    ----------
+    func : relay.Expr
+        Expr will be optimized to sparse operation
+    params : Dict[String, tvm.nd.array]
+        Parameters of the Expr
+    nm : Tuple(int, int)
+        The maximum number of nonzeros n in every group of m values
+        along the reduction axis of the weight
+
+    Returns
+    -------
+    new_func: relay.Expr
+        Mutated Expr with sparse operations
+
+    params: Dict[String, tvm.nd.array]
+        New params with N:M compressed weights for mutated Expr
+    """
+    n, m = nm
+    weight_info = process_params_nm(func, params, n, m)
+    new_func = _run_opt_pass(
+        func,
+        relay.transform.DenseToSparseNM(weight_info.weight_name, weight_info.weight_shape, n, m),
+    )
+    return new_func, params
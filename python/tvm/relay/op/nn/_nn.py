@@ -175,6 +175,10 @@ def alter_op_layout_sparse_dense(attrs, inputs, tinfos, out_type):
     return topi.nn.sparse_dense_alter_layout(attrs, inputs, tinfos, out_type)
 
 
+# sparse_dense_nm
+reg.register_strategy("nn.sparse_dense_nm", strategy.sparse_dense_nm_strategy)
+reg.register_pattern("nn.sparse_dense_nm", reg.OpPattern.OUT_ELEMWISE_FUSABLE)
+
 # sparse_add
 reg.register_strategy("nn.sparse_add", strategy.sparse_add_strategy)
 reg.register_pattern("nn.sparse_add", reg.OpPattern.OPAQUE)
@@ -216,6 +220,15 @@ reg.register_strategy("nn.sparse_conv2d", strategy.sparse_conv2d_strategy)
 reg.register_pattern("nn.sparse_conv2d", reg.OpPattern.OUT_ELEMWISE_FUSABLE)
 
 
+# sddmm
+reg.register_strategy("nn.sddmm", strategy.sddmm_strategy)
+reg.register_pattern("nn.sddmm", reg.OpPattern.OUT_ELEMWISE_FUSABLE)
+
+
+# sparse_softmax
+reg.register_strategy("nn.sparse_softmax", strategy.sparse_softmax_strategy)
+reg.register_pattern("nn.sparse_softmax", reg.OpPattern.OPAQUE)
+
 # conv1d
 reg.register_strategy("nn.conv1d", strategy.conv1d_strategy)
 reg.register_pattern("nn.conv1d", OpPattern.OUT_ELEMWISE_FUSABLE)
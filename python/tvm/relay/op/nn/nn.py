@@ -2313,6 +2313,40 @@ def sparse_dense(dense_mat, sparse_mat, sparse_lhs=False):
         )
 
 
+def sparse_dense_nm(data, weight, n, m):
+    r"""
+    Computes the matrix multiplication of `data` and `weight`, where `weight` is a
+    [N, K] matrix with N:M structured sparsity along K, stored as a namedtuple or tuple
+    with fields `values` and `meta` (see ``topi.sparse.utils.nm_compress``).
+
+    .. math::
+
+        \mbox{sparse_dense_nm}(data, weight)[b, j] = \sum_k data[b, k] * W[j, k]
+
+    Parameters
+    ----------
+    data : tvm.relay.Expr
+        The input data for the matrix multiplication, with shape `[M, K]`.
+
+    weight : Union[namedtuple, Tuple[ndarray, ndarray]]
+        The compressed N:M sparse weight.
+
+    n : int
+        The maximum number of nonzeros in every group of `m` values.
+
+    m : int
+        The group size.
+
+    Returns
+    -------
+    result: tvm.relay.Expr
+        The computed result with shape `[M, N]`.
+    """
+    if hasattr(weight, "values"):
+        return _make.sparse_dense_nm(data, weight.values, weight.meta, n, m)
+    return _make.sparse_dense_nm(data, weight[0], weight[1], n, m)
+
+
 def sparse_transpose(x):
     r"""
     Computes the fast matrix transpose of x,
@@ -2392,6 +2426,63 @@ def sparse_add(dense_mat, sparse_mat):
         return _make.sparse_add(dense_mat, sparse_mat[0], sparse_mat[1], sparse_mat[2])
 
 
+def sddmm(data_a, data_b, mask, block_size=(1, 1)):
+    r"""
+    Computes the sampled dense-dense matrix multiplication of `data_a` and `data_b`,
+    only evaluating the entries which are stored in the sparse `mask`.
+
+    .. math::
+
+        \mbox{sddmm}(A, B, M) = (A * B^T) \odot \mbox{as_dense}(M)
+
+    The result is the `data` of a BSR (CSR when `block_size` is `(1, 1)`) matrix
+    that shares `indices` and `indptr` with `mask`.
+
+    Parameters
+    ----------
+    data_a : tvm.relay.Expr
+        The left dense matrix with shape `[M, K]`.
+
+    data_b : tvm.relay.Expr
+        The right dense matrix with shape `[N, K]`.
+
+    mask : Union[namedtuple, Tuple[ndarray, ndarray]]
+        The sparsity structure of the output, given by its `indices` and `indptr`.
+
+    block_size : Tuple[int, int]
+        The block size `(bs_r, bs_c)` of the mask.
+
+    Returns
+    -------
+    result: tvm.relay.Expr
+        The computed result with shape `[num_blocks, bs_r, bs_c]`.
+    """
+    if hasattr(mask, "indices"):
+        return _make.sddmm(data_a, data_b, mask.indices, mask.indptr, block_size)
+    return _make.sddmm(data_a, data_b, mask[0], mask[1], block_size)
+
+
+def sparse_softmax(sparse_mat):
+    r"""
+    Computes the softmax over the stored entries of every row of `sparse_mat`,
+    a sparse (CSR or BSR) namedtuple with fields `data`, `indices`, and `indptr`.
+    Entries that are not stored are treated as masked out.
+
+    Parameters
+    ----------
+    sparse_mat : Union[namedtuple, Tuple[ndarray, ndarray, ndarray]]
+        The input sparse matrix.
+
+    Returns
+    -------
+    result: tvm.relay.Expr
+        The `data` of the normalized sparse matrix, sharing the structure of `sparse_mat`.
+    """
+    if hasattr(sparse_mat, "indices"):
+        return _make.sparse_softmax(sparse_mat.data, sparse_mat.indices, sparse_mat.indptr)
+    return _make.sparse_softmax(sparse_mat[0], sparse_mat[1], sparse_mat[2])
+
+
 def contrib_conv2d_winograd_without_weight_transform(
     data,
     weight,
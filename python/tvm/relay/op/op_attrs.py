@@ -554,6 +554,11 @@ class SparseToDenseAttrs(Attrs):
     """Attributes used in sparse_to_dense operators"""
 
 
+@tvm._ffi.register_object("relay.attrs.SparseDenseNMAttrs")
+class SparseDenseNMAttrs(Attrs):
+    """Attributes used in sparse_dense_nm operators"""
+
+
 @tvm._ffi.register_object("relay.attrs.SparseTransposeAttrs")
 class SparseTransposeAttrs(Attrs):
     """Attributes used in sparse_transpose operators"""
@@ -564,6 +569,11 @@ class SparseConv2DAttrs(Attrs):
     """Attributes used in sparse_conv2d operators"""
 
 
+@tvm._ffi.register_object("relay.attrs.SDDMMAttrs")
+class SDDMMAttrs(Attrs):
+    """Attributes used in sddmm operators"""
+
+
 @tvm._ffi.register_object("relay.attrs.TopkAttrs")
 class TopkAttrs(Attrs):
     """Attributes used in topk operators"""
@@ -937,6 +937,29 @@ def sparse_dense_strategy(attrs, inputs, out_type, target):
     return strategy
 
 
+# sparse dense N:M
+def wrap_compute_sparse_dense_nm(topi_compute):
+    """wrap sparse dense N:M topi compute"""
+
+    def _compute_sparse_dense_nm(attrs, inputs, out_type):
+        return [topi_compute(inputs[0], inputs[1], inputs[2], attrs["n"], attrs["m"])]
+
+    return _compute_sparse_dense_nm
+
+
+@override_native_generic_func("sparse_dense_nm_strategy")
+def sparse_dense_nm_strategy(attrs, inputs, out_type, target):
+    """sparse dense N:M generic strategy"""
+    logger.warning("sparse dense N:M is not optimized for this platform.")
+    strategy = _op.OpStrategy()
+    strategy.add_implementation(
+        wrap_compute_sparse_dense_nm(topi.nn.sparse_dense_nm),
+        wrap_topi_schedule(topi.generic.schedule_sparse_dense_nm),
+        name="sparse_dense_nm.generic",
+    )
+    return strategy
+
+
 @override_native_generic_func("sparse_dense_padded_strategy")
 def sparse_dense_padded_strategy(attrs, inputs, out_type, target):
     """sparse dense padded generic strategy"""
@@ -997,6 +1020,52 @@ def sparse_conv2d_strategy(attrs, inputs, out_type, target):
     return strategy
 
 
+# sddmm
+def wrap_compute_sddmm(topi_compute):
+    """wrap sddmm topi compute"""
+
+    def _compute_sddmm(attrs, inputs, out_type):
+        block_size = get_const_tuple(attrs.block_size)
+        return [topi_compute(inputs[0], inputs[1], inputs[2], inputs[3], block_size)]
+
+    return _compute_sddmm
+
+
+@override_native_generic_func("sddmm_strategy")
+def sddmm_strategy(attrs, inputs, out_type, target):
+    """sddmm generic strategy"""
+    logger.warning("sddmm is not optimized for this platform.")
+    strategy = _op.OpStrategy()
+    strategy.add_implementation(
+        wrap_compute_sddmm(topi.sparse.sddmm),
+        wrap_topi_schedule(topi.generic.schedule_sddmm),
+        name="sddmm.generic",
+    )
+    return strategy
+
+
+# sparse_softmax
+def wrap_compute_sparse_softmax(topi_compute):
+    """wrap sparse softmax topi compute"""
+
+    def _compute_sparse_softmax(attrs, inputs, out_type):
+        return [topi_compute(inputs[0], inputs[1], inputs[2])]
+
+    return _compute_sparse_softmax
+
+
+@override_native_generic_func("sparse_softmax_strategy")
+def sparse_softmax_strategy(attrs, inputs, out_type, target):
+    """sparse softmax generic strategy"""
+    strategy = _op.OpStrategy()
+    strategy.add_implementation(
+        wrap_compute_sparse_softmax(topi.nn.sparse_softmax),
+        wrap_topi_schedule(topi.generic.schedule_extern),
+        name="sparse_softmax.generic",
+    )
+    return strategy
+
+
 # sort
 def wrap_compute_sort(topi_compute):
     """Wrap sort topi compute"""
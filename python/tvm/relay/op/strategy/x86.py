@@ -21,7 +21,9 @@ import logging
 import re
 from tvm import topi
 from tvm.auto_scheduler import is_auto_scheduler_enabled
+from tvm.ir.transform import PassContext
 from tvm.te import SpecializedCondition
+from tvm.tir import IntImm
 from tvm.relay.ty import is_dynamic
 from .generic import *
 from .. import op as _op
@@ -601,6 +603,35 @@ def sparse_dense_strategy_cpu(attrs, inputs, out_type, target):
         name="sparse_dense.x86",
         plevel=10,
     )
+    if (
+        len(inputs[1].shape) == 1
+        and not is_dynamic(out_type)
+        and not is_auto_scheduler_enabled()
+        and PassContext.current().config.get("relay.sparse_dense.csr_balanced", False)
+        and all(isinstance(dim, IntImm) for tensor in inputs[1:] for dim in tensor.shape)
+    ):
+        # CSR: partition the sparse rows by nnz instead of parallelizing over rows, so that
+        # matrices with skewed row lengths do not leave most threads idle. The row lengths are not
+        # known here and the balanced kernel is slower on uniform rows, so it is only used when
+        # enabled with the "relay.sparse_dense.csr_balanced" config of the PassContext.
+        strategy.add_implementation(
+            wrap_compute_sparse_dense(topi.nn.sparse_dense_csr_balanced),
+            wrap_topi_schedule(topi.x86.schedule_sparse_dense_csr_balanced),
+            name="sparse_dense_csr_balanced.x86",
+            plevel=15,
+        )
+    return strategy
+
+
+@sparse_dense_nm_strategy.register("cpu")
+def sparse_dense_nm_strategy_cpu(attrs, inputs, out_type, target):
+    """sparse dense N:M x86 strategy"""
+    strategy = _op.OpStrategy()
+    strategy.add_implementation(
+        wrap_compute_sparse_dense_nm(topi.nn.sparse_dense_nm),
+        wrap_topi_schedule(topi.x86.schedule_sparse_dense_nm),
+        name="sparse_dense_nm.x86",
+    )
     return strategy
 
 
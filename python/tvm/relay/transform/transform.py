@@ -1107,6 +1107,34 @@ def DenseToSparse(weight_name, weight_shape):
     return _ffi_api.DenseToSparse(weight_name, weight_shape)
 
 
+def DenseToSparseNM(weight_name, weight_shape, n, m):
+    """
+    Rewrite qualified ```nn.dense operation``` to ```nn.sparse_dense_nm```
+    This pass is used in ```data_dep_optimization.nm_dense```
+    Parameters of this pass is generated by ```analysis.sparse_dense.process_params_nm```
+
+    Parameters
+    ----------
+    weight_name: Array[String]
+      Names of weights which qualified N:M sparse contrains
+
+    weight_shape: Array[Array[IntImm]]
+      Weights shape in N:M format: number of kept values, units and metadata rows.
+
+    n: int
+      The maximum number of nonzeros in each group
+
+    m: int
+      The group size
+
+    Returns
+    -------
+    ret : tvm.transform.Pass
+        The registered DenseToSparseNM pass.
+    """
+    return _ffi_api.DenseToSparseNM(weight_name, weight_shape, n, m)
+
+
 def Conv2dToSparse(weight_name, weight_shape, layout, kernel_size):
     """
     Rewrite qualified ```nn.conv2d operation``` to ```nn.sparse_conv2d```
@@ -798,6 +798,23 @@ def schedule_sparse_dense(outs):
     return _default_schedule(outs, False)
 
 
+def schedule_sparse_dense_nm(outs):
+    """Schedule for sparse_dense_nm
+
+    Parameters
+    ----------
+    outs: Array of Tensor
+          The computation graph description of sparse_dense_nm
+          in the format of an array of tensors.
+
+    Returns
+    -------
+    sch: Schedule
+        The computation schedule for the op.
+    """
+    return _default_schedule(outs, False)
+
+
 def schedule_sparse_transpose(outs):
     """Schedule for sparse_transpose
 
@@ -832,6 +849,23 @@ def schedule_sparse_conv2d(outs):
     return _default_schedule(outs, False)
 
 
+def schedule_sddmm(outs):
+    """Schedule for sddmm
+
+    Parameters
+    ----------
+    outs: Array of Tensor
+          The computation graph description of sddmm
+          in the format of an array of tensors.
+
+    Returns
+    -------
+    sch: Schedule
+        The computation schedule for the op.
+    """
+    return _default_schedule(outs, False)
+
+
 def schedule_batch_matmul(outs):
     """Schedule for batch_matmul
 
@@ -230,6 +230,243 @@ def _sparse_dense_sp_rhs_bsrmm(data, weight_data, weight_indices, weight_indptr)
     )
 
 
+def sparse_dense_csr_balanced(
+    dense_data,
+    sparse_data,
+    sparse_indices,
+    sparse_indptr,
+    sparse_lhs=False,
+    num_parts=None,
+    row_partition=None,
+):
+    """
+    Computes CSR sparse-dense matrix multiplication like `sparse_dense`, but distributes the
+    rows of the sparse matrix over `num_parts` parallel partitions holding roughly the same
+    amount of work instead of parallelizing over rows directly.
+
+    Partition boundaries follow the merge-path split at row granularity: partition `p` starts
+    at the first row `r` with `r + indptr[r] >= p * (num_rows + nnz) // num_parts`. This keeps
+    the threads busy for matrices with skewed (e.g. power-law) row lengths, where a few heavy
+    rows would otherwise dominate the runtime of a row-parallel loop.
+
+    Parameters
+    ----------
+    dense_data : tvm.te.Tensor
+        2-D with shape [M, K]
+
+    sparse_data : tvm.te.Tensor
+        1-D with shape [nnz]
+
+    sparse_indices : tvm.te.Tensor
+        1-D with shape [nnz]
+
+    sparse_indptr : tvm.te.Tensor
+        1-D with shape [N + 1]
+
+    sparse_lhs : bool, optional
+        Indicates whether lhs or rhs matrix is sparse. Default value is False.
+
+    num_parts : int, optional
+        Number of partitions. Defaults to `min(N, 256)`.
+
+    row_partition : Optional[tvm.te.Tensor]
+        1-D with shape [num_parts + 1], the first row of every partition as generated by
+        `tvm.topi.sparse.utils.csr_balanced_row_partition`. When not given, the partition is
+        computed inside the kernel by a binary search over `sparse_indptr`.
+
+    Returns
+    -------
+    output : tvm.te.Tensor
+        2-D with shape [M, N] if sparse_lhs=False, [N, M] otherwise
+    """
+    assert len(sparse_data.shape) == 1, "only CSR format is supported"
+    num_rows = get_const_tuple(sparse_indptr.shape)[0] - 1
+    num_dense = get_const_tuple(dense_data.shape)[0]
+    if row_partition is not None:
+        num_parts = get_const_tuple(row_partition.shape)[0] - 1
+    elif num_parts is None:
+        num_parts = min(num_rows, 256)
+    num_parts = max(num_parts, 1)
+    oshape = (num_rows, num_dense) if sparse_lhs else (num_dense, num_rows)
+
+    inputs = [dense_data, sparse_data, sparse_indices, sparse_indptr]
+    if row_partition is not None:
+        inputs.append(row_partition)
+
+    return te.extern(
+        shape=oshape,
+        inputs=inputs,
+        fcompute=lambda ins, outs: _sparse_dense_csr_balanced_ir(
+            ins[0],
+            ins[1],
+            ins[2],
+            ins[3],
+            ins[4] if len(ins) == 5 else None,
+            outs[0],
+            num_parts,
+            sparse_lhs,
+        ),
+        tag="sparse_dense_csr_balanced",
+        dtype=dense_data.dtype,
+        name="sparse_dense_csr_balanced_output",
+    )
+
+
+def _merge_path_row_search(irb, indptr_ptr, num_rows, nnz, part, num_parts, idx_dtype):
+    """Find the first row `r` such that `r + indptr[r] >= part * (num_rows + nnz) // num_parts`"""
+    diag = (part.astype("int64") * (num_rows + nnz)) // num_parts
+    lo = irb.allocate(idx_dtype, (1,), name="lo", scope="local")
+    hi = irb.allocate(idx_dtype, (1,), name="hi", scope="local")
+    lo[0] = tvm.tir.const(0, idx_dtype)
+    hi[0] = tvm.tir.const(num_rows, idx_dtype)
+    with irb.while_loop(lo[0] < hi[0]):
+        mid = lo[0] + ((hi[0] - lo[0]) >> 1)
+        with irb.if_scope(mid.astype("int64") + indptr_ptr[mid].astype("int64") < diag):
+            lo[0] = mid + 1
+        with irb.else_scope():
+            hi[0] = mid
+    return lo[0]
+
+
+def _sparse_dense_csr_balanced_ir(
+    dense_data,
+    sparse_data,
+    sparse_indices,
+    sparse_indptr,
+    row_partition,
+    out,
+    num_parts,
+    sparse_lhs,
+):
+    """define ir for sparse_dense_csr_balanced"""
+    irb = tvm.tir.ir_builder.create()
+    dense_data_ptr = irb.buffer_ptr(dense_data)
+    sparse_data_ptr = irb.buffer_ptr(sparse_data)
+    sparse_indices_ptr = irb.buffer_ptr(sparse_indices)
+    sparse_indptr_ptr = irb.buffer_ptr(sparse_indptr)
+    out_ptr = irb.buffer_ptr(out)
+
+    idx_dtype = sparse_indptr.dtype
+    num_rows = get_const_tuple(sparse_indptr.shape)[0] - 1
+    nnz = get_const_tuple(sparse_data.shape)[0]
+    num_dense = get_const_tuple(dense_data.shape)[0]
+    zero = tvm.tir.const(0, idx_dtype)
+
+    with irb.for_range(0, num_parts, kind="parallel", name="part") as part:
+        bounds = irb.allocate(idx_dtype, (2,), name="bounds", scope="local")
+        if row_partition is None:
+            bounds[0] = _merge_path_row_search(
+                irb, sparse_indptr_ptr, num_rows, nnz, part, num_parts, idx_dtype
+            )
+            bounds[1] = _merge_path_row_search(
+                irb, sparse_indptr_ptr, num_rows, nnz, part + 1, num_parts, idx_dtype
+            )
+        else:
+            row_partition_ptr = irb.buffer_ptr(row_partition)
+            bounds[0] = row_partition_ptr[part].astype(idx_dtype)
+            bounds[1] = row_partition_ptr[part + 1].astype(idx_dtype)
+
+        with irb.for_range(zero, bounds[1] - bounds[0], name="row_offset", dtype=idx_dtype) as r:
+            row = bounds[0] + r
+            row_start = sparse_indptr_ptr[row]
+            row_elems = sparse_indptr_ptr[row + 1] - row_start
+            with irb.for_range(zero, num_dense, name="i", dtype=idx_dtype) as i:
+                acc = irb.allocate(out.dtype, (1,), name="acc", scope="local")
+                acc[0] = tvm.tir.const(0, out.dtype)
+                with irb.for_range(zero, row_elems, name="elem_idx", dtype=idx_dtype) as elem_idx:
+                    elem = row_start + elem_idx
+                    acc[0] += sparse_data_ptr[elem] * dense_data_ptr[i, sparse_indices_ptr[elem]]
+                if sparse_lhs:
+                    out_ptr[row, i] = acc[0]
+                else:
+                    out_ptr[i, row] = acc[0]
+
+    return irb.get()
+
+
+def sparse_nm_metadata_bits(m):
+    """Number of bits used to store the in-group position of one value of an N:M matrix.
+
+    Parameters
+    ----------
+    m : int
+        The group size of the N:M format
+
+    Returns
+    -------
+    bits : int
+        2 for groups of up to 4 values, 4 for groups of up to 16 values
+    """
+    if m <= 4:
+        return 2
+    if m <= 16:
+        return 4
+    raise ValueError("N:M sparsity is only supported for group sizes up to 16, got %d" % m)
+
+
+def sparse_dense_nm(data, weight_values, weight_meta, n, m):
+    """
+    Computes `data @ W.T` for a weight `W` of shape [N, K] with N:M structured sparsity:
+    in every group of `m` consecutive values along K at most `n` are nonzero.
+
+    The weight is stored group-major with the output channel innermost, so that the kept
+    values of neighbouring output channels are contiguous:
+
+    - `weight_values[g * n + e, j]` is the `e`-th kept value of group `g` of row `j`.
+    - `weight_meta` holds the position of every kept value inside its group, packed with
+      `sparse_nm_metadata_bits(m)` bits per entry into uint8 words, entry `t` of row `j` being
+      stored at `weight_meta[t // per_byte, j]` with a shift of `(t % per_byte) * bits`.
+
+    Since every group holds exactly `n` values, both reductions have static extents and no
+    row pointers are needed. See `topi.sparse.utils.nm_compress` for the conversion.
+
+    Parameters
+    ----------
+    data : tvm.te.Tensor
+        2-D with shape [M, K]
+
+    weight_values : tvm.te.Tensor
+        2-D with shape [K // m * n, N]
+
+    weight_meta : tvm.te.Tensor
+        2-D with shape [ceil(K // m * n / per_byte), N] and dtype uint8
+
+    n : int
+        The maximum number of nonzeros in each group
+
+    m : int
+        The group size
+
+    Returns
+    -------
+    output : tvm.te.Tensor
+        2-D with shape [M, N]
+    """
+    batch, _ = get_const_tuple(data.shape)
+    num_values, out_dim = get_const_tuple(weight_values.shape)
+    bits = sparse_nm_metadata_bits(m)
+    per_byte = 8 // bits
+    num_groups = num_values // n
+    group = te.reduce_axis((0, num_groups), name="group")
+    elem = te.reduce_axis((0, n), name="elem")
+
+    def _position(t, j):
+        word = weight_meta[t // per_byte, j].astype("int32")
+        return (word >> ((t % per_byte) * bits)) & ((1 << bits) - 1)
+
+    return te.compute(
+        (batch, out_dim),
+        lambda i, j: te.sum(
+            data[i, group * m + _position(group * n + elem, j)]
+            * weight_values[group * n + elem, j],
+            axis=[group, elem],
+        ),
+        name="sparse_dense_nm",
+        tag="sparse_dense_nm",
+        attrs={"FLOP": 2 * batch * out_dim * num_values},
+    )
+
+
 def sparse_transpose(sparse_data, sparse_indices, sparse_indptr):
     """
     Transpose a square sparse matrix,
@@ -814,3 +1051,84 @@ def _sparse_add_csr(dense_data_inp, sparse_data_inp, sparse_indices_inp, sparse_
         ],
         name="sparse_add_csr_output",
     )
+
+
+def sparse_softmax(sparse_data, sparse_indices, sparse_indptr):
+    """
+    Computes the softmax over the stored entries of every row of a CSR/BSR matrix.
+    Entries that are not stored are treated as masked out, so the result keeps the
+    sparsity structure of the input.
+
+    Parameters
+    ----------
+    sparse_data : tvm.te.Tensor
+        1-D with shape [nnz] (CSR) or
+        3-D with shape [num_blocks, bs_r, bs_c] (BSR)
+
+    sparse_indices : tvm.te.Tensor
+        1-D with shape [nnz] (CSR) or
+        1-D with shape [num_blocks] (BSR)
+
+    sparse_indptr : tvm.te.Tensor
+        1-D with shape [M + 1] (CSR) or
+        1-D with shape [(M + 1) // bs_r] (BSR)
+
+    Returns
+    -------
+    output : tvm.te.Tensor
+        Tensor with the shape of `sparse_data`, sharing `sparse_indices` and `sparse_indptr`
+    """
+    assert len(sparse_data.shape) in (1, 3), "only CSR and BSR formats are supported"
+    oshape = get_const_tuple(sparse_data.shape)
+    return te.extern(
+        shape=oshape,
+        inputs=[sparse_data, sparse_indices, sparse_indptr],
+        fcompute=lambda ins, outs: _sparse_softmax_ir(ins[0], ins[2], outs[0]),
+        tag="sparse_softmax",
+        dtype=sparse_data.dtype,
+        name="sparse_softmax_output",
+    )
+
+
+def _sparse_softmax_ir(sparse_data, sparse_indptr, out):
+    """define ir for sparse_softmax"""
+    irb = tvm.tir.ir_builder.create()
+    sparse_data_ptr = irb.buffer_ptr(sparse_data)
+    sparse_indptr_ptr = irb.buffer_ptr(sparse_indptr)
+    out_ptr = irb.buffer_ptr(out)
+
+    dtype = sparse_data.dtype
+    idx_dtype = sparse_indptr.dtype
+    if len(sparse_data.shape) == 3:
+        _, bs_r, bs_c = get_const_tuple(sparse_data.shape)
+    else:
+        bs_r, bs_c = 1, 1
+    num_rows = get_const_tuple(sparse_indptr.shape)[0] - 1
+    zero = tvm.tir.const(0, idx_dtype)
+
+    with irb.for_range(0, num_rows, kind="parallel", name="row") as row:
+        row_start = sparse_indptr_ptr[row]
+        row_elems = sparse_indptr_ptr[row + 1] - row_start
+        with irb.for_range(0, bs_r, name="i") as i:
+            row_max = irb.allocate(dtype, (1,), name="row_max", scope="local")
+            row_sum = irb.allocate(dtype, (1,), name="row_sum", scope="local")
+
+            def _index(elem, j):
+                return ((row_start + elem) * bs_r + i) * bs_c + j
+
+            row_max[0] = tvm.tir.min_value(dtype)
+            with irb.for_range(zero, row_elems, name="elem", dtype=idx_dtype) as elem:
+                with irb.for_range(0, bs_c, name="j") as j:
+                    row_max[0] = tvm.te.max(row_max[0], sparse_data_ptr[_index(elem, j)])
+
+            row_sum[0] = tvm.tir.const(0, dtype)
+            with irb.for_range(zero, row_elems, name="elem", dtype=idx_dtype) as elem:
+                with irb.for_range(0, bs_c, name="j") as j:
+                    out_ptr[_index(elem, j)] = te.exp(sparse_data_ptr[_index(elem, j)] - row_max[0])
+                    row_sum[0] += out_ptr[_index(elem, j)]
+
+            with irb.for_range(zero, row_elems, name="elem", dtype=idx_dtype) as elem:
+                with irb.for_range(0, bs_c, name="j") as j:
+                    out_ptr[_index(elem, j)] = out_ptr[_index(elem, j)] / row_sum[0]
+
+    return irb.get()
@@ -21,4 +21,7 @@ from __future__ import absolute_import as _abs
 
 from .csrmv import csrmv
 from .csrmm import csrmm
+from .bsrmm import bsrmm
 from .dense import dense
+from .ell import sparse_dense_ell
+from .sddmm import sddmm, bsr_block_rows
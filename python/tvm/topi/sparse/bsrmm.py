@@ -0,0 +1,103 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""TVM operator compute SpMM in BSR format."""
+import tvm
+from tvm import te
+
+from ..utils import get_const_tuple
+
+
+def bsrmm(data, indices, indptr, weight):
+    """Computes the product of a BSR matrix and a dense matrix, `A @ weight`.
+
+    Unlike `topi.nn.sparse_dense` with `sparse_lhs=True`, the dense operand is not transposed
+    and the kernel is a single `te.extern`, so it can be embedded in TensorIR functions
+    produced by `te.create_prim_func`.
+
+    Parameters
+    ----------
+    data : tvm.te.Tensor
+        3-D with shape [num_blocks, bs_r, bs_c]
+
+    indices : tvm.te.Tensor
+        1-D with shape [num_blocks]
+
+    indptr : tvm.te.Tensor
+        1-D with shape [M // bs_r + 1]
+
+    weight : tvm.te.Tensor
+        2-D with shape [K, N]
+
+    Returns
+    -------
+    output : tvm.te.Tensor
+        2-D with shape [M, N]
+    """
+    assert (
+        len(data.shape) == 3
+        and len(indices.shape) == 1
+        and len(indptr.shape) == 1
+        and len(weight.shape) == 2
+    ), "only support 2-dim bsrmm"
+    assert (
+        data.dtype == weight.dtype
+    ), "Data and weight must have the same dtype, but they have %s and %s" % (
+        data.dtype,
+        weight.dtype,
+    )
+    _, bs_r, _ = get_const_tuple(data.shape)
+    num_block_rows = get_const_tuple(indptr.shape)[0] - 1
+    _, n = get_const_tuple(weight.shape)
+    return te.extern(
+        (num_block_rows * bs_r, n),
+        [data, indices, indptr, weight],
+        lambda ins, outs: _bsrmm_ir(ins[0], ins[1], ins[2], ins[3], outs[0]),
+        tag="bsrmm",
+        dtype=data.dtype,
+        name="bsrmm_output",
+    )
+
+
+def _bsrmm_ir(data, indices, indptr, weight, out):
+    """define ir for bsrmm"""
+    irb = tvm.tir.ir_builder.create()
+    data_ptr = irb.buffer_ptr(data)
+    indices_ptr = irb.buffer_ptr(indices)
+    indptr_ptr = irb.buffer_ptr(indptr)
+    weight_ptr = irb.buffer_ptr(weight)
+    out_ptr = irb.buffer_ptr(out)
+
+    _, bs_r, bs_c = get_const_tuple(data.shape)
+    num_block_rows = get_const_tuple(indptr.shape)[0] - 1
+    _, n = get_const_tuple(weight.shape)
+    idx_dtype = indptr.dtype
+    zero = tvm.tir.const(0, idx_dtype)
+
+    with irb.for_range(0, num_block_rows, kind="parallel", name="block_row") as block_row:
+        row_start = indptr_ptr[block_row]
+        row_elems = indptr_ptr[block_row + 1] - row_start
+        with irb.for_range(0, bs_r, name="i") as i:
+            with irb.for_range(0, n, kind="vectorize", name="col") as col:
+                out_ptr[(block_row * bs_r + i) * n + col] = tvm.tir.const(0, data.dtype)
+            with irb.for_range(zero, row_elems, name="elem", dtype=idx_dtype) as elem:
+                block = row_start + elem
+                with irb.for_range(0, bs_c, name="j") as j:
+                    value = data_ptr[(block * bs_r + i) * bs_c + j]
+                    k = indices_ptr[block] * bs_c + j
+                    with irb.for_range(0, n, kind="vectorize", name="col") as col:
+                        out_ptr[(block_row * bs_r + i) * n + col] += value * weight_ptr[k * n + col]
+    return irb.get()
@@ -0,0 +1,94 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""TVM operator compute sparse-dense matmul with the sparse matrix in ELL format.
+
+Each (block) row of the sparse matrix is padded to the same number of nonzeros, so every
+loop has a static extent. Unlike the `te.extern` and variable-extent reductions used by
+`topi.nn.sparse_dense`, this keeps the computation a plain `te.compute` that
+`te.create_prim_func` turns into a TensorIR block which meta_schedule can tile, parallelize
+and vectorize. Use `tvm.topi.sparse.utils.csr_to_ell` to convert CSR/BSR arrays.
+"""
+from tvm import te
+
+from ..utils import get_const_tuple
+
+
+def sparse_dense_ell(data, weight_data, weight_indices):
+    """Computes sparse-dense matrix multiplication of `data` and
+    `(weight_data, weight_indices).T` with the sparse weight in (blocked) ELL format.
+
+    Padded slots are expected to have zero data and a valid column index (e.g. 0).
+
+    Parameters
+    ----------
+    data : tvm.te.Tensor
+        2-D with shape [M, K]
+
+    weight_data : tvm.te.Tensor
+        2-D with shape [N, width] (CSR) or
+        4-D with shape [N // bs_r, width, bs_r, bs_c] (BSR)
+
+    weight_indices : tvm.te.Tensor
+        2-D with shape [N, width] (CSR) or
+        2-D with shape [N // bs_r, width] (BSR), holding block column indices
+
+    Returns
+    -------
+    output : tvm.te.Tensor
+        2-D with shape [M, N]
+    """
+    assert len(weight_data.shape) in (2, 4)
+    assert len(weight_indices.shape) == 2
+    if len(weight_data.shape) == 2:
+        return _sparse_dense_csr_ell(data, weight_data, weight_indices)
+    return _sparse_dense_bsr_ell(data, weight_data, weight_indices)
+
+
+def _sparse_dense_csr_ell(data, weight_data, weight_indices):
+    (m, _) = get_const_tuple(data.shape)
+    (n, width) = get_const_tuple(weight_data.shape)
+    elem = te.reduce_axis((0, width), name="elem")
+    return te.compute(
+        (m, n),
+        lambda i, j: te.sum(weight_data[j, elem] * data[i, weight_indices[j, elem]], axis=elem),
+        name="sparse_dense_csr_ell",
+        tag="sparse_dense_csr_ell",
+        attrs={"FLOP": 2 * m * n * width},
+    )
+
+
+def _sparse_dense_bsr_ell(data, weight_data, weight_indices):
+    (m, _) = get_const_tuple(data.shape)
+    (num_block_rows, width, bs_r, bs_c) = get_const_tuple(weight_data.shape)
+    elem = te.reduce_axis((0, width), name="elem")
+    c = te.reduce_axis((0, bs_c), name="c")
+    block = te.compute(
+        (m, num_block_rows, bs_r),
+        lambda i, nb_j, j: te.sum(
+            weight_data[nb_j, elem, j, c] * data[i, weight_indices[nb_j, elem] * bs_c + c],
+            axis=[elem, c],
+        ),
+        name="sparse_dense_bsr_ell_block",
+        tag="sparse_dense_bsr_ell_block",
+        attrs={"FLOP": 2 * m * num_block_rows * width * bs_r * bs_c},
+    )
+    return te.compute(
+        (m, num_block_rows * bs_r),
+        lambda i, j: block[i, j // bs_r, j % bs_r],
+        name="sparse_dense_bsr_ell",
+        tag="sparse_dense_bsr_ell",
+    )
@@ -0,0 +1,107 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""TVM operator compute sampled dense-dense matrix multiplication (SDDMM)."""
+import tvm
+from tvm import te
+
+from ..utils import get_const_tuple
+
+
+def sddmm(data_a, data_b, mask_indices, mask_indptr, block_size=(1, 1)):
+    """Computes `data_a @ data_b.T` only at the nonzero blocks of a BSR (or CSR) mask.
+
+    The mask is given by its structure only. Every loop has a static extent: the row of each
+    nonzero block is recovered by a binary search over `mask_indptr`, so the whole
+    computation stays a plain `te.compute` usable by `te.create_prim_func` and meta_schedule.
+
+    Parameters
+    ----------
+    data_a : tvm.te.Tensor
+        2-D with shape [M, K]
+
+    data_b : tvm.te.Tensor
+        2-D with shape [N, K]
+
+    mask_indices : tvm.te.Tensor
+        1-D with shape [num_blocks], the block column of every nonzero block
+
+    mask_indptr : tvm.te.Tensor
+        1-D with shape [M // bs_r + 1]
+
+    block_size : Tuple[int, int]
+        The block size `(bs_r, bs_c)` of the mask, `(1, 1)` for CSR.
+
+    Returns
+    -------
+    output : tvm.te.Tensor
+        3-D with shape [num_blocks, bs_r, bs_c], the data array of the BSR result
+        sharing `mask_indices` and `mask_indptr`
+    """
+    (bs_r, bs_c) = block_size
+    (_, k) = get_const_tuple(data_a.shape)
+    (num_blocks,) = get_const_tuple(mask_indices.shape)
+    block_rows = bsr_block_rows(mask_indptr, num_blocks)
+    reduce_k = te.reduce_axis((0, k), name="k")
+    return te.compute(
+        (num_blocks, bs_r, bs_c),
+        lambda b, i, j: te.sum(
+            data_a[block_rows[b] * bs_r + i, reduce_k]
+            * data_b[mask_indices[b] * bs_c + j, reduce_k],
+            axis=reduce_k,
+        ),
+        name="sddmm",
+        tag="sddmm",
+        attrs={"FLOP": 2 * num_blocks * bs_r * bs_c * k},
+    )
+
+
+def bsr_block_rows(indptr, num_blocks):
+    """Computes the (block) row of every nonzero (block) of a CSR/BSR matrix.
+
+    Parameters
+    ----------
+    indptr : tvm.te.Tensor
+        1-D with shape [num_rows + 1]
+
+    num_blocks : int
+        The number of nonzero (blocks)
+
+    Returns
+    -------
+    output : tvm.te.Tensor
+        1-D with shape [num_blocks] and the dtype of `indptr`
+    """
+    (num_rows_plus_1,) = get_const_tuple(indptr.shape)
+    num_rows = num_rows_plus_1 - 1
+    # Binary search of the last row starting at or before the block, i.e. the largest r with
+    # indptr[r] <= b, which skips the empty rows. Each step halves the stride and is one
+    # elementwise stage, so the search costs O(num_blocks * log(num_rows)).
+    rows = te.compute((num_blocks,), lambda b: tvm.tir.const(0, indptr.dtype), name="block_rows")
+    stride = 1 << max(num_rows - 1, 0).bit_length()
+    while stride > 1:
+        stride //= 2
+
+        def _step(b, rows=rows, stride=stride):
+            nxt = rows[b] + stride
+            return te.if_then_else(
+                tvm.tir.all(nxt < num_rows, indptr[tvm.tir.min(nxt, num_rows - 1)] <= b),
+                nxt,
+                rows[b],
+            )
+
+        rows = te.compute((num_blocks,), _step, name="block_rows")
+    return te.compute((num_blocks,), lambda b: rows[b], name="block_rows", tag="bsr_block_rows")
@@ -53,6 +53,145 @@ def random_bsr_matrix(m, n, bs_r, bs_c, density, dtype):
     return s
 
 
+def csr_balanced_row_partition(indptr, num_parts):
+    """Split the rows of a CSR matrix into partitions holding a similar amount of work.
+
+    This is the host-side counterpart of the in-kernel search done by
+    `tvm.topi.nn.sparse_dense_csr_balanced`, so that the partition can be computed once
+    alongside the CSR arrays and passed to the kernel as `row_partition`.
+
+    Parameters
+    ----------
+    indptr : numpy.ndarray
+        The row pointer array of the CSR matrix.
+    num_parts : int
+        The number of partitions.
+
+    Returns
+    -------
+    numpy.ndarray
+        1-D array with shape [num_parts + 1] holding the first row of every partition.
+    """
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+
+    num_rows = indptr.shape[0] - 1
+    nnz = int(indptr[-1])
+    cost = np.arange(num_rows + 1, dtype="int64") + indptr.astype("int64")
+    diag = (np.arange(num_parts + 1, dtype="int64") * (num_rows + nnz)) // num_parts
+    return np.searchsorted(cost, diag, side="left").astype(indptr.dtype)
+
+
+def csr_to_ell(data, indices, indptr, width=None):
+    """Pad the (block) rows of a CSR/BSR matrix to the same number of nonzeros.
+
+    Padded slots get zero data and column index 0, so they contribute nothing to a product
+    while still being safe to gather from.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        1-D with shape [nnz] (CSR) or 3-D with shape [num_blocks, bs_r, bs_c] (BSR)
+    indices : numpy.ndarray
+        1-D with shape [nnz] (CSR) or [num_blocks] (BSR)
+    indptr : numpy.ndarray
+        1-D with shape [num_rows + 1]
+    width : Optional[int]
+        The padded row length. Defaults to the longest row.
+
+    Returns
+    -------
+    (ell_data, ell_indices) : Tuple[numpy.ndarray, numpy.ndarray]
+        `ell_data` with shape [num_rows, width] (CSR) or [num_rows, width, bs_r, bs_c] (BSR),
+        `ell_indices` with shape [num_rows, width]
+    """
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+
+    num_rows = indptr.shape[0] - 1
+    row_nnz = np.diff(indptr)
+    if width is None:
+        width = int(row_nnz.max()) if num_rows > 0 else 0
+    assert num_rows == 0 or width >= row_nnz.max(), "width %d is less than the longest row" % width
+    ell_data = np.zeros((num_rows, width) + data.shape[1:], dtype=data.dtype)
+    ell_indices = np.zeros((num_rows, width), dtype=indices.dtype)
+    # position of every nonzero inside its row
+    rows = np.repeat(np.arange(num_rows), row_nnz)
+    cols = np.arange(indptr[-1]) - np.repeat(indptr[:-1], row_nnz)
+    ell_data[rows, cols] = data
+    ell_indices[rows, cols] = indices
+    return ell_data, ell_indices
+
+
+def is_nm_sparse(weight, n, m):
+    """Check whether every group of `m` consecutive values along the rows of `weight` holds
+    at most `n` nonzeros.
+
+    Parameters
+    ----------
+    weight : numpy.ndarray
+        2-D with shape [N, K]
+    n : int
+        The maximum number of nonzeros in each group
+    m : int
+        The group size
+
+    Returns
+    -------
+    bool
+    """
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+
+    rows, k = weight.shape
+    if k % m != 0:
+        return False
+    groups = weight.reshape(rows, k // m, m)
+    return bool(np.all(np.count_nonzero(groups, axis=2) <= n))
+
+
+def nm_compress(weight, n, m):
+    """Compress an N:M sparse matrix into the layout used by `tvm.topi.nn.sparse_dense_nm`.
+
+    Groups with fewer than `n` nonzeros are padded with explicit zeros, so every group
+    stores exactly `n` values.
+
+    Parameters
+    ----------
+    weight : numpy.ndarray
+        2-D with shape [N, K], N:M sparse along K
+    n : int
+        The maximum number of nonzeros in each group
+    m : int
+        The group size
+
+    Returns
+    -------
+    (values, meta) : Tuple[numpy.ndarray, numpy.ndarray]
+        `values` with shape [K // m * n, N] and the dtype of `weight`,
+        `meta` with shape [ceil(K // m * n / per_byte), N] and dtype uint8
+    """
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+    from ..nn.sparse import sparse_nm_metadata_bits
+
+    if not is_nm_sparse(weight, n, m):
+        raise ValueError("weight is not %d:%d sparse" % (n, m))
+    rows, k = weight.shape
+    bits = sparse_nm_metadata_bits(m)
+    per_byte = 8 // bits
+    groups = weight.reshape(rows, k // m, m)
+    # keep the n largest magnitudes of every group, which covers all of its nonzeros
+    positions = np.sort(np.argsort(-np.abs(groups), axis=2, kind="stable")[:, :, :n], axis=2)
+    values = np.take_along_axis(groups, positions, axis=2).reshape(rows, -1)
+    positions = positions.reshape(rows, -1).T.astype("uint8")
+    positions = np.pad(positions, ((0, -positions.shape[0] % per_byte), (0, 0)))
+    positions = positions.reshape(-1, per_byte, rows)
+    shifts = (np.arange(per_byte, dtype="uint8") * bits)[None, :, None]
+    meta = np.bitwise_or.reduce(positions << shifts, axis=1).astype("uint8")
+    return np.ascontiguousarray(values.T), meta
+
+
 def random_sparse_dense_params(func, params, bs_r, bs_c, density):
     """Replace the dense parameters with random sparse parameters. Mainly used for testing.
 
@@ -64,6 +64,56 @@ def schedule_sparse_dense(outs):
     return s
 
 
+def schedule_sparse_dense_csr_balanced(outs):
+    """Create schedule for sparse_dense_csr_balanced
+
+    The parallel loop over nnz-balanced row partitions is part of the extern compute, so only
+    the fused elementwise consumers need to be scheduled.
+    """
+    s = te.create_schedule([x.op for x in outs])
+    out = outs[0]
+    if out.op.tag != "sparse_dense_csr_balanced":
+        traverse_inline(s, out.op, lambda _: None)
+        simd_width = get_simd_32bit_lanes()
+        fused = s[out].fuse(*s[out].op.axis)
+        (f_o, f_i) = s[out].split(fused, 2 * simd_width)
+        s[out].parallel(f_o)
+        s[out].vectorize(f_i)
+    return s
+
+
+def schedule_sparse_dense_nm(outs):
+    """Create schedule for sparse_dense_nm
+
+    Every group holds exactly n values, so the loop over a group is unrolled without any
+    bounds check, and the output channels, contiguous in the compressed weight, are vectorized.
+    """
+    s = te.create_schedule([x.op for x in outs])
+
+    def _callback(op):
+        if op.tag == "sparse_dense_nm":
+            simd_width = get_simd_32bit_lanes()
+            (i, j) = s[op].op.axis
+            (group, elem) = s[op].op.reduce_axis
+            (j_o, j_i) = s[op].split(j, simd_width)
+            s[op].reorder(i, j_o, group, elem, j_i)
+            s[op].unroll(elem)
+            s[op].vectorize(j_i)
+            if op != outs[0].op:
+                out = outs[0]
+                (o_i, o_j) = s[out].op.axis
+                (o_jo, o_ji) = s[out].split(o_j, simd_width)
+                fused = s[out].fuse(o_i, o_jo)
+                s[out].parallel(fused)
+                s[out].vectorize(o_ji)
+                s[op].compute_at(s[out], fused)
+            else:
+                s[op].parallel(s[op].fuse(i, j_o))
+
+    traverse_inline(s, outs[0].op, _callback)
+    return s
+
+
 @autotvm.register_topi_compute("conv3x3_spNHWC.x86")
 def spconv2d_3x3_nhwc(cfg, data, wdat, wind, wptr, layout="NHWC"):
     """Sparse Conv2d 3x3 compute (NHWC)."""
@@ -16,8 +16,13 @@
  * specific language governing permissions and limitations
  * under the License.
  */
+#include <algorithm>
+#include <cstdlib>
+#include <fstream>
 #include <set>
+#include <string>
 #include <unordered_map>
+#include <vector>
 
 #include "../utils.h"
 
@@ -46,23 +51,58 @@ struct SortTuningRecordByMeanRunSecs {
   }
 };
 
+/*!
+ * \brief Extract the workload index from a line of the tuning record file without parsing the
+ * rest of the line, i.e. the leading integer of `[workload_index, tuning_record]`.
+ * \param line The line to be parsed.
+ * \return The workload index, or -1 if the line is empty or a comment.
+ */
+inline int ParseWorkloadIndex(const std::string& line) {
+  size_t pos = line.find_first_not_of(" \t\r");
+  if (pos == std::string::npos || line.compare(pos, 1, "#") == 0 ||
+      line.compare(pos, 2, "//") == 0) {
+    return -1;
+  }
+  CHECK_EQ(line[pos], '[') << "ValueError: Unable to parse the JSON object: " << line;
+  const char* begin = line.c_str() + pos + 1;
+  char* end = nullptr;
+  long workload_index = std::strtol(begin, &end, 10);  // NOLINT(runtime/int)
+  CHECK(end != begin && workload_index >= 0)
+      << "ValueError: Unable to parse the workload index of the JSON object: " << line;
+  return static_cast<int>(workload_index);
+}
+
+/*! \brief The number of lines of the tuning record table parsed at a time when loading. */
+constexpr int kLoadChunkSize = 4096;
+
 /*! \brief The default database implementation, which mimics two database tables with two files. */
 class JSONDatabaseNode : public DatabaseNode {
  public:
+  using RecordSet = std::multiset<TuningRecord, SortTuningRecordByMeanRunSecs>;
+
   /*! \brief The path to the workload table */
   String path_workload;
   /*! \brief The path to the tuning record table */
   String path_tuning_record;
+  /*! \brief The max number of records kept in memory per workload, -1 for unlimited */
+  int max_records_per_workload;
   /*! \brief All the workloads in the database */
   std::unordered_map<Workload, int, WorkloadHash, WorkloadEqual> workloads2idx_;
-  /*! \brief All the tuning records in the database */
-  std::multiset<TuningRecord, SortTuningRecordByMeanRunSecs> tuning_records_;
+  /*! \brief The workloads in the database, indexed by their position in the workload table */
+  std::vector<Workload> workloads_;
+  /*! \brief The tuning records of each workload, sorted by mean run seconds */
+  std::vector<RecordSet> tuning_records_;
+  /*! \brief The number of tuning records kept in the database */
+  int64_t num_records_ = 0;
 
   void VisitAttrs(tvm::AttrVisitor* v) {
     v->Visit("path_workload", &path_workload);
     v->Visit("path_tuning_record", &path_tuning_record);
+    v->Visit("max_records_per_workload", &max_records_per_workload);
     // `workloads2idx_` is not visited
+    // `workloads_` is not visited
     // `tuning_records_` is not visited
+    // `num_records_` is not visited
   }
 
   static constexpr const char* _type_key = "meta_schedule.JSONDatabase";
@@ -82,17 +122,18 @@ class JSONDatabaseNode : public DatabaseNode {
     Workload workload = it->first;
     // If `mod` is new in `workloads2idx_`, append it to the workload file
     if (inserted) {
-      it->second = static_cast<int>(this->workloads2idx_.size()) - 1;
+      it->second = AddWorkload(workload);
       JSONFileAppendLine(this->path_workload, JSONObj2Str(workload->AsJSON()));
     }
     return it->first;
   }
 
   void CommitTuningRecord(const TuningRecord& record) {
-    this->tuning_records_.insert(record);
+    int workload_index = this->workloads2idx_.at(record->workload);
+    AddTuningRecord(workload_index, record);
     JSONFileAppendLine(this->path_tuning_record,
                        JSONObj2Str(Array<ObjectRef>{
-                           /*workload_index=*/Integer(this->workloads2idx_.at(record->workload)),
+                           /*workload_index=*/Integer(workload_index),
                            /*tuning_record=*/record->AsJSON()  //
                        }));
   }
@@ -102,55 +143,128 @@ class JSONDatabaseNode : public DatabaseNode {
     if (top_k == 0) {
       return {};
     }
+    auto it = this->workloads2idx_.find(workload);
+    if (it == this->workloads2idx_.end()) {
+      return {};
+    }
+    const RecordSet& records = this->tuning_records_.at(it->second);
+    Array<TuningRecord> results;
+    results.reserve(std::min<size_t>(top_k, records.size()));
+    for (const TuningRecord& record : records) {
+      results.push_back(record);
+      if (static_cast<int>(results.size()) == top_k) {
+        break;
+      }
+    }
+    return results;
+  }
+
+  Array<TuningRecord> GetAllTuningRecords() {
     Array<TuningRecord> results;
-    results.reserve(top_k);
-    int counter = 0;
-    for (const TuningRecord& record : this->tuning_records_) {
-      if (WorkloadEqual()(record->workload, workload)) {
+    results.reserve(num_records_);
+    for (const RecordSet& records : this->tuning_records_) {
+      for (const TuningRecord& record : records) {
         results.push_back(record);
-        if (++counter == top_k) {
-          break;
-        }
       }
     }
     return results;
   }
 
-  int64_t Size() { return tuning_records_.size(); }
+  int64_t Size() { return num_records_; }
+
+  /*!
+   * \brief Register a workload and allocate its record index.
+   * \param workload The workload.
+   * \return The index of the workload.
+   */
+  int AddWorkload(const Workload& workload) {
+    this->workloads_.push_back(workload);
+    this->tuning_records_.emplace_back();
+    return static_cast<int>(this->workloads_.size()) - 1;
+  }
+
+  /*!
+   * \brief Insert a record into the index of its workload, dropping the slowest record when the
+   * index exceeds `max_records_per_workload`.
+   */
+  void AddTuningRecord(int workload_index, const TuningRecord& record) {
+    RecordSet& records = this->tuning_records_.at(workload_index);
+    records.insert(record);
+    ++this->num_records_;
+    if (max_records_per_workload >= 0 &&
+        static_cast<int>(records.size()) > max_records_per_workload) {
+      records.erase(std::prev(records.end()));
+      --this->num_records_;
+    }
+  }
+
+  /*!
+   * \brief Parse lines of the tuning record table and insert their records.
+   * \param lines The lines to be parsed.
+   */
+  void LoadTuningRecords(const Array<String>& lines) {
+    for (const ObjectRef& json_obj : JSONStr2Obj(lines)) {
+      int workload_index = -1;
+      ObjectRef tuning_record{nullptr};
+      try {
+        const ArrayNode* arr = json_obj.as<ArrayNode>();
+        ICHECK_EQ(arr->size(), 2);
+        workload_index = Downcast<Integer>(arr->at(0));
+        tuning_record = arr->at(1);
+      } catch (std::runtime_error& e) {
+        LOG(FATAL) << "ValueError: Unable to parse the JSON object: " << json_obj
+                   << "\nThe error is: " << e.what();
+      }
+      AddTuningRecord(workload_index,
+                      TuningRecord::FromJSON(tuning_record, this->workloads_.at(workload_index)));
+    }
+  }
 };
 
 Database Database::JSONDatabase(String path_workload, String path_tuning_record,
-                                bool allow_missing) {
+                                bool allow_missing, int max_records_per_workload) {
   ObjectPtr<JSONDatabaseNode> n = make_object<JSONDatabaseNode>();
+  n->max_records_per_workload = max_records_per_workload;
   // Load `n->workloads2idx_` from `path_workload`
-  std::vector<Workload> workloads;
   {
     Array<ObjectRef> json_objs = JSONStr2Obj(JSONFileReadLines(path_workload, allow_missing));
     int n_objs = json_objs.size();
     n->workloads2idx_.reserve(n_objs);
-    workloads.reserve(n_objs);
+    n->workloads_.reserve(n_objs);
     for (int i = 0; i < n_objs; ++i) {
       Workload workload = Workload::FromJSON(json_objs[i]);
-      n->workloads2idx_.emplace(workload, i);
-      workloads.push_back(workload);
+      n->workloads2idx_.emplace(workload, n->AddWorkload(workload));
     }
   }
-  // Load `n->tuning_records_` from `path_tuning_record`
+  // Stream `path_tuning_record` in chunks of lines, so that only the records kept by
+  // `max_records_per_workload` stay in memory
   {
-    Array<ObjectRef> json_objs = JSONStr2Obj(JSONFileReadLines(path_tuning_record, allow_missing));
-    for (const ObjectRef& json_obj : json_objs) {
-      int workload_index = -1;
-      ObjectRef tuning_record{nullptr};
-      try {
-        const ArrayNode* arr = json_obj.as<ArrayNode>();
-        ICHECK_EQ(arr->size(), 2);
-        workload_index = Downcast<Integer>(arr->at(0));
-        tuning_record = arr->at(1);
-      } catch (std::runtime_error& e) {
-        LOG(FATAL) << "ValueError: Unable to parse the JSON object: " << json_obj
-                   << "\nThe error is: " << e.what();
+    std::ifstream is(path_tuning_record);
+    if (is.good()) {
+      Array<String> chunk;
+      chunk.reserve(kLoadChunkSize);
+      for (std::string line; std::getline(is, line);) {
+        int workload_index = ParseWorkloadIndex(line);
+        if (workload_index == -1) {
+          continue;
+        }
+        CHECK_LT(workload_index, static_cast<int>(n->workloads_.size()))
+            << "ValueError: The workload index " << workload_index
+            << " is out of range in the JSON object: " << line;
+        chunk.push_back(line);
+        if (static_cast<int>(chunk.size()) == kLoadChunkSize) {
+          n->LoadTuningRecords(chunk);
+          chunk = Array<String>();
+          chunk.reserve(kLoadChunkSize);
+        }
+      }
+      if (!chunk.empty()) {
+        n->LoadTuningRecords(chunk);
       }
-      n->tuning_records_.insert(TuningRecord::FromJSON(tuning_record, workloads[workload_index]));
+    } else {
+      CHECK(allow_missing) << "ValueError: File doesn't exist: " << path_tuning_record;
+      std::ofstream os(path_tuning_record);
+      CHECK(os.good()) << "ValueError: Cannot create new file: " << path_tuning_record;
     }
   }
   n->path_workload = path_workload;
@@ -19,7 +19,9 @@
 #include <tvm/tir/transform.h>
 
 #include <cmath>
+#include <deque>
 #include <memory>
+#include <mutex>
 #include <numeric>
 #include <unordered_map>
 #include <unordered_set>
@@ -1267,12 +1269,83 @@ class PerStoreFeatureNode : public FeatureExtractorNode {
   int arith_intensity_curve_num_samples;
   int cache_line_bytes;
   int feature_vector_length;
+  int max_cache_size;
+
+  /*! \brief An extracted feature, together with the module it is extracted from. */
+  struct CacheEntry {
+    IRModule mod;
+    bool is_gpu;
+    runtime::NDArray feature;
+  };
+  /*! \brief The features extracted so far, keyed by the structural hash of the module. */
+  std::unordered_map<size_t, CacheEntry> cache_;
+  /*! \brief The keys of `cache_` in insertion order, to evict the oldest entries first. */
+  std::deque<size_t> cache_order_;
+  /*! \brief The mutex guarding `cache_` and `cache_order_`. */
+  std::mutex cache_mutex_;
+  /*! \brief The number of candidates whose features are found in the cache. */
+  int64_t num_cache_hits_ = 0;
+  /*! \brief The number of candidates whose features are extracted. */
+  int64_t num_cache_misses_ = 0;
 
   void VisitAttrs(tvm::AttrVisitor* v) {
     v->Visit("buffers_per_store", &buffers_per_store);
     v->Visit("arith_intensity_curve_num_samples", &arith_intensity_curve_num_samples);
     v->Visit("cache_line_bytes", &cache_line_bytes);
     v->Visit("feature_vector_length", &feature_vector_length);
+    v->Visit("max_cache_size", &max_cache_size);
+    v->Visit("num_cache_hits", &num_cache_hits_);
+    v->Visit("num_cache_misses", &num_cache_misses_);
+    // `cache_` is not visited
+    // `cache_order_` is not visited
+    // `cache_mutex_` is not visited
+  }
+
+  /*!
+   * \brief Look up the feature of a module in the cache.
+   * \param key The structural hash of the module.
+   * \param mod The module.
+   * \param is_gpu Whether the features are extracted for GPU.
+   * \return The cached feature, or NullOpt if missing.
+   */
+  Optional<runtime::NDArray> LookupCache(size_t key, const IRModule& mod, bool is_gpu) {
+    CacheEntry entry{IRModule{nullptr}, false, runtime::NDArray{nullptr}};
+    {
+      std::lock_guard<std::mutex> lock(cache_mutex_);
+      auto it = cache_.find(key);
+      if (it != cache_.end()) {
+        entry = it->second;
+      }
+    }
+    // Compare outside the lock, so that the other threads are not blocked meanwhile
+    bool hit = entry.mod.defined() && entry.is_gpu == is_gpu && StructuralEqual()(entry.mod, mod);
+    std::lock_guard<std::mutex> lock(cache_mutex_);
+    if (!hit) {
+      ++num_cache_misses_;
+      return NullOpt;
+    }
+    ++num_cache_hits_;
+    return entry.feature;
+  }
+
+  /*!
+   * \brief Add the feature of a module to the cache, evicting the oldest entries if full.
+   * \param key The structural hash of the module.
+   * \param mod The module.
+   * \param is_gpu Whether the features are extracted for GPU.
+   * \param feature The feature extracted.
+   */
+  void AddToCache(size_t key, const IRModule& mod, bool is_gpu, const runtime::NDArray& feature) {
+    std::lock_guard<std::mutex> lock(cache_mutex_);
+    if (!cache_.emplace(key, CacheEntry{mod, is_gpu, feature}).second) {
+      // On a hash collision, keep the entry already cached
+      return;
+    }
+    cache_order_.push_back(key);
+    while (static_cast<int>(cache_order_.size()) > max_cache_size) {
+      cache_.erase(cache_order_.front());
+      cache_order_.pop_front();
+    }
   }
 
   void ExtractSingle(IRModule mod, bool is_gpu, std::vector<std::vector<double>>* results) {
@@ -1302,9 +1375,22 @@ class PerStoreFeatureNode : public FeatureExtractorNode {
     results.resize(candidates.size());
     auto f = [this, is_gpu, &candidates, &results](int, int task_id) -> void {
       const auto& candidate = candidates[task_id];
+      IRModule mod = candidate->sch->mod();
+      size_t key = 0;
+      if (max_cache_size > 0) {
+        key = StructuralHash()(mod);
+        Optional<runtime::NDArray> feature = LookupCache(key, mod, is_gpu);
+        if (feature.defined()) {
+          results[task_id] = feature.value();
+          return;
+        }
+      }
       std::vector<std::vector<double>> features;
-      ExtractSingle(candidate->sch->mod(), is_gpu, &features);
+      ExtractSingle(mod, is_gpu, &features);
       results[task_id] = tir::utils::AsNDArray(features);
+      if (max_cache_size > 0) {
+        AddToCache(key, mod, is_gpu, results[task_id]);
+      }
     };
     support::parallel_for_dynamic(0, candidates.size(), tune_context->num_threads, f);
     return results;
@@ -1316,11 +1402,12 @@ class PerStoreFeatureNode : public FeatureExtractorNode {
 
 FeatureExtractor FeatureExtractor::PerStoreFeature(int buffers_per_store,
                                                    int arith_intensity_curve_num_samples,
-                                                   int cache_line_bytes) {
+                                                   int cache_line_bytes, int max_cache_size) {
   ObjectPtr<PerStoreFeatureNode> n = make_object<PerStoreFeatureNode>();
   n->buffers_per_store = buffers_per_store;
   n->arith_intensity_curve_num_samples = arith_intensity_curve_num_samples;
   n->cache_line_bytes = cache_line_bytes;
+  n->max_cache_size = max_cache_size;
   n->feature_vector_length = tir::group1::Feature::kCount +                                  //
                              tir::group2::Feature::SubFeature::kCount * buffers_per_store +  //
                              arith_intensity_curve_num_samples +                             //
@@ -0,0 +1,99 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one
+ * or more contributor license agreements.  See the NOTICE file
+ * distributed with this work for additional information
+ * regarding copyright ownership.  The ASF licenses this file
+ * to you under the Apache License, Version 2.0 (the
+ * "License"); you may not use this file except in compliance
+ * with the License.  You may obtain a copy of the License at
+ *
+ *   http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an
+ * "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+ * KIND, either express or implied.  See the License for the
+ * specific language governing permissions and limitations
+ * under the License.
+ */
+#include <limits>
+
+#include "../utils.h"
+
+namespace tvm {
+namespace meta_schedule {
+
+class StopOnConvergenceNode : public MeasureCallbackNode {
+ public:
+  /*! \brief The number of consecutive rounds without improvement before stopping a task. */
+  int num_rounds;
+  /*! \brief The minimal relative reduction of the best latency that counts as an improvement. */
+  double min_improvement;
+  /*! \brief The best mean latency of each task so far. */
+  std::vector<double> best_latency_;
+  /*! \brief The number of consecutive rounds without improvement of each task. */
+  std::vector<int> num_rounds_without_improvement_;
+
+  void VisitAttrs(tvm::AttrVisitor* v) {
+    v->Visit("num_rounds", &num_rounds);
+    v->Visit("min_improvement", &min_improvement);
+    // `best_latency_` is not visited
+    // `num_rounds_without_improvement_` is not visited
+  }
+
+  void Apply(const TaskScheduler& task_scheduler, int task_id,
+             const Array<MeasureCandidate>& measure_candidates,
+             const Array<BuilderResult>& builder_results,
+             const Array<RunnerResult>& runner_results) final {
+    int n_tasks = task_scheduler->tasks.size();
+    if (static_cast<int>(best_latency_.size()) < n_tasks) {
+      best_latency_.resize(n_tasks, std::numeric_limits<double>::infinity());
+      num_rounds_without_improvement_.resize(n_tasks, 0);
+    }
+    double& best = best_latency_[task_id];
+    double round_best = std::numeric_limits<double>::infinity();
+    for (const RunnerResult& result : runner_results) {
+      if (result->error_msg.defined() || !result->run_secs.defined() ||
+          result->run_secs.value().empty()) {
+        continue;
+      }
+      double sum = 0.0;
+      for (const FloatImm& run_sec : result->run_secs.value()) {
+        sum += run_sec->value;
+      }
+      round_best = std::min(round_best, sum / result->run_secs.value().size());
+    }
+    if (round_best < best * (1.0 - min_improvement)) {
+      num_rounds_without_improvement_[task_id] = 0;
+    } else if (++num_rounds_without_improvement_[task_id] >= num_rounds) {
+      TuneContext task = task_scheduler->tasks[task_id];
+      if (!task->is_stopped) {
+        LOG(INFO) << "Task #" << task_id + 1 << ": " << task->task_name
+                  << " has converged without improvement for " << num_rounds
+                  << " round(s), stopping it";
+        task_scheduler->SetTaskStopped(task_id);
+      }
+    }
+    best = std::min(best, round_best);
+  }
+
+  static constexpr const char* _type_key = "meta_schedule.StopOnConvergence";
+  TVM_DECLARE_FINAL_OBJECT_INFO(StopOnConvergenceNode, MeasureCallbackNode);
+};
+
+MeasureCallback MeasureCallback::StopOnConvergence(int num_rounds, double min_improvement) {
+  CHECK_GT(num_rounds, 0) << "ValueError: num_rounds must be positive, but gets: " << num_rounds;
+  CHECK(0.0 <= min_improvement && min_improvement < 1.0)
+      << "ValueError: min_improvement should be within [0, 1), but gets: " << min_improvement;
+  ObjectPtr<StopOnConvergenceNode> n = make_object<StopOnConvergenceNode>();
+  n->num_rounds = num_rounds;
+  n->min_improvement = min_improvement;
+  return MeasureCallback(n);
+}
+
+TVM_REGISTER_NODE_TYPE(StopOnConvergenceNode);
+TVM_REGISTER_GLOBAL("meta_schedule.MeasureCallbackStopOnConvergence")
+    .set_body_typed(MeasureCallback::StopOnConvergence);
+
+}  // namespace meta_schedule
+}  // namespace tvm
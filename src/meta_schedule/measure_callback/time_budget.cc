@@ -0,0 +1,88 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one
+ * or more contributor license agreements.  See the NOTICE file
+ * distributed with this work for additional information
+ * regarding copyright ownership.  The ASF licenses this file
+ * to you under the Apache License, Version 2.0 (the
+ * "License"); you may not use this file except in compliance
+ * with the License.  You may obtain a copy of the License at
+ *
+ *   http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an
+ * "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+ * KIND, either express or implied.  See the License for the
+ * specific language governing permissions and limitations
+ * under the License.
+ */
+#include <chrono>
+
+#include "../utils.h"
+
+namespace tvm {
+namespace meta_schedule {
+
+class TimeBudgetNode : public MeasureCallbackNode {
+ public:
+  /*! \brief The wall-clock budget in seconds. */
+  double max_time_sec;
+  /*! \brief Whether the budget has started to be consumed. */
+  bool started_ = false;
+  /*! \brief The time when the budget starts to be consumed, i.e. the first invocation. */
+  std::chrono::steady_clock::time_point start_time_;
+
+  void VisitAttrs(tvm::AttrVisitor* v) {
+    v->Visit("max_time_sec", &max_time_sec);
+    // `started_` is not visited
+    // `start_time_` is not visited
+  }
+
+  void Apply(const TaskScheduler& task_scheduler, int task_id,
+             const Array<MeasureCandidate>& measure_candidates,
+             const Array<BuilderResult>& builder_results,
+             const Array<RunnerResult>& runner_results) final {
+    // Start the clock when tuning starts, not when the callback is created, so that the time
+    // spent on task extraction or on warm starting the cost model is not counted
+    if (!started_) {
+      started_ = true;
+      start_time_ = std::chrono::steady_clock::now();
+      return;
+    }
+    double elapsed_sec = std::chrono::duration_cast<std::chrono::duration<double>>(
+                             std::chrono::steady_clock::now() - start_time_)
+                             .count();
+    if (elapsed_sec < max_time_sec) {
+      return;
+    }
+    // The task being joined, and the tasks without measurement in flight, are stopped right away.
+    // The others are stopped when their results are collected and this callback is invoked again.
+    int n_tasks = task_scheduler->tasks.size();
+    for (int i = 0; i < n_tasks; ++i) {
+      TuneContext task = task_scheduler->tasks[i];
+      if (!task->is_stopped && (i == task_id || !task->runner_futures.defined())) {
+        LOG(INFO) << "Tuning time budget of " << max_time_sec << "s is used up after "
+                  << elapsed_sec << "s, stopping Task #" << i + 1 << ": " << task->task_name;
+        task_scheduler->SetTaskStopped(i);
+      }
+    }
+  }
+
+  static constexpr const char* _type_key = "meta_schedule.TimeBudget";
+  TVM_DECLARE_FINAL_OBJECT_INFO(TimeBudgetNode, MeasureCallbackNode);
+};
+
+MeasureCallback MeasureCallback::TimeBudget(double max_time_sec) {
+  CHECK_GT(max_time_sec, 0.0) << "ValueError: max_time_sec must be positive, but gets: "
+                              << max_time_sec;
+  ObjectPtr<TimeBudgetNode> n = make_object<TimeBudgetNode>();
+  n->max_time_sec = max_time_sec;
+  return MeasureCallback(n);
+}
+
+TVM_REGISTER_NODE_TYPE(TimeBudgetNode);
+TVM_REGISTER_GLOBAL("meta_schedule.MeasureCallbackTimeBudget")
+    .set_body_typed(MeasureCallback::TimeBudget);
+
+}  // namespace meta_schedule
+}  // namespace tvm
@@ -17,6 +17,8 @@
  * under the License.
  */
 
+#include <numeric>
+
 #include "../utils.h"
 
 #define TVM_META_SCHEDULE_CHECK_PROB_RANGE(p, name)                               \
@@ -63,10 +65,13 @@ class SizedHeap {
 
   /*!
    * \brief Push the specific item to the heap if its key did not appears in the heap
-   * \param item The item to be pushed
+   * \param sch The schedule to be pushed
+   * \param mod The IRModule of the schedule
+   * \param shash The structural hash of the IRModule
+   * \param score The predicted score of the schedule
    */
-  void Push(Schedule sch, IRModule mod, double score) {
-    Item item{sch, mod, StructuralHash()(mod), score};
+  void Push(Schedule sch, IRModule mod, size_t shash, double score) {
+    Item item{sch, mod, shash, score};
     if (!in_heap.insert(item).second) {
       return;
     }
@@ -188,6 +193,46 @@ struct ConcurrentBitmask {
 
 /**************** Util Functions ****************/
 
+/*!
+ * \brief Hash the block structure of the entry function of the given IRModule, i.e. the names of
+ * its blocks and the types of their block iters, leaving out the shapes. Workloads that are
+ * identical up to shape, e.g. the same conv2d at different resolutions, share the same hash.
+ * \param mod The IRModule to be hashed
+ * \return The hash of the block structure
+ */
+size_t BlockStructureHash(const IRModule& mod) {
+  size_t result = 0;
+  tir::PreOrderVisit(FindEntryFunc(mod)->body, [&result](const ObjectRef& obj) -> bool {
+    if (const auto* block = obj.as<tir::BlockNode>()) {
+      result = support::HashCombine(result, std::hash<String>()(block->name_hint));
+      for (const tir::IterVar& iter_var : block->iter_vars) {
+        result = support::HashCombine(result, static_cast<int>(iter_var->iter_type));
+      }
+    }
+    return true;
+  });
+  return result;
+}
+
+/*!
+ * \brief Prepare a trace measured on another task for replaying onto the current one. The tile
+ * sizes depend on the shapes, so their decisions are dropped to be re-sampled, while the rest of
+ * the decisions are kept.
+ * \param trace The trace measured on another task
+ * \return The trace with shape-dependent decisions removed
+ */
+tir::Trace DropShapeDependentDecisions(const tir::Trace& trace) {
+  static const tir::InstructionKind& kind_sample_perfect_tile =
+      tir::InstructionKind::Get("SamplePerfectTile");
+  Map<tir::Instruction, ObjectRef> decisions;
+  for (const auto& kv : trace->decisions) {
+    if (!kv.first->kind.same_as(kind_sample_perfect_tile)) {
+      decisions.Set(kv.first, kv.second);
+    }
+  }
+  return tir::Trace(trace->insts, decisions);
+}
+
 /*!
  * \brief Assemble measure candidates from the given candidate traces.
  * \param traces The picked candidate traces.
@@ -247,6 +292,13 @@ class EvolutionarySearchNode : public SearchStrategyNode {
      * \return The picked best candidates.
      */
     inline std::vector<Schedule> PickBestFromDatabase(int num);
+    /*!
+     * \brief Seed candidates by replaying the best measured traces of the other tasks that share
+     *  the block structure of the current one, with their shape-dependent decisions re-sampled.
+     * \param num The number of traces to produce.
+     * \return The seeded candidates.
+     */
+    inline std::vector<Schedule> PickCrossTaskSeeds(int num);
     /*!
      * \brief Sample the initial population from previous measured results and randomly generated
      *  traces via trace replaying.
@@ -261,6 +313,13 @@ class EvolutionarySearchNode : public SearchStrategyNode {
      * \return The evolved traces from initial population.
      */
     inline std::vector<Schedule> EvolveWithCostModel(std::vector<Schedule> population, int num);
+    /*!
+     * \brief Record the statistics of an iteration of the genetic algorithm.
+     * \param iter The index of the iteration.
+     * \param num_unique The number of structurally unique candidates in the population.
+     * \param scores The predicted scores of the population.
+     */
+    inline void RecordIterStats(int iter, int num_unique, std::vector<double> scores);
     /*!
      * \brief Pick final candidates from the given initial population and bests of evolved ones.
      * \param inits The initial population of traces sampled.
@@ -302,6 +361,8 @@ class EvolutionarySearchNode : public SearchStrategyNode {
   std::unique_ptr<State> state_ = nullptr;
   /*! \brief The token registered for the given workload in database. */
   Workload token_{nullptr};
+  /*! \brief The hash of the block structure of the workload. */
+  size_t block_structure_hash_;
 
   /*** Configuration: global ***/
   /*! \brief The number of trials per iteration. */
@@ -325,6 +386,18 @@ class EvolutionarySearchNode : public SearchStrategyNode {
   /*** Configuration: pick states for measurement ***/
   /*! \brief The ratio of measurements to use randomly sampled states. */
   double eps_greedy;
+  /*** Configuration: cross-task seeding ***/
+  /*! \brief The ratio of the initial population seeded from other tasks of the same structure. */
+  double cross_task_seed_ratio;
+
+  /*** Statistics ***/
+  /*! \brief The number of candidates seeded from other tasks. */
+  int64_t num_cross_task_seeds;
+  /*!
+   * \brief The statistics of each iteration of the genetic algorithm, including the population
+   * diversity, the mutation success rate and the distribution of the predicted scores.
+   */
+  Array<Map<String, FloatImm>> search_stats;
 
   void VisitAttrs(tvm::AttrVisitor* v) {
     // `context_` is not visited
@@ -338,6 +411,8 @@ class EvolutionarySearchNode : public SearchStrategyNode {
     // `rand_state_` is not visited
     // `per_thread_data_` is not visited
     // `state_` is not visited
+    // `token_` is not visited
+    // `block_structure_hash_` is not visited
 
     /*** Configuration: global ***/
     v->Visit("num_trials_total", &num_trials_total);
@@ -352,6 +427,11 @@ class EvolutionarySearchNode : public SearchStrategyNode {
     v->Visit("genetic_max_fail_count", &genetic_max_fail_count);
     /*** Configuration: pick states for measurement ***/
     v->Visit("eps_greedy", &eps_greedy);
+    /*** Configuration: cross-task seeding ***/
+    v->Visit("cross_task_seed_ratio", &cross_task_seed_ratio);
+    /*** Statistics ***/
+    v->Visit("num_cross_task_seeds", &num_cross_task_seeds);
+    v->Visit("search_stats", &search_stats);
   }
 
   static constexpr const char* _type_key = "meta_schedule.EvolutionarySearch";
@@ -371,6 +451,7 @@ class EvolutionarySearchNode : public SearchStrategyNode {
     this->cost_model_ = context->task_scheduler->cost_model.value();
     this->database_ = context->task_scheduler->database;
     this->token_ = this->database_->CommitWorkload(context->mod.value());
+    this->block_structure_hash_ = BlockStructureHash(context->mod.value());
     this->per_thread_data_.resize(this->num_threads_);
     for (const auto& kv : this->mutator_probs_) {
       double mass = kv.second->value;
@@ -381,6 +462,8 @@ class EvolutionarySearchNode : public SearchStrategyNode {
       data.rand_state = ForkSeed(&this->rand_state_);
     }
     this->state_.reset();
+    this->num_cross_task_seeds = 0;
+    this->search_stats.clear();
   }
 
   void PreTuning(const Array<Schedule>& design_spaces) final {
@@ -442,6 +525,81 @@ std::vector<Schedule> EvolutionarySearchNode::State::PickBestFromDatabase(int nu
   return results;
 }
 
+std::vector<Schedule> EvolutionarySearchNode::State::PickCrossTaskSeeds(int num) {
+  if (num <= 0 || self->context_->task_scheduler == nullptr) {
+    return {};
+  }
+  // Collect the best records of each task with the same block structure
+  std::vector<Array<TuningRecord>> records_per_task;
+  for (const TuneContext& task : self->context_->task_scheduler->tasks) {
+    if (task.get() == self->context_ || !task->mod.defined()) {
+      continue;
+    }
+    IRModule mod = task->mod.value();
+    if (BlockStructureHash(mod) != self->block_structure_hash_ ||
+        !self->database_->HasWorkload(mod)) {
+      continue;
+    }
+    Workload workload = self->database_->CommitWorkload(mod);
+    if (workload->shash == self->token_->shash &&
+        StructuralEqual()(workload->mod, self->token_->mod)) {
+      continue;
+    }
+    Array<TuningRecord> records = self->database_->GetTopK(workload, num);
+    if (!records.empty()) {
+      records_per_task.push_back(records);
+    }
+  }
+  // Interleave the records so that each task contributes its best ones first
+  std::vector<tir::Trace> seed_traces;
+  seed_traces.reserve(num);
+  for (size_t rank = 0; static_cast<int>(seed_traces.size()) < num; ++rank) {
+    bool found = false;
+    for (const Array<TuningRecord>& records : records_per_task) {
+      if (rank < records.size() && static_cast<int>(seed_traces.size()) < num) {
+        seed_traces.push_back(DropShapeDependentDecisions(records[rank]->trace));
+        found = true;
+      }
+    }
+    if (!found) {
+      break;
+    }
+  }
+  int actual_num = seed_traces.size();
+  ThreadedTraceApply pp(self->postprocs_);
+  std::vector<Schedule> results(actual_num, Schedule{nullptr});
+  auto f_proc_seed = [this, &seed_traces, &results, &pp](int thread_id, int trace_id) -> void {
+    PerThreadData& data = self->per_thread_data_.at(thread_id);
+    TRandState* rand_state = &data.rand_state;
+    const IRModule& mod = data.mod;
+    const tir::Trace& trace = seed_traces.at(trace_id);
+    Schedule& result = results.at(trace_id);
+    ICHECK(!result.defined());
+    // Replay with the shape-independent decisions kept first, and then fall back to re-sampling
+    // all the decisions in case some of the kept ones are invalid on the current task
+    for (const tir::Trace& replayed : {trace, tir::Trace(trace->insts, {})}) {
+      try {
+        if (Optional<Schedule> sch = pp.Apply(mod, replayed, rand_state)) {
+          result = sch.value();
+          return;
+        }
+      } catch (const std::runtime_error& e) {  // includes tvm::Error and dmlc::Error
+        // The trace does not apply to the current task despite the matching block structure
+      }
+    }
+  };
+  support::parallel_for_dynamic(0, actual_num, self->num_threads_, f_proc_seed);
+  std::vector<Schedule> out_schs;
+  out_schs.reserve(actual_num);
+  for (const Schedule& sch : results) {
+    if (sch.defined()) {
+      out_schs.push_back(sch);
+    }
+  }
+  self->num_cross_task_seeds += out_schs.size();
+  return out_schs;
+}
+
 std::vector<Schedule> EvolutionarySearchNode::State::SampleInitPopulation(int num) {
   ThreadedTraceApply pp(self->postprocs_);
   std::vector<Schedule> out_schs;
@@ -483,14 +641,18 @@ std::vector<Schedule> EvolutionarySearchNode::State::EvolveWithCostModel(
                                                         self->cost_model_,                    //
                                                         self->args_info_);
     ICHECK_EQ(scores.size(), population.size());
+    std::unordered_set<size_t> unique_shashes;
     for (int i = 0, n = population.size(); i < n; ++i) {
       Schedule sch = population.at(i);
       IRModule mod = sch->mod();
+      size_t shash = StructuralHash()(mod);
       double score = scores.at(i);
+      unique_shashes.insert(shash);
       if (!self->database_->HasWorkload(mod)) {
-        heap.Push(sch, mod, score);
+        heap.Push(sch, mod, shash, score);
       }
     }
+    RecordIterStats(iter, unique_shashes.size(), scores);
     // Discontinue once it reaches end of search
     if (iter == self->genetic_num_iters) {
       break;
@@ -502,9 +664,11 @@ std::vector<Schedule> EvolutionarySearchNode::State::EvolveWithCostModel(
     ThreadedTraceApply pp(self->postprocs_);
     ConcurrentBitmask cbmask(self->population_size);
     std::vector<Schedule> next_population(self->population_size, Schedule{nullptr});
+    std::atomic<int> num_mutations{0};
+    std::atomic<int> num_mutation_successes{0};
     // The worker function
-    auto f_find_candidate = [&cbmask, &population, &next_population, &pp, this](int thread_id,
-                                                                                int trace_id) {
+    auto f_find_candidate = [&cbmask, &population, &next_population, &pp, &num_mutations,
+                             &num_mutation_successes, this](int thread_id, int trace_id) {
       // Prepare samplers
       PerThreadData& data = self->per_thread_data_.at(thread_id);
       TRandState* rand_state = &data.rand_state;
@@ -520,11 +684,13 @@ std::vector<Schedule> EvolutionarySearchNode::State::EvolveWithCostModel(
         if (Optional<Mutator> opt_mutator = mutator_sampler()) {
           // Decision: mutate
           Mutator mutator = opt_mutator.value();
+          ++num_mutations;
           if (Optional<tir::Trace> new_trace = mutator->Apply(trace, rand_state)) {
             if (Optional<Schedule> sch = pp.Apply(mod, new_trace.value(), rand_state)) {
               // note that sch's trace is different from new_trace
               // because it contains post-processing information
               result = sch.value();
+              ++num_mutation_successes;
               break;
             }
           }
@@ -540,7 +706,16 @@ std::vector<Schedule> EvolutionarySearchNode::State::EvolveWithCostModel(
     };
     support::parallel_for_dynamic(0, self->population_size, self->num_threads_, f_find_candidate);
     population.swap(next_population);
-    LOG(INFO) << "Evolve iter #" << iter << " done. Summary:\n" << pp.SummarizeFailures();
+    int n_mutations = num_mutations.load();
+    int n_successes = num_mutation_successes.load();
+    Map<String, FloatImm> stats = self->search_stats.back();
+    stats.Set("mutation_success_rate",
+              FloatImm(DataType::Float(64),
+                       n_mutations > 0 ? static_cast<double>(n_successes) / n_mutations : 0.0));
+    self->search_stats.Set(self->search_stats.size() - 1, stats);
+    LOG(INFO) << "Evolve iter #" << iter << " done. Mutation success rate: " << n_successes << "/"
+              << n_mutations << ". Summary:\n"
+              << pp.SummarizeFailures();
   }
   // Return the best states from the heap, sorting from higher score to lower ones
   std::sort(heap.heap.begin(), heap.heap.end());
@@ -568,6 +743,30 @@ std::vector<Schedule> EvolutionarySearchNode::State::EvolveWithCostModel(
   return results;
 }
 
+void EvolutionarySearchNode::State::RecordIterStats(int iter, int num_unique,
+                                                    std::vector<double> scores) {
+  int n = scores.size();
+  ICHECK_GT(n, 0);
+  std::sort(scores.begin(), scores.end());
+  double median = n % 2 == 1 ? scores[n / 2] : (scores[n / 2 - 1] + scores[n / 2]) / 2.0;
+  double mean = std::accumulate(scores.begin(), scores.end(), 0.0) / n;
+  double diversity = static_cast<double>(num_unique) / n;
+  auto f_float = [](double value) { return FloatImm(DataType::Float(64), value); };
+  Map<String, FloatImm> stats{
+      {"iter", f_float(iter)},
+      {"population_size", f_float(n)},
+      {"diversity", f_float(diversity)},
+      {"score_min", f_float(scores.front())},
+      {"score_median", f_float(median)},
+      {"score_max", f_float(scores.back())},
+      {"score_mean", f_float(mean)},
+  };
+  self->search_stats.push_back(stats);
+  LOG(INFO) << "Evolve iter #" << iter << ": population diversity " << num_unique << "/" << n
+            << ", predicted scores: min " << scores.front() << ", median " << median << ", max "
+            << scores.back() << ", mean " << mean;
+}
+
 std::vector<Schedule> EvolutionarySearchNode::State::PickWithEpsGreedy(
     const std::vector<Schedule>& unmeasured, const std::vector<Schedule>& bests, int num) {
   int num_rands = num * self->eps_greedy;
@@ -622,9 +821,14 @@ Optional<Array<MeasureCandidate>> EvolutionarySearchNode::State::GenerateMeasure
   LOG(INFO) << "Generating candidates......";
   std::vector<Schedule> measured = PickBestFromDatabase(pop * self->init_measured_ratio);
   LOG(INFO) << "Picked top " << measured.size() << " candidate(s) from database";
-  std::vector<Schedule> unmeasured = SampleInitPopulation(pop - measured.size());
+  std::vector<Schedule> seeds = PickCrossTaskSeeds(pop * self->cross_task_seed_ratio);
+  if (!seeds.empty()) {
+    LOG(INFO) << "Seeded " << seeds.size() << " candidate(s) from other tasks";
+  }
+  std::vector<Schedule> unmeasured = SampleInitPopulation(pop - measured.size() - seeds.size());
   LOG(INFO) << "Sampled " << unmeasured.size() << " candidate(s)";
   inits.insert(inits.end(), measured.begin(), measured.end());
+  inits.insert(inits.end(), seeds.begin(), seeds.end());
   inits.insert(inits.end(), unmeasured.begin(), unmeasured.end());
   std::vector<Schedule> bests = EvolveWithCostModel(inits, sample_num);
   LOG(INFO) << "Got " << bests.size() << " candidate(s) with evolutionary search";
@@ -648,10 +852,16 @@ SearchStrategy SearchStrategy::EvolutionarySearch(int num_trials_per_iter,     /
                                                   int genetic_num_iters,       //
                                                   double genetic_mutate_prob,  //
                                                   int genetic_max_fail_count,  //
-                                                  double eps_greedy) {
+                                                  double eps_greedy,           //
+                                                  double cross_task_seed_ratio) {
   TVM_META_SCHEDULE_CHECK_PROB_RANGE(init_measured_ratio, "Initial measured ratio");
   TVM_META_SCHEDULE_CHECK_PROB_RANGE(genetic_mutate_prob, "Mutation probability");
   TVM_META_SCHEDULE_CHECK_PROB_RANGE(eps_greedy, "Greedy pick probability");
+  TVM_META_SCHEDULE_CHECK_PROB_RANGE(cross_task_seed_ratio, "Cross-task seed ratio");
+  CHECK_LE(init_measured_ratio + cross_task_seed_ratio, 1.0)
+      << "ValueError: The sum of init_measured_ratio and cross_task_seed_ratio should not exceed "
+         "1, but get "
+      << init_measured_ratio << " + " << cross_task_seed_ratio;
   ObjectPtr<EvolutionarySearchNode> n = make_object<EvolutionarySearchNode>();
   n->num_trials_per_iter = num_trials_per_iter;
   n->num_trials_total = num_trials_total;
@@ -662,6 +872,8 @@ SearchStrategy SearchStrategy::EvolutionarySearch(int num_trials_per_iter,     /
   n->genetic_max_fail_count = genetic_max_fail_count;
   n->genetic_mutate_prob = genetic_mutate_prob;
   n->eps_greedy = eps_greedy;
+  n->cross_task_seed_ratio = cross_task_seed_ratio;
+  n->num_cross_task_seeds = 0;
   return SearchStrategy(n);
 }
 
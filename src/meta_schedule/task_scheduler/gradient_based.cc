@@ -0,0 +1,218 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one
+ * or more contributor license agreements.  See the NOTICE file
+ * distributed with this work for additional information
+ * regarding copyright ownership.  The ASF licenses this file
+ * to you under the Apache License, Version 2.0 (the
+ * "License"); you may not use this file except in compliance
+ * with the License.  You may obtain a copy of the License at
+ *
+ *   http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an
+ * "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+ * KIND, either express or implied.  See the License for the
+ * specific language governing permissions and limitations
+ * under the License.
+ */
+#include <limits>
+
+#include "../utils.h"
+
+namespace tvm {
+namespace meta_schedule {
+
+/*! \brief The latency of a task without any valid measurement. */
+static constexpr double kMaxLatency = 1e10;
+/*! \brief The relative latency reduction below which a round is considered no improvement. */
+static constexpr double kMinImprovement = 1e-3;
+
+/*!
+ * \brief The gradient based task scheduler. It picks the task whose next round of trials is
+ * expected to reduce the weighted latency of the whole workload the most, following the
+ * task scheduler of auto_scheduler.
+ */
+class GradientBasedNode final : public TaskSchedulerNode {
+ public:
+  /*! \brief The weights of the tasks, i.e. how many times each of them occurs. */
+  Array<FloatImm> task_weights;
+  /*! \brief The weight of the backward gradient against the forward one. */
+  double alpha;
+  /*! \brief The number of rounds the backward gradient looks back. */
+  int window_size;
+  /*! \brief The number of rounds without improvement after which a task is stopped. */
+  int early_stopping_rounds;
+
+  /*! \brief The number of rounds dispatched so far. */
+  int num_rounds_already_;
+  /*! \brief The best latency of each task after each of its rounds. */
+  std::vector<std::vector<double>> best_latency_history_;
+
+  void VisitAttrs(tvm::AttrVisitor* v) {
+    TaskSchedulerNode::VisitAttrs(v);
+    v->Visit("task_weights", &task_weights);
+    v->Visit("alpha", &alpha);
+    v->Visit("window_size", &window_size);
+    v->Visit("early_stopping_rounds", &early_stopping_rounds);
+    // `num_rounds_already_` is not visited
+    // `best_latency_history_` is not visited
+  }
+
+  static constexpr const char* _type_key = "meta_schedule.GradientBased";
+  TVM_DECLARE_FINAL_OBJECT_INFO(GradientBasedNode, TaskSchedulerNode);
+
+ public:
+  void JoinRunningTask(int task_id) final {
+    TuneContext task = tasks[task_id];
+    std::vector<double>& history = best_latency_history_[task_id];
+    double best = history.empty() ? kMaxLatency : history.back();
+    // Resolve the futures once, so that the callbacks see the same results as the scheduler
+    Array<RunnerFuture> futures;
+    for (const RunnerFuture& future : task->runner_futures.value()) {
+      RunnerResult result = future->Result();
+      if (!result->error_msg.defined() && result->run_secs.defined() &&
+          !result->run_secs.value().empty()) {
+        double sum = 0.0;
+        for (const FloatImm& run_sec : result->run_secs.value()) {
+          sum += run_sec->value;
+        }
+        best = std::min(best, sum / result->run_secs.value().size());
+      }
+      futures.push_back(RunnerFuture(/*f_done=*/[]() -> bool { return true; },
+                                     /*f_result=*/[result]() -> RunnerResult { return result; }));
+    }
+    task->runner_futures = futures;
+    TaskSchedulerNode::JoinRunningTask(task_id);
+    history.push_back(best);
+  }
+
+ protected:
+  int NextTaskId() final {
+    int n_tasks = this->tasks.size();
+    // Warm up by measuring each task once, in a round-robin fashion
+    while (num_rounds_already_ < n_tasks) {
+      int task_id = num_rounds_already_++;
+      if (!tasks[task_id]->is_stopped) {
+        return task_id;
+      }
+    }
+    // Rank the tasks by the results collected so far. The tasks whose results are all in are
+    // joined without blocking, the others keep being measured while a ready task is picked.
+    for (;;) {
+      int best_ready_task_id = -1;
+      int best_running_task_id = -1;
+      double best_ready_gradient = -1.0;
+      double best_running_gradient = -1.0;
+      for (int task_id = 0; task_id < n_tasks; ++task_id) {
+        if (tasks[task_id]->is_stopped) {
+          continue;
+        }
+        bool running = IsTaskRunning(task_id);
+        // The measure callbacks may stop the task when its results are collected
+        if (tasks[task_id]->is_stopped) {
+          continue;
+        }
+        if (!running && IsPlateaued(task_id)) {
+          LOG(INFO) << "Task #" << task_id + 1 << " has not improved for " << early_stopping_rounds
+                    << " round(s), stopping it early";
+          SetTaskStopped(task_id);
+          continue;
+        }
+        double gradient = Gradient(task_id);
+        if (running && gradient > best_running_gradient) {
+          best_running_task_id = task_id;
+          best_running_gradient = gradient;
+        } else if (!running && gradient > best_ready_gradient) {
+          best_ready_task_id = task_id;
+          best_ready_gradient = gradient;
+        }
+      }
+      if (best_ready_task_id != -1) {
+        ++num_rounds_already_;
+        return best_ready_task_id;
+      }
+      if (best_running_task_id == -1) {
+        return -1;
+      }
+      // Every remaining task is being measured, wait for the most promising one only
+      JoinRunningTask(best_running_task_id);
+    }
+  }
+
+ private:
+  /*!
+   * \brief Estimate the reduction of the weighted latency per round of trials of a task.
+   * \param task_id The task id.
+   * \return The estimated reduction.
+   */
+  double Gradient(int task_id) const {
+    const std::vector<double>& history = best_latency_history_[task_id];
+    int n = history.size();
+    if (n == 0 || history.back() >= kMaxLatency) {
+      // Tasks without any valid measurement come first
+      return std::numeric_limits<double>::infinity();
+    }
+    double best = history.back();
+    // The reduction observed during the last few rounds
+    double backward = n > window_size ? (history[n - 1 - window_size] - best) / window_size : 0.0;
+    // The optimistic reduction if the latency keeps decreasing at the average pace so far
+    double forward = best / n;
+    return task_weights[task_id]->value * (alpha * backward + (1.0 - alpha) * forward);
+  }
+
+  /*!
+   * \brief Check whether a task has not improved during the last `early_stopping_rounds` rounds.
+   * \param task_id The task id.
+   * \return Whether the task has plateaued.
+   */
+  bool IsPlateaued(int task_id) const {
+    const std::vector<double>& history = best_latency_history_[task_id];
+    int n = history.size();
+    if (early_stopping_rounds <= 0 || n <= early_stopping_rounds) {
+      return false;
+    }
+    double best = history.back();
+    double previous = history[n - 1 - early_stopping_rounds];
+    return best < kMaxLatency && previous - best <= previous * kMinImprovement;
+  }
+};
+
+TaskScheduler TaskScheduler::GradientBased(Array<TuneContext> tasks,                            //
+                                           Array<FloatImm> task_weights,                        //
+                                           Builder builder,                                     //
+                                           Runner runner,                                       //
+                                           Database database,                                   //
+                                           Optional<CostModel> cost_model,                      //
+                                           Optional<Array<MeasureCallback>> measure_callbacks,  //
+                                           double alpha,                                        //
+                                           int window_size,                                     //
+                                           int early_stopping_rounds) {
+  CHECK_EQ(tasks.size(), task_weights.size())
+      << "ValueError: The number of task weights should match the number of tasks";
+  CHECK_GT(window_size, 0) << "ValueError: Require `window_size` to be positive";
+  ObjectPtr<GradientBasedNode> n = make_object<GradientBasedNode>();
+  n->tasks = tasks;
+  n->builder = builder;
+  n->runner = runner;
+  n->database = database;
+  n->cost_model = cost_model;
+  n->measure_callbacks = measure_callbacks.value_or({});
+  n->task_weights = task_weights;
+  n->alpha = alpha;
+  n->window_size = window_size;
+  n->early_stopping_rounds = early_stopping_rounds;
+  n->num_rounds_already_ = 0;
+  n->best_latency_history_.resize(tasks.size());
+  for (const TuneContext& task : tasks) {
+    task->task_scheduler = n.get();
+  }
+  return TaskScheduler(n);
+}
+
+TVM_REGISTER_NODE_TYPE(GradientBasedNode);
+TVM_REGISTER_GLOBAL("meta_schedule.TaskSchedulerGradientBased")
+    .set_body_typed(TaskScheduler::GradientBased);
+
+}  // namespace meta_schedule
+}  // namespace tvm
@@ -45,7 +45,10 @@ class RoundRobinNode final : public TaskSchedulerNode {
         if (IsTaskRunning(task_id)) {
           JoinRunningTask(task_id);
         }
-        return task_id;
+        // The measure callbacks may stop the task when its results are collected
+        if (!task->is_stopped) {
+          return task_id;
+        }
       }
     }
     return -1;
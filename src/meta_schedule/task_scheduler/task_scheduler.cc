@@ -91,6 +91,52 @@ Array<RunnerFuture> SendToRunner(const Runner& runner, const TuneContext& contex
   return results;
 }
 
+/*! \brief The number of chunks a batch of measure candidates is split into for pipelining. */
+static constexpr int kNumPipelineChunks = 4;
+
+/*!
+ * \brief Build the measure candidates chunk by chunk, and send each built chunk to runner
+ * right away, so that building a chunk overlaps with measuring the previous ones. Runners that
+ * measure before returning from `Run`, e.g. LocalRunner by default, leave nothing to overlap
+ * with, so once a chunk comes back already measured, the rest of the batch is built at once.
+ * \param builder The builder to send the candidates to.
+ * \param runner The runner to send the candidates to.
+ * \param context The tuning context.
+ * \param candidates The measure candidates.
+ * \param builder_results The builder results, in the same order as the candidates.
+ * \return An array of the runner futures, in the same order as the candidates.
+ */
+Array<RunnerFuture> SendToBuilderAndRunner(const Builder& builder, const Runner& runner,
+                                           const TuneContext& context,
+                                           const Array<MeasureCandidate>& candidates,
+                                           Array<BuilderResult>* builder_results) {
+  int n = candidates.size();
+  int chunk_size = std::max(1, (n + kNumPipelineChunks - 1) / kNumPipelineChunks);
+  Array<RunnerFuture> futures;
+  futures.reserve(n);
+  builder_results->reserve(n);
+  for (int st = 0; st < n; st += chunk_size) {
+    int ed = std::min(st + chunk_size, n);
+    Array<MeasureCandidate> chunk(candidates.begin() + st, candidates.begin() + ed);
+    Array<BuilderResult> chunk_builder_results = SendToBuilder(builder, context, chunk);
+    Array<RunnerFuture> chunk_futures = SendToRunner(runner, context, chunk, chunk_builder_results);
+    builder_results->insert(builder_results->end(), chunk_builder_results.begin(),
+                            chunk_builder_results.end());
+    futures.insert(futures.end(), chunk_futures.begin(), chunk_futures.end());
+    bool all_done = true;
+    for (const RunnerFuture& future : chunk_futures) {
+      if (!future->Done()) {
+        all_done = false;
+        break;
+      }
+    }
+    if (all_done) {
+      chunk_size = n;
+    }
+  }
+  return futures;
+}
+
 void TaskSchedulerNode::InitializeTask(int task_id) {
   TuneContext task = this->tasks[task_id];
   LOG(INFO) << "Initializing task " << task_id << ": " << task->task_name << ", mod =\n"
@@ -122,7 +168,6 @@ void TaskSchedulerNode::Tune() {
     task->search_strategy.value()->PreTuning(design_spaces);
   }
 
-  int running_tasks = tasks.size();
   for (int task_id; (task_id = NextTaskId()) != -1;) {
     LOG(INFO) << "Scheduler picks Task #" << task_id + 1 << ": " << tasks[task_id]->task_name;
     TuneContext task = tasks[task_id];
@@ -130,18 +175,22 @@ void TaskSchedulerNode::Tune() {
     ICHECK(!task->runner_futures.defined());
     SearchStrategy strategy = task->search_strategy.value();
     if ((task->measure_candidates = strategy->GenerateMeasureCandidates()).defined()) {
-      Array<BuilderResult> builder_results =
-          SendToBuilder(this->builder, task, task->measure_candidates.value());
+      // The runner futures are joined lazily, so while this batch is being measured, the
+      // scheduler moves on to generate and build the next batch of other tasks.
+      Array<BuilderResult> builder_results;
+      task->runner_futures = SendToBuilderAndRunner(this->builder, this->runner, task,
+                                                    task->measure_candidates.value(),
+                                                    &builder_results);
       task->builder_results = builder_results;
-      task->runner_futures =
-          SendToRunner(this->runner, task, task->measure_candidates.value(), builder_results);
     } else {
       SetTaskStopped(task_id);
-      --running_tasks;
+      int running_tasks = 0;
+      for (const TuneContext& t : this->tasks) {
+        running_tasks += !t->is_stopped;
+      }
       LOG(INFO) << "Task #" << task_id + 1 << " has finished. Remaining task(s): " << running_tasks;
     }
   }
-  ICHECK_EQ(running_tasks, 0) << "Not all tasks are finished";
   int n_tasks = this->tasks.size();
   for (int task_id = 0; task_id < n_tasks; ++task_id) {
     ICHECK(!IsTaskRunning(task_id)) << "Task #" << task_id << " is still running";
@@ -89,5 +89,7 @@ TVM_REGISTER_GLOBAL("meta_schedule.TuneContext")
       return TuneContext(mod, target, space_generator, search_strategy, sch_rules, postprocs,
                          mutator_probs, task_name, rand_state, num_threads);
     });
+TVM_REGISTER_GLOBAL("meta_schedule.TuneContextInitialize")
+    .set_body_method<TuneContext>(&TuneContextNode::Initialize);
 }  // namespace meta_schedule
 }  // namespace tvm
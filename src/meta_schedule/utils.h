@@ -50,6 +50,17 @@
 #include "../tir/schedule/utils.h"
 
 namespace tvm {
+namespace tir {
+
+/*!
+ * \brief Count the floating point operations of an IRModule.
+ * \param mod The IRModule.
+ * \return The number of floating point operations.
+ */
+double CountFlop(const IRModule& mod);
+
+}  // namespace tir
+
 namespace meta_schedule {
 
 /*! \brief The type of the random state */
@@ -0,0 +1,377 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one
+ * or more contributor license agreements.  See the NOTICE file
+ * distributed with this work for additional information
+ * regarding copyright ownership.  The ASF licenses this file
+ * to you under the Apache License, Version 2.0 (the
+ * "License"); you may not use this file except in compliance
+ * with the License.  You may obtain a copy of the License at
+ *
+ *   http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an
+ * "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+ * KIND, either express or implied.  See the License for the
+ * specific language governing permissions and limitations
+ * under the License.
+ */
+
+/*!
+ * \file src/relax/backend/aot/codegen_aot.cc
+ * \brief A codegen to lower static-shape relax functions to TIR host functions ahead of time.
+ */
+
+#include <tvm/ir/module.h>
+#include <tvm/relax/attrs/memory.h>
+#include <tvm/relax/expr.h>
+#include <tvm/relax/type.h>
+#include <tvm/tir/buffer.h>
+#include <tvm/tir/builtin.h>
+#include <tvm/tir/function.h>
+#include <tvm/tir/op.h>
+#include <tvm/tir/stmt.h>
+
+#include <algorithm>
+#include <string>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+namespace tvm {
+namespace relax {
+namespace aot {
+
+/*!
+ * \brief Lower a relax function to a TIR host function which calls the PrimFuncs directly.
+ *
+ * The input function is expected to have gone through CallTIRRewrite, so that every call_tir is
+ * an explicit relax.builtin.alloc_tensor followed by a destination-passing call. The parameters
+ * of the generated function are the inputs of the relax function followed by its outputs. The
+ * intermediate tensors are planned ahead of time: a storage is reused once the last use of the
+ * tensor it holds has passed, and all storages are allocated when the host function is entered.
+ *
+ * Example:
+ * alloc = relax.builtin.alloc_tensor((m, n))
+ * _ = tir_add(x, y, alloc)
+ * -->
+ * allocate(alloc_storage, "float32", [m * n])
+ * tvm_call_packed("tir_add", x, y, alloc_storage)
+ */
+class CodeGenAOT {
+ public:
+  explicit CodeGenAOT(IRModule mod) : mod_(mod) {}
+
+  tir::PrimFunc Codegen(const String& name, const Function& func) {
+    const auto* seq = func->body.as<SeqExprNode>();
+    CHECK(seq != nullptr) << "AOT codegen expects the body of " << name << " to be a SeqExpr";
+    std::vector<VarBinding> bindings;
+    for (const BindingBlock& block : seq->blocks) {
+      for (const Binding& binding : block->bindings) {
+        const auto* var_binding = binding.as<VarBindingNode>();
+        CHECK(var_binding != nullptr)
+            << "AOT codegen does not support " << binding->GetTypeKey() << " in " << name;
+        bindings.push_back(GetRef<VarBinding>(var_binding));
+      }
+    }
+    // Step 1. Collect the tensors and the destination-passing calls
+    for (size_t i = 0; i < bindings.size(); ++i) {
+      VisitBinding(i, bindings[i]);
+    }
+    // Step 2. Bind the inputs and the outputs to the buffer parameters
+    Array<tir::Var> params;
+    Map<tir::Var, tir::Buffer> buffer_map;
+    for (const Var& param : func->params) {
+      tir::Buffer buffer =
+          tir::decl_buffer(GetStaticShape(param->shape_), GetDType(param), param->name_hint());
+      tir::Var handle(param->name_hint(), DataType::Handle());
+      params.push_back(handle);
+      buffer_map.Set(handle, buffer);
+      buffers_[param.get()] = buffer;
+    }
+    Array<Var> outputs = CollectOutputs(seq->body);
+    for (size_t i = 0; i < outputs.size(); ++i) {
+      const Var& output = outputs[i];
+      std::string out_name = outputs.size() == 1 ? "out" : "out_" + std::to_string(i);
+      tir::Buffer buffer =
+          tir::decl_buffer(alloc_shapes_.at(output.get()), alloc_dtypes_[output.get()], out_name);
+      tir::Var handle(out_name, DataType::Handle());
+      params.push_back(handle);
+      buffer_map.Set(handle, buffer);
+      buffers_[output.get()] = buffer;
+    }
+    // Step 3. Plan the storages of the intermediate tensors
+    PlanStorage(bindings.size());
+    // Step 4. Emit the calls, and allocate the storages around them
+    Array<tir::Stmt> seq_stmt;
+    for (const auto& call : calls_) {
+      Array<PrimExpr> args{tir::StringImm(call.first)};
+      for (const Var& arg : call.second) {
+        args.push_back(PackBuffer(buffers_.at(arg.get())));
+      }
+      seq_stmt.push_back(
+          tir::Evaluate(tir::Call(DataType::Int(32), tir::builtin::tvm_call_packed(), args)));
+    }
+    tir::Stmt body = seq_stmt.empty() ? tir::Evaluate(0) : tir::SeqStmt::Flatten(seq_stmt);
+    for (auto it = storages_.rbegin(); it != storages_.rend(); ++it) {
+      body = tir::Allocate(it->data, it->dtype, {IntImm(DataType::Int(64), it->num_elems)},
+                           const_true(), body);
+    }
+    tir::PrimFunc prim_func(params, body, VoidType(), buffer_map);
+    prim_func = WithAttr(std::move(prim_func), tvm::attr::kGlobalSymbol, name);
+    prim_func = WithAttr(std::move(prim_func), "tir.noalias", Bool(true));
+    prim_func = WithAttr(std::move(prim_func), "relax.aot_num_outputs",
+                         Integer(static_cast<int>(outputs.size())));
+    return prim_func;
+  }
+
+ private:
+  /*! \brief A storage shared by the intermediate tensors whose lifetimes do not overlap. */
+  struct Storage {
+    /*! \brief The data pointer of the storage. */
+    tir::Var data;
+    /*! \brief The data type of the elements. */
+    DataType dtype;
+    /*! \brief The number of elements, which is the largest among the tensors it holds. */
+    int64_t num_elems;
+  };
+
+  void VisitBinding(size_t index, const VarBinding& binding) {
+    static const Op& alloc_tensor_op = Op::Get("relax.builtin.alloc_tensor");
+    const Var& var = binding->var;
+    const Expr& value = binding->value;
+    if (const auto* call = value.as<CallNode>()) {
+      if (call->op == alloc_tensor_op) {
+        alloc_shapes_[var.get()] = GetStaticShape(call->args[0]);
+        alloc_index_[var.get()] = index;
+        // The dtype is set by CallTIRRewrite, and refined by the PrimFunc writing the tensor
+        const auto* alloc_attrs = call->attrs.as<AllocTensorAttrs>();
+        alloc_dtypes_[var.get()] = alloc_attrs ? alloc_attrs->dtype : DataType::Float(32);
+        return;
+      }
+      String callee;
+      Optional<tir::PrimFunc> prim_func = NullOpt;
+      if (const auto* gvar = call->op.as<GlobalVarNode>()) {
+        callee = gvar->name_hint;
+        BaseFunc base_func = mod_->Lookup(GetRef<GlobalVar>(gvar));
+        if (const auto* prim_func_node = base_func.as<tir::PrimFuncNode>()) {
+          prim_func = GetRef<tir::PrimFunc>(prim_func_node);
+        }
+        CHECK(prim_func.defined()) << "AOT codegen only supports calls to PrimFuncs, but "
+                                   << callee << " is a " << base_func->GetTypeKey();
+      } else if (const auto* extern_func = call->op.as<ExternFuncNode>()) {
+        callee = extern_func->global_symbol;
+      } else {
+        LOG(FATAL) << "AOT codegen does not support calls to " << call->op;
+      }
+      Array<Var> args;
+      for (size_t i = 0; i < call->args.size(); ++i) {
+        const auto* arg = call->args[i].as<VarNode>();
+        CHECK(arg != nullptr) << "AOT codegen expects the arguments of " << callee
+                              << " to be tensors, but gets:\n"
+                              << call->args[i];
+        Var tensor = Resolve(GetRef<Var>(arg));
+        if (prim_func.defined() && alloc_index_.count(tensor.get()) &&
+            i < prim_func.value()->params.size()) {
+          const tir::Var& param = prim_func.value()->params[i];
+          if (Optional<tir::Buffer> buffer = prim_func.value()->buffer_map.Get(param)) {
+            alloc_dtypes_[tensor.get()] = buffer.value()->dtype;
+          }
+        }
+        last_use_[tensor.get()] = index;
+        args.push_back(tensor);
+      }
+      calls_.emplace_back(callee, args);
+    } else if (const auto* alias = value.as<VarNode>()) {
+      alias_[var.get()] = GetRef<Var>(alias);
+    } else if (const auto* tuple = value.as<TupleNode>()) {
+      Array<Var> fields;
+      for (const Expr& field : tuple->fields) {
+        const auto* field_var = field.as<VarNode>();
+        CHECK(field_var != nullptr) << "AOT codegen expects tuples of tensors, but gets:\n"
+                                    << value;
+        fields.push_back(GetRef<Var>(field_var));
+      }
+      tuples_[var.get()] = fields;
+    } else if (const auto* get_item = value.as<TupleGetItemNode>()) {
+      const auto* tuple_var = get_item->tuple.as<VarNode>();
+      CHECK(tuple_var != nullptr) << "AOT codegen expects TupleGetItem on a var, but gets:\n"
+                                  << value;
+      Var tuple_root = Resolve(GetRef<Var>(tuple_var));
+      auto it = tuples_.find(tuple_root.get());
+      CHECK(it != tuples_.end()) << "AOT codegen cannot find the tuple " << tuple_root;
+      alias_[var.get()] = it->second[get_item->index];
+    } else {
+      LOG(FATAL) << "AOT codegen does not support binding " << var << " to "
+                 << value->GetTypeKey();
+    }
+  }
+
+  /*! \brief Follow the aliases of a var to the tensor it refers to. */
+  Var Resolve(Var var) const {
+    for (auto it = alias_.find(var.get()); it != alias_.end(); it = alias_.find(var.get())) {
+      var = it->second;
+    }
+    return var;
+  }
+
+  Array<Var> CollectOutputs(const Expr& ret) {
+    Array<Var> outputs;
+    std::vector<Expr> fields;
+    if (const auto* tuple = ret.as<TupleNode>()) {
+      fields.assign(tuple->fields.begin(), tuple->fields.end());
+    } else if (const auto* var = ret.as<VarNode>()) {
+      Var root = Resolve(GetRef<Var>(var));
+      auto it = tuples_.find(root.get());
+      if (it != tuples_.end()) {
+        fields.assign(it->second.begin(), it->second.end());
+      } else {
+        fields.push_back(root);
+      }
+    }
+    for (const Expr& field : fields) {
+      const auto* var = field.as<VarNode>();
+      CHECK(var != nullptr) << "AOT codegen expects the function to return tensors, but gets:\n"
+                            << field;
+      Var output = Resolve(GetRef<Var>(var));
+      CHECK(alloc_index_.count(output.get()))
+          << "AOT codegen expects the outputs to be computed by the function, but " << output
+          << " is returned directly";
+      for (const Var& other : outputs) {
+        CHECK(!other.same_as(output)) << "AOT codegen does not support returning " << output
+                                      << " more than once";
+      }
+      outputs.push_back(output);
+    }
+    CHECK(!outputs.empty()) << "AOT codegen does not support functions returning " << ret;
+    return outputs;
+  }
+
+  void PlanStorage(size_t num_bindings) {
+    // The tensors whose lifetime ends after each binding
+    std::vector<std::vector<const VarNode*>> expired(num_bindings);
+    std::vector<const VarNode*> allocs(num_bindings, nullptr);
+    for (const auto& kv : alloc_index_) {
+      allocs[kv.second] = kv.first;
+      auto it = last_use_.find(kv.first);
+      expired[it != last_use_.end() ? it->second : kv.second].push_back(kv.first);
+    }
+    std::unordered_map<const VarNode*, size_t> storage_of;
+    std::vector<size_t> free_list;
+    for (size_t i = 0; i < num_bindings; ++i) {
+      const VarNode* tensor = allocs[i];
+      if (tensor != nullptr && !buffers_.count(tensor)) {
+        DataType dtype = alloc_dtypes_[tensor];
+        Array<PrimExpr> shape = alloc_shapes_[tensor];
+        int64_t num_elems = 1;
+        for (const PrimExpr& dim : shape) {
+          num_elems *= Downcast<IntImm>(dim)->value;
+        }
+        // Prefer the smallest free storage that fits, otherwise grow the largest one
+        auto best = free_list.end();
+        for (auto it = free_list.begin(); it != free_list.end(); ++it) {
+          const Storage& storage = storages_[*it];
+          if (storage.dtype != dtype) continue;
+          if (best == free_list.end()) {
+            best = it;
+            continue;
+          }
+          const Storage& best_storage = storages_[*best];
+          bool fits = storage.num_elems >= num_elems;
+          bool best_fits = best_storage.num_elems >= num_elems;
+          if ((fits && (!best_fits || storage.num_elems < best_storage.num_elems)) ||
+              (!fits && !best_fits && storage.num_elems > best_storage.num_elems)) {
+            best = it;
+          }
+        }
+        size_t storage_index;
+        if (best != free_list.end()) {
+          storage_index = *best;
+          free_list.erase(best);
+          storages_[storage_index].num_elems =
+              std::max(storages_[storage_index].num_elems, num_elems);
+        } else {
+          storage_index = storages_.size();
+          std::string name = "storage_" + std::to_string(storage_index);
+          storages_.push_back(
+              Storage{tir::Var(name, PointerType(PrimType(dtype), "global")), dtype, num_elems});
+        }
+        storage_of[tensor] = storage_index;
+        buffers_[tensor] = tir::Buffer(storages_[storage_index].data, dtype, shape, {}, PrimExpr(),
+                                       tensor->name_hint(), 0, 0, tir::kDefault);
+      }
+      for (const VarNode* dead : expired[i]) {
+        auto it = storage_of.find(dead);
+        if (it != storage_of.end()) {
+          free_list.push_back(it->second);
+        }
+      }
+    }
+  }
+
+  /*! \brief Pack a buffer into a DLTensor on the stack, as tvm.tir.call_packed does. */
+  static PrimExpr PackBuffer(const tir::Buffer& buffer) {
+    PrimExpr shape =
+        tir::Call(DataType::Handle(), tir::builtin::tvm_stack_make_shape(), buffer->shape);
+    return tir::Call(DataType::Handle(), tir::builtin::tvm_stack_make_array(),
+                     {buffer->data, shape, make_zero(DataType::Int(32)),
+                      Integer(static_cast<int>(buffer->shape.size())), make_zero(buffer->dtype),
+                      buffer->elem_offset});
+  }
+
+  static Array<PrimExpr> GetStaticShape(const Optional<ObjectRef>& shape) {
+    const auto* shape_expr = shape.as<ShapeExprNode>();
+    CHECK(shape_expr != nullptr) << "AOT codegen only supports tensors of static shapes";
+    for (const PrimExpr& dim : shape_expr->values) {
+      CHECK(dim->IsInstance<IntImmNode>())
+          << "AOT codegen only supports tensors of static shapes, but gets "
+          << shape_expr->values;
+    }
+    return shape_expr->values;
+  }
+
+  static DataType GetDType(const Var& var) {
+    const auto* tensor_type = var->checked_type_.as<DynTensorTypeNode>();
+    CHECK(tensor_type != nullptr && !tensor_type->IsUnknownDtype())
+        << "AOT codegen expects " << var << " to be a tensor of known dtype";
+    return tensor_type->dtype;
+  }
+
+  /*! \brief The IRModule containing the PrimFuncs being called. */
+  IRModule mod_;
+  /*! \brief The destination-passing calls, in the order of the bindings. */
+  std::vector<std::pair<String, Array<Var>>> calls_;
+  /*! \brief The shapes of the tensors allocated by the function. */
+  std::unordered_map<const VarNode*, Array<PrimExpr>> alloc_shapes_;
+  /*! \brief The dtypes of the tensors allocated by the function. */
+  std::unordered_map<const VarNode*, DataType> alloc_dtypes_;
+  /*! \brief The index of the binding allocating each tensor. */
+  std::unordered_map<const VarNode*, size_t> alloc_index_;
+  /*! \brief The index of the binding using each tensor for the last time. */
+  std::unordered_map<const VarNode*, size_t> last_use_;
+  /*! \brief Map from a var to the var it is bound to. */
+  std::unordered_map<const VarNode*, Var> alias_;
+  /*! \brief Map from a var to the fields of the tuple it is bound to. */
+  std::unordered_map<const VarNode*, Array<Var>> tuples_;
+  /*! \brief The buffers of the inputs, the outputs and the intermediate tensors. */
+  std::unordered_map<const VarNode*, tir::Buffer> buffers_;
+  /*! \brief The storages planned for the intermediate tensors. */
+  std::vector<Storage> storages_;
+};
+
+IRModule CodeGen(IRModule mod) {
+  IRModule result;
+  for (const auto& kv : mod->functions) {
+    if (const auto* func = kv.second.as<FunctionNode>()) {
+      const String& name = kv.first->name_hint;
+      result->Add(GlobalVar(name), CodeGenAOT(mod).Codegen(name, GetRef<Function>(func)));
+    }
+  }
+  return result;
+}
+
+TVM_REGISTER_GLOBAL("relax.AOTCodeGen").set_body_typed(CodeGen);
+
+}  // namespace aot
+}  // namespace relax
+}  // namespace tvm
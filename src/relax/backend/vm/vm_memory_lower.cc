@@ -80,18 +80,22 @@ class VMMemLowerMutator : public ExprMutator {
     if (call->op == alloc_tensor_op) {
       ShapeExpr output_shape = Downcast<ShapeExpr>(call->args[0]);
 
-      // TODO(@yuchen): Get the type of input x, options: add an attr to relax.builtin.alloc_tensor
-      Type tensor_type = DynTensorType(output_shape->values.size(), DataType::Float(32));
+      // The dtype is set by CallTIRRewrite, and defaults to float32 otherwise
+      DataType dtype = DataType::Float(32);
+      if (const auto* alloc_attrs = call->attrs.as<AllocTensorAttrs>()) {
+        dtype = alloc_attrs->dtype;
+      }
+      Type tensor_type = DynTensorType(output_shape->values.size(), dtype);
       Expr storage_size = ComputeStorageSize(output_shape, tensor_type);
       auto storage_attr = make_object<AllocStorageAttrs>();
-      storage_attr->dtype = DataType::Float(32);
+      storage_attr->dtype = dtype;
       storage_attr->device_type = 1;
 
       Var storage =
           builder_->Emit(Call(vm_alloc_storage_op, {storage_size}, Attrs(storage_attr)), "storage");
       auto tensor_attr = make_object<AllocTensorAttrs>();
       tensor_attr->offset = 0;
-      tensor_attr->dtype = DataType::Float(32);
+      tensor_attr->dtype = dtype;
       Expr shape = call->args[0];
       Var tensor =
           builder_->Emit(Call(vm_alloc_tensor_op, {storage, shape}, Attrs(tensor_attr)), "tensor");
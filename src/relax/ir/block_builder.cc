@@ -29,6 +29,9 @@
 #include <tvm/relay/op.h>
 #include <tvm/tir/function.h>
 
+#include <unordered_map>
+#include <vector>
+
 namespace tvm {
 namespace relax {
 
@@ -59,6 +62,13 @@ class BlockBuilderNode::ExprNormalizer : public ExprFunctor<Expr(const Expr&)> {
       ICHECK(post.as<VarNode>()) << "memoized expressions should map to variables";
       return post.value();
     }
+    auto it = dataflow_memo_.find(expr.get());
+    if (it != dataflow_memo_.end()) {
+      return it->second;
+    }
+    if (HasNestedDataflow(expr)) {
+      return ExpandDataflow(expr);
+    }
     return ExprFunctor::VisitExpr(expr);
   }
 
@@ -254,20 +264,112 @@ class BlockBuilderNode::ExprNormalizer : public ExprFunctor<Expr(const Expr&)> {
     return post;
   }
 
-  Expr Bind(const Expr& expr) {
-    Expr post = this->VisitExpr(expr);
+  Expr Bind(const Expr& expr) { return Bind(expr, this->VisitExpr(expr)); }
+
+  Expr Bind(const Expr& pre, Expr post) {
     if (!IsLeaf(post)) {
       post = builder_->Emit(post);
-      expr_memo_.Set(expr, post);
+      expr_memo_.Set(pre, post);
     }
     return post;
   }
 
+  static bool IsDataflow(const Expr& expr) {
+    return expr.as<CallNode>() || expr.as<TupleNode>() || expr.as<TupleGetItemNode>();
+  }
+
+  /*!
+   * \brief The i-th child of a dataflow expression, in the order they are visited, or NullOpt if
+   *  the expression has no more than i children. \p bind is set if the child is bound to a var.
+   */
+  static Optional<Expr> DataflowChild(const Expr& expr, size_t i, bool* bind) {
+    *bind = true;
+    if (const auto* call = expr.as<CallNode>()) {
+      if (i == 0) {
+        *bind = false;
+        return call->op;
+      }
+      return i <= call->args.size() ? call->args[i - 1] : Optional<Expr>(NullOpt);
+    } else if (const auto* tuple = expr.as<TupleNode>()) {
+      return i < tuple->fields.size() ? tuple->fields[i] : Optional<Expr>(NullOpt);
+    } else if (const auto* get_item = expr.as<TupleGetItemNode>()) {
+      *bind = false;
+      return i == 0 ? get_item->tuple : Optional<Expr>(NullOpt);
+    }
+    return NullOpt;
+  }
+
+  bool IsMemoized(const Expr& expr) {
+    return dataflow_memo_.count(expr.get()) || expr_memo_.Get(expr).defined();
+  }
+
+  bool HasNestedDataflow(const Expr& expr) {
+    if (!IsDataflow(expr)) {
+      return false;
+    }
+    bool bind;
+    for (size_t i = 0;; ++i) {
+      Optional<Expr> child = DataflowChild(expr, i, &bind);
+      if (!child) {
+        return false;
+      }
+      if (IsDataflow(child.value()) && !IsMemoized(child.value())) {
+        return true;
+      }
+    }
+  }
+
+  /*!
+   * \brief Normalize a nested dataflow expression with an explicit stack instead of recursion.
+   *
+   * The nested nodes are normalized in the post-order of a recursive visit, and those bound to a
+   * var by their parent are emitted right away, so that the bindings come in the same order as
+   * with recursion. The parents then find their normalized children in the memo.
+   */
+  Expr ExpandDataflow(const Expr& expr) {
+    // the nodes normalized by an enclosing expansion are not visible in this one
+    std::unordered_map<const Object*, Expr> outer;
+    std::swap(outer, dataflow_memo_);
+    struct Frame {
+      Expr expr;
+      bool bind;
+      size_t next_child;
+    };
+    std::vector<Frame> stack{{expr, false, 0}};
+    Expr ret;
+    while (!stack.empty()) {
+      bool bind;
+      Optional<Expr> child = DataflowChild(stack.back().expr, stack.back().next_child++, &bind);
+      if (child) {
+        if (IsDataflow(child.value()) && !IsMemoized(child.value())) {
+          stack.push_back({child.value(), bind, 0});
+        }
+        continue;
+      }
+      Frame frame = std::move(stack.back());
+      stack.pop_back();
+      Expr post = ExprFunctor::VisitExpr(frame.expr);
+      if (stack.empty()) {
+        ret = post;
+      } else {
+        dataflow_memo_.emplace(frame.expr.get(), post);
+        if (frame.bind) {
+          Bind(frame.expr, post);
+        }
+      }
+    }
+    std::swap(outer, dataflow_memo_);
+    return ret;
+  }
+
   /*! \brief BlockBuilder used for emitting intermediate variables. */
   BlockBuilderNode* builder_;
 
   /*! \brief Memoization table for mapping expressions to their ANF variables. */
   ExprMemo expr_memo_;
+
+  /*! \brief The normalized nodes of the current dataflow expansion. */
+  std::unordered_map<const Object*, Expr> dataflow_memo_;
 };
 
 // ================
@@ -595,6 +697,9 @@ TVM_REGISTER_GLOBAL("relax.BlockBuilderEmitOutput")
       return builder->EmitOutput(output);
     });
 
+TVM_REGISTER_GLOBAL("relax.BlockBuilderLookupBinding")
+    .set_body_method<BlockBuilder>(&BlockBuilderNode::LookupBinding);
+
 TVM_REGISTER_GLOBAL("relax.BlockBuilderGetUniqueName")
     .set_body_typed([](BlockBuilder builder, String name_hint) {
       return builder->name_table()->GetUniqueName(name_hint);
@@ -30,9 +30,80 @@
 #include <tvm/relay/analysis.h>
 #include <tvm/relay/pattern_functor.h>
 
+#include <unordered_set>
+#include <utility>
+#include <vector>
+
 namespace tvm {
 namespace relax {
 
+namespace {
+
+/*! \brief Whether a node is a dataflow node, i.e. a Call, a Tuple or a TupleGetItem. */
+bool IsDataflowNode(const ExprNode* node) {
+  return node->IsInstance<CallNode>() || node->IsInstance<TupleNode>() ||
+         node->IsInstance<TupleGetItemNode>();
+}
+
+/*!
+ * \brief The i-th expression child of a dataflow node, in the order they are visited.
+ * \return The child, or nullptr if the node has no more than i children.
+ */
+const ExprNode* DataflowChild(const ExprNode* node, size_t i) {
+  if (const auto* call = node->as<CallNode>()) {
+    if (i == 0) {
+      return call->op.get();
+    }
+    return i <= call->args.size() ? call->args[i - 1].get() : nullptr;
+  } else if (const auto* tuple = node->as<TupleNode>()) {
+    return i < tuple->fields.size() ? tuple->fields[i].get() : nullptr;
+  } else if (const auto* get_item = node->as<TupleGetItemNode>()) {
+    return i == 0 ? get_item->tuple.get() : nullptr;
+  }
+  return nullptr;
+}
+
+/*!
+ * \brief Whether a dataflow node has a dataflow child for which \p fseen returns false, and
+ *  therefore needs to be expanded.
+ */
+template <typename FSeen>
+bool HasNestedDataflow(const ExprNode* node, FSeen fseen) {
+  if (!IsDataflowNode(node)) {
+    return false;
+  }
+  for (size_t i = 0; const ExprNode* child = DataflowChild(node, i); ++i) {
+    if (IsDataflowNode(child) && !fseen(child)) {
+      return true;
+    }
+  }
+  return false;
+}
+
+/*!
+ * \brief Collect the nested dataflow nodes of an expression with an explicit stack, in the
+ *  post-order of a recursive visit. Each node is collected once, and the expression comes last.
+ */
+std::vector<const ExprNode*> DataflowPostOrder(const Expr& expr) {
+  std::vector<const ExprNode*> order;
+  std::unordered_set<const ExprNode*> pushed{expr.get()};
+  // each frame holds a node and the index of its next child to be visited
+  std::vector<std::pair<const ExprNode*, size_t>> stack{{expr.get(), 0}};
+  while (!stack.empty()) {
+    const ExprNode* node = stack.back().first;
+    const ExprNode* child = DataflowChild(node, stack.back().second++);
+    if (child == nullptr) {
+      order.push_back(node);
+      stack.pop_back();
+    } else if (IsDataflowNode(child) && pushed.insert(child).second) {
+      stack.emplace_back(child, 0);
+    }
+  }
+  return order;
+}
+
+}  // namespace
+
 void ExprVisitor::VisitExpr_(const ConstantNode* op) {
   this->VisitSpan(op->span);
 
@@ -165,7 +236,30 @@ void ExprVisitor::VisitVarDef_(const VarNode* var) {
   }
 }
 
-void ExprVisitor::VisitExpr(const Expr& expr) { ExprFunctor::VisitExpr(expr); }
+void ExprVisitor::VisitExpr(const Expr& expr) {
+  if (visited_.count(expr.get())) {
+    return;
+  }
+  if (HasNestedDataflow(expr.get(), [this](const ExprNode* n) { return visited_.count(n); })) {
+    ExpandDataflow(expr);
+  } else {
+    ExprFunctor::VisitExpr(expr);
+  }
+}
+
+void ExprVisitor::ExpandDataflow(const Expr& expr) {
+  // the nodes visited by an enclosing expansion are not visible in this one
+  std::unordered_set<const Object*> outer;
+  std::swap(outer, visited_);
+  std::vector<const ExprNode*> order = DataflowPostOrder(expr);
+  visited_.reserve(order.size());
+  for (size_t i = 0; i + 1 < order.size(); ++i) {
+    this->VisitExpr(GetRef<Expr>(order[i]));
+    visited_.insert(order[i]);
+  }
+  ExprFunctor::VisitExpr(expr);
+  std::swap(outer, visited_);
+}
 
 void ExprVisitor::VisitBinding(const Binding& binding) {
   if (const auto* node = binding.as<VarBindingNode>()) {
@@ -202,6 +296,10 @@ class ExprApplyVisit : public ExprVisitor {
   explicit ExprApplyVisit(std::function<void(const Expr&)> f) : f_(f) {}
 
   void VisitExpr(const Expr& e) final {
+    // the nodes of a dataflow expansion are visited again by their parents
+    if (visited_.count(e.get())) {
+      return;
+    }
     ExprVisitor::VisitExpr(e);
     f_(e);
   }
@@ -541,9 +639,31 @@ Var ExprMutator::VisitVarDef_(const VarNode* var) {
 }
 
 Expr ExprMutator::VisitExpr(const Expr& expr) {
+  auto it = memo_.find(expr.get());
+  if (it != memo_.end()) {
+    return it->second;
+  }
+  if (HasNestedDataflow(expr.get(), [this](const ExprNode* n) { return memo_.count(n); })) {
+    return ExpandDataflow(expr);
+  }
   return builder_->Normalize(ExprFunctor::VisitExpr(expr));
 }
 
+Expr ExprMutator::ExpandDataflow(const Expr& expr) {
+  // the nodes rewritten by an enclosing expansion are not visible in this one
+  std::unordered_map<const Object*, Expr> outer;
+  std::swap(outer, memo_);
+  std::vector<const ExprNode*> order = DataflowPostOrder(expr);
+  memo_.reserve(order.size());
+  for (size_t i = 0; i + 1 < order.size(); ++i) {
+    Expr post = this->VisitExpr(GetRef<Expr>(order[i]));
+    memo_.emplace(order[i], post);
+  }
+  Expr ret = builder_->Normalize(ExprFunctor::VisitExpr(expr));
+  std::swap(outer, memo_);
+  return ret;
+}
+
 void ExprMutator::VisitBinding(const Binding& binding) {
   if (const auto* node = binding.as<VarBindingNode>()) {
     VisitBinding_(node);
@@ -24,6 +24,7 @@
 #include <tvm/relax/expr_functor.h>
 #include <tvm/relax/transform.h>
 #include <tvm/relax/type.h>
+#include <tvm/tir/function.h>
 #include <tvm/tir/op.h>
 
 #include "../../relay/transforms/pattern_utils.h"
@@ -39,9 +40,13 @@ namespace relax {
 // -->
 // gv0 = rx.call("relax.builtin.alloc_tensor", [n, m])
 // rx.call_packed(op.identity, x, gv0)
+// The dtype of each allocated tensor is taken from the corresponding buffer of the PrimFunc, and
+// defaults to float32 when the callee is not a PrimFunc of the module.
 
 class CallTIRMutator : public ExprMutator {
  public:
+  explicit CallTIRMutator(Optional<IRModule> mod = NullOpt) : mod_(mod) {}
+
   Expr VisitExpr_(const CallNode* call) override {
     // post-order mutation
     Expr expr = VisitExprPostOrder_(call);
@@ -53,20 +58,27 @@ class CallTIRMutator : public ExprMutator {
 
     if (call->op == call_tir_op) {
       Array<Expr> outs;
+      size_t num_inputs = 1;
+      if (const auto* tuple = call->args[2].as<TupleNode>()) {
+        num_inputs = tuple->fields.size();
+      }
       if (call->args[0]->IsInstance<ShapeExprNode>()) {
         // single output case
         ShapeExpr output_shape = Downcast<ShapeExpr>(call->args[0]);
-        outs.push_back(builder_->Emit(Call(alloc_tensor_op, {output_shape}), "alloc"));
+        outs.push_back(builder_->Emit(
+            Call(alloc_tensor_op, {output_shape}, AllocAttrs(call->args[1], num_inputs)), "alloc"));
       } else {
         // multiple output case
         CHECK(call->args[0]->IsInstance<TupleNode>())
             << "call_tir expects ShapeExpr or Tuple as first argument, got " << call->args[0];
         Tuple output_shapes = Downcast<Tuple>(call->args[0]);
-        for (const auto& shape : output_shapes->fields) {
+        for (size_t i = 0; i < output_shapes->fields.size(); ++i) {
+          const Expr& shape = output_shapes->fields[i];
           CHECK(shape->IsInstance<ShapeExprNode>())
               << "call_tir exoects Tuple of ShapeExprs, got " << shape << " as an element of tuple";
-          outs.push_back(
-              builder_->Emit(Call(alloc_tensor_op, {Downcast<ShapeExpr>(shape)}), "alloc"));
+          outs.push_back(builder_->Emit(Call(alloc_tensor_op, {Downcast<ShapeExpr>(shape)},
+                                             AllocAttrs(call->args[1], num_inputs + i)),
+                                        "alloc"));
         }
       }
 
@@ -96,15 +108,46 @@ class CallTIRMutator : public ExprMutator {
 
     return GetRef<Expr>(call);
   }
+
+ private:
+  /*!
+   * \brief Make the attributes of the tensor allocated for an output of call_tir.
+   * \param func The function called by call_tir.
+   * \param param_index The index of the parameter of the function the output is passed to.
+   */
+  Attrs AllocAttrs(const Expr& func, size_t param_index) const {
+    auto attrs = make_object<AllocTensorAttrs>();
+    attrs->offset = 0;
+    attrs->dtype = DataType::Float(32);
+    const auto* gvar = func.as<GlobalVarNode>();
+    if (mod_.defined() && gvar != nullptr && mod_.value()->ContainGlobalVar(gvar->name_hint)) {
+      if (const auto* prim_func = mod_.value()->Lookup(gvar->name_hint).as<tir::PrimFuncNode>()) {
+        if (param_index < prim_func->params.size()) {
+          if (Optional<tir::Buffer> buffer =
+                  prim_func->buffer_map.Get(prim_func->params[param_index])) {
+            attrs->dtype = buffer.value()->dtype;
+          }
+        }
+      }
+    }
+    return Attrs(attrs);
+  }
+
+  /*! \brief The module containing the PrimFuncs being called. */
+  Optional<IRModule> mod_;
 };
 
-Expr CallTIRRewrite(const Expr& e) { return CallTIRMutator().VisitExpr(e); }
+Expr CallTIRRewrite(const Expr& e, Optional<IRModule> mod) {
+  return CallTIRMutator(mod).VisitExpr(e);
+}
 
 namespace transform {
 
 Pass CallTIRRewrite() {
   runtime::TypedPackedFunc<Function(Function, IRModule, PassContext)> pass_func =
-      [=](Function f, IRModule m, PassContext pc) { return Downcast<Function>(CallTIRRewrite(f)); };
+      [=](Function f, IRModule m, PassContext pc) {
+        return Downcast<Function>(CallTIRRewrite(f, m));
+      };
   return CreateFunctionPass(pass_func, 0, "CallTIRRewrite", {});
 }
 
@@ -24,16 +24,30 @@
 
 #include <tvm/relax/transform.h>
 
+#include <iomanip>
+#include <sstream>
+
+#include "../../meta_schedule/utils.h"
+
 namespace tvm {
 namespace relax {
 
 class MetaScheduleAHB {
  public:
-  explicit MetaScheduleAHB(IRModule mod, const tvm::meta_schedule::Database& db, Target target)
-      : mod_(mod), db_(db), target_(target) {}
+  explicit MetaScheduleAHB(IRModule mod, const tvm::meta_schedule::Database& db, Target target,
+                           bool fallback, Optional<tvm::meta_schedule::CostModel> cost_model)
+      : mod_(mod), db_(db), target_(target), fallback_(fallback), cost_model_(cost_model) {}
   IRModule Apply() {
     ret_mod_ = IRModule();
     tvm::meta_schedule::ApplyHistoryBest ahb(db_);
+    const runtime::PackedFunc* f_fallback = nullptr;
+    if (fallback_) {
+      f_fallback = runtime::Registry::Get("tvm.meta_schedule.tune.fallback_schedule");
+      ICHECK(f_fallback) << "Fallback schedule function not defined!";
+    }
+    std::vector<String> names;
+    std::vector<String> statuses;
+    std::vector<double> flops;
     for (auto& p : mod_->functions) {
       GlobalVar gv = p.first;
       BaseFunc func = p.second;
@@ -41,31 +55,148 @@ class MetaScheduleAHB {
       if (func->IsInstance<tir::PrimFuncNode>()) {
         IRModule tir_mod(Map<GlobalVar, BaseFunc>({{gv, func}}));
         ObjectRef res = ahb->Query(gv->name_hint, mod_, target_, Array<IRModule>{tir_mod});
-        // replace the tir func only when the schedule is found in tuning database.
+        String status = "hit";
+        // schedule the tir func with a default schedule if it is not found in tuning database.
+        if (!res.defined()) {
+          status = "miss";
+          if (f_fallback != nullptr) {
+            ObjectRef fallback_res = (*f_fallback)(tir_mod, target_, cost_model_);
+            res = fallback_res;
+            if (res.defined()) {
+              status = "fallback";
+            }
+          }
+        }
+        // replace the tir func only when a schedule is found.
         if (res.defined()) {
           IRModule newmod = Downcast<IRModule>(res);
           ICHECK_EQ(newmod->functions.size(), 1);
           newfunc = (*newmod->functions.begin()).second;
         }
+        names.push_back(gv->name_hint);
+        statuses.push_back(status);
+        flops.push_back(EstimateFlop(tir_mod));
       }
 
       ret_mod_->Add(gv, newfunc);
     }
+    LOG(INFO) << "MetaScheduleApplyHistoryBest report:\n"
+              << ReportToString(MakeReport(names, statuses, flops));
     return ret_mod_;
   }
 
+  /*!
+   * \brief Estimate the floating point operations of a PrimFunc.
+   * \param tir_mod The IRModule containing the PrimFunc.
+   * \return The number of floating point operations, or 0 if it cannot be estimated statically,
+   * e.g. with dynamic shapes.
+   */
+  static double EstimateFlop(const IRModule& tir_mod) {
+    try {
+      return tir::CountFlop(tir_mod);
+    } catch (const std::runtime_error& e) {  // includes tvm::Error and dmlc::Error
+      return 0.0;
+    }
+  }
+
+  /*!
+   * \brief Make the report of how the PrimFuncs are scheduled.
+   * \param names The names of the PrimFuncs.
+   * \param statuses Whether each PrimFunc hit the database, fell back to a default schedule, or
+   * missed the database.
+   * \param flops The estimated floating point operations of each PrimFunc.
+   * \return One entry per PrimFunc, with its name, status, estimated FLOPs, and the share of the
+   * FLOPs over all the PrimFuncs.
+   */
+  static Array<Map<String, ObjectRef>> MakeReport(const std::vector<String>& names,
+                                                  const std::vector<String>& statuses,
+                                                  const std::vector<double>& flops) {
+    double total_flop = 0.0;
+    for (double flop : flops) {
+      total_flop += flop;
+    }
+    Array<Map<String, ObjectRef>> report;
+    for (size_t i = 0; i < names.size(); ++i) {
+      double cost_share = total_flop > 0.0 ? flops[i] / total_flop : 0.0;
+      report.push_back(Map<String, ObjectRef>{
+          {"name", names[i]},
+          {"status", statuses[i]},
+          {"flop", FloatImm(DataType::Float(64), flops[i])},
+          {"cost_share", FloatImm(DataType::Float(64), cost_share)},
+      });
+    }
+    return report;
+  }
+
+  /*!
+   * \brief Render the report as a table.
+   * \param report The report.
+   * \return The table.
+   */
+  static std::string ReportToString(const Array<Map<String, ObjectRef>>& report) {
+    std::ostringstream os;
+    os << std::setw(40) << std::left << "Name" << std::setw(10) << "Status" << std::setw(16)
+       << "FLOP" << "Cost Share";
+    for (const Map<String, ObjectRef>& entry : report) {
+      os << "\n"
+         << std::setw(40) << std::left << Downcast<String>(entry["name"]) << std::setw(10)
+         << Downcast<String>(entry["status"]) << std::setw(16) << std::setprecision(6)
+         << Downcast<FloatImm>(entry["flop"])->value << std::fixed << std::setprecision(2)
+         << Downcast<FloatImm>(entry["cost_share"])->value * 100.0 << "%" << std::defaultfloat;
+    }
+    return os.str();
+  }
+
  private:
   IRModule mod_;
   const tvm::meta_schedule::Database& db_;
   Target target_;
+  bool fallback_;
+  Optional<tvm::meta_schedule::CostModel> cost_model_;
   IRModule ret_mod_;
 };
 
+/*!
+ * \brief Report which PrimFuncs of an IRModule have a schedule in the tuning database.
+ * \param mod The IRModule.
+ * \param database The tuning database.
+ * \return One entry per PrimFunc, with its name, status ("hit" or "miss"), estimated FLOPs, and
+ * the share of the FLOPs over all the PrimFuncs.
+ */
+Array<Map<String, ObjectRef>> MetaScheduleReport(IRModule mod,
+                                                 const tvm::meta_schedule::Database& database) {
+  const auto* parse_mod_func = runtime::Registry::Get("tvm.meta_schedule.tune.parse_mod");
+  ICHECK(parse_mod_func) << "Parse mod function not defined!";
+  std::vector<String> names;
+  std::vector<String> statuses;
+  std::vector<double> flops;
+  for (auto& p : mod->functions) {
+    GlobalVar gv = p.first;
+    if (!p.second->IsInstance<tir::PrimFuncNode>()) {
+      continue;
+    }
+    IRModule tir_mod(Map<GlobalVar, BaseFunc>({{gv, p.second}}));
+    IRModule prim_mod = (*parse_mod_func)(tir_mod);
+    bool hit = database->HasWorkload(prim_mod) &&
+               !database->GetTopK(database->CommitWorkload(prim_mod), 1).empty();
+    names.push_back(gv->name_hint);
+    statuses.push_back(hit ? "hit" : "miss");
+    flops.push_back(MetaScheduleAHB::EstimateFlop(tir_mod));
+  }
+  return MetaScheduleAHB::MakeReport(names, statuses, flops);
+}
+
+TVM_REGISTER_GLOBAL("relax.analysis.meta_schedule_report").set_body_typed(MetaScheduleReport);
+
 namespace transform {
 
-Pass MetaScheduleApplyHistoryBest(const tvm::meta_schedule::Database& database, Target target) {
+Pass MetaScheduleApplyHistoryBest(const tvm::meta_schedule::Database& database, Target target,
+                                  bool fallback,
+                                  Optional<tvm::meta_schedule::CostModel> cost_model) {
   runtime::TypedPackedFunc<IRModule(IRModule, PassContext)> pass_func =
-      [=](IRModule m, PassContext pc) { return MetaScheduleAHB(m, database, target).Apply(); };
+      [=](IRModule m, PassContext pc) {
+        return MetaScheduleAHB(m, database, target, fallback, cost_model).Apply();
+      };
   return CreateModulePass(/*pass function*/ pass_func, /*opt level*/ 0,
                           /*pass name*/ "MetaScheduleApplyHistoryBest",
                           /*required*/ {});
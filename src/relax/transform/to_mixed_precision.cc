@@ -0,0 +1,571 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one
+ * or more contributor license agreements.  See the NOTICE file
+ * distributed with this work for additional information
+ * regarding copyright ownership.  The ASF licenses this file
+ * to you under the Apache License, Version 2.0 (the
+ * "License"); you may not use this file except in compliance
+ * with the License.  You may obtain a copy of the License at
+ *
+ *   http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an
+ * "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+ * KIND, either express or implied.  See the License for the
+ * specific language governing permissions and limitations
+ * under the License.
+ */
+/*!
+ * \file src/relax/transform/to_mixed_precision.cc
+ * \brief Convert the float32 tensors passed between PrimFuncs to float16 or bfloat16.
+ */
+#include <tvm/node/structural_equal.h>
+#include <tvm/relax/expr_functor.h>
+#include <tvm/relax/transform.h>
+#include <tvm/relax/type.h>
+#include <tvm/tir/function.h>
+#include <tvm/tir/op.h>
+#include <tvm/tir/stmt_functor.h>
+
+#include <algorithm>
+#include <map>
+#include <string>
+#include <unordered_map>
+#include <unordered_set>
+#include <utility>
+#include <vector>
+
+namespace tvm {
+namespace relax {
+
+// ==================
+// PrimFuncConverter
+// Convert the float32 buffer parameters of a PrimFunc to a lower precision. The computation stays
+// in float32: the loads are cast to float32 and the stores are cast back. The outputs which are
+// also read by the PrimFunc, e.g. to accumulate a reduction, keep their float32 buffer internally
+// and are cast to the lower precision at the end.
+// Example:
+// C = T.match_buffer(c, (m, n), "float32")
+// C[i, j] = C[i, j] + A[i, k] * B[j, k]
+// -->
+// C = T.match_buffer(c, (m, n), "float16")
+// C_fp32 = T.alloc_buffer((m, n), "float32")
+// C_fp32[i, j] = C_fp32[i, j] + T.cast(A[i, k], "float32") * T.cast(B[j, k], "float32")
+// C[i, j] = T.cast(C_fp32[i, j], "float16")
+
+/*!
+ * \brief Make the loop nest which casts a buffer to another of the same shape.
+ * \param src The buffer to read.
+ * \param dst The buffer to write.
+ * \param name The name of the block.
+ */
+tir::Stmt MakeCastNest(const tir::Buffer& src, const tir::Buffer& dst, const String& name) {
+  Array<tir::Var> loop_vars;
+  Array<PrimExpr> iter_values;
+  Array<tir::IterVar> iter_vars;
+  Array<PrimExpr> indices;
+  Array<Range> region;
+  for (size_t i = 0; i < src->shape.size(); ++i) {
+    const PrimExpr& extent = src->shape[i];
+    tir::Var loop_var("ax" + std::to_string(i), extent.dtype());
+    tir::Var block_var("v_ax" + std::to_string(i), extent.dtype());
+    loop_vars.push_back(loop_var);
+    iter_values.push_back(loop_var);
+    iter_vars.push_back(tir::IterVar(Range::FromMinExtent(make_zero(extent.dtype()), extent),
+                                     block_var, tir::kDataPar));
+    indices.push_back(block_var);
+    region.push_back(Range::FromMinExtent(block_var, make_const(extent.dtype(), 1)));
+  }
+  tir::Stmt body =
+      tir::BufferStore(dst, tir::Cast(dst->dtype, tir::BufferLoad(src, indices)), indices);
+  tir::Block block(iter_vars, {tir::BufferRegion(src, region)}, {tir::BufferRegion(dst, region)},
+                   name, body);
+  tir::Stmt stmt = tir::BlockRealize(iter_values, const_true(), block);
+  for (int i = static_cast<int>(loop_vars.size()) - 1; i >= 0; --i) {
+    stmt = tir::For(loop_vars[i], make_zero(loop_vars[i].dtype()), src->shape[i],
+                    tir::ForKind::kSerial, stmt);
+  }
+  return stmt;
+}
+
+class PrimFuncConverter : public tir::StmtExprMutator {
+ public:
+  /*!
+   * \brief Convert the float32 buffer parameters of a PrimFunc.
+   * \param func The PrimFunc in destination-passing style.
+   * \param num_inputs The number of inputs, the other parameters being the outputs.
+   * \param dtype The lower precision dtype.
+   * \param converted Whether each parameter is converted.
+   * \return The converted PrimFunc, or NullOpt if it cannot be converted.
+   */
+  static Optional<tir::PrimFunc> Convert(const tir::PrimFunc& func, size_t num_inputs,
+                                         DataType dtype, std::vector<bool>* converted) {
+    // Step 1. Collect the buffers which are read
+    std::unordered_set<const tir::BufferNode*> loaded;
+    tir::PostOrderVisit(func->body, [&loaded](const ObjectRef& obj) {
+      if (const auto* load = obj.as<tir::BufferLoadNode>()) {
+        loaded.insert(load->buffer.get());
+      }
+    });
+    // Step 2. Make the lower precision buffers
+    PrimFuncConverter converter(dtype);
+    Map<tir::Var, tir::Buffer> buffer_map;
+    Array<tir::Buffer> accum_buffers;
+    std::vector<std::pair<tir::Buffer, tir::Buffer>> cast_outs;
+    converted->assign(func->params.size(), false);
+    for (size_t i = 0; i < func->params.size(); ++i) {
+      const tir::Var& param = func->params[i];
+      Optional<tir::Buffer> buffer = func->buffer_map.Get(param);
+      if (!buffer.defined()) {
+        continue;
+      }
+      if (buffer.value()->dtype != DataType::Float(32)) {
+        buffer_map.Set(param, buffer.value());
+        continue;
+      }
+      tir::Buffer half_buffer = buffer.value();
+      tir::BufferNode* n = half_buffer.CopyOnWrite();
+      n->data = tir::Var(n->data->name_hint, PointerType(PrimType(dtype), ""));
+      n->dtype = dtype;
+      buffer_map.Set(param, half_buffer);
+      (*converted)[i] = true;
+      if (i >= num_inputs && loaded.count(buffer.value().get())) {
+        // The output is accumulated in its float32 buffer, which becomes internal
+        accum_buffers.push_back(buffer.value());
+        cast_outs.emplace_back(buffer.value(), half_buffer);
+      } else {
+        converter.buffer_remap_[buffer.value().get()] = half_buffer;
+        converter.data_vars_.insert(buffer.value()->data.get());
+      }
+    }
+    if (std::find(converted->begin(), converted->end(), true) == converted->end()) {
+      return NullOpt;
+    }
+    // Step 3. Rewrite the accesses to the converted buffers
+    tir::Stmt body = converter(func->body);
+    if (converter.failed_) {
+      return NullOpt;
+    }
+    // Step 4. Cast the accumulated outputs at the end
+    if (!accum_buffers.empty()) {
+      const auto* realize = body.as<tir::BlockRealizeNode>();
+      if (realize == nullptr || !realize->block->iter_vars.empty()) {
+        return NullOpt;
+      }
+      Array<tir::Stmt> seq{realize->block->body};
+      for (const auto& kv : cast_outs) {
+        seq.push_back(MakeCastNest(kv.first, kv.second, "T_cast_" + kv.first->name));
+      }
+      tir::Block root = realize->block;
+      tir::BlockNode* n = root.CopyOnWrite();
+      n->body = tir::SeqStmt(seq);
+      for (const tir::Buffer& buffer : accum_buffers) {
+        n->alloc_buffers.push_back(buffer);
+      }
+      body = tir::BlockRealize(realize->iter_values, realize->predicate, root);
+    }
+    tir::PrimFunc result = func;
+    tir::PrimFuncNode* n = result.CopyOnWrite();
+    n->body = body;
+    n->buffer_map = buffer_map;
+    return result;
+  }
+
+ private:
+  explicit PrimFuncConverter(DataType dtype) : dtype_(dtype) {}
+
+  PrimExpr VisitExpr_(const tir::BufferLoadNode* op) final {
+    tir::BufferLoad load = Downcast<tir::BufferLoad>(tir::StmtExprMutator::VisitExpr_(op));
+    auto it = buffer_remap_.find(load->buffer.get());
+    if (it == buffer_remap_.end()) {
+      return std::move(load);
+    }
+    return tir::Cast(DataType::Float(32, load->dtype.lanes()),
+                     tir::BufferLoad(it->second, load->indices, load->span));
+  }
+
+  tir::Stmt VisitStmt_(const tir::BufferStoreNode* op) final {
+    tir::BufferStore store = Downcast<tir::BufferStore>(tir::StmtExprMutator::VisitStmt_(op));
+    auto it = buffer_remap_.find(store->buffer.get());
+    if (it == buffer_remap_.end()) {
+      return std::move(store);
+    }
+    PrimExpr value = tir::Cast(dtype_.with_lanes(store->value.dtype().lanes()), store->value);
+    return tir::BufferStore(it->second, value, store->indices, store->span);
+  }
+
+  tir::Stmt VisitStmt_(const tir::BlockNode* op) final {
+    tir::Block block = Downcast<tir::Block>(tir::StmtExprMutator::VisitStmt_(op));
+    for (const tir::MatchBufferRegion& match_buffer : block->match_buffers) {
+      if (buffer_remap_.count(match_buffer->source->buffer.get())) {
+        failed_ = true;
+      }
+    }
+    auto f_remap = [this](const Array<tir::BufferRegion>& regions) {
+      Array<tir::BufferRegion> new_regions;
+      for (const tir::BufferRegion& region : regions) {
+        auto it = buffer_remap_.find(region->buffer.get());
+        new_regions.push_back(
+            it == buffer_remap_.end() ? region : tir::BufferRegion(it->second, region->region));
+      }
+      return new_regions;
+    };
+    tir::BlockNode* n = block.CopyOnWrite();
+    n->reads = f_remap(n->reads);
+    n->writes = f_remap(n->writes);
+    return std::move(block);
+  }
+
+  PrimExpr VisitExpr_(const tir::VarNode* op) final {
+    // The data pointer of a converted buffer is accessed directly, e.g. by an extern call
+    if (data_vars_.count(op)) {
+      failed_ = true;
+    }
+    return GetRef<PrimExpr>(op);
+  }
+
+  /*! \brief The lower precision dtype. */
+  DataType dtype_;
+  /*! \brief Map from the float32 buffers to the buffers of lower precision. */
+  std::unordered_map<const tir::BufferNode*, tir::Buffer> buffer_remap_;
+  /*! \brief The data pointers of the float32 buffers being remapped. */
+  std::unordered_set<const tir::VarNode*> data_vars_;
+  /*! \brief Whether the PrimFunc cannot be converted. */
+  bool failed_{false};
+};
+
+// ==================
+// MixedPrecisionMutator
+// Rewrite the call_tir whose PrimFunc can be converted to the lower precision, and cast the
+// tensors at the boundaries with the calls which stay in float32. The inputs and the outputs of
+// the relax functions stay in float32.
+// Example:
+// lv0 = relax.call_tir((m, n), dense, (x, w))
+// lv1 = relax.call_tir((m, n), softmax, (lv0,))
+// -->
+// lv2 = relax.call_tir((m, k), cast, (x,))
+// lv3 = relax.call_tir((k, n), cast, (w,))
+// lv0 = relax.call_tir((m, n), dense_fp16, (lv2, lv3))
+// lv4 = relax.call_tir((m, n), cast1, (lv0,))
+// lv1 = relax.call_tir((m, n), softmax, (lv4,))
+
+class MixedPrecisionMutator : public ExprMutator {
+ public:
+  MixedPrecisionMutator(IRModule mod, DataType dtype, const Array<String>& exclude)
+      : mod_(mod), dtype_(dtype) {
+    for (const String& name : exclude) {
+      exclude_.insert(name);
+    }
+  }
+
+  IRModule Run() {
+    std::vector<std::pair<GlobalVar, Function>> funcs;
+    for (const auto& kv : mod_->functions) {
+      if (const auto* func = kv.second.as<FunctionNode>()) {
+        funcs.emplace_back(kv.first, GetRef<Function>(func));
+      }
+    }
+    std::unordered_set<const GlobalVarNode*> used;
+    for (auto& kv : funcs) {
+      kv.second = Downcast<Function>(this->VisitExpr(kv.second));
+      PostOrderVisit(kv.second, [&used](const Expr& expr) {
+        if (const auto* gvar = expr.as<GlobalVarNode>()) {
+          used.insert(gvar);
+        }
+      });
+    }
+    for (const auto& kv : funcs) {
+      mod_->Update(kv.first, kv.second);
+    }
+    // Remove the float32 PrimFuncs which are no longer called
+    for (const auto& kv : converted_) {
+      if (kv.second.defined() && !used.count(kv.first.first)) {
+        mod_->Remove(GetRef<GlobalVar>(kv.first.first));
+      }
+    }
+    return mod_;
+  }
+
+ private:
+  /*! \brief A PrimFunc converted to the lower precision. */
+  struct ConvertedFunc {
+    /*! \brief The global var of the converted PrimFunc, undefined if it cannot be converted. */
+    GlobalVar gvar;
+    /*! \brief Whether each parameter is converted. */
+    std::vector<bool> converted_params;
+    /*! \brief The dtype of the output before conversion. */
+    DataType out_dtype;
+    bool defined() const { return gvar.defined(); }
+  };
+
+  BindingBlock VisitBindingBlock(const BindingBlock& block) final {
+    // The casts emitted in another block may not be visible
+    cast_cache_.clear();
+    return ExprMutator::VisitBindingBlock(block);
+  }
+
+  Expr VisitExpr_(const SeqExprNode* op) final {
+    Array<BindingBlock> blocks;
+    for (const BindingBlock& block : op->blocks) {
+      BindingBlock new_block = this->VisitBindingBlock(block);
+      if (!new_block->bindings.empty()) {
+        blocks.push_back(new_block);
+      }
+    }
+    builder_->BeginBindingBlock();
+    cast_cache_.clear();
+    // The results of the sequence stay in float32
+    Expr body = CastToFloat(this->VisitExpr(op->body));
+    BindingBlock prologue = builder_->EndBlock();
+    if (!prologue->bindings.empty()) {
+      blocks.push_back(prologue);
+    }
+    cast_cache_.clear();
+    return SeqExpr(blocks, body);
+  }
+
+  void VisitBinding_(const VarBindingNode* binding) final {
+    Expr new_value = this->VisitExpr(binding->value);
+    Var new_var = this->VisitVarDef(binding->var);
+    Var temp = WithShapeAndType(new_var, new_value->shape_, new_value->checked_type_);
+    if (!temp.same_as(new_var)) {
+      new_var = temp;
+      this->var_remap_[binding->var->vid] = new_var;
+    }
+    if (IsHalf(new_value)) {
+      half_vars_.insert(new_var.get());
+    }
+    if (builder_->CurrentBlockIsDataFlow() && !new_var.as<DataflowVarNode>()) {
+      builder_->EmitOutput(VarBinding(new_var, new_value));
+    } else {
+      builder_->Emit(VarBinding(new_var, new_value));
+    }
+  }
+
+  Expr VisitExpr_(const CallNode* op) final {
+    static const Op& call_tir_op = Op::Get("relax.call_tir");
+    Call call = Downcast<Call>(ExprMutator::VisitExpr_(op));
+    if (call->op == call_tir_op && call->args.size() == 3 &&
+        call->args[0]->IsInstance<ShapeExprNode>() && call->args[1]->IsInstance<GlobalVarNode>() &&
+        call->args[2]->IsInstance<TupleNode>()) {
+      Tuple args = Downcast<Tuple>(call->args[2]);
+      ConvertedFunc converted = GetConvertedFunc(Downcast<GlobalVar>(call->args[1]), args);
+      if (converted.defined()) {
+        Array<Expr> new_args;
+        for (size_t i = 0; i < args->fields.size(); ++i) {
+          new_args.push_back(converted.converted_params[i] ? CastToHalf(args->fields[i])
+                                                           : CastToFloat(args->fields[i]));
+        }
+        ShapeExpr shape = Downcast<ShapeExpr>(call->args[0]);
+        bool half_output = converted.converted_params[args->fields.size()];
+        return CallTIR(shape, converted.gvar, new_args, half_output ? dtype_ : converted.out_dtype);
+      }
+    }
+    // The other calls take float32
+    Array<Expr> new_args;
+    bool changed = false;
+    for (const Expr& arg : call->args) {
+      new_args.push_back(CastToFloat(arg));
+      changed |= !new_args.back().same_as(arg);
+    }
+    if (!changed) {
+      return std::move(call);
+    }
+    Call new_call(call->op, new_args, call->attrs, call->type_args, call->span);
+    new_call->shape_ = call->shape_;
+    new_call->checked_type_ = call->checked_type_;
+    return std::move(new_call);
+  }
+
+  Expr VisitExpr_(const IfNode* op) final {
+    // The casts emitted in the branches are not visible after the If
+    cast_cache_.clear();
+    Expr ret = ExprMutator::VisitExpr_(op);
+    cast_cache_.clear();
+    return ret;
+  }
+
+  /*! \brief Whether an expression is a tensor of lower precision, or computes one. */
+  bool IsHalf(const Expr& expr) const {
+    static const Op& call_tir_op = Op::Get("relax.call_tir");
+    if (const auto* var = expr.as<VarNode>()) {
+      return half_vars_.count(var);
+    }
+    if (const auto* call = expr.as<CallNode>()) {
+      const auto* gvar = call->args.size() < 2 ? nullptr : call->args[1].as<GlobalVarNode>();
+      return call->op == call_tir_op && gvar != nullptr && half_funcs_.count(gvar);
+    }
+    return false;
+  }
+
+  Call CallTIR(const ShapeExpr& shape, const GlobalVar& gvar, const Array<Expr>& args,
+               DataType dtype) const {
+    static const Op& call_tir_op = Op::Get("relax.call_tir");
+    Call call(call_tir_op, {shape, gvar, Tuple(args)}, {}, {});
+    call->shape_ = shape;
+    call->checked_type_ = DynTensorType(shape->values.size(), dtype);
+    return call;
+  }
+
+  /*! \brief Cast a float32 tensor to the lower precision. */
+  Expr CastToHalf(const Expr& expr) {
+    if (IsHalf(expr)) {
+      return expr;
+    }
+    Var var = EmitCast(expr, dtype_);
+    half_vars_.insert(var.get());
+    return var;
+  }
+
+  /*! \brief Cast the tensors of lower precision in an expression back to float32. */
+  Expr CastToFloat(const Expr& expr) {
+    if (const auto* tuple = expr.as<TupleNode>()) {
+      Array<Expr> fields;
+      bool changed = false;
+      for (const Expr& field : tuple->fields) {
+        fields.push_back(CastToFloat(field));
+        changed |= !fields.back().same_as(field);
+      }
+      if (!changed) {
+        return expr;
+      }
+      return builder_->Normalize(Tuple(fields, tuple->span));
+    }
+    if (!IsHalf(expr)) {
+      return expr;
+    }
+    return EmitCast(expr, DataType::Float(32));
+  }
+
+  /*! \brief Emit the call_tir which casts a tensor, reusing the casts of the same block. */
+  Var EmitCast(const Expr& expr, DataType dtype) {
+    auto key = std::make_pair(expr.get(), dtype.code() << 8 | dtype.bits());
+    auto it = cast_cache_.find(key);
+    if (it != cast_cache_.end()) {
+      return it->second;
+    }
+    ShapeExpr shape = Downcast<ShapeExpr>(expr->shape_.value());
+    DataType src_dtype = dtype == DataType::Float(32) ? dtype_ : DataType::Float(32);
+    tir::Buffer src = tir::decl_buffer(shape->values, src_dtype, "A");
+    tir::Buffer dst = tir::decl_buffer(shape->values, dtype, "B");
+    tir::Var src_handle("a", DataType::Handle());
+    tir::Var dst_handle("b", DataType::Handle());
+    tir::Block root(Array<tir::IterVar>(), Array<tir::BufferRegion>(), Array<tir::BufferRegion>(),
+                    "root", MakeCastNest(src, dst, "T_cast"));
+    Array<tir::Var> params{src_handle, dst_handle};
+    Map<tir::Var, tir::Buffer> buffer_map{{src_handle, src}, {dst_handle, dst}};
+    tir::PrimFunc func(params, tir::BlockRealize(Array<PrimExpr>(), const_true(), root),
+                       VoidType(), buffer_map);
+    // Reuse the cast of the same shape and dtypes
+    GlobalVar gvar;
+    for (const auto& kv : cast_funcs_) {
+      if (StructuralEqual()(kv.first, func)) {
+        gvar = kv.second;
+        break;
+      }
+    }
+    if (!gvar.defined()) {
+      gvar = AddPrimFunc(func, "cast");
+      cast_funcs_.emplace_back(func, gvar);
+      if (dtype != DataType::Float(32)) {
+        half_funcs_.insert(gvar.get());
+      }
+    }
+    Var var = builder_->Emit(CallTIR(shape, gvar, {expr}, dtype), "cast");
+    cast_cache_[key] = var;
+    return var;
+  }
+
+  ConvertedFunc GetConvertedFunc(const GlobalVar& gvar, const Tuple& args) {
+    auto key = std::make_pair(gvar.get(), args->fields.size());
+    auto it = converted_.find(key);
+    if (it != converted_.end()) {
+      return it->second;
+    }
+    ConvertedFunc& converted = converted_[key];
+    const auto* prim_func = mod_->Lookup(gvar).as<tir::PrimFuncNode>();
+    if (prim_func == nullptr || exclude_.count(StripNumericSuffix(gvar->name_hint))) {
+      return converted;
+    }
+    if (prim_func->params.size() != args->fields.size() + 1) {
+      return converted;
+    }
+    // The inputs are cast with call_tir, which needs their shapes
+    for (const Expr& arg : args->fields) {
+      if (!arg->shape_.defined() || !arg->shape_.value()->IsInstance<ShapeExprNode>()) {
+        return converted;
+      }
+    }
+    std::vector<bool> converted_params;
+    Optional<tir::PrimFunc> new_func = PrimFuncConverter::Convert(
+        GetRef<tir::PrimFunc>(prim_func), args->fields.size(), dtype_, &converted_params);
+    if (new_func.defined()) {
+      std::string suffix = dtype_.is_bfloat16() ? "_bf16" : "_fp16";
+      converted.gvar = AddPrimFunc(new_func.value(), gvar->name_hint + suffix);
+      converted.out_dtype = prim_func->buffer_map[prim_func->params.back()]->dtype;
+      if (converted_params.back()) {
+        half_funcs_.insert(converted.gvar.get());
+      }
+      converted.converted_params = std::move(converted_params);
+    }
+    return converted;
+  }
+
+  /*! \brief Add a PrimFunc to the module with a unique name. */
+  GlobalVar AddPrimFunc(tir::PrimFunc func, const std::string& name_hint) {
+    std::string name = name_hint;
+    for (int i = 1; mod_->ContainGlobalVar(name); ++i) {
+      name = name_hint + std::to_string(i);
+    }
+    func = WithAttr(std::move(func), tvm::attr::kGlobalSymbol, String(name));
+    GlobalVar gvar(name);
+    mod_->Add(gvar, func);
+    return gvar;
+  }
+
+  static std::string StripNumericSuffix(const std::string& name) {
+    size_t end = name.find_last_not_of("0123456789");
+    return end == std::string::npos ? name : name.substr(0, end + 1);
+  }
+
+  /*! \brief The module, to which the converted PrimFuncs and the casts are added. */
+  IRModule mod_;
+  /*! \brief The lower precision dtype. */
+  DataType dtype_;
+  /*! \brief The names of the PrimFuncs which stay in float32, without numeric suffix. */
+  std::unordered_set<std::string> exclude_;
+  /*! \brief The converted PrimFuncs, by the original PrimFunc and the number of inputs. */
+  std::map<std::pair<const GlobalVarNode*, size_t>, ConvertedFunc> converted_;
+  /*! \brief The PrimFuncs casting tensors, to be reused for the same shape and dtypes. */
+  std::vector<std::pair<tir::PrimFunc, GlobalVar>> cast_funcs_;
+  /*! \brief The PrimFuncs whose output is of lower precision. */
+  std::unordered_set<const GlobalVarNode*> half_funcs_;
+  /*! \brief The vars bound to tensors of lower precision. */
+  std::unordered_set<const VarNode*> half_vars_;
+  /*! \brief The casts emitted in the current block, by the tensor and the target dtype. */
+  std::map<std::pair<const Object*, int>, Var> cast_cache_;
+};
+
+namespace transform {
+
+Pass ToMixedPrecision(DataType dtype, Optional<Array<String>> exclude) {
+  // The numerically sensitive PrimFuncs which stay in float32 by default
+  static const Array<String> default_exclude = {
+      "softmax", "log_softmax", "fast_softmax", "exp", "fast_exp", "log", "erf", "fast_erf"};
+  CHECK(dtype.is_float16() || dtype.is_bfloat16())
+      << "ToMixedPrecision expects float16 or bfloat16, but gets " << dtype;
+  runtime::TypedPackedFunc<IRModule(IRModule, PassContext)> pass_func =
+      [=](IRModule m, PassContext pc) {
+        Array<String> excluded = exclude.defined() ? exclude.value() : default_exclude;
+        return MixedPrecisionMutator(m->ShallowCopy(), dtype, excluded).Run();
+      };
+  return CreateModulePass(pass_func, 0, "ToMixedPrecision", {});
+}
+
+TVM_REGISTER_GLOBAL("relax.transform.ToMixedPrecision").set_body_typed(ToMixedPrecision);
+
+}  // namespace transform
+
+}  // namespace relax
+}  // namespace tvm
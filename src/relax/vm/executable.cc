@@ -27,7 +27,9 @@
 #include <tvm/runtime/logging.h>
 
 #include <functional>
+#include <mutex>
 #include <sstream>
+#include <utility>
 
 #include "../../runtime/file_utils.h"
 
@@ -212,6 +214,10 @@ void ExecutableNode::SaveToFile(const std::string& path) {
 Executable ExecutableNode::LoadFromBinary(void* stream) {
   std::string code;
   static_cast<dmlc::Stream*>(stream)->Read(&code);
+  return LoadFromBytes(std::move(code));
+}
+
+Executable ExecutableNode::LoadFromBytes(std::string code) {
   dmlc::MemoryStringStream strm(&code);
 
   auto exec = make_object<ExecutableNode>();
@@ -540,6 +546,71 @@ TVM_REGISTER_GLOBAL("relax.ExecutableSaveToFile")
 
 TVM_REGISTER_GLOBAL("relax.ExecutableLoadFromFile").set_body_typed(ExecutableNode::LoadFromFile);
 
+/*!
+ * \brief A runtime module holding an executable and importing the library it runs, so that both
+ * are exported into a single shared library by export_library.
+ *
+ * The executable loaded back from a shared library stays serialized until it is first requested,
+ * which is when a VirtualMachine is created from the module.
+ */
+class ExecutableModuleNode : public ModuleNode {
+ public:
+  explicit ExecutableModuleNode(Executable exec) : exec_(exec) {}
+
+  explicit ExecutableModuleNode(std::string code) : code_(std::move(code)) {}
+
+  PackedFunc GetFunction(const std::string& name, const ObjectPtr<Object>& sptr_to_self) final {
+    if (name == "get_executable") {
+      return PackedFunc([sptr_to_self, this](TVMArgs args, TVMRetValue* rv) {
+        *rv = this->GetExecutable();
+      });
+    }
+    return PackedFunc(nullptr);
+  }
+
+  const char* type_key() const final { return "relax.ExecutableModule"; }
+
+  void SaveToBinary(dmlc::Stream* stream) final {
+    std::lock_guard<std::mutex> lock(mutex_);
+    if (exec_.defined()) {
+      exec_->SaveToBinary(stream);
+    } else {
+      stream->Write(code_);
+    }
+  }
+
+  /*! \brief Get the executable, deserializing it on the first call. */
+  Executable GetExecutable() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    if (!exec_.defined()) {
+      exec_ = ExecutableNode::LoadFromBytes(std::move(code_));
+      code_ = std::string();
+    }
+    return exec_;
+  }
+
+ private:
+  /*! \brief The executable, undefined until the serialized content is deserialized. */
+  Executable exec_;
+  /*! \brief The serialized content of the executable. */
+  std::string code_;
+  /*! \brief The mutex guarding the lazy deserialization. */
+  std::mutex mutex_;
+};
+
+TVM_REGISTER_GLOBAL("relax.ExecutableModule").set_body_typed([](Executable exec, Module lib) {
+  auto n = make_object<ExecutableModuleNode>(exec);
+  n->Import(lib);
+  return Module(n);
+});
+
+TVM_REGISTER_GLOBAL("runtime.module.loadbinary_relax.ExecutableModule")
+    .set_body_typed([](void* strm) {
+      std::string code;
+      static_cast<dmlc::Stream*>(strm)->Read(&code);
+      return Module(make_object<ExecutableModuleNode>(std::move(code)));
+    });
+
 }  // namespace relax_vm
 }  // namespace runtime
 }  // namespace tvm
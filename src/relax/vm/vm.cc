@@ -24,6 +24,9 @@
 
 #include <tvm/relax/vm/vm.h>
 
+#include <tuple>
+#include <unordered_set>
+
 namespace tvm {
 namespace runtime {
 namespace relax_vm {
@@ -43,6 +46,10 @@ PackedFunc VirtualMachine::GetFunction(const std::string& name,
   if (m.find(name) != m.end()) {
     Index gf_idx = m.at(name);
     return PackedFunc([sptr_to_self, this, gf_idx](TVMArgs args, TVMRetValue* rv) {
+      if (this->record_replay_) {
+        *rv = this->InvokeRecordReplay(gf_idx, args);
+        return;
+      }
       std::vector<RegType> inputs(args.size());
       for (int i = 0; i < args.size(); ++i) {
         inputs[i] = args[i];
@@ -60,6 +67,137 @@ void VirtualMachine::Load(Executable exec, runtime::Module mod) {
   this->state.mod_ = mod;
 }
 
+void VirtualMachine::SetRecordReplay(bool enabled) {
+  record_replay_ = enabled;
+  recordings_.clear();
+}
+
+/*!
+ * \brief Get the signature of the inputs, made of the device, the dtype and the shape of each
+ * tensor.
+ * \return Whether the inputs are all tensors, which is required by the record-and-replay mode.
+ */
+static bool GetInputSignature(TVMArgs args, std::vector<int64_t>* signature) {
+  for (int i = 0; i < args.size(); ++i) {
+    if (args.type_codes[i] != kTVMNDArrayHandle) {
+      return false;
+    }
+    NDArray arr = args[i];
+    const DLTensor* tensor = arr.operator->();
+    signature->push_back(tensor->device.device_type);
+    signature->push_back(tensor->device.device_id);
+    signature->push_back(tensor->dtype.code);
+    signature->push_back(tensor->dtype.bits);
+    signature->push_back(tensor->dtype.lanes);
+    signature->push_back(tensor->ndim);
+    signature->insert(signature->end(), tensor->shape, tensor->shape + tensor->ndim);
+  }
+  return true;
+}
+
+RegType VirtualMachine::InvokeRecordReplay(Index gf_idx, TVMArgs args) {
+  std::vector<RegType> inputs(args.size());
+  for (int i = 0; i < args.size(); ++i) {
+    inputs[i] = args[i];
+  }
+  std::vector<int64_t> signature;
+  if (!GetInputSignature(args, &signature)) {
+    return Invoke(gf_idx, inputs);
+  }
+  auto it = recordings_.find(gf_idx);
+  if (it != recordings_.end() && it->second.signature == signature) {
+    if (it->second.replayable) {
+      return Replay(&it->second, args);
+    }
+    return Invoke(gf_idx, inputs);
+  }
+  // Record the function with the new signature, replacing the previous recording
+  Recording& recording = recordings_[gf_idx];
+  recording = Recording();
+  recording.signature = std::move(signature);
+  recording.reg_sources.resize(exec_->global_funcs[gf_idx].register_file_size,
+                               {RecordedCall::kConstant, -1});
+  for (int i = 0; i < args.size(); ++i) {
+    recording.reg_sources[i] = {RecordedCall::kInput, i};
+  }
+  recording_ = &recording;
+  RegType ret;
+  try {
+    ret = Invoke(gf_idx, inputs);
+  } catch (...) {
+    recording_ = nullptr;
+    recordings_.erase(gf_idx);
+    throw;
+  }
+  recording_ = nullptr;
+  recording.reg_sources.clear();
+  return ret;
+}
+
+void VirtualMachine::RecordCall(const Instruction& instr, const std::string& func_name,
+                                const PackedFunc& func, const std::vector<TVMValue>& values,
+                                const std::vector<int>& tcodes, const RegType& ret) {
+  // The builtins which only depend on the shapes of the inputs
+  static const std::unordered_set<std::string> elided_funcs = {
+      "vm.builtin.shape_of",    "vm.builtin.alloc_shape_heap", "vm.builtin.store_shape",
+      "vm.builtin.load_shape",  "vm.builtin.alloc_storage",    "vm.builtin.alloc_tensor",
+      "vm.binary_broadcast_shape_infer"};
+  Recording* recording = recording_;
+  RecordedCall call;
+  call.func = func;
+  call.elided = elided_funcs.count(func_name);
+  call.values = values;
+  call.tcodes = tcodes;
+  for (Index i = 0; i < instr.num_args; ++i) {
+    Instruction::Arg arg = instr.args[i];
+    if (arg.kind() == Instruction::kRegister && arg.value() != Instruction::kVMStateRegister) {
+      const auto& source = recording->reg_sources[arg.value()];
+      if (source.second < 0) {
+        recording->replayable = false;
+      }
+      call.arg_sources.push_back(source.first);
+      call.arg_indices.push_back(source.second);
+    } else {
+      call.arg_sources.push_back(RecordedCall::kConstant);
+      call.arg_indices.push_back(-1);
+    }
+  }
+  if (instr.dst != Instruction::kVoidArg) {
+    recording->reg_sources[instr.dst] = {RecordedCall::kCallResult,
+                                         static_cast<Index>(recording->calls.size())};
+  }
+  recording->calls.push_back(std::move(call));
+  recording->results.push_back(ret);
+}
+
+RegType VirtualMachine::Replay(Recording* recording, TVMArgs args) {
+  for (size_t k = 0; k < recording->calls.size(); ++k) {
+    RecordedCall& call = recording->calls[k];
+    if (call.elided) {
+      continue;
+    }
+    runtime::TVMArgsSetter setter(call.values.data(), call.tcodes.data());
+    for (size_t i = 0; i < call.arg_sources.size(); ++i) {
+      Index index = call.arg_indices[i];
+      if (call.arg_sources[i] == RecordedCall::kInput) {
+        call.values[i] = args.values[index];
+        call.tcodes[i] = args.type_codes[index];
+      } else if (call.arg_sources[i] == RecordedCall::kCallResult) {
+        setter(i, recording->results[index]);
+      }
+    }
+    TVMRetValue ret;
+    call.func.CallPacked(TVMArgs(call.values.data(), call.tcodes.data(), call.values.size()), &ret);
+    recording->results[k] = ret;
+  }
+  if (recording->ret_source == RecordedCall::kInput) {
+    return args[recording->ret_index];
+  } else if (recording->ret_source == RecordedCall::kCallResult) {
+    return recording->results[recording->ret_index];
+  }
+  return recording->ret_value;
+}
+
 RegType VirtualMachine::Invoke(Index gf_idx, const std::vector<RegType>& args) {
   const VMFunction& gfunc = exec_->global_funcs[gf_idx];
   PushFrame(this->pc_ + 1, gfunc);
@@ -135,6 +273,9 @@ void VirtualMachine::RunLoop() {
         TVMArgs args(values.data(), tcodes.data(), values.size());
         TVMRetValue ret;
         func.CallPacked(args, &ret);
+        if (recording_ != nullptr) {
+          RecordCall(instr, func_name, func, values, tcodes, ret);
+        }
         if (instr.dst != Instruction::kVoidArg) {
           WriteRegister(instr.dst, ret);
         }
@@ -146,6 +287,14 @@ void VirtualMachine::RunLoop() {
         // running, we should return to the caller breaking
         // the dispatch loop.
         return_value_ = ReadRegister(instr.result);
+        if (recording_ != nullptr && frames_.size() == start_frame) {
+          std::tie(recording_->ret_source, recording_->ret_index) =
+              recording_->reg_sources[instr.result];
+          recording_->ret_value = return_value_;
+          if (recording_->ret_index < 0) {
+            recording_->replayable = false;
+          }
+        }
         auto caller_return_register = frames_.back().caller_return_register;
         PopFrame();
         if (frames_.size() < start_frame) {
@@ -161,6 +310,10 @@ void VirtualMachine::RunLoop() {
         break;
       }
       case Opcode::If: {
+        if (recording_ != nullptr) {
+          // The branch taken depends on the values of the inputs
+          recording_->replayable = false;
+        }
         int64_t cond_val = ReadRegister(instr.cond);
         if (cond_val != 0) {
           pc_++;
@@ -217,6 +370,7 @@ TVM_REGISTER_GLOBAL("relax.VirtualMachine")
 TVM_REGISTER_GLOBAL("relax.VirtualMachineInit").set_body([](TVMArgs args, TVMRetValue* rv) {
   ICHECK_EQ(args.size() % 3, 1);
   runtime::Module mod = args[0];
+  ICHECK_EQ(std::string(mod->type_key()), "relax.VirtualMachine");
   auto vm = static_cast<VirtualMachine*>(mod.operator->());
   std::vector<Device> devices;
   std::vector<AllocatorType> alloc_types;
@@ -232,6 +386,25 @@ TVM_REGISTER_GLOBAL("relax.VirtualMachineInit").set_body([](TVMArgs args, TVMRet
   vm->Init(devices, alloc_types);
 });
 
+TVM_REGISTER_GLOBAL("relax.VirtualMachineFromModule").set_body_typed([](runtime::Module exec_mod) {
+  PackedFunc get_executable = exec_mod.GetFunction("get_executable");
+  CHECK(get_executable != nullptr)
+      << "Expects a module exported from a relax executable, but gets " << exec_mod->type_key();
+  Executable exec = get_executable();
+  Optional<runtime::Module> lib = NullOpt;
+  if (!exec_mod->imports().empty()) {
+    lib = exec_mod->imports()[0];
+  }
+  return CreateVirtualMachine(exec, lib);
+});
+
+TVM_REGISTER_GLOBAL("relax.VirtualMachineSetRecordReplay")
+    .set_body_typed([](runtime::Module mod, bool enabled) {
+      ICHECK_EQ(std::string(mod->type_key()), "relax.VirtualMachine");
+      auto vm = static_cast<VirtualMachine*>(mod.operator->());
+      vm->SetRecordReplay(enabled);
+    });
+
 }  // namespace relax_vm
 }  // namespace runtime
 }  // namespace tvm
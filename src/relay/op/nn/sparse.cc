@@ -22,6 +22,7 @@
  * \brief Property def of nn.sparse_dense operator.
  */
 
+#include <tvm/ir/transform.h>
 #include <tvm/relay/attrs/nn.h>
 #include <tvm/relay/op.h>
 #include <tvm/tir/data_layout.h>
@@ -104,6 +105,9 @@ Expr MakeSparseDense(Expr data, Expr weight_data, Expr weight_indices, Expr weig
 
 TVM_REGISTER_GLOBAL("relay.op.nn._make.sparse_dense").set_body_typed(MakeSparseDense);
 
+// Whether the CSR sparse_dense is partitioned by nnz instead of by rows, see the x86 strategy
+TVM_REGISTER_PASS_CONFIG_OPTION("relay.sparse_dense.csr_balanced", Bool);
+
 RELAY_REGISTER_OP("nn.sparse_dense")
     .describe(
         R"code(Applies a sparse linear transformation: :math:`Y = XW^T` with either X or W sparse.
@@ -153,6 +157,64 @@ which will be converted to this op when running on the GPU.
     .set_support_level(1)
     .add_type_rel("SparseDense", SparseDenseRel);
 
+// relay.nn.sparse_dense_nm
+TVM_REGISTER_NODE_TYPE(SparseDenseNMAttrs);
+
+bool SparseDenseNMRel(const Array<Type>& types, int num_inputs, const Attrs& attrs,
+                      const TypeReporter& reporter) {
+  ICHECK_EQ(types.size(), 4) << "expecting 3 inputs and 1 output.";
+  const auto* param = attrs.as<SparseDenseNMAttrs>();
+  ICHECK(param != nullptr);
+  ICHECK(param->n > 0 && param->n <= param->m) << "N:M sparsity requires 0 < n <= m.";
+  ICHECK(param->m <= 16) << "N:M sparsity supports group sizes up to 16.";
+
+  const auto* data = types[0].as<TensorTypeNode>();
+  const auto* weight_values = types[1].as<TensorTypeNode>();
+  const auto* weight_meta = types[2].as<TensorTypeNode>();
+  if (data == nullptr || weight_values == nullptr || weight_meta == nullptr) return false;
+  ICHECK(data->shape.size() == 2) << "data of nn.sparse_dense_nm should be 2D.";
+  ICHECK(weight_values->shape.size() == 2) << "weight values of nn.sparse_dense_nm should be 2D.";
+  ICHECK(weight_meta->shape.size() == 2) << "weight metadata of nn.sparse_dense_nm should be 2D.";
+  ICHECK(weight_meta->dtype == DataType::UInt(8))
+      << "weight metadata of nn.sparse_dense_nm should be uint8.";
+  // every group of m values along K keeps exactly n of them
+  reporter->AssertEQ(indexdiv(data->shape[1], param->m) * param->n, weight_values->shape[0]);
+
+  Array<IndexExpr> oshape({data->shape[0], weight_values->shape[1]});
+  reporter->Assign(types[3], TensorType(oshape, data->dtype));
+  return true;
+}
+
+Expr MakeSparseDenseNM(Expr data, Expr weight_values, Expr weight_meta, int n, int m) {
+  static const Op& op = Op::Get("nn.sparse_dense_nm");
+  auto attrs = make_object<SparseDenseNMAttrs>();
+  attrs->n = n;
+  attrs->m = m;
+  return Call(op, {data, weight_values, weight_meta}, Attrs(attrs), {});
+}
+
+TVM_REGISTER_GLOBAL("relay.op.nn._make.sparse_dense_nm").set_body_typed(MakeSparseDenseNM);
+
+RELAY_REGISTER_OP("nn.sparse_dense_nm")
+    .describe(R"code(Applies a linear transformation with an N:M structured sparse weight: :math:`Y = XW^T`.
+
+In every group of `m` consecutive values along the reduction axis, at most `n` are nonzero.
+The weight is stored as the kept values and their packed in-group positions.
+
+- **data**: `(x1, x2)`
+- **weight_values**: `(x2 / m * n, units)`
+- **weight_meta**: `(ceil(x2 / m * n * bits / 8), units)` with dtype uint8
+- **out**: `(x1, units)`.
+
+)code" TVM_ADD_FILELINE)
+    .set_attrs_type<SparseDenseNMAttrs>()
+    .set_num_inputs(3)
+    .add_argument("data", "2D Tensor", "Input data.")
+    .add_argument("weight_values", "2D Tensor", "Kept weight values.")
+    .add_argument("weight_meta", "2D Tensor", "Packed in-group positions of the kept values.")
+    .set_support_level(1)
+    .add_type_rel("SparseDenseNM", SparseDenseNMRel);
+
 // relay.nn.sparse_transpose
 TVM_REGISTER_NODE_TYPE(SparseTransposeAttrs);
 
@@ -302,5 +364,104 @@ RELAY_REGISTER_OP("nn.sparse_conv2d")
     .set_support_level(1)
     .add_type_rel("SparseConv2d", SparseConv2dRel);
 
+// relay.nn.sddmm
+TVM_REGISTER_NODE_TYPE(SDDMMAttrs);
+
+bool SDDMMRel(const Array<Type>& types, int num_inputs, const Attrs& attrs,
+              const TypeReporter& reporter) {
+  ICHECK_EQ(types.size(), 5) << "expecting 4 inputs and 1 output.";
+  const auto* param = attrs.as<SDDMMAttrs>();
+  ICHECK(param != nullptr);
+  ICHECK_EQ(param->block_size.size(), 2) << "block_size should be (bs_r, bs_c).";
+
+  const auto* data_a = types[0].as<TensorTypeNode>();
+  const auto* data_b = types[1].as<TensorTypeNode>();
+  const auto* mask_indices = types[2].as<TensorTypeNode>();
+  const auto* mask_indptr = types[3].as<TensorTypeNode>();
+  if (data_a == nullptr || data_b == nullptr || mask_indices == nullptr ||
+      mask_indptr == nullptr) {
+    return false;
+  }
+  ICHECK(reporter->Assert(data_a->dtype == data_b->dtype))
+      << "the two dense operands of sddmm should have the same datatype.";
+  ICHECK(data_a->shape.size() == 2 && data_b->shape.size() == 2)
+      << "the dense operands of sddmm should be 2D.";
+  ICHECK(mask_indices->shape.size() == 1) << "mask indices tensor should be 1D.";
+  ICHECK(mask_indptr->shape.size() == 1) << "mask indptr tensor should be 1D.";
+  ICHECK(mask_indices->dtype.is_int() || mask_indices->dtype.is_uint())
+      << "mask indices of sddmm must be a tensor of integers.";
+  ICHECK(mask_indptr->dtype.is_int() || mask_indptr->dtype.is_uint())
+      << "mask indptr of sddmm must be a tensor of integers.";
+  reporter->AssertEQ(data_a->shape[1], data_b->shape[1]);
+
+  Array<IndexExpr> oshape({mask_indices->shape[0], param->block_size[0], param->block_size[1]});
+  reporter->Assign(types[4], TensorType(oshape, data_a->dtype));
+  return true;
+}
+
+Expr MakeSDDMM(Expr data_a, Expr data_b, Expr mask_indices, Expr mask_indptr,
+               Array<IndexExpr> block_size) {
+  static const Op& op = Op::Get("nn.sddmm");
+  auto attrs = make_object<SDDMMAttrs>();
+  attrs->block_size = std::move(block_size);
+  return Call(op, {data_a, data_b, mask_indices, mask_indptr}, Attrs(attrs), {});
+}
+
+TVM_REGISTER_GLOBAL("relay.op.nn._make.sddmm").set_body_typed(MakeSDDMM);
+
+RELAY_REGISTER_OP("nn.sddmm")
+    .describe(R"code(Sampled dense-dense matrix multiplication :math:`Y = (A * B^T) \odot M`,
+only computed at the nonzero blocks of the BSR (or CSR) mask M.
+
+- **data_a**: `(M, K)`
+- **data_b**: `(N, K)`
+- **mask**: `(M, N)` in BSR format, given by its indices and indptr
+- **out**: `(num_blocks, bs_r, bs_c)`, the data of a BSR matrix sharing the structure of mask.
+
+)code" TVM_ADD_FILELINE)
+    .set_attrs_type<SDDMMAttrs>()
+    .set_num_inputs(4)
+    .add_argument("data_a", "2D Tensor", "Left dense matrix.")
+    .add_argument("data_b", "2D Tensor", "Right dense matrix, transposed.")
+    .add_argument("mask_indices", "1D Tensor", "Mask indices vector.")
+    .add_argument("mask_indptr", "1D Tensor", "Mask index pointer vector.")
+    .set_support_level(1)
+    .add_type_rel("SDDMM", SDDMMRel);
+
+// relay.nn.sparse_softmax
+bool SparseSoftmaxRel(const Array<Type>& types, int num_inputs, const Attrs& attrs,
+                      const TypeReporter& reporter) {
+  ICHECK_EQ(types.size(), 4) << "expecting 3 inputs and 1 output.";
+  const auto* sparse_data = types[0].as<TensorTypeNode>();
+  if (sparse_data == nullptr) return false;
+  ICHECK(sparse_data->shape.size() == 1 || sparse_data->shape.size() == 3)
+      << "sparse data tensor should be 1D (CSR) or 3D (BSR).";
+  reporter->Assign(types[3], TensorType(sparse_data->shape, sparse_data->dtype));
+  return true;
+}
+
+Expr MakeSparseSoftmax(Expr sparse_data, Expr sparse_indices, Expr sparse_indptr) {
+  static const Op& op = Op::Get("nn.sparse_softmax");
+  return Call(op, {sparse_data, sparse_indices, sparse_indptr}, Attrs(), {});
+}
+
+TVM_REGISTER_GLOBAL("relay.op.nn._make.sparse_softmax").set_body_typed(MakeSparseSoftmax);
+
+RELAY_REGISTER_OP("nn.sparse_softmax")
+    .describe(R"code(Softmax over the stored entries of every row of a CSR/BSR matrix.
+
+Entries which are not stored are treated as masked out (-inf).
+
+- **sparse**: `(M, N)` in CSR or BSR format
+- **out**: the data of a matrix with the same sparsity structure.
+
+)code" TVM_ADD_FILELINE)
+    .set_num_inputs(3)
+    .add_argument("sparse_data", "1D or 3D Tensor", "Sparse data.")
+    .add_argument("sparse_indices", "1D Tensor", "Sparse indices vector.")
+    .add_argument("sparse_indptr", "1D Tensor", "Sparse index pointer vector.")
+    .set_support_level(1)
+    .add_type_rel("SparseSoftmax", SparseSoftmaxRel);
+
 }  // namespace relay
 }  // namespace tvm
@@ -126,6 +126,64 @@ Expr DenseToSparse(const Expr& e, const Array<ObjectRef>& weight_name,
   return PostOrderRewrite(e, &rewriter);
 }
 
+// Mutate ```nn.dense``` to ```nn.sparse_dense_nm```
+class DenseToSparseDenseNMMutator : public ExprRewriter {
+ public:
+  DenseToSparseDenseNMMutator(const Array<ObjectRef>& weight_name,
+                              const Array<Array<PrimExpr> >& weight_shape, int n, int m)
+      : dense_op_(Op::Get("nn.dense")), sparse_dense_nm_op_(Op::Get("nn.sparse_dense_nm")), n_(n),
+        m_(m) {
+    ICHECK_EQ(weight_name.size(), weight_shape.size());
+    for (size_t i = 0; i < weight_name.size(); ++i) {
+      ICHECK(weight_name[i]->IsInstance<runtime::StringObj>());
+      std::string k = weight_name[i].as<runtime::StringObj>()->data;
+      const auto& ws = weight_shape[i];
+      std::vector<int> v(ws.size());
+      for (size_t j = 0; j < ws.size(); ++j) {
+        v[j] = ws[j].as<IntImmNode>()->value;
+      }
+      target_weights_.emplace(k, v);
+    }
+  }
+
+  Expr Rewrite_(const CallNode* pre, const Expr& post) override {
+    if (pre->op == dense_op_) {
+      const auto weight = pre->args[1].as<VarNode>();
+      if (weight && target_weights_.count(weight->name_hint())) {
+        const auto& prefix = weight->name_hint();
+        const auto& ws = target_weights_.at(prefix);
+        const auto data = post.as<CallNode>()->args[0];
+        DataType dtype = DataType::Float(32);
+        if (const auto* weight_type = weight->type_annotation.as<TensorTypeNode>()) {
+          dtype = weight_type->dtype;
+        }
+        Var weight_values(prefix + ".nm_values", relay::TensorType({ws.at(0), ws.at(1)}, dtype));
+        Var weight_meta(prefix + ".nm_meta",
+                        relay::TensorType({ws.at(2), ws.at(1)}, DataType::UInt(8)));
+        auto attrs = make_object<SparseDenseNMAttrs>();
+        attrs->n = n_;
+        attrs->m = m_;
+        return Call(sparse_dense_nm_op_, {data, weight_values, weight_meta}, Attrs(attrs));
+      }
+    }
+    return post;
+  }
+
+ private:
+  // Cached op
+  const Op& dense_op_;
+  const Op& sparse_dense_nm_op_;
+  int n_;
+  int m_;
+  std::unordered_map<std::string, std::vector<int> > target_weights_;
+};  // class DenseToSparseDenseNMMutator
+
+Expr DenseToSparseNM(const Expr& e, const Array<ObjectRef>& weight_name,
+                     const Array<Array<PrimExpr> >& weight_shape, int n, int m) {
+  auto rewriter = DenseToSparseDenseNMMutator(weight_name, weight_shape, n, m);
+  return PostOrderRewrite(e, &rewriter);
+}
+
 namespace transform {
 
 Pass DenseToSparse(const Array<ObjectRef>& weight_name,
@@ -147,6 +205,24 @@ Pass DenseToSparse(const Array<ObjectRef>& weight_name,
 
 TVM_REGISTER_GLOBAL("relay._transform.DenseToSparse").set_body_typed(DenseToSparse);
 
+Pass DenseToSparseNM(const Array<ObjectRef>& weight_name,
+                     const Array<Array<PrimExpr> >& weight_shape, int n, int m) {
+  runtime::TypedPackedFunc<Function(Function, IRModule, PassContext)> pass_func =
+      [=](Function f, IRModule mod, PassContext pc) {
+        auto f0 = Downcast<Function>(DenseToSparseNM(f, weight_name, weight_shape, n, m));
+        Array<Var> sparse_params = FreeVars(f0);
+        auto f1 = WithFields(f0, sparse_params);
+        Array<Var> params = FreeVars(f1);
+        for (const auto& var : sparse_params) {
+          params.push_back(var);
+        }
+        return WithFields(f1, params);
+      };
+  return CreateFunctionPass(pass_func, 4, "DenseToSparseNM", {"DeadCodeElimination"});
+}
+
+TVM_REGISTER_GLOBAL("relay._transform.DenseToSparseNM").set_body_typed(DenseToSparseNM);
+
 }  // namespace transform
 
 }  // namespace relay
@@ -325,8 +325,15 @@ std::vector<int64_t> SamplePerfectTile(
   const int64_t* extent = GetLoopIntExtent(loop);
   std::vector<int64_t> result;
   if (extent == nullptr) {
-    // Case 1. Handle loops with non-constant length
-    result = std::vector<int64_t>(n_splits, 1);
+    // Case 1. Handle loops with non-constant length. A previous decision, e.g. tuned on a
+    // specialized shape, keeps its inner tiles, and the outermost one is inferred. The tail is
+    // guarded by the predicate of split when the length is not divisible.
+    if (decision->defined()) {
+      result = support::AsVector<Integer, int64_t>(decision->value());
+      ICHECK_EQ(result.size(), static_cast<size_t>(n_splits));
+    } else {
+      result = std::vector<int64_t>(n_splits, 1);
+    }
     result[0] = -1;
   } else if (decision->defined()) {
     // Case 2. Use previous decision
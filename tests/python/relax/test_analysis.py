@@ -67,5 +67,24 @@ def test_post_order_visit():
     assert names == ["relax.add", "relax.multiply"]
 
 
+def test_post_order_visit_deep_nesting():
+    x = rx.Var("x", [4], rx.DynTensorType(rank=1, dtype="float32"))
+    expr = x
+    for _ in range(10000):
+        expr = rx.op.add(expr, x)
+
+    calls = []
+
+    def fvisit(e):
+        if isinstance(e, rx.Call):
+            calls.append(e)
+
+    rx.analysis.post_order_visit(expr, fvisit)
+    # every call is visited once, the innermost one first
+    assert len(calls) == 10000
+    assert calls[0].args[0].same_as(x)
+    assert calls[-1].same_as(expr)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
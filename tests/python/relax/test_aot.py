@@ -0,0 +1,101 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations  # must import to defer parsing of annotations
+import pytest
+import numpy as np
+import tvm
+from tvm import relax, tir, te, topi
+
+
+def _build_chain(shape, num_layers):
+    bb = relax.BlockBuilder()
+    x = relax.Var("x", shape, relax.DynTensorType(len(shape), "float32"))
+    y = relax.Var("y", shape, relax.DynTensorType(len(shape), "float32"))
+    with bb.function("chain", [x, y]):
+        gv = x
+        for _ in range(num_layers):
+            gv = bb.emit_te(topi.add, gv, y)
+            gv = bb.emit_te(topi.nn.relu, gv)
+        bb.emit_func_output(gv)
+    return bb.get()
+
+
+def _num_allocates(func):
+    allocates = []
+    tir.stmt_functor.post_order_visit(
+        func.body, lambda stmt: allocates.append(stmt) if isinstance(stmt, tir.Allocate) else None
+    )
+    return len(allocates)
+
+
+def test_aot_matches_vm():
+    mod = _build_chain([4, 8], num_layers=3)
+    target = tvm.target.Target("llvm", host="llvm")
+    x = tvm.nd.array(np.random.rand(4, 8).astype(np.float32) - 0.5)
+    y = tvm.nd.array(np.random.rand(4, 8).astype(np.float32) - 0.5)
+
+    ex, lib = relax.vm.build(mod, target)
+    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    expected = vm["chain"](x, y)
+
+    aot_mod = relax.aot.build(mod, target)
+    res = aot_mod["chain"](x, y)
+    np.testing.assert_allclose(res.numpy(), expected.numpy())
+
+
+def test_aot_storage_reuse():
+    mod = _build_chain([4, 8], num_layers=4)
+    lowered = relax.transform.CallTIRRewrite()(relax.transform.ToNonDataflow()(mod))
+    host_mod = relax._ffi_api.AOTCodeGen(lowered)
+    func = host_mod["chain"]
+    # 8 tensors are computed, the last one is written to the output parameter directly, and the
+    # other 7 take turns in 2 storages
+    assert len(func.params) == 3
+    assert func.attrs["relax.aot_num_outputs"].value == 1
+    assert _num_allocates(func) == 2
+
+
+def test_aot_multiple_outputs():
+    bb = relax.BlockBuilder()
+    x = relax.Var("x", [16], relax.DynTensorType(1, "float32"))
+
+    def te_func(A):
+        B = te.compute((16,), lambda i: A[i] + 1.0)
+        C = te.compute((16,), lambda i: A[i] * 2.0)
+        return [B, C]
+
+    with bb.function("rx_func", [x]):
+        gv = bb.emit_te(te_func, x)
+        bb.emit_func_output(gv)
+    mod = bb.get()
+
+    aot_mod = relax.aot.build(mod, "llvm")
+    inp = tvm.nd.array(np.random.rand(16).astype(np.float32))
+    add_res, mul_res = aot_mod["rx_func"](inp)
+    np.testing.assert_allclose(add_res.numpy(), inp.numpy() + 1.0)
+    np.testing.assert_allclose(mul_res.numpy(), inp.numpy() * 2.0)
+
+
+def test_aot_symbolic_shape_unsupported():
+    n = tir.Var("n", "int64")
+    mod = _build_chain([n, 8], num_layers=1)
+    with pytest.raises(tvm.TVMError):
+        relax.aot.build(mod, "llvm")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -22,10 +22,11 @@ import numpy as np
 from tvm.tir import Schedule
 from tvm.ir.module import IRModule
 from tvm.target.target import Target
+import os
 import tempfile
 from typing import List
-from tvm.meta_schedule import ReplayTraceConfig, tune_tir
-from tvm.meta_schedule.database import PyDatabase, Workload, TuningRecord
+from tvm.meta_schedule import ReplayTraceConfig, tune_relax, tune_tir
+from tvm.meta_schedule.database import JSONDatabase, PyDatabase, Workload, TuningRecord
 from tvm.meta_schedule.integration import extract_task_from_relax
 from tvm import transform
 import time
@@ -209,5 +210,82 @@ def test_class_irmodule(dev: str):
     print(f"w/  tuning: {e1}")
 
 
+@tvm.script.ir_module
+class MatmulModule:
+    @T.prim_func
+    def tir_matmul(x: T.handle, y: T.handle, z: T.handle) -> None:
+        T.func_attr({"global_symbol": "tir_matmul"})
+        A = T.match_buffer(x, (32, 32))
+        B = T.match_buffer(y, (32, 32))
+        C = T.match_buffer(z, (32, 32))
+        for (i0, j0, k0) in T.grid(32, 32, 32):
+            with T.block():
+                i, j, k = T.axis.remap("SSR", [i0, j0, k0])
+                with T.init():
+                    C[i, j] = 0.0
+                C[i, j] += A[i, k] * B[j, k]
+
+    @R.function
+    def main(x: Tensor[(32, 32), "float32"], w: Tensor[(32, 32), "float32"]) -> Tensor:
+        with R.dataflow():
+            lv0 = R.call_tir((32, 32), tir_matmul, (x, w))
+            relax.output(lv0)
+        return lv0
+
+
+def test_tune_relax_resume():
+    target = Target("llvm --num-cores=16")
+    config = ReplayTraceConfig(num_trials_per_iter=4, num_trials_total=4)
+    with tempfile.TemporaryDirectory() as work_dir:
+        database = JSONDatabase(
+            path_workload=work_dir + "/workload.json",
+            path_tuning_record=work_dir + "/tuning_record.json",
+        )
+        mod = tune_relax(MatmulModule, target, config, work_dir, database=database)
+        num_records = len(database)
+        assert num_records > 0
+        # The trials are counted aside from the database, failed ones included
+        with open(os.path.join(work_dir, "trial_counts.txt"), encoding="utf-8") as file:
+            assert sum(int(line.split()[1]) for line in file) == config.num_trials_total
+        # All the trials are recorded already, so resuming measures nothing new
+        mod = tune_relax(MatmulModule, target, config, work_dir, database=database, resume=True)
+        assert len(database) == num_records
+        with transform.PassContext(opt_level=3):
+            ex, lib = relax.vm.build(mod, target)
+    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    data = tvm.nd.array(np.random.rand(32, 32).astype(np.float32))
+    weight = tvm.nd.array(np.random.rand(32, 32).astype(np.float32))
+    np.testing.assert_allclose(
+        vm["main"](data, weight).numpy(), data.numpy() @ weight.numpy().T, rtol=1e-5
+    )
+
+
+def test_apply_history_best_fallback():
+    target = Target("llvm --num-cores=16")
+    database = DummyDatabase()
+    (entry,) = relax.analysis.meta_schedule_report(MatmulModule, database)
+    assert entry["name"] == "tir_matmul"
+    assert entry["status"] == "miss"
+    assert entry["flop"].value == 2 * 32 * 32 * 32
+    assert entry["cost_share"].value == 1.0
+    # Without fallback, the function missing from the database is left untouched
+    mod = relax.transform.MetaScheduleApplyHistoryBest(database, target)(MatmulModule)
+    tvm.ir.assert_structural_equal(mod["tir_matmul"], MatmulModule["tir_matmul"])
+    mod = relax.transform.MetaScheduleApplyHistoryBest(database, target, fallback=True)(
+        MatmulModule
+    )
+    assert not tvm.ir.structural_equal(mod["tir_matmul"], MatmulModule["tir_matmul"])
+    with transform.PassContext(opt_level=3):
+        ex, lib = relax.vm.build(mod, target)
+    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    data = tvm.nd.array(np.random.rand(32, 32).astype(np.float32))
+    weight = tvm.nd.array(np.random.rand(32, 32).astype(np.float32))
+    np.testing.assert_allclose(
+        vm["main"](data, weight).numpy(), data.numpy() @ weight.numpy().T, rtol=1e-5
+    )
+
+
 if __name__ == "__main__":
     test_class_irmodule(dev="cpu")
+    test_tune_relax_resume()
+    test_apply_history_best_fallback()
@@ -275,6 +275,25 @@ def test_normalize():
     assert add_call.shape[1] == n
 
 
+def test_normalize_deep_nesting():
+    x = rx.Var("x", [4], rx.DynTensorType(rank=1, dtype="float32"))
+    expr = x
+    for _ in range(10000):
+        expr = rx.op.add(expr, x)
+
+    bb = rx.BlockBuilder()
+    with bb.function("func", [x]):
+        gv = bb.emit(expr)
+        bb.emit_func_output(gv)
+    func = bb.get()["func"]
+
+    # the nested calls are bound in order, each one to the argument of the next one
+    bindings = func.body.blocks[0].bindings
+    assert len(bindings) == 10000
+    for prev, binding in zip(bindings, bindings[1:]):
+        assert binding.value.args[0].same_as(prev.var)
+
+
 def test_emit_te():
     bb = rx.BlockBuilder()
     n, m = tir.Var("n", "int64"), tir.Var("m", "int64")
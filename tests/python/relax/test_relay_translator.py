@@ -0,0 +1,157 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations  # must import to defer parsing of annotations
+import pytest
+import numpy as np
+import tvm
+from tvm import relax, relay
+from tvm.relax.testing import relay_translator
+
+
+def _conv_relu_conv():
+    data = relay.var("data", shape=(1, 16, 14, 14), dtype="float32")
+    w0 = relay.var("w0", shape=(32, 16, 3, 3), dtype="float32")
+    w1 = relay.var("w1", shape=(32, 32, 3, 3), dtype="float32")
+    y = relay.nn.conv2d(data, w0, channels=32, kernel_size=(3, 3), padding=(1, 1))
+    y = relay.nn.relu(y)
+    y = relay.nn.conv2d(y, w1, channels=32, kernel_size=(3, 3), padding=(1, 1))
+    func = relay.Function([data, w0, w1], y)
+    params = {
+        "w0": tvm.nd.array(np.random.uniform(-1, 1, (32, 16, 3, 3)).astype("float32")),
+        "w1": tvm.nd.array(np.random.uniform(-1, 1, (32, 32, 3, 3)).astype("float32")),
+    }
+    return relay.transform.InferType()(tvm.IRModule.from_expr(func))["main"], params
+
+
+def _callees(func):
+    return [
+        binding.value.args[1].name_hint
+        for block in func.body.blocks
+        for binding in block.bindings
+        if isinstance(binding.value, relax.Call) and binding.value.op.name == "relax.call_tir"
+    ]
+
+
+def test_translate_alter_layout():
+    func, params = _conv_relu_conv()
+    target = tvm.target.Target("llvm", host="llvm")
+    mod = relay_translator.from_relay(func, target, params)
+
+    main = mod["main"]
+    # the weights are bound and packed at compile time
+    assert len(main.params) == 1
+    callees = _callees(main)
+    assert len([name for name in callees if name.startswith("conv2d_NCHWc")]) == 2
+    # the activations stay in the blocked layout between the two conv2d
+    assert len([name for name in callees if name.startswith("layout_transform")]) == 2
+
+    data = np.random.uniform(-1, 1, (1, 16, 14, 14)).astype("float32")
+    ex, lib = relax.vm.build(mod, target)
+    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    res = vm["main"](tvm.nd.array(data))
+
+    with tvm.transform.PassContext(opt_level=3):
+        expected = relay.create_executor("graph", tvm.IRModule.from_expr(func), target=target)
+        expected = expected.evaluate()(data, params["w0"], params["w1"])
+    np.testing.assert_allclose(res.numpy(), expected.numpy(), rtol=1e-4, atol=1e-4)
+
+
+def test_translate_bind_params():
+    func, params = _conv_relu_conv()
+    mod = relay_translator.from_relay(func, params=params)
+    main = mod["main"]
+    assert len(main.params) == 1
+    assert all(name.startswith(("conv2d_nchw", "relu")) for name in _callees(main))
+
+
+def test_translate_reuse_prim_funcs(monkeypatch):
+    data = relay.var("data", shape=(16, 64), dtype="float32")
+    weights = [relay.var("w%d" % i, shape=(64, 64), dtype="float32") for i in range(3)]
+    y = data
+    for weight in weights:
+        y = relay.nn.relu(relay.nn.dense(y, weight))
+    y = relay.add(y, y)
+    # count the calls lowered with TE, i.e. the misses of the cache
+    emitted = []
+    emit_te = relax.BlockBuilder.emit_te
+
+    def _counting_emit_te(self, func, *args, **kwargs):
+        emitted.append(func)
+        return emit_te(self, func, *args, **kwargs)
+
+    monkeypatch.setattr(relax.BlockBuilder, "emit_te", _counting_emit_te)
+    # the function is not type inferred
+    mod = relay_translator.from_relay(relay.Function([data, *weights], y))
+    # only the first dense and relu are lowered, the others hit the cache
+    assert len(emitted) == 3
+    monkeypatch.undo()
+
+    # the layers of the same signature call the same PrimFuncs with their own arguments
+    main = mod["main"]
+    assert _callees(main) == ["dense", "relu"] * 3 + ["add"]
+    assert len([gv for gv in mod.get_global_vars() if gv.name_hint != "main"]) == 3
+    bindings = main.body.blocks[0].bindings
+    for i in range(1, len(bindings)):
+        assert bindings[i].value.args[2].fields[0].same_as(bindings[i - 1].var)
+
+    inputs = [np.random.uniform(-1, 1, (16, 64)).astype("float32")]
+    inputs += [np.random.uniform(-1, 1, (64, 64)).astype("float32") for _ in range(3)]
+    ex, lib = relax.vm.build(mod, tvm.target.Target("llvm", host="llvm"))
+    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    res = vm["main"](*[tvm.nd.array(inp) for inp in inputs])
+    expected = inputs[0]
+    for weight in inputs[1:]:
+        expected = np.maximum(expected @ weight.T, 0)
+    np.testing.assert_allclose(res.numpy(), expected + expected, rtol=1e-4, atol=1e-4)
+
+
+@pytest.mark.skipif(
+    tvm.get_global_func("tvm.contrib.cblas.matmul", allow_missing=True) is None,
+    reason="cblas is not enabled",
+)
+def test_translate_library_dispatch():
+    data = relay.var("data", shape=(64, 256), dtype="float32")
+    w0 = relay.var("w0", shape=(256, 256), dtype="float32")
+    w1 = relay.var("w1", shape=(4, 256), dtype="float32")
+    y = relay.nn.dense(relay.nn.dense(data, w0), w1)
+    func = relay.Function([data, w0, w1], y)
+    func = relay.transform.InferType()(tvm.IRModule.from_expr(func))["main"]
+
+    # the first dense has 2 * 64 * 256 * 256 flops, the second one 2 * 64 * 256 * 4
+    dispatch = relay_translator.LibraryDispatch("cblas", min_flops=2**20)
+    mod = relay_translator.from_relay(func, library_dispatch=dispatch)
+    assert _callees(mod["main"]) == ["cblas_matmul", "dense"]
+    assert relay_translator.LibraryDispatch.current() is None
+
+    # the policy overrides the flops threshold
+    dispatch = relay_translator.LibraryDispatch("cblas", policy=lambda op, lhs, rhs: rhs[0] < 16)
+    mod_policy = relay_translator.from_relay(func, library_dispatch=dispatch)
+    assert _callees(mod_policy["main"]) == ["dense", "cblas_matmul"]
+
+    inputs = [
+        np.random.uniform(-1, 1, shape).astype("float32")
+        for shape in [(64, 256), (256, 256), (4, 256)]
+    ]
+    ex, lib = relax.vm.build(mod, tvm.target.Target("llvm", host="llvm"))
+    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    res = vm["main"](*[tvm.nd.array(inp) for inp in inputs])
+    expected = inputs[0] @ inputs[1].T @ inputs[2].T
+    np.testing.assert_allclose(res.numpy(), expected, rtol=1e-4, atol=1e-4)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
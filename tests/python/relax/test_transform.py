@@ -359,5 +359,101 @@ def test_to_anf_no_op():
     assert_structural_equal(mod, mod_post)
 
 
+def test_to_anf_deep_nesting():
+    x = relax.Var("x", [4], relax.DynTensorType(1, "float32"))
+    body = x
+    for _ in range(10000):
+        body = relax.op.add(body, x)
+    gvar = relax.GlobalVar("f")
+    func = relax.Function([x], body, None, gvar)
+
+    new_mod = relax.transform.ToANF()(tvm.IRModule({gvar: func}))
+    new_body = new_mod["f"].body
+    # all the calls but the outermost one are bound to vars
+    assert len(new_body.blocks[0].bindings) == 9999
+    assert isinstance(new_body.body, relax.Call)
+    assert new_body.body.args[0].same_as(new_body.blocks[0].bindings[-1].var)
+
+
+def _dense_relu_softmax():
+    from tvm import topi
+
+    bb = relax.BlockBuilder()
+    x = relax.Var("x", [4, 16], relax.DynTensorType(2, "float32"))
+    w = relax.Var("w", [8, 16], relax.DynTensorType(2, "float32"))
+    with bb.function("main", [x, w]):
+        with bb.dataflow():
+            lv0 = bb.emit_te(topi.nn.dense, x, w)
+            lv1 = bb.emit_te(topi.nn.relu, lv0)
+            gv = bb.emit_output(bb.emit_te(topi.nn.softmax, lv1))
+        bb.emit_func_output(gv)
+    return bb.get()
+
+
+def test_to_mixed_precision():
+    mod = _dense_relu_softmax()
+    new_mod = relax.transform.ToMixedPrecision("float16")(mod)
+    names = [gv.name_hint for gv in new_mod.get_global_vars()]
+    # dense and relu are converted, softmax stays in float32
+    assert "dense_fp16" in names and "relu_fp16" in names
+    assert "dense" not in names and "relu" not in names
+    assert "softmax" in names
+    dense = new_mod["dense_fp16"]
+    assert all(dense.buffer_map[param].dtype == "float16" for param in dense.params)
+
+    func = new_mod["main"]
+    assert all(param.checked_type.dtype == "float32" for param in func.params)
+    assert func.body.body.checked_type.dtype == "float32"
+    callees = [
+        binding.value.args[1].name_hint for block in func.body.blocks for binding in block.bindings
+    ]
+    # x and w are cast to float16, relu is fed directly by dense, and cast back for softmax
+    assert callees.count("dense_fp16") == 1 and callees.count("relu_fp16") == 1
+    assert len([name for name in callees if name.startswith("cast")]) == 3
+
+    # the input module is unchanged
+    assert "dense" in [gv.name_hint for gv in mod.get_global_vars()]
+
+    # the excluded PrimFuncs are matched without their numeric suffix
+    new_mod = relax.transform.ToMixedPrecision("float16", exclude=["dense"])(mod)
+    names = [gv.name_hint for gv in new_mod.get_global_vars()]
+    assert "dense" in names and "relu_fp16" in names
+
+
+def test_to_mixed_precision_build():
+    import numpy as np
+
+    mod = _dense_relu_softmax()
+    new_mod = relax.transform.ToMixedPrecision("float16")(mod)
+
+    # the storage of the tensors passed to the converted PrimFuncs is allocated in float16
+    lowered = tvm.transform.Sequential(
+        [
+            relax.transform.ToNonDataflow(),
+            relax.transform.CallTIRRewrite(),
+            relax.transform.VMMemoryLower(),
+        ]
+    )(new_mod)
+    alloc_storage_op = tvm.ir.Op.get("relax.vm.builtin.alloc_storage")
+    storage_dtypes = [
+        binding.value.attrs.dtype
+        for block in lowered["main"].body.blocks
+        for binding in block.bindings
+        if isinstance(binding.value, relax.Call) and binding.value.op == alloc_storage_op
+    ]
+    assert "float16" in storage_dtypes and "float32" in storage_dtypes
+
+    # the converted module computes the same results as the float32 one, within fp16 precision
+    target = tvm.target.Target("llvm")
+    data = tvm.nd.array(np.random.rand(4, 16).astype("float32"))
+    weight = tvm.nd.array(np.random.rand(8, 16).astype("float32"))
+    results = []
+    for m in [mod, new_mod]:
+        ex, lib = relax.vm.build(m, target)
+        vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+        results.append(vm["main"](data, weight).numpy())
+    np.testing.assert_allclose(results[1], results[0], rtol=1e-2, atol=1e-3)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
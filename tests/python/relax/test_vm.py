@@ -21,6 +21,7 @@ import numpy as np
 import tvm
 from tvm import relax, tir, te
 from tvm.runtime import container
+from tvm.contrib import utils
 import numpy as np
 
 from tvm.ir.base import assert_structural_equal
@@ -426,6 +427,38 @@ def test_vm_compile_stage3():
     np.testing.assert_allclose(inp.numpy(), res.numpy())
 
 
+def test_vm_export_library():
+    @tvm.script.ir_module
+    class TestVMExportLibrary:
+        @T.prim_func
+        def tir_add(x: T.handle, y: T.handle) -> None:
+            T.func_attr({"global_symbol": "tir_add"})
+            A = T.match_buffer(x, (32, 16))
+            B = T.match_buffer(y, (32, 16))
+            for i, j in T.grid(32, 16):
+                with T.block():
+                    vi, vj = T.axis.remap("SS", [i, j])
+                    B[vi, vj] = A[vi, vj] + 1.0
+
+        @R.function
+        def foo(x: Tensor[(32, 16), "float32"]) -> Tensor:
+            y = R.call_tir((32, 16), tir_add, (x))
+            return y
+
+    mod = TestVMExportLibrary
+    target = tvm.target.Target("llvm", host="llvm")
+    ex, lib = relax.vm.build(mod, target)
+    temp = utils.tempdir()
+    path = temp.relpath("exec.so")
+    ex.export_library(lib, path)
+
+    loaded = tvm.runtime.load_module(path)
+    vm = relax.VirtualMachine(loaded, tvm.cpu())
+    inp = tvm.nd.array(np.random.rand(32, 16).astype(np.float32))
+    res = vm["foo"](inp)
+    np.testing.assert_allclose(res.numpy(), inp.numpy() + 1.0)
+
+
 def test_vm_compile_e2e():
     @tvm.script.ir_module
     class TestVMCompileE2E:
@@ -698,5 +731,76 @@ def test_vm_tuplegetitem():
     np.testing.assert_allclose(res.numpy(), x_inp.numpy() + y_inp.numpy())
 
 
+def test_vm_block_sparse_attention():
+    seq_len, head_dim, block_size = 64, 16, 16
+    num_block_rows = seq_len // block_size
+    # a banded (sliding window) block mask
+    mask_blocks = [
+        (r, c) for r in range(num_block_rows) for c in range(num_block_rows) if abs(r - c) <= 1
+    ]
+    mask_indices = np.array([c for _, c in mask_blocks], dtype="int32")
+    mask_indptr = np.searchsorted([r for r, _ in mask_blocks], np.arange(num_block_rows + 1))
+
+    bb = relax.BlockBuilder()
+    with bb.function("main"):
+        attn = nn.BlockSparseAttention(seq_len, head_dim, block_size, len(mask_blocks))
+        q = nn.Placeholder((seq_len, head_dim), name="data_q")
+        k = nn.Placeholder((seq_len, head_dim), name="data_k")
+        v = nn.Placeholder((seq_len, head_dim), name="data_v")
+        out = attn(q, k, v)
+        bb.emit_func_output(out, [q, k, v] + attn.parameters())
+
+    mod = bb.get()
+    target = tvm.target.Target("llvm", host="llvm")
+    ex, lib = relax.vm.build(mod, target)
+    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+
+    q_np, k_np, v_np = [np.random.rand(seq_len, head_dim).astype("float32") for _ in range(3)]
+    res = vm["main"](
+        tvm.nd.array(q_np),
+        tvm.nd.array(k_np),
+        tvm.nd.array(v_np),
+        tvm.nd.array(mask_indices),
+        tvm.nd.array(mask_indptr.astype("int32")),
+    )
+
+    dense_mask = np.zeros((seq_len, seq_len), dtype=bool)
+    for r, c in mask_blocks:
+        dense_mask[r * block_size : (r + 1) * block_size, c * block_size : (c + 1) * block_size] = 1
+    scores = np.where(dense_mask, q_np.dot(k_np.T) / np.sqrt(head_dim), -np.inf)
+    probs = np.exp(scores - scores.max(axis=1, keepdims=True))
+    probs /= probs.sum(axis=1, keepdims=True)
+    np.testing.assert_allclose(res.numpy(), probs.dot(v_np), rtol=1e-4, atol=1e-4)
+
+
+def test_vm_record_replay():
+    bb = relax.BlockBuilder()
+    n = tir.Var("n", "int64")
+    type_anno = relax.DynTensorType(2, "float32")
+    x = relax.Var("x", [n, 4], type_anno)
+    y = relax.Var("y", [n, 4], type_anno)
+
+    def te_func(A, B):
+        C = te.compute((n, 4), lambda i, j: (A[i, j] + B[i, j]) * B[i, j])
+        return C
+
+    with bb.function("rx_func", [x, y]):
+        lv0 = bb.emit_te(te_func, x, y)
+        lv1 = bb.emit_te(te_func, lv0, y)
+        bb.emit_func_output(lv1)
+
+    mod = bb.get()
+
+    target = tvm.target.Target("llvm", host="llvm")
+    ex, lib = relax.vm.build(mod, target)
+    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib, record_replay=True)
+    # the first call of each shape records, the others replay
+    for shape in [(3, 4), (3, 4), (3, 4), (5, 4), (5, 4), (3, 4)]:
+        x_np = np.random.rand(*shape).astype(np.float32)
+        y_np = np.random.rand(*shape).astype(np.float32)
+        res = vm["rx_func"](tvm.nd.array(x_np), tvm.nd.array(y_np))
+        np.testing.assert_allclose(res.numpy(), ((x_np + y_np) * y_np + y_np) * y_np, rtol=1e-5)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
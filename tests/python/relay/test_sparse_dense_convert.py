@@ -86,5 +86,123 @@ def test_bsr_sparse_dense():
     np.testing.assert_allclose(sparse_output, dense_output, atol=1e-5, rtol=1e-5)
 
 
+def test_process_params_shares_task_inputs():
+    from tvm.auto_scheduler.search_task import get_task_input_buffer
+    from tvm.relay.analysis.sparse_dense import process_params
+
+    data = relay.var("data", shape=(1, 128), dtype="float32")
+    y = data
+    weights = {}
+    for i in range(4):
+        w = relay.var("weight%d" % i, shape=(128, 128), dtype="float32")
+        y = relay.nn.dense(y, w)
+        weights["weight%d" % i] = random_bsr_matrix(128, 128, 16, 1, 0.1).todense()
+    func = relay.Function(relay.analysis.free_vars(y), y)
+
+    serial = {k: tvm.nd.array(v) for k, v in weights.items()}
+    threaded = {k: tvm.nd.array(v) for k, v in weights.items()}
+    serial_info = process_params(func, serial, (16, 1), 0.2, num_workers=1)
+    threaded_info = process_params(func, threaded, (16, 1), 0.2, num_workers=4)
+
+    assert [str(n) for n in serial_info.weight_name] == [str(n) for n in threaded_info.weight_name]
+    assert len(threaded_info.weight_name) == 4
+    for name in serial:
+        np.testing.assert_array_equal(serial[name].numpy(), threaded[name].numpy())
+
+    name = str(threaded_info.weight_name[-1])
+    s = sp.bsr_matrix(weights[name], blocksize=(16, 1))
+    prefix = "sparse_dense_bsr_%d_%d_%d_%d_%d_%d_" % (
+        128,
+        128,
+        16,
+        1,
+        s.indices.shape[0],
+        s.indptr.shape[0],
+    )
+    assert get_task_input_buffer("default", prefix + "W_data").same_as(threaded[name + ".data"])
+
+
+def random_nm_matrix(rows, cols, n, m, dtype="float32"):
+    w = np.random.randn(rows, cols).astype(dtype)
+    groups = w.reshape(rows, cols // m, m)
+    # zero all but n random positions of every group
+    drop = np.argsort(np.random.rand(rows, cols // m, m), axis=2)[:, :, n:]
+    np.put_along_axis(groups, drop, 0, axis=2)
+    return w
+
+
+def test_nm_sparse_dense():
+    data = relay.var("data", shape=(4, 128), dtype="float32")
+    x = relay.nn.relu(data)
+    w0 = relay.var("weight0", shape=(256, 128), dtype="float32")
+    w1 = relay.var("weight1", shape=(64, 256), dtype="float32")
+    y = relay.nn.relu(relay.nn.dense(x, w0))
+    z = relay.nn.dense(y, w1)
+    func = relay.Function(relay.analysis.free_vars(z), z)
+
+    # weight1 is dense and must be left untouched
+    params = {
+        "weight0": tvm.nd.array(random_nm_matrix(256, 128, 2, 4)),
+        "weight1": tvm.nd.array(np.random.randn(64, 256).astype("float32")),
+    }
+
+    x_np = np.random.randn(4, 128).astype("float32")
+    dense_output = run_func(func, params, x_np)
+    sparse_func, params = relay.data_dep_optimization.nm_dense.convert(func, params, (2, 4))
+    assert set(params.keys()) == {"weight0.nm_values", "weight0.nm_meta", "weight1"}
+    # 2-bit positions: one byte of metadata per 4 kept values
+    assert params["weight0.nm_values"].shape == (64, 256)
+    assert params["weight0.nm_meta"].shape == (16, 256)
+    assert params["weight0.nm_meta"].dtype == "uint8"
+    sparse_output = run_func(sparse_func, params, x_np)
+    np.testing.assert_allclose(sparse_output, dense_output, atol=1e-4, rtol=1e-4)
+
+
+def test_csr_sparse_dense_balanced():
+    M, N, K = 8, 64, 32
+    weight_np = sp.random(N, K, density=0.2, format="csr", dtype="float32")
+    data = relay.var("data", shape=(M, K), dtype="float32")
+    w_data = relay.var("w_data", shape=weight_np.data.shape, dtype="float32")
+    w_indices = relay.var("w_indices", shape=weight_np.indices.shape, dtype="int32")
+    w_indptr = relay.var("w_indptr", shape=weight_np.indptr.shape, dtype="int32")
+    y = relay.nn.sparse_dense(data, (w_data, w_indices, w_indptr))
+    func = relay.Function([data, w_data, w_indices, w_indptr], y)
+    params = {
+        "w_data": tvm.nd.array(weight_np.data),
+        "w_indices": tvm.nd.array(weight_np.indices.astype("int32")),
+        "w_indptr": tvm.nd.array(weight_np.indptr.astype("int32")),
+    }
+    call = relay.transform.InferType()(IRModule.from_expr(func))["main"].body
+
+    def _select_impl():
+        inputs = [tvm.te.placeholder(data.type_annotation.shape)] + [
+            tvm.te.placeholder(params[name].shape, params[name].dtype)
+            for name in ["w_data", "w_indices", "w_indptr"]
+        ]
+        impl, _ = relay.backend.te_compiler.select_implementation(
+            call.op, call.attrs, inputs, call.checked_type, tvm.target.Target("llvm")
+        )
+        return impl.name
+
+    config = {"relay.sparse_dense.csr_balanced": True}
+    assert _select_impl() == "sparse_dense.x86"
+    with tvm.transform.PassContext(opt_level=3, config=config):
+        assert _select_impl() == "sparse_dense_csr_balanced.x86"
+        lib = relay.build(IRModule.from_expr(func), "llvm", params=params)
+
+    from tvm.contrib import graph_executor
+
+    x = np.random.randn(M, K).astype("float32")
+    m = graph_executor.GraphModule(lib["default"](tvm.cpu(0)))
+    m.set_input("data", tvm.nd.array(x))
+    m.run()
+    np.testing.assert_allclose(
+        m.get_output(0).numpy(), x @ weight_np.toarray().T, rtol=1e-5, atol=1e-5
+    )
+
+
 if __name__ == "__main__":
     test_bsr_sparse_dense()
+    test_csr_sparse_dense_balanced()
+    test_process_params_shares_task_inputs()
+    test_nm_sparse_dense()
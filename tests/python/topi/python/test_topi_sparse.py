@@ -23,10 +23,12 @@ from tvm import relay
 import tvm.topi.testing
 from tvm.topi.utils import get_const_tuple
 import tvm.contrib.sparse as tvmsp
+from tvm.topi.sparse.utils import csr_balanced_row_partition, csr_to_ell, nm_compress
 from collections import namedtuple
 import time
 import scipy.sparse as sp
 import tvm.testing
+import pytest
 
 _sparse_dense_implement = {
     "generic": (topi.nn.sparse_dense, topi.generic.schedule_sparse_dense),
@@ -296,6 +298,216 @@ def test_sparse_dense_csr_reverse():
     tvm.testing.assert_allclose(Y_tvm.numpy(), Y_np, atol=1e-4, rtol=1e-4)
 
 
+def test_sparse_dense_csr_balanced():
+    M, N, K = 3, 64, 47
+    # power-law row lengths: a few heavy rows and many short or empty ones
+    row_nnz = np.minimum(np.random.zipf(1.5, N), K)
+    row_nnz[:8] = 0
+    indptr = np.concatenate([[0], np.cumsum(row_nnz)]).astype("int32")
+    indices = np.concatenate(
+        [np.sort(np.random.choice(K, n, replace=False)) for n in row_nnz]
+    ).astype("int32")
+    W_sp_np = sp.csr_matrix(
+        (np.random.randn(indptr[-1]).astype("float32"), indices, indptr), shape=(N, K)
+    )
+    X_np = np.random.randn(M, K).astype("float32")
+
+    num_parts = 5
+    partition_np = csr_balanced_row_partition(W_sp_np.indptr, num_parts)
+    assert partition_np[0] == 0 and partition_np[-1] == N
+    assert np.all(np.diff(partition_np) >= 0)
+
+    W_data = te.placeholder(shape=W_sp_np.data.shape, dtype="float32")
+    W_indices = te.placeholder(shape=W_sp_np.indices.shape, dtype="int32")
+    W_indptr = te.placeholder(shape=W_sp_np.indptr.shape, dtype="int32")
+    X = te.placeholder(shape=X_np.shape, dtype="float32")
+    partition = te.placeholder(shape=partition_np.shape, dtype="int32")
+    for sparse_lhs in [False, True]:
+        Y_np = W_sp_np.dot(X_np.T) if sparse_lhs else X_np.dot(W_sp_np.todense().T)
+        for row_partition in [None, partition]:
+            Y = topi.nn.sparse_dense_csr_balanced(
+                X,
+                W_data,
+                W_indices,
+                W_indptr,
+                sparse_lhs=sparse_lhs,
+                num_parts=num_parts,
+                row_partition=row_partition,
+            )
+            s = topi.x86.schedule_sparse_dense_csr_balanced([Y])
+            args = [X, W_data, W_indices, W_indptr]
+            nd_args = [
+                tvm.nd.array(X_np),
+                tvm.nd.array(W_sp_np.data),
+                tvm.nd.array(W_sp_np.indices),
+                tvm.nd.array(W_sp_np.indptr),
+            ]
+            if row_partition is not None:
+                args.append(row_partition)
+                nd_args.append(tvm.nd.array(partition_np))
+            func = tvm.build(s, args + [Y])
+            Y_tvm = tvm.nd.array(np.zeros(Y_np.shape, dtype=Y_np.dtype))
+            func(*nd_args, Y_tvm)
+            tvm.testing.assert_allclose(Y_tvm.numpy(), Y_np, atol=1e-4, rtol=1e-4)
+
+
+def test_sparse_dense_ell():
+    M, N, K, BS_R, BS_C, density = 4, 64, 48, 16, 4, 0.2
+    X_np = np.random.randn(M, K).astype("float32")
+    for W_sp_np in [
+        sp.random(N, K, density=density, format="csr", dtype="float32"),
+        random_bsr_matrix(N, K, BS_R, BS_C, density=density, dtype="float32"),
+    ]:
+        Y_np = X_np.dot(W_sp_np.todense().T)
+        ell_data, ell_indices = csr_to_ell(W_sp_np.data, W_sp_np.indices, W_sp_np.indptr)
+
+        X = te.placeholder(shape=X_np.shape, dtype="float32")
+        W_data = te.placeholder(shape=ell_data.shape, dtype="float32")
+        W_indices = te.placeholder(shape=ell_indices.shape, dtype=str(ell_indices.dtype))
+        Y = topi.sparse.sparse_dense_ell(X, W_data, W_indices)
+        # the compute has static loop extents, so it can be lowered through TensorIR
+        func = tvm.build(te.create_prim_func([X, W_data, W_indices, Y]), target="llvm")
+        Y_tvm = tvm.nd.array(np.zeros(Y_np.shape, dtype=Y_np.dtype))
+        func(tvm.nd.array(X_np), tvm.nd.array(ell_data), tvm.nd.array(ell_indices), Y_tvm)
+        tvm.testing.assert_allclose(Y_tvm.numpy(), Y_np, atol=1e-4, rtol=1e-4)
+
+
+def test_sddmm():
+    M, N, K = 64, 48, 16
+    for BS_R, BS_C in [(1, 1), (16, 8)]:
+        mask = random_bsr_matrix(M, N, BS_R, BS_C, density=0.3, dtype="float32")
+        A_np = np.random.randn(M, K).astype("float32")
+        B_np = np.random.randn(N, K).astype("float32")
+        dense_np = A_np.dot(B_np.T)
+        # gather the dense result at the mask blocks
+        rows = np.repeat(np.arange(M // BS_R), np.diff(mask.indptr))
+        C_np = np.stack(
+            [
+                dense_np[r * BS_R : (r + 1) * BS_R, c * BS_C : (c + 1) * BS_C]
+                for r, c in zip(rows, mask.indices)
+            ]
+        )
+
+        A = te.placeholder(shape=A_np.shape, dtype="float32")
+        B = te.placeholder(shape=B_np.shape, dtype="float32")
+        indices = te.placeholder(shape=mask.indices.shape, dtype=str(mask.indices.dtype))
+        indptr = te.placeholder(shape=mask.indptr.shape, dtype=str(mask.indptr.dtype))
+        C = topi.sparse.sddmm(A, B, indices, indptr, (BS_R, BS_C))
+        func = tvm.build(te.create_prim_func([A, B, indices, indptr, C]), target="llvm")
+        C_tvm = tvm.nd.array(np.zeros(C_np.shape, dtype=C_np.dtype))
+        func(
+            tvm.nd.array(A_np),
+            tvm.nd.array(B_np),
+            tvm.nd.array(mask.indices),
+            tvm.nd.array(mask.indptr),
+            C_tvm,
+        )
+        tvm.testing.assert_allclose(C_tvm.numpy(), C_np, atol=1e-4, rtol=1e-4)
+
+
+def test_bsr_block_rows():
+    # empty rows at the start, in the middle and at the end
+    indptr_np = np.array([0, 0, 2, 2, 2, 5, 6, 6], dtype="int32")
+    indptr = te.placeholder(shape=indptr_np.shape, dtype="int32")
+    rows = topi.sparse.bsr_block_rows(indptr, 6)
+    func = tvm.build(te.create_prim_func([indptr, rows]), target="llvm")
+    rows_tvm = tvm.nd.array(np.zeros((6,), dtype="int32"))
+    func(tvm.nd.array(indptr_np), rows_tvm)
+    tvm.testing.assert_allclose(rows_tvm.numpy(), [1, 1, 4, 4, 4, 5])
+
+
+def test_csr_to_ell_empty():
+    data = np.zeros((0,), dtype="float32")
+    indices = np.zeros((0,), dtype="int32")
+    ell_data, ell_indices = csr_to_ell(data, indices, np.zeros((1,), dtype="int32"))
+    assert ell_data.shape == (0, 0) and ell_indices.shape == (0, 0)
+
+
+def _sparse_softmax_python(data, indptr):
+    blocks = data if data.ndim == 3 else data[:, None, None]
+    out = np.zeros_like(blocks)
+    for row in range(len(indptr) - 1):
+        start, end = indptr[row], indptr[row + 1]
+        if start == end:
+            continue
+        vals = blocks[start:end]
+        exp = np.exp(vals - vals.max(axis=(0, 2), keepdims=True))
+        out[start:end] = exp / exp.sum(axis=(0, 2), keepdims=True)
+    return out.reshape(data.shape)
+
+
+def test_sparse_softmax():
+    M, N = 64, 48
+    for BS_R, BS_C in [(1, 1), (8, 4)]:
+        mask = random_bsr_matrix(M, N, BS_R, BS_C, density=0.3, dtype="float32")
+        data_np = mask.data if (BS_R, BS_C) != (1, 1) else mask.data.reshape(-1)
+        out_np = _sparse_softmax_python(data_np, mask.indptr)
+
+        data = te.placeholder(shape=data_np.shape, dtype="float32")
+        indices = te.placeholder(shape=mask.indices.shape, dtype=str(mask.indices.dtype))
+        indptr = te.placeholder(shape=mask.indptr.shape, dtype=str(mask.indptr.dtype))
+        out = topi.nn.sparse_softmax(data, indices, indptr)
+        func = tvm.build(te.create_prim_func([data, indices, indptr, out]), target="llvm")
+        out_tvm = tvm.nd.array(np.zeros(out_np.shape, dtype=out_np.dtype))
+        func(
+            tvm.nd.array(data_np),
+            tvm.nd.array(mask.indices),
+            tvm.nd.array(mask.indptr),
+            out_tvm,
+        )
+        tvm.testing.assert_allclose(out_tvm.numpy(), out_np, atol=1e-5, rtol=1e-5)
+
+
+def test_bsrmm():
+    M, K, N, BS_R, BS_C = 64, 48, 32, 8, 4
+    A_sp = random_bsr_matrix(M, K, BS_R, BS_C, density=0.3, dtype="float32")
+    B_np = np.random.randn(K, N).astype("float32")
+    C_np = A_sp.dot(B_np)
+
+    data = te.placeholder(shape=A_sp.data.shape, dtype="float32")
+    indices = te.placeholder(shape=A_sp.indices.shape, dtype=str(A_sp.indices.dtype))
+    indptr = te.placeholder(shape=A_sp.indptr.shape, dtype=str(A_sp.indptr.dtype))
+    B = te.placeholder(shape=B_np.shape, dtype="float32")
+    C = topi.sparse.bsrmm(data, indices, indptr, B)
+    func = tvm.build(te.create_prim_func([data, indices, indptr, B, C]), target="llvm")
+    C_tvm = tvm.nd.array(np.zeros(C_np.shape, dtype=C_np.dtype))
+    func(
+        tvm.nd.array(A_sp.data),
+        tvm.nd.array(A_sp.indices),
+        tvm.nd.array(A_sp.indptr),
+        tvm.nd.array(B_np),
+        C_tvm,
+    )
+    tvm.testing.assert_allclose(C_tvm.numpy(), C_np, atol=1e-4, rtol=1e-4)
+
+
+@pytest.mark.parametrize("n, m", [(2, 4), (1, 4), (4, 8)])
+def test_sparse_dense_nm(n, m):
+    M, N, K = 16, 64, 128
+    W_np = np.random.randn(N, K).astype("float32")
+    groups = W_np.reshape(N, K // m, m)
+    drop = np.argsort(np.random.rand(N, K // m, m), axis=2)[:, :, n:]
+    np.put_along_axis(groups, drop, 0, axis=2)
+    X_np = np.random.randn(M, K).astype("float32")
+    Y_np = X_np.dot(W_np.T)
+
+    values_np, meta_np = nm_compress(W_np, n, m)
+    num_values, per_byte = K // m * n, 4 if m <= 4 else 2
+    assert values_np.shape == (num_values, N)
+    assert meta_np.shape == ((num_values + per_byte - 1) // per_byte, N)
+
+    X = te.placeholder(shape=X_np.shape, dtype="float32")
+    values = te.placeholder(shape=values_np.shape, dtype="float32")
+    meta = te.placeholder(shape=meta_np.shape, dtype="uint8")
+    Y = topi.nn.sparse_dense_nm(X, values, meta, n, m)
+    with tvm.target.Target("llvm"):
+        s = topi.x86.schedule_sparse_dense_nm([Y])
+    func = tvm.build(s, [X, values, meta, Y], target="llvm")
+    Y_tvm = tvm.nd.array(np.zeros(Y_np.shape, dtype=Y_np.dtype))
+    func(tvm.nd.array(X_np), tvm.nd.array(values_np), tvm.nd.array(meta_np), Y_tvm)
+    tvm.testing.assert_allclose(Y_tvm.numpy(), Y_np, atol=1e-4, rtol=1e-4)
+
+
 def test_sparse_transpose_csr():
     N, density = 1023, 0.3
 
@@ -27,7 +27,8 @@ import pytest
 
 import tvm
 from tvm.meta_schedule.cost_model import PyCostModel, RandomModel
-from tvm.meta_schedule.feature_extractor import RandomFeatureExtractor
+from tvm.meta_schedule.database import JSONDatabase, TuningRecord
+from tvm.meta_schedule.feature_extractor import PyFeatureExtractor, RandomFeatureExtractor
 from tvm.meta_schedule.runner import RunnerResult
 from tvm.meta_schedule.cost_model import XGBModel
 from tvm.meta_schedule.search_strategy import MeasureCandidate
@@ -214,5 +215,58 @@ def test_meta_schedule_xgb_model_reupdate():
     model.predict(TuneContext(), [_dummy_candidate() for i in range(predict_sample_count)])
 
 
+def test_meta_schedule_xgb_model_warm_start():
+    class CountingFeatureExtractor(PyFeatureExtractor):
+        def __init__(self):
+            super().__init__()
+            self.num_extracted = 0
+
+        def extract_from(
+            self, context: TuneContext, candidates: List[MeasureCandidate]
+        ) -> List[np.ndarray]:
+            self.num_extracted += len(candidates)
+            return [tvm.nd.array(np.random.rand(4, 5).astype("float32")) for _ in candidates]
+
+    num_records = 12
+    tmpdir = tempfile.mkdtemp()
+    database = JSONDatabase(
+        path_workload=os.path.join(tmpdir, "workloads.json"),
+        path_tuning_record=os.path.join(tmpdir, "tuning_records.json"),
+    )
+    workload = database.commit_workload(Matmul)
+    for i in range(num_records):
+        sch = Schedule(Matmul)
+        loop, _, _ = sch.get_loops(sch.get_block("matmul"))
+        sch.split(loop, factors=[2 ** (i % 10 + 1), None])
+        database.commit_tuning_record(
+            TuningRecord(
+                sch.trace,
+                [float(x) for x in _dummy_result().run_secs],
+                workload,
+                tvm.target.Target("llvm"),
+                [],
+            )
+        )
+    cache_path = os.path.join(tmpdir, "features.npz")
+    extractor = CountingFeatureExtractor()
+    model = XGBModel(extractor=extractor, num_warmup_samples=2)
+    assert model.warm_start(database, feature_cache_path=cache_path, batch_size=5) == num_records
+    assert extractor.num_extracted == 10  # records with the same trace share their features
+    assert len(model.cached_features) == num_records
+    # the records are trained on the same costs as the measurements of `update`
+    expected_costs = np.asarray(
+        [np.median([float(x) for x in r.run_secs]) for r in database.get_all_tuning_records()],
+        dtype="float32",
+    )
+    assert np.array_equal(model.cached_mean_costs, expected_costs)
+    model.predict(TuneContext(), [_dummy_candidate() for i in range(10)])
+    # the features of all the records are reloaded from the cache
+    extractor = CountingFeatureExtractor()
+    model = XGBModel(extractor=extractor, num_warmup_samples=2)
+    assert model.warm_start(database, feature_cache_path=cache_path) == num_records
+    assert extractor.num_extracted == 0
+    shutil.rmtree(tmpdir)
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__] + sys.argv[1:]))
@@ -26,7 +26,12 @@ import tvm
 from tvm import tir
 from tvm.ir.module import IRModule
 from tvm.meta_schedule.arg_info import ArgInfo
-from tvm.meta_schedule.database import JSONDatabase, TuningRecord
+from tvm.meta_schedule.database import (
+    JSONDatabase,
+    SQLiteDatabase,
+    TuningRecord,
+    compact_json_database,
+)
 from tvm.script import tir as T
 from tvm.tir import Schedule
 
@@ -295,5 +300,146 @@ def test_meta_schedule_database_reload():
             _equal_record(ret[1], records[2])
 
 
+def _commit_records(database: JSONDatabase, mod: IRModule, all_run_secs):
+    workload = database.commit_workload(mod)
+    trace = _create_schedule(mod, _schedule_matmul).trace
+    records = [
+        TuningRecord(
+            trace,
+            run_secs,
+            workload,
+            tvm.target.Target("llvm"),
+            ArgInfo.from_prim_func(func=mod["main"]),  # pylint: disable=unsubscriptable-object
+        )
+        for run_secs in all_run_secs
+    ]
+    for record in records:
+        database.commit_tuning_record(record)
+    return workload, records
+
+
+def test_meta_schedule_database_get_all_tuning_records():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = _create_tmp_database(tmpdir)
+        _, records = _commit_records(database, Matmul, [[7.0, 8.0, 9.0], [1.0, 2.0, 3.0]])
+        _, relu_records = _commit_records(database, MatmulRelu, [[3.0]])
+        for new_database in [database, _create_tmp_database(tmpdir)]:
+            ret = new_database.get_all_tuning_records()
+            assert len(ret) == 3
+            _equal_record(ret[0], records[1])
+            _equal_record(ret[1], records[0])
+            _equal_record(ret[2], relu_records[0])
+
+
+def test_meta_schedule_database_max_records_per_workload():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = JSONDatabase(
+            osp.join(tmpdir, "workloads.json"),
+            osp.join(tmpdir, "tuning_records.json"),
+            max_records_per_workload=2,
+        )
+        workload, records = _commit_records(
+            database, Matmul, [[7.0, 8.0, 9.0], [1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [3.0]]
+        )
+        workload_2, records_2 = _commit_records(database, MatmulRelu, [[5.0], [6.0]])
+        # only the records kept are counted
+        assert len(database) == 4
+        assert len(database.get_all_tuning_records()) == 4
+        ret = database.get_top_k(workload, 10)
+        assert len(ret) == 2
+        _equal_record(ret[0], records[1])
+        _equal_record(ret[1], records[3])
+        ret = database.get_top_k(workload_2, 10)
+        assert len(ret) == 2
+        _equal_record(ret[0], records_2[0])
+
+        # the records beyond the limit are dropped on reload
+        new_database = JSONDatabase(
+            path_workload=database.path_workload,
+            path_tuning_record=database.path_tuning_record,
+            max_records_per_workload=1,
+        )
+        assert len(new_database) == 2
+        (ret,) = new_database.get_top_k(new_database.commit_workload(Matmul), 10)
+        _equal_record(ret, records[1])
+
+
+def test_meta_schedule_database_compaction():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = _create_tmp_database(tmpdir)
+        _commit_records(database, MatmulRelu, [])
+        _, records = _commit_records(
+            database, Matmul, [[7.0, 8.0, 9.0], [1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [3.0]]
+        )
+        assert compact_json_database(
+            database.path_workload, database.path_tuning_record, top_k=2
+        ) == (4, 2)
+
+        new_database = JSONDatabase(
+            path_workload=database.path_workload,
+            path_tuning_record=database.path_tuning_record,
+            allow_missing=False,
+        )
+        # the workload without any record is dropped
+        assert not new_database.has_workload(MatmulRelu)
+        assert len(new_database) == 2
+        ret = new_database.get_top_k(new_database.commit_workload(Matmul), 10)
+        assert len(ret) == 2
+        _equal_record(ret[0], records[1])
+        _equal_record(ret[1], records[3])
+
+
+def test_meta_schedule_sqlite_database():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = osp.join(tmpdir, "tuning.db")
+        database = SQLiteDatabase(path)
+        workload, records = _commit_records(
+            database, Matmul, [[7.0, 8.0, 9.0], [1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+        )
+        assert database.has_workload(Matmul)
+        assert not database.has_workload(MatmulRelu)
+        assert len(database) == 3
+        ret = database.get_top_k(workload, 2)
+        assert len(ret) == 2
+        _equal_record(ret[0], records[1])
+        _equal_record(ret[1], records[2])
+
+        # a second writer sees the committed workload and shares its row
+        other = SQLiteDatabase(path)
+        assert other.has_workload(Matmul)
+        other_workload, other_records = _commit_records(other, Matmul, [[0.5]])
+        assert len(database) == 4
+        (ret,) = database.get_top_k(workload, 1)
+        _equal_record(ret, other_records[0])
+        assert len(database.get_all_tuning_records()) == 4
+        other.close()
+        database.close()
+
+
+def test_meta_schedule_sqlite_database_json_round_trip():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        json_database = _create_tmp_database(tmpdir)
+        _, records = _commit_records(json_database, Matmul, [[7.0, 8.0, 9.0], [1.0, 2.0, 3.0]])
+        _commit_records(json_database, MatmulRelu, [[3.0]])
+
+        database = SQLiteDatabase(osp.join(tmpdir, "tuning.db"))
+        assert (
+            database.import_json(json_database.path_workload, json_database.path_tuning_record) == 3
+        )
+        assert len(database) == 3
+        (ret,) = database.get_top_k(database.commit_workload(Matmul), 1)
+        _equal_record(ret, records[1])
+
+        path_workload = osp.join(tmpdir, "exported_workloads.json")
+        path_tuning_record = osp.join(tmpdir, "exported_tuning_records.json")
+        assert database.export_json(path_workload, path_tuning_record) == 3
+        new_database = JSONDatabase(path_workload, path_tuning_record, allow_missing=False)
+        assert len(new_database) == 3
+        ret = new_database.get_top_k(new_database.commit_workload(Matmul), 2)
+        _equal_record(ret[0], records[1])
+        _equal_record(ret[1], records[0])
+        database.close()
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__] + sys.argv[1:]))
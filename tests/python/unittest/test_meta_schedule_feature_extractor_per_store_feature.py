@@ -370,6 +370,38 @@ def test_cpu_matmul():
     )
 
 
+def test_cpu_matmul_cache():
+    def _create_schedule(factor):
+        def f_sch():
+            sch = tir.Schedule(matmul, debug_mask="all")
+            i, _, _ = sch.get_loops(sch.get_block("C"))
+            sch.split(i, factors=[None, factor])
+            return sch
+
+        return f_sch
+
+    extractor = ms.feature_extractor.PerStoreFeature()
+    uncached = ms.feature_extractor.PerStoreFeature(max_cache_size=0)
+    candidates = [_make_candidate(_create_schedule(factor)) for factor in [16, 32, 16, 16]]
+    context = _make_context(tvm.target.Target("llvm"))
+    features = extractor.extract_from(context, candidates)
+    # structurally equal modules share their features
+    assert extractor.num_cache_misses == 2
+    assert extractor.num_cache_hits == 2
+    features = extractor.extract_from(context, candidates)
+    assert extractor.num_cache_misses == 2
+    assert extractor.num_cache_hits == 6
+    for feature, expected in zip(features, uncached.extract_from(context, candidates)):
+        assert_allclose(feature.numpy(), expected.numpy(), rtol=1e-5)
+    assert uncached.num_cache_hits == 0
+    # the cache is bounded, evicting the oldest modules first
+    small = ms.feature_extractor.PerStoreFeature(max_cache_size=1)
+    for candidate in [candidates[0], candidates[1], candidates[1], candidates[0]]:
+        small.extract_from(context, [candidate])
+    assert small.num_cache_hits == 1
+    assert small.num_cache_misses == 3
+
+
 def test_cpu_fusion():
     # pylint: disable=all
     @T.prim_func
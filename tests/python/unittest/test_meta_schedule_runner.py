@@ -338,8 +338,10 @@ def test_meta_schedule_local_multiple_runs():
 
     runner = LocalRunner(timeout_sec=100, evaluator_config=evaluator_config)
 
-    # Run the module
+    # Run the module, the measurements are done once `run` returns, so that they never run
+    # alongside the builder
     runner_futures = runner.run(runner_inputs)
+    assert all(runner_future.done() for runner_future in runner_futures)
     runner_results = [runner_future.result() for runner_future in runner_futures]
 
     for runner_result in runner_results:
@@ -354,6 +356,98 @@ def test_meta_schedule_local_multiple_runs():
         _clean_build(builder_result.artifact_path)
 
 
+def test_meta_schedule_local_runner_overlap_build():
+    """Test meta schedule local runner returning pending measurements"""
+    # Build the module
+    builder = LocalBuilder()
+    (builder_result,) = builder.build([BuilderInput(MatmulModule, Target("llvm"))])
+    assert builder_result.artifact_path is not None
+    assert builder_result.error_msg is None
+
+    runner_input = RunnerInput(
+        builder_result.artifact_path,
+        "llvm",
+        [
+            TensorInfo("float32", (MATMUL_N, MATMUL_N)),
+            TensorInfo("float32", (MATMUL_N, MATMUL_N)),
+            TensorInfo("float32", (MATMUL_N, MATMUL_N)),
+        ],
+    )
+    evaluator_config = EvaluatorConfig(
+        number=1,
+        repeat=1,
+        min_repeat_ms=0,
+        enable_cpu_cache_flush=False,
+    )
+    runner = LocalRunner(timeout_sec=100, evaluator_config=evaluator_config, overlap_build=True)
+
+    # Run the module, the measurements may still be pending once `run` returns
+    runner_futures = runner.run([runner_input] * 2)
+    runner_results = [runner_future.result() for runner_future in runner_futures]
+    assert all(runner_future.done() for runner_future in runner_futures)
+    for runner_result in runner_results:
+        assert runner_result.error_msg is None
+        for result in runner_result.run_secs:
+            if isinstance(result, FloatImm):
+                result = result.value
+            assert isinstance(result, float)
+            assert result >= 0.0
+    runner.shutdown()
+
+    _clean_build(builder_result.artifact_path)
+
+
+def test_meta_schedule_local_runner_parallel_pinned():
+    """Test meta schedule local runner measuring concurrently on pinned cores"""
+    # Build the module
+    builder = LocalBuilder()
+    (builder_result,) = builder.build([BuilderInput(MatmulModule, Target("llvm"))])
+    assert builder_result.artifact_path is not None
+    assert builder_result.error_msg is None
+
+    runner_input = RunnerInput(
+        builder_result.artifact_path,
+        "llvm",
+        [
+            TensorInfo("float32", (MATMUL_N, MATMUL_N)),
+            TensorInfo("float32", (MATMUL_N, MATMUL_N)),
+            TensorInfo("float32", (MATMUL_N, MATMUL_N)),
+        ],
+    )
+    evaluator_config = EvaluatorConfig(
+        number=1,
+        repeat=1,
+        min_repeat_ms=0,
+        enable_cpu_cache_flush=False,
+    )
+    runner = LocalRunner(
+        timeout_sec=100,
+        evaluator_config=evaluator_config,
+        max_workers=2,
+        cores_per_worker=1,
+    )
+    assert len(runner.pools) == 2
+    assert len(runner.worker_cores) == 2
+    assert not set(runner.worker_cores[0]) & set(runner.worker_cores[1])
+
+    # Run the module, the measurements are done once `run` returns
+    runner_futures = runner.run([runner_input] * 4)
+    assert all(future.done() for future in runner_futures)
+    runner_results = [future.result() for future in runner_futures]
+    assert len(runner_results) == 4
+    for runner_result in runner_results:
+        assert runner_result.error_msg is None
+        for result in runner_result.run_secs:
+            if isinstance(result, FloatImm):
+                result = result.value
+            assert isinstance(result, float)
+            assert result >= 0.0
+    assert runner.noise_check([runner_input] * 2, rtol=float("inf")) >= 0.0
+    runner.shutdown()
+
+    _clean_build(builder_result.artifact_path)
+
+
 def test_meta_schedule_py_runner():
     """Test meta schedule PyRunner"""
 
@@ -163,6 +163,68 @@ def test_cpu_matmul_relu():
     check_trace(spaces, expected)
 
 
+def test_cpu_sparse_dense_csr_ell():
+    # the gather through W_indices does not prevent tiling the ELL sparse-dense block
+    expected = [
+        [
+            'b0 = sch.get_block(name="sparse_dense_csr_ell", func_name="main")',
+            'sch.annotate(block_or_loop=b0, ann_key="meta_schedule.tiling_structure", ann_val="SSRSRS")',
+            "l1, l2, l3 = sch.get_loops(block=b0)",
+            "v4, v5, v6, v7 = sch.sample_perfect_tile(loop=l1, n=4, max_innermost_factor=64)",
+            "l8, l9, l10, l11 = sch.split(loop=l1, factors=[v4, v5, v6, v7])",
+            "v12, v13, v14, v15 = sch.sample_perfect_tile(loop=l2, n=4, max_innermost_factor=64)",
+            "l16, l17, l18, l19 = sch.split(loop=l2, factors=[v12, v13, v14, v15])",
+            "v20, v21 = sch.sample_perfect_tile(loop=l3, n=2, max_innermost_factor=64)",
+            "l22, l23 = sch.split(loop=l3, factors=[v20, v21])",
+            "sch.reorder(l8, l16, l9, l17, l22, l10, l18, l23, l11, l19)",
+            'b24 = sch.cache_write(block=b0, write_buffer_index=0, storage_scope="global")',
+            "sch.reverse_compute_at(block=b24, loop=l17, preserve_unit_loops=True)",
+        ],
+        [
+            'b0 = sch.get_block(name="sparse_dense_csr_ell", func_name="main")',
+            'sch.annotate(block_or_loop=b0, ann_key="meta_schedule.tiling_structure", ann_val="SSRSRS")',
+            "l1, l2, l3 = sch.get_loops(block=b0)",
+            "v4, v5, v6, v7 = sch.sample_perfect_tile(loop=l1, n=4, max_innermost_factor=64)",
+            "l8, l9, l10, l11 = sch.split(loop=l1, factors=[v4, v5, v6, v7])",
+            "v12, v13, v14, v15 = sch.sample_perfect_tile(loop=l2, n=4, max_innermost_factor=64)",
+            "l16, l17, l18, l19 = sch.split(loop=l2, factors=[v12, v13, v14, v15])",
+            "v20, v21 = sch.sample_perfect_tile(loop=l3, n=2, max_innermost_factor=64)",
+            "l22, l23 = sch.split(loop=l3, factors=[v20, v21])",
+            "sch.reorder(l8, l16, l9, l17, l22, l10, l18, l23, l11, l19)",
+            'b24 = sch.cache_write(block=b0, write_buffer_index=0, storage_scope="global")',
+            "sch.reverse_compute_at(block=b24, loop=l16, preserve_unit_loops=True)",
+        ],
+        [
+            'b0 = sch.get_block(name="sparse_dense_csr_ell", func_name="main")',
+            'sch.annotate(block_or_loop=b0, ann_key="meta_schedule.tiling_structure", ann_val="SSRSRS")',
+            "l1, l2, l3 = sch.get_loops(block=b0)",
+            "v4, v5, v6, v7 = sch.sample_perfect_tile(loop=l1, n=4, max_innermost_factor=64)",
+            "l8, l9, l10, l11 = sch.split(loop=l1, factors=[v4, v5, v6, v7])",
+            "v12, v13, v14, v15 = sch.sample_perfect_tile(loop=l2, n=4, max_innermost_factor=64)",
+            "l16, l17, l18, l19 = sch.split(loop=l2, factors=[v12, v13, v14, v15])",
+            "v20, v21 = sch.sample_perfect_tile(loop=l3, n=2, max_innermost_factor=64)",
+            "l22, l23 = sch.split(loop=l3, factors=[v20, v21])",
+            "sch.reorder(l8, l16, l9, l17, l22, l10, l18, l23, l11, l19)",
+        ],
+    ]
+    target = Target("llvm")
+    ctx = _create_context(
+        create_prim_func(
+            te_workload.sparse_dense_csr_ell(
+                m=128,
+                n=768,
+                k=768,
+                width=80,
+            )
+        ),
+        target=target,
+        rule=multi_level_tiling(target=target),
+    )
+    spaces = ctx.space_generator.generate_design_space(mod=ctx.mod)
+    assert len(spaces) == 3
+    check_trace(spaces, expected)
+
+
 def test_cuda_matmul():
     # pylint: disable=line-too-long
     expected = [
@@ -276,5 +338,6 @@ def test_cuda_matmul_relu():
 if __name__ == "__main__":
     test_cpu_matmul()
     test_cpu_matmul_relu()
+    test_cpu_sparse_dense_csr_ell()
     test_cuda_matmul()
     test_cuda_matmul_relu()
@@ -16,17 +16,21 @@
 # under the License.
 """ Test Meta Schedule SearchStrategy """
 # pylint: disable=missing-function-docstring
+import os
 import sys
+import tempfile
 from typing import List, Optional, Tuple, Union
 
 import numpy as np
 import pytest
 import tvm
+from tvm import te
 from tvm.ir import IRModule
 from tvm.meta_schedule import TuneContext
+from tvm.meta_schedule.arg_info import ArgInfo
 from tvm.meta_schedule.builder import LocalBuilder
 from tvm.meta_schedule.cost_model import PyCostModel
-from tvm.meta_schedule.database import PyDatabase, TuningRecord, Workload
+from tvm.meta_schedule.database import JSONDatabase, PyDatabase, TuningRecord, Workload
 from tvm.meta_schedule.mutator.mutator import PyMutator
 from tvm.meta_schedule.runner import LocalRunner, RunnerResult
 from tvm.meta_schedule.search_strategy import (
@@ -38,6 +42,7 @@ from tvm.meta_schedule.search_strategy import (
 )
 from tvm.meta_schedule.space_generator import ScheduleFn
 from tvm.meta_schedule.task_scheduler import RoundRobin
+from tvm.meta_schedule.testing import te_workload
 from tvm.script import tir as T
 from tvm.tir.schedule import Schedule, Trace
 
@@ -266,5 +271,88 @@ def test_meta_schedule_evolutionary_search():  # pylint: disable = invalid-name
     del _scheduler
 
 
+def test_meta_schedule_evolutionary_search_cross_task_seeding():  # pylint: disable = invalid-name
+    def _schedule_te_matmul(sch: Schedule):
+        block = sch.get_block("C")
+        i, j, k = sch.get_loops(block=block)
+        i_0, i_1 = sch.split(i, sch.sample_perfect_tile(i, n=2))
+        j_0, j_1 = sch.split(j, sch.sample_perfect_tile(j, n=2))
+        sch.reorder(i_0, j_0, i_1, j_1, k)
+
+    target = tvm.target.Target("llvm")
+    mod_small = IRModule({"main": te.create_prim_func(te_workload.matmul(32, 32, 32))})
+    mod_large = IRModule({"main": te.create_prim_func(te_workload.matmul(64, 64, 64))})
+    with tempfile.TemporaryDirectory() as work_dir:
+        database = JSONDatabase(
+            path_workload=os.path.join(work_dir, "workload.json"),
+            path_tuning_record=os.path.join(work_dir, "tuning_record.json"),
+        )
+        # Only the small matmul has been measured
+        workload = database.commit_workload(mod_small)
+        for seed in range(4):
+            sch = Schedule(mod_small, seed=seed)
+            _schedule_te_matmul(sch)
+            database.commit_tuning_record(
+                TuningRecord(
+                    sch.trace,
+                    [0.1 * (seed + 1)],
+                    workload,
+                    target,
+                    ArgInfo.from_prim_func(mod_small["main"]),
+                )
+            )
+        contexts = [
+            TuneContext(
+                mod=mod,
+                space_generator=ScheduleFn(sch_fn=_schedule_te_matmul),
+                mutator_probs={},
+                target=target,
+                num_threads=1,
+            )
+            for mod in [mod_small, mod_large]
+        ]
+        _scheduler = RoundRobin(
+            tasks=contexts,
+            builder=LocalBuilder(),
+            runner=LocalRunner(),
+            database=database,
+            cost_model=tvm.meta_schedule.cost_model.RandomModel(seed=0),
+            measure_callbacks=[],
+        )
+        strategy = EvolutionarySearch(
+            num_trials_per_iter=4,
+            num_trials_total=4,
+            population_size=8,
+            init_measured_ratio=0.0,
+            init_min_unmeasured=2,
+            genetic_num_iters=2,
+            genetic_mutate_prob=0.0,
+            genetic_max_fail_count=10,
+            eps_greedy=0.0,
+            cross_task_seed_ratio=0.5,
+        )
+        context = contexts[1]
+        context.space_generator.initialize_with_tune_context(context)
+        spaces = context.space_generator.generate_design_space(context.mod)
+        strategy.initialize_with_tune_context(context)
+        strategy.pre_tuning(spaces)
+        candidates = strategy.generate_measure_candidates()
+        strategy.post_tuning()
+        assert len(candidates) == 4
+        for candidate in candidates:
+            # The tile sizes are re-sampled for the shapes of the large matmul
+            for decision in candidate.sch.trace.decisions.values():
+                assert np.prod([int(factor) for factor in decision]) == 64
+        assert strategy.num_cross_task_seeds == 4
+        assert len(strategy.search_stats) == 3
+        for stats in strategy.search_stats:
+            assert 0.0 < stats["diversity"].value <= 1.0
+            assert stats["score_min"].value <= stats["score_median"].value
+            assert stats["score_median"].value <= stats["score_max"].value
+        for stats in strategy.search_stats[:-1]:
+            assert stats["mutation_success_rate"].value == 0.0
+        del _scheduler
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__] + sys.argv[1:]))
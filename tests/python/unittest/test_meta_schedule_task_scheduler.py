@@ -29,7 +29,7 @@ from tvm.meta_schedule.database import PyDatabase, TuningRecord, Workload
 from tvm.meta_schedule.runner import PyRunner, RunnerFuture, RunnerInput, RunnerResult
 from tvm.meta_schedule.search_strategy import ReplayTrace
 from tvm.meta_schedule.space_generator import ScheduleFn
-from tvm.meta_schedule.task_scheduler import PyTaskScheduler, RoundRobin
+from tvm.meta_schedule.task_scheduler import GradientBased, PyTaskScheduler, RoundRobin
 from tvm.script import tir as T
 from tvm.tir import Schedule
 
@@ -195,6 +195,66 @@ def test_meta_schedule_task_scheduler_single():
     assert len(database) == num_trials_total
 
 
+def _run_recorded_task_scheduler(runner_future_done: bool):
+    events = []
+
+    class RecordingBuilder(PyBuilder):
+        def build(self, build_inputs: List[BuilderInput]) -> List[BuilderResult]:
+            events.append(("build", len(build_inputs)))
+            return [BuilderResult("test_path", None) for _ in build_inputs]
+
+    class RecordingRunnerFuture(DummyRunnerFuture):
+        def __init__(self) -> None:
+            super().__init__()
+            self.measured = runner_future_done
+
+        def done(self) -> bool:
+            return self.measured
+
+        def result(self) -> RunnerResult:
+            self.measured = True
+            return super().result()
+
+    class RecordingRunner(PyRunner):
+        def run(self, runner_inputs: List[RunnerInput]) -> List[RunnerFuture]:
+            events.append(("run", len(runner_inputs)))
+            return [RecordingRunnerFuture() for _ in runner_inputs]
+
+    num_trials_per_iter = 8
+    num_trials_total = 16
+    task = TuneContext(
+        MatmulModule,
+        target=tvm.target.Target("llvm"),
+        space_generator=ScheduleFn(sch_fn=_schedule_matmul),
+        search_strategy=ReplayTrace(num_trials_per_iter, num_trials_total),
+        task_name="Test",
+        rand_state=42,
+    )
+    database = DummyDatabase()
+    round_robin = RoundRobin(
+        [task],
+        RecordingBuilder(),
+        RecordingRunner(),
+        database,
+        measure_callbacks=[measure_callback.AddToDatabase()],
+    )
+    round_robin.tune()
+    assert len(database) == num_trials_total
+    return events
+
+
+def test_meta_schedule_task_scheduler_pipelined():  # pylint: disable=invalid-name
+    events = _run_recorded_task_scheduler(runner_future_done=False)
+    # Each batch is built in chunks, and every chunk is sent to the runner once it is built
+    assert events == [("build", 2), ("run", 2)] * 8
+
+
+def test_meta_schedule_task_scheduler_blocking_runner():  # pylint: disable=invalid-name
+    events = _run_recorded_task_scheduler(runner_future_done=True)
+    # The first chunk comes back measured, so the rest of the batch is built at once
+    assert events == [("build", 2), ("run", 2), ("build", 6), ("run", 6)] * 2
+
+
 def test_meta_schedule_task_scheduler_multiple():
     num_trials_per_iter = 6
     num_trials_total = 101
@@ -247,6 +307,191 @@ def test_meta_schedule_task_scheduler_multiple():
         )
 
 
+def _gradient_based_tasks(num_trials_per_iter, num_trials_total):
+    return [
+        TuneContext(
+            MatmulModule,
+            target=tvm.target.Target("llvm"),
+            space_generator=ScheduleFn(sch_fn=_schedule_matmul),
+            search_strategy=ReplayTrace(num_trials_per_iter, num_trials_total),
+            task_name="Matmul",
+            rand_state=42,
+        ),
+        TuneContext(
+            BatchMatmulModule,
+            target=tvm.target.Target("llvm"),
+            space_generator=ScheduleFn(sch_fn=_schedule_batch_matmul),
+            search_strategy=ReplayTrace(num_trials_per_iter, num_trials_total),
+            task_name="BatchMatmul",
+            rand_state=0x114514,
+        ),
+    ]
+
+
+def test_meta_schedule_task_scheduler_gradient_based():  # pylint: disable=invalid-name
+    num_trials_per_iter = 6
+    num_trials_total = 36
+    tasks = _gradient_based_tasks(num_trials_per_iter, num_trials_total)
+    database = DummyDatabase()
+    gradient_based = GradientBased(
+        tasks,
+        DummyBuilder(),
+        DummyRunner(),
+        database,
+        measure_callbacks=[measure_callback.AddToDatabase()],
+        task_weights=[3.0, 1.0],
+        early_stopping_rounds=-1,
+    )
+    assert [weight.value for weight in gradient_based.task_weights] == [3.0, 1.0]
+    gradient_based.tune()
+    # Without early stopping, every task uses up its trials
+    assert len(database) == num_trials_total * len(tasks)
+    for task in tasks:
+        assert (
+            len(database.get_top_k(database.commit_workload(task.mod), 100000)) == num_trials_total
+        )
+
+
+def test_meta_schedule_task_scheduler_gradient_based_early_stopping():  # pylint: disable=invalid-name
+    class ConstantRunnerFuture(RunnerFuture):
+        def done(self) -> bool:
+            return True
+
+        def result(self) -> RunnerResult:
+            return RunnerResult([1.0], None)
+
+    class ConstantRunner(PyRunner):
+        def run(self, runner_inputs: List[RunnerInput]) -> List[RunnerFuture]:
+            return [ConstantRunnerFuture() for _ in runner_inputs]
+
+    num_trials_per_iter = 6
+    num_trials_total = 120
+    early_stopping_rounds = 2
+    tasks = _gradient_based_tasks(num_trials_per_iter, num_trials_total)
+    database = DummyDatabase()
+    gradient_based = GradientBased(
+        tasks,
+        DummyBuilder(),
+        ConstantRunner(),
+        database,
+        measure_callbacks=[measure_callback.AddToDatabase()],
+        early_stopping_rounds=early_stopping_rounds,
+    )
+    gradient_based.tune()
+    # The latency never improves, so each task stops after its first rounds
+    for task in tasks:
+        assert len(
+            database.get_top_k(database.commit_workload(task.mod), 100000)
+        ) == num_trials_per_iter * (early_stopping_rounds + 1)
+
+
+def test_meta_schedule_task_scheduler_gradient_based_lazy_join():  # pylint: disable=invalid-name
+    events = []
+
+    class SlowRunnerFuture(RunnerFuture):
+        def __init__(self, task_name: str) -> None:
+            super().__init__()
+            self.task_name = task_name
+
+        def done(self) -> bool:
+            # The batch matmul is never reported done, it is only joined when nothing else is left
+            return self.task_name == "Matmul"
+
+        def result(self) -> RunnerResult:
+            events.append(("result", self.task_name))
+            return RunnerResult([random.uniform(5, 30)], None)
+
+    class SlowRunner(PyRunner):
+        def run(self, runner_inputs: List[RunnerInput]) -> List[RunnerFuture]:
+            futures = []
+            for runner_input in runner_inputs:
+                is_batch = len(runner_input.args_info[0].shape) == 3
+                task_name = "BatchMatmul" if is_batch else "Matmul"
+                events.append(("run", task_name))
+                futures.append(SlowRunnerFuture(task_name))
+            return futures
+
+    num_trials_per_iter = 6
+    num_trials_total = 36
+    tasks = _gradient_based_tasks(num_trials_per_iter, num_trials_total)
+    database = DummyDatabase()
+    gradient_based = GradientBased(
+        tasks,
+        DummyBuilder(),
+        SlowRunner(),
+        database,
+        measure_callbacks=[measure_callback.AddToDatabase()],
+        early_stopping_rounds=-1,
+    )
+    gradient_based.tune()
+    assert len(database) == num_trials_total * len(tasks)
+    # The matmul keeps being picked while the first batch of the batch matmul is still running
+    first_batch_matmul_result = events.index(("result", "BatchMatmul"))
+    assert events[:first_batch_matmul_result].count(("run", "Matmul")) == num_trials_total
+
+
+def test_meta_schedule_task_scheduler_time_budget():  # pylint: disable=invalid-name
+    num_trials_per_iter = 6
+    num_trials_total = 120
+    tasks = _gradient_based_tasks(num_trials_per_iter, num_trials_total)
+    database = DummyDatabase()
+    round_robin = RoundRobin(
+        tasks,
+        DummyBuilder(),
+        DummyRunner(),
+        database,
+        measure_callbacks=[
+            measure_callback.AddToDatabase(),
+            measure_callback.TimeBudget(max_time_sec=1e-9),
+        ],
+    )
+    round_robin.tune()
+    # The clock starts when the first batch of Task #1 is collected, and the budget is used up
+    # when the first batch of Task #2 is. Task #1 has its second batch in flight by then, so it
+    # stops once that batch is collected.
+    for task, num_batches in zip(tasks, [2, 1]):
+        assert task.is_stopped
+        assert (
+            len(database.get_top_k(database.commit_workload(task.mod), 100000))
+            == num_trials_per_iter * num_batches
+        )
+
+
+def test_meta_schedule_task_scheduler_stop_on_convergence():  # pylint: disable=invalid-name
+    class ConstantRunnerFuture(RunnerFuture):
+        def done(self) -> bool:
+            return True
+
+        def result(self) -> RunnerResult:
+            return RunnerResult([1.0], None)
+
+    class ConstantRunner(PyRunner):
+        def run(self, runner_inputs: List[RunnerInput]) -> List[RunnerFuture]:
+            return [ConstantRunnerFuture() for _ in runner_inputs]
+
+    num_trials_per_iter = 6
+    num_trials_total = 120
+    num_rounds = 2
+    tasks = _gradient_based_tasks(num_trials_per_iter, num_trials_total)
+    database = DummyDatabase()
+    round_robin = RoundRobin(
+        tasks,
+        DummyBuilder(),
+        ConstantRunner(),
+        database,
+        measure_callbacks=[
+            measure_callback.AddToDatabase(),
+            measure_callback.StopOnConvergence(num_rounds=num_rounds),
+        ],
+    )
+    round_robin.tune()
+    # The latency never improves after the first round
+    for task in tasks:
+        assert len(
+            database.get_top_k(database.commit_workload(task.mod), 100000)
+        ) == num_trials_per_iter * (num_rounds + 1)
+
+
 def test_meta_schedule_task_scheduler_not_implemented_error():  # pylint: disable=invalid-name
     class MyTaskScheduler(PyTaskScheduler):
         pass
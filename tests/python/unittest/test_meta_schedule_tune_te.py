@@ -20,6 +20,7 @@ import tempfile
 
 import pytest
 from tvm.meta_schedule import ReplayTraceConfig, tune_te
+from tvm.meta_schedule.runner import LocalRunner
 from tvm.meta_schedule.testing import te_workload
 from tvm.target.target import Target
 from tvm.tir import Schedule
@@ -48,5 +49,34 @@ def test_tune_matmul():
             print(sch.trace)
 
 
+@pytest.mark.skip("Integration test")
+@pytest.mark.parametrize("workload", ["SPMM-CSR", "SPMM-BSR", "SDDMM"])
+def test_tune_sparse(workload):
+    workload_func, params = te_workload.CONFIGS[workload]
+    runner = LocalRunner(
+        f_alloc_argument=te_workload.fixed_input_alloc_argument(
+            te_workload.sparse_fixed_inputs(workload, 0)
+        ),
+    )
+    with tempfile.TemporaryDirectory() as work_dir:
+        sch: Schedule = tune_te(
+            tensors=workload_func(*params[0]),
+            target=Target("llvm --num-cores=16"),
+            config=ReplayTraceConfig(
+                num_trials_per_iter=32,
+                num_trials_total=64,
+            ),
+            runner=runner,
+            work_dir=work_dir,
+        )
+        if sch is None:
+            print("No valid schedule found!")
+        else:
+            print(sch.mod.script())
+            print(sch.trace)
+
+
 if __name__ == """__main__""":
     test_tune_matmul()
+    for workload in ["SPMM-CSR", "SPMM-BSR", "SDDMM"]:
+        test_tune_sparse(workload)
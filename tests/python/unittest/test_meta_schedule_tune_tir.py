@@ -20,7 +20,7 @@ import tempfile
 
 import tvm
 import pytest
-from tvm.meta_schedule import ReplayTraceConfig, tune_tir
+from tvm.meta_schedule import ReplayTraceConfig, tune_symbolic_tir, tune_tir
 from tvm.meta_schedule.tune_context import TuneContext
 from tvm.meta_schedule import schedule_rule, postproc
 from tvm.meta_schedule.space_generator import PostOrderApply
@@ -50,6 +50,19 @@ def matmul(a: T.handle, b: T.handle, c: T.handle) -> None:
             C[vi, vj] = C[vi, vj] + A[vi, vk] * B[vj, vk]
 
 
+@T.prim_func
+def matmul_symbolic(a: T.handle, b: T.handle, c: T.handle, n: T.int32) -> None:
+    A = T.match_buffer(a, [n, 128])
+    B = T.match_buffer(b, [128, 128])
+    C = T.match_buffer(c, [n, 128])
+    for i, j, k in T.grid(n, 128, 128):
+        with T.block("update"):
+            vi, vj, vk = T.axis.remap("SSR", [i, j, k])
+            with T.init():
+                C[vi, vj] = 0.0
+            C[vi, vj] = C[vi, vj] + A[vi, vk] * B[vj, vk]
+
+
 # pylint: enable=no-member,invalid-name,unused-variable
 
 
@@ -72,6 +85,26 @@ def test_tune_matmul_cpu():
             print(sch.trace)
 
 
+@pytest.mark.skip("Integration test")
+def test_tune_matmul_symbolic_cpu():
+    with tempfile.TemporaryDirectory() as work_dir:
+        sch: Schedule = tune_symbolic_tir(
+            mod=matmul_symbolic,
+            target=Target("llvm --num-cores=16"),
+            config=ReplayTraceConfig(
+                num_trials_per_iter=16,
+                num_trials_total=16,
+            ),
+            work_dir=work_dir,
+            shape_samples=[{"n": 1}, {"n": 24}, {"n": 128}],
+        )
+        if sch is None:
+            print("No valid schedule found!")
+        else:
+            print(sch.mod.script())
+            print(sch.trace)
+
+
 @pytest.mark.skip("Integration test")
 def test_tune_matmul_cuda():
     with tempfile.TemporaryDirectory() as work_dir:
@@ -212,5 +245,6 @@ def test_tune_matmul_cuda_tensor_core():
 
 if __name__ == """__main__""":
     test_tune_matmul_cpu()
+    test_tune_matmul_symbolic_cpu()
     test_tune_matmul_cuda()
     test_tune_matmul_cuda_tensor_core()
@@ -38,6 +38,16 @@ def elementwise(a: T.handle, b: T.handle) -> None:
             B[vi, vj, vk] = A[vi, vj, vk] * 2.0
 
 
+@T.prim_func
+def elementwise_symbolic(a: T.handle, b: T.handle, n: T.int32) -> None:
+    A = T.match_buffer(a, (n, 128))
+    B = T.match_buffer(b, (n, 128))
+    for i, j in T.grid(n, 128):
+        with T.block("B"):
+            vi, vj = T.axis.remap("SS", [i, j])
+            B[vi, vj] = A[vi, vj] * 2.0
+
+
 @T.prim_func
 def tiled_conv2d_with_padding(
     inputs: T.Buffer[(1, 224, 224, 3), "float32"],
@@ -178,6 +188,29 @@ def test_sample_perfect_tile_composite():
     verify_trace_roundtrip(sch, mod=elementwise)
 
 
+def test_sample_perfect_tile_symbolic():
+    sch = tir.Schedule(elementwise_symbolic, debug_mask="all")
+    i, _ = sch.get_loops(sch.get_block("B"))
+    factors = [sch.get(f) for f in sch.sample_perfect_tile(i, n=3)]
+    assert factors == [-1, 1, 1]
+    # A decision tuned on a static shape keeps its inner tiles, and the outer one is inferred
+    sch = tir.Schedule(elementwise_symbolic, debug_mask="all")
+    i, _ = sch.get_loops(sch.get_block("B"))
+    factors = sch.sample_perfect_tile(i, n=3, decision=[4, 8, 4])
+    assert [sch.get(f) for f in factors] == [-1, 8, 4]
+    sch.split(i, factors=factors)
+    verify_trace_roundtrip(sch, mod=elementwise_symbolic)
+    # The decision is recorded with -1 as the outer factor, as the extent is unknown
+    (inst,) = [inst for inst in sch.trace.insts if inst.kind.name == "SamplePerfectTile"]
+    assert [int(x) for x in sch.trace.decisions[inst]] == [-1, 8, 4]
+    # Replayed on a static shape, the outer factor is inferred from the extent
+    n = elementwise_symbolic.params[2]
+    static = tir.Schedule(elementwise_symbolic.specialize({n: tir.IntImm("int32", 64)}))
+    sch.trace.apply_to_schedule(static, remove_postproc=False)
+    loops = static.get_loops(static.get_block("B"))
+    assert [int(static.get(loop).extent) for loop in loops] == [2, 8, 4, 128]
+
+
 def test_sample_compute_location():
     n = 100
     sch = tir.Schedule(tiled_conv2d_with_padding, seed=42, debug_mask="all")